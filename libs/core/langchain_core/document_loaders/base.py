@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
-from langchain_core.runnables import run_in_executor
+from langchain_core.utils.aiter import aiterate_in_thread
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Iterator
@@ -32,6 +32,12 @@ class BaseLoader(ABC):  # noqa: B024
     `load` is provided just for user convenience and should not be overridden.
     """
 
+    alazy_load_chunk_size: ClassVar[int] = 64
+    """Number of documents the default `alazy_load` hands over at a time."""
+
+    alazy_load_prefetch: ClassVar[int] = 2
+    """Maximum number of chunks the default `alazy_load` reads ahead."""
+
     # Sub-classes should not implement this method directly. Instead, they
     # should implement the lazy load method.
     def load(self) -> list[Document]:
@@ -101,16 +107,20 @@ class BaseLoader(ABC):  # noqa: B024
     async def alazy_load(self) -> AsyncIterator[Document]:
         """A lazy loader for `Document`.
 
+        The default implementation runs `lazy_load` in the default executor, one
+        hop per `alazy_load_chunk_size` documents, and reads at most
+        `alazy_load_prefetch` chunks ahead. Loaders doing native async I/O should
+        override this method instead.
+
         Yields:
             The `Document` objects.
         """
-        iterator = await run_in_executor(None, self.lazy_load)
-        done = object()
-        while True:
-            doc = await run_in_executor(None, next, iterator, done)
-            if doc is done:
-                break
-            yield doc  # type: ignore[misc]
+        async for doc in aiterate_in_thread(
+            self.lazy_load,
+            chunk_size=self.alazy_load_chunk_size,
+            max_chunks=self.alazy_load_prefetch,
+        ):
+            yield doc
 
 
 class BaseBlobParser(ABC):
@@ -27,6 +27,12 @@ from langchain_core.messages import (
     MessageLikeRepresentation,
     get_buffer_string,
 )
+from langchain_core.messages._token_cache import (
+    counter_key,
+    get_cached_count,
+    invalidate_counter,
+    set_cached_count,
+)
 from langchain_core.prompt_values import (
     ChatPromptValueConcrete,
     PromptValue,
@@ -153,6 +159,11 @@ class BaseLanguageModel(
         arbitrary_types_allowed=True,
     )
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute and retire token counts memoized for this model."""
+        super().__setattr__(name, value)
+        invalidate_counter(self)
+
     @field_validator("verbose", mode="before")
     def set_verbose(cls, verbose: bool | None) -> bool:  # noqa: FBT001
         """If verbose is `None`, set it.
@@ -323,6 +334,14 @@ class BaseLanguageModel(
         This should be overridden by model-specific implementations to provide accurate
         token counts via model-specific tokenizers.
 
+        Per-message counts of the base implementation are memoized on the message,
+        and reused while neither the message nor the model changes. In-place edits
+        of nested lists, dicts and strings in the message content are detected.
+        After mutating other objects nested in it, assign the field again (e.g.
+        `message.content = message.content`) to drop the memoized counts. Overrides
+        whose count is a sum over messages get the same memoization by calling
+        `_sum_message_tokens`.
+
         !!! note
 
             * The base implementation of `get_num_tokens_from_messages` ignores tool
@@ -346,4 +365,36 @@ class BaseLanguageModel(
                 "Counting tokens in tool schemas is not yet supported. Ignoring tools.",
                 stacklevel=2,
             )
-        return sum(self.get_num_tokens(get_buffer_string([m])) for m in messages)
+        return self._sum_message_tokens(messages, self._get_num_tokens_from_message)
+
+    def _get_num_tokens_from_message(self, message: BaseMessage) -> int:
+        return self.get_num_tokens(get_buffer_string([message]))
+
+    def _sum_message_tokens(
+        self,
+        messages: Sequence[BaseMessage],
+        count: Callable[..., int],
+        *args: Any,
+    ) -> int:
+        """Sum the token counts of messages, memoizing the count of each message.
+
+        Args:
+            messages: The messages to count.
+            count: Method of this model counting the tokens of one message. Counts
+                are memoized per model and per `count` method.
+            *args: Extra arguments passed to `count` after the message, e.g.
+                settings looked up once per call. They are not part of the cache
+                key, so they must only depend on the model's configuration.
+
+        Returns:
+            The sum of the counts of the messages.
+        """
+        key = (counter_key(self), getattr(count, "__func__", count))
+        total = 0
+        for message in messages:
+            num_tokens = get_cached_count(message, key)
+            if num_tokens is None:
+                num_tokens = count(message, *args)
+                set_cached_count(message, key, num_tokens)
+            total += num_tokens
+        return total
@@ -5,7 +5,12 @@ from typing import Any
 
 from pydantic import BaseModel
 
-from langchain_core.load.serializable import Serializable, to_json_not_implemented
+from langchain_core.load.serializable import (
+    Serializable,
+    _get_class_info,
+    _lc_kwargs,
+    to_json_not_implemented,
+)
 from langchain_core.messages import AIMessage
 from langchain_core.outputs import ChatGeneration
 
@@ -68,15 +73,107 @@ def dumps(obj: Any, *, pretty: bool = False, **kwargs: Any) -> str:
         return json.dumps(to_json_not_implemented(obj), **kwargs)
 
 
+def _json_key(key: Any) -> str:
+    # Same key coercion as `json.dumps`
+    if isinstance(key, str):
+        return str.__str__(key)
+    if isinstance(key, float):
+        if key != key:  # noqa: PLR0124
+            return "NaN"
+        if key == _INFINITY:
+            return "Infinity"
+        if key == -_INFINITY:
+            return "-Infinity"
+        return float.__repr__(key)
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    msg = f"keys must be str, int, float, bool or None, not {type(key).__name__}"
+    raise TypeError(msg)
+
+
+_INFINITY = float("inf")
+_ATOMIC_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _is_plain_serializable(obj: Any) -> bool:
+    """Whether `obj.to_json()` is the default constructor dict without secrets."""
+    return (
+        isinstance(obj, Serializable)
+        and type(obj).to_json is Serializable.to_json
+        and obj.is_lc_serializable()
+        and not _get_class_info(type(obj)).secret_getters
+    )
+
+
+def _to_dumpd(obj: Any, markers: set[int]) -> Any:
+    """Convert an object to what `json.loads(dumps(obj))` would return.
+
+    Mirrors the encoding rules of `json.dumps` with `default` as the fallback,
+    including circular reference detection.
+    """
+    type_ = type(obj)
+    if type_ in _ATOMIC_TYPES:
+        return obj
+    if isinstance(obj, str):
+        return str.__str__(obj)
+    if isinstance(obj, int):
+        return int.__int__(obj)
+    if isinstance(obj, float):
+        return float.__float__(obj)
+
+    marker = id(obj)
+    if marker in markers:
+        msg = "Circular reference detected"
+        raise ValueError(msg)
+    markers.add(marker)
+    # Atomic keys and values are inlined, as they make up most of the data
+    if type_ is not dict and type_ is not list and _is_plain_serializable(obj):
+        # Same as `default(obj)`, without building the intermediate dict
+        info = _get_class_info(type_)
+        result = {
+            "lc": 1,
+            "type": "constructor",
+            "id": list(info.lc_id),
+            "kwargs": _to_dumpd(_lc_kwargs(obj, info), markers),
+        }
+    elif isinstance(obj, dict):
+        result: Any = {
+            (key if type(key) is str else _json_key(key)): (
+                value if type(value) in _ATOMIC_TYPES else _to_dumpd(value, markers)
+            )
+            for key, value in obj.items()
+        }
+    elif isinstance(obj, (list, tuple)):
+        result = [
+            item if type(item) in _ATOMIC_TYPES else _to_dumpd(item, markers)
+            for item in obj
+        ]
+    else:
+        result = _to_dumpd(default(obj), markers)
+    markers.discard(marker)
+    return result
+
+
 def dumpd(obj: Any) -> Any:
     """Return a dict representation of an object.
 
+    The result is the same as `json.loads(dumps(obj))`, but is built directly
+    without going through a JSON string.
+
     Args:
         obj: The object to dump.
 
     Returns:
         Dictionary that can be serialized to json using `json.dumps`.
     """
-    # Unfortunately this function is not as efficient as it could be because it first
-    # dumps the object to a json string and then loads it back into a dictionary.
-    return json.loads(dumps(obj))
+    obj = _dump_pydantic_models(obj)
+    try:
+        return _to_dumpd(obj, set())
+    except TypeError:
+        return to_json_not_implemented(obj)
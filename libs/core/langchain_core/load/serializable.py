@@ -2,12 +2,13 @@
 
 import contextlib
 import logging
+import weakref
 from abc import ABC
 from typing import (
     Any,
     Literal,
+    NamedTuple,
     TypedDict,
-    cast,
 )
 
 from pydantic import BaseModel, ConfigDict
@@ -202,55 +203,20 @@ class Serializable(BaseModel, ABC):
         if not self.is_lc_serializable():
             return self.to_json_not_implemented()
 
-        model_fields = type(self).model_fields
-        secrets = {}
-        # Get latest values for kwargs if there is an attribute with same name
-        lc_kwargs = {}
-        for k, v in self:
-            if not _is_field_useful(self, k, v):
-                continue
-            # Do nothing if the field is excluded
-            if k in model_fields and model_fields[k].exclude:
-                continue
-
-            lc_kwargs[k] = getattr(self, k, v)
-
-        # Merge the lc_secrets and lc_attributes from every class in the MRO
-        for cls in [None, *self.__class__.mro()]:
-            # Once we get to Serializable, we're done
-            if cls is Serializable:
-                break
+        info = _get_class_info(type(self))
+        lc_kwargs = _lc_kwargs(self, info)
 
-            if cls:
-                deprecated_attributes = [
-                    "lc_namespace",
-                    "lc_serializable",
-                ]
-
-                for attr in deprecated_attributes:
-                    if hasattr(cls, attr):
-                        msg = (
-                            f"Class {self.__class__} has a deprecated "
-                            f"attribute {attr}. Please use the corresponding "
-                            f"classmethod instead."
-                        )
-                        raise ValueError(msg)
-
-            # Get a reference to self bound to each class in the MRO
-            this = cast("Serializable", self if cls is None else super(cls, self))
-
-            secrets.update(this.lc_secrets)
+        # Merge the lc_secrets from every class in the MRO
+        secrets: dict[str, str] = {}
+        for getter in info.secret_getters:
+            secrets.update(getter.__get__(self, type(self)))
             # Now also add the aliases for the secrets
             # This ensures known secret aliases are hidden.
             # Note: this does NOT hide any other extra kwargs
             # that are not present in the fields.
             for key in list(secrets):
-                value = secrets[key]
-                if (key in model_fields) and (
-                    alias := model_fields[key].alias
-                ) is not None:
-                    secrets[alias] = value
-            lc_kwargs.update(this.lc_attributes)
+                if (alias := info.aliases.get(key)) is not None:
+                    secrets[alias] = secrets[key]
 
         # include all secrets, even if not specified in kwargs
         # as these secrets may be passed as an environment variable instead
@@ -262,7 +228,7 @@ class Serializable(BaseModel, ABC):
         return {
             "lc": 1,
             "type": "constructor",
-            "id": self.lc_id(),
+            "id": list(info.lc_id),
             "kwargs": lc_kwargs
             if not secrets
             else _replace_secrets(lc_kwargs, secrets),
@@ -277,6 +243,112 @@ class Serializable(BaseModel, ABC):
         return to_json_not_implemented(self)
 
 
+class _ClassInfo(NamedTuple):
+    """Per-class metadata used by `Serializable.to_json`."""
+
+    fields: dict[str, FieldInfo]
+    required: frozenset[str]
+    excluded: frozenset[str]
+    # Fields shadowed by a class attribute, whose value must be read with getattr
+    shadowed: frozenset[str]
+    aliases: dict[str, str]
+    # `lc_secrets` / `lc_attributes` definitions visited when walking the MRO
+    secret_getters: tuple[Any, ...]
+    attribute_getters: tuple[Any, ...]
+    deprecated_error: str | None
+    lc_id: tuple[str, ...]
+
+
+_CLASS_INFO: weakref.WeakKeyDictionary[type, _ClassInfo] = weakref.WeakKeyDictionary()
+
+
+def _mro_getters(cls: type[Serializable], name: str) -> tuple[Any, ...]:
+    """Get the definitions of `name` merged by `to_json`, in merge order.
+
+    `to_json` merges `self.<name>` followed by `super(c, self).<name>` for every
+    class `c` in the MRO up to `Serializable`. Each of these resolves to the first
+    definition at or after some position in the MRO, so consecutive lookups often
+    resolve to the same definition; merging it again has no effect, so duplicates
+    are collapsed. `Serializable`'s own (empty) definition is skipped.
+    """
+    mro = cls.__mro__
+    stop = mro.index(Serializable)
+    default = vars(Serializable)[name]
+    getters: list[Any] = []
+    for start in range(stop + 1):
+        definition = next(
+            vars(klass)[name] for klass in mro[start:] if name in vars(klass)
+        )
+        if definition is not default and (not getters or getters[-1] is not definition):
+            getters.append(definition)
+    return tuple(getters)
+
+
+def _get_class_info(cls: type[Serializable]) -> _ClassInfo:
+    info = _CLASS_INFO.get(cls)
+    if info is not None:
+        return info
+    model_fields = dict(cls.model_fields)
+    deprecated_error = None
+    for attr in ("lc_namespace", "lc_serializable"):
+        if hasattr(cls, attr):
+            deprecated_error = (
+                f"Class {cls} has a deprecated "
+                f"attribute {attr}. Please use the corresponding "
+                f"classmethod instead."
+            )
+            break
+    info = _ClassInfo(
+        fields=model_fields,
+        required=frozenset(k for k, f in model_fields.items() if f.is_required()),
+        excluded=frozenset(k for k, f in model_fields.items() if f.exclude),
+        shadowed=frozenset(k for k in model_fields if hasattr(cls, k)),
+        aliases={k: f.alias for k, f in model_fields.items() if f.alias is not None},
+        secret_getters=_mro_getters(cls, "lc_secrets"),
+        attribute_getters=_mro_getters(cls, "lc_attributes"),
+        deprecated_error=deprecated_error,
+        lc_id=tuple(cls.lc_id()),
+    )
+    _CLASS_INFO[cls] = info
+    return info
+
+
+def _lc_kwargs(inst: Serializable, info: _ClassInfo) -> dict[str, Any]:
+    """Get the constructor kwargs of `inst`, without secrets replaced.
+
+    Args:
+        inst: The instance.
+        info: The class info of `type(inst)`.
+
+    Returns:
+        The useful fields of `inst` merged with the `lc_attributes` of every class
+        in the MRO.
+
+    Raises:
+        ValueError: If the class has deprecated attributes.
+    """
+    model_fields = info.fields
+    # Get latest values for kwargs if there is an attribute with same name
+    lc_kwargs = {}
+    for k, v in inst.__dict__.items():
+        field = model_fields.get(k)
+        # Do nothing if the field is excluded
+        if (
+            field is None
+            or k in info.excluded
+            or (k not in info.required and not _is_useful(field, v))
+        ):
+            continue
+        lc_kwargs[k] = getattr(inst, k, v) if k in info.shadowed else v
+
+    if info.deprecated_error is not None:
+        raise ValueError(info.deprecated_error)
+
+    for getter in info.attribute_getters:
+        lc_kwargs.update(getter.__get__(inst, type(inst)))
+    return lc_kwargs
+
+
 def _is_field_useful(inst: Serializable, key: str, value: Any) -> bool:
     """Check if a field is useful as a constructor argument.
 
@@ -294,10 +366,17 @@ def _is_field_useful(inst: Serializable, key: str, value: Any) -> bool:
     field = type(inst).model_fields.get(key)
     if not field:
         return False
+    return _is_useful(field, value)
 
+
+def _is_useful(field: FieldInfo, value: Any) -> bool:
     if field.is_required():
         return True
 
+    # Common case of an unset optional field, skipping the copy of the default
+    if value is None and field.default is None and field.default_factory is None:
+        return False
+
     # Handle edge case: a value cannot be converted to a boolean (e.g. a
     # Pandas DataFrame).
     try:
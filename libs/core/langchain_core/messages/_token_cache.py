@@ -0,0 +1,163 @@
+"""Per-message memoization of token counts.
+
+`BaseLanguageModel.get_num_tokens_from_messages` is called many times over the same
+message history (e.g. by `trim_messages` and by agent middleware that checks
+context size on every step). Running a tokenizer over each message every time is
+costly, so per-message counts are memoized here.
+
+Entries are keyed by the identity of the message and the identity of the counter,
+and every entry records a fingerprint of the message content. Assigning to any
+field of a message drops its entries. In-place edits of `content`, `tool_calls` or
+`additional_kwargs` are caught by the fingerprint, which walks the nested lists and
+dicts and keeps a reference to every leaf value. Strings are compared by value and
+other values by identity; holding the references means a freed value's address
+cannot be reused by a replacement while the entry lives. Unchanged strings are
+the same objects, so checking a fingerprint costs one step per node rather than
+per character. In-place changes to other mutable objects nested in the content are
+not detected; call `invalidate_token_cache` after making those.
+"""
+
+from __future__ import annotations
+
+import itertools
+import weakref
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from langchain_core.messages.base import BaseMessage
+
+# id(message) -> (weakref to message, {counter key: (version, count)})
+_MESSAGE_ENTRIES: dict[
+    int, tuple[weakref.ref[Any], dict[Hashable, tuple[Any, Any]]]
+] = {}
+
+# id(counter) -> (weakref to counter, counter token)
+_COUNTER_TOKENS: dict[int, tuple[weakref.ref[Any], int]] = {}
+_COUNTER_IDS = itertools.count()
+
+
+def _fingerprint(value: Any) -> Any:
+    if isinstance(value, str):
+        # Equality checks identity first, so unchanged strings compare in one step
+        return value
+    if isinstance(value, dict):
+        return tuple([(key, _fingerprint(item)) for key, item in value.items()])
+    if isinstance(value, list):
+        return tuple([_fingerprint(item) for item in value])
+    # Ids differ unless it is the same (referenced) object, so `value.__eq__` is
+    # never called
+    return (id(value), value)
+
+
+def _content_version(message: BaseMessage) -> tuple[Any, Any, Any]:
+    # Read from `__dict__` to avoid pydantic's slow missing-attribute path
+    fields = message.__dict__
+    return (
+        _fingerprint(message.content),
+        _fingerprint(fields.get("tool_calls")),
+        _fingerprint(fields.get("additional_kwargs")),
+    )
+
+
+def _drop_message(key: int, ref: weakref.ref[Any]) -> None:
+    entry = _MESSAGE_ENTRIES.get(key)
+    if entry is not None and entry[0] is ref:
+        del _MESSAGE_ENTRIES[key]
+
+
+def _drop_counter(key: int, ref: weakref.ref[Any]) -> None:
+    entry = _COUNTER_TOKENS.get(key)
+    if entry is not None and entry[0] is ref:
+        del _COUNTER_TOKENS[key]
+
+
+def counter_key(counter: Any) -> Hashable:
+    """Get a cache key identifying a token counter object.
+
+    Keys are never reused, even if the counter is garbage collected and a new object
+    is allocated at the same address.
+
+    Args:
+        counter: The object that counts tokens, e.g. a language model.
+
+    Returns:
+        A hashable key unique to `counter` for as long as it is alive.
+    """
+    key = id(counter)
+    entry = _COUNTER_TOKENS.get(key)
+    if entry is not None and entry[0]() is counter:
+        return ("counter", entry[1])
+    token = next(_COUNTER_IDS)
+    ref = weakref.ref(counter, lambda r: _drop_counter(key, r))
+    _COUNTER_TOKENS[key] = (ref, token)
+    return ("counter", token)
+
+
+def invalidate_counter(counter: Any) -> None:
+    """Retire the cache key of a token counter.
+
+    Counts memoized under the old key are no longer returned. Call this when the
+    counter's configuration changes in a way that affects its counts.
+
+    Args:
+        counter: The object that counts tokens.
+    """
+    _COUNTER_TOKENS.pop(id(counter), None)
+
+
+def get_cached_count(message: BaseMessage, key: Hashable) -> Any:
+    """Look up a memoized token count for a message.
+
+    Args:
+        message: The message that was counted.
+        key: Key identifying the counter that produced the count.
+
+    Returns:
+        The memoized count, or `None` if there is no valid entry.
+    """
+    entry = _MESSAGE_ENTRIES.get(id(message))
+    if entry is None or entry[0]() is not message:
+        return None
+    cached = entry[1].get(key)
+    if cached is None or cached[0] != _content_version(message):
+        return None
+    return cached[1]
+
+
+def set_cached_count(message: BaseMessage, key: Hashable, count: Any) -> None:
+    """Memoize a token count for a message.
+
+    Args:
+        message: The message that was counted.
+        key: Key identifying the counter that produced the count.
+        count: The count to memoize.
+    """
+    message_id = id(message)
+    entry = _MESSAGE_ENTRIES.get(message_id)
+    if entry is None or entry[0]() is not message:
+        ref = weakref.ref(message, lambda r: _drop_message(message_id, r))
+        entry = (ref, {})
+        _MESSAGE_ENTRIES[message_id] = entry
+    entry[1][key] = (_content_version(message), count)
+
+
+def invalidate_token_cache(message: BaseMessage) -> None:
+    """Drop all memoized token counts for a message.
+
+    This is called automatically whenever a message field is assigned, and in-place
+    edits of nested lists, dicts and strings are detected. Call it manually after
+    mutating other objects nested in the content in place.
+
+    Args:
+        message: The message whose memoized counts should be dropped.
+    """
+    entry = _MESSAGE_ENTRIES.get(id(message))
+    if entry is not None:
+        entry[1].clear()
+
+
+def clear_token_cache() -> None:
+    """Drop all memoized token counts."""
+    for _, counts in _MESSAGE_ENTRIES.values():
+        counts.clear()
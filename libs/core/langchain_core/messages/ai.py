@@ -4,9 +4,10 @@ import json
 import logging
 import operator
 from collections.abc import Sequence
+from contextvars import ContextVar
 from typing import Any, Literal, cast, overload
 
-from pydantic import model_validator
+from pydantic import PrivateAttr, model_validator
 from typing_extensions import NotRequired, Self, TypedDict, override
 
 from langchain_core.messages import content as types
@@ -27,7 +28,11 @@ from langchain_core.messages.tool import invalid_tool_call as create_invalid_too
 from langchain_core.messages.tool import tool_call as create_tool_call
 from langchain_core.messages.tool import tool_call_chunk as create_tool_call_chunk
 from langchain_core.utils._merge import merge_dicts, merge_lists
-from langchain_core.utils.json import parse_partial_json
+from langchain_core.utils.json import (
+    PartialJsonParser,
+    _feed_partial_json,
+    parse_partial_json,
+)
 from langchain_core.utils.usage import _dict_int_op
 from langchain_core.utils.utils import LC_AUTO_PREFIX, LC_ID_PREFIX
 
@@ -385,6 +390,25 @@ class AIMessage(BaseMessage):
         return (base.strip() + "\n" + "\n".join(lines)).strip()
 
 
+class _ToolCallArgsParsers(dict[tuple[str | None, int | None], PartialJsonParser]):
+    """Parsers of the streamed args of a chunk's tool calls, by `(id, index)`.
+
+    This is a parse cache carried from one chunk of a stream to the next, not message
+    data, so it never makes two chunks compare unequal.
+    """
+
+    def __eq__(self, other: object) -> bool:
+        return other is None or isinstance(other, _ToolCallArgsParsers)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+# Parsers of the left operand while `add_ai_message_chunks` builds the sum.
+_inherited_tool_call_parsers: ContextVar[_ToolCallArgsParsers | None] = ContextVar(
+    "_inherited_tool_call_parsers", default=None
+)
+
+
 class AIMessageChunk(AIMessage, BaseMessageChunk):
     """Message chunk from an AI (yielded when streaming)."""
 
@@ -404,6 +428,8 @@ class AIMessageChunk(AIMessage, BaseMessageChunk):
     `tool_call_chunks` in message content will be parsed into `tool_calls`.
     """
 
+    _tool_call_parsers: _ToolCallArgsParsers | None = PrivateAttr(default=None)
+
     @property
     def lc_attributes(self) -> dict:
         """Attributes to be serialized, even if they are derived from other initialization args."""  # noqa: E501
@@ -513,9 +539,22 @@ class AIMessageChunk(AIMessage, BaseMessageChunk):
                 )
             )
 
+        # Args of a chunk summed from a stream extend the args of its left operand,
+        # so only their new text is scanned.
+        inherited = _inherited_tool_call_parsers.get() or {}
+        parsers = _ToolCallArgsParsers()
         for chunk in self.tool_call_chunks:
             try:
-                args_ = parse_partial_json(chunk["args"]) if chunk["args"] else {}
+                args = chunk["args"]
+                if not args:
+                    args_ = {}
+                elif isinstance(args, str):
+                    key = (chunk["id"], chunk["index"])
+                    parser = _feed_partial_json(inherited.get(key), args)
+                    parsers[key] = parser
+                    args_ = parser.parse()
+                else:
+                    args_ = parse_partial_json(args)
                 if isinstance(args_, dict):
                     tool_calls.append(
                         create_tool_call(
@@ -530,6 +569,7 @@ class AIMessageChunk(AIMessage, BaseMessageChunk):
                 add_chunk_to_invalid_tool_calls(chunk)
         self.tool_calls = tool_calls
         self.invalid_tool_calls = invalid_tool_calls
+        self._tool_call_parsers = parsers
 
         if (
             self.chunk_position == "last"
@@ -679,15 +719,19 @@ def add_ai_message_chunks(
         "last" if any(x.chunk_position == "last" for x in [left, *others]) else None
     )
 
-    return left.__class__(
-        content=content,
-        additional_kwargs=additional_kwargs,
-        tool_call_chunks=tool_call_chunks,
-        response_metadata=response_metadata,
-        usage_metadata=usage_metadata,
-        id=chunk_id,
-        chunk_position=chunk_position,
-    )
+    token = _inherited_tool_call_parsers.set(left._tool_call_parsers)  # noqa: SLF001
+    try:
+        return left.__class__(
+            content=content,
+            additional_kwargs=additional_kwargs,
+            tool_call_chunks=tool_call_chunks,
+            response_metadata=response_metadata,
+            usage_metadata=usage_metadata,
+            id=chunk_id,
+            chunk_position=chunk_position,
+        )
+    finally:
+        _inherited_tool_call_parsers.reset(token)
 
 
 def add_usage(left: UsageMetadata | None, right: UsageMetadata | None) -> UsageMetadata:
@@ -8,6 +8,7 @@ from pydantic import ConfigDict, Field
 
 from langchain_core._api.deprecation import warn_deprecated
 from langchain_core.load.serializable import Serializable
+from langchain_core.messages._token_cache import invalidate_token_cache
 from langchain_core.utils import get_bolded_text
 from langchain_core.utils._merge import merge_dicts, merge_lists
 from langchain_core.utils.interactive_env import is_interactive_env
@@ -178,6 +179,11 @@ class BaseMessage(Serializable):
         else:
             super().__init__(content=content, **kwargs)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute and drop any memoized token counts for the message."""
+        super().__setattr__(name, value)
+        invalidate_token_cache(self)
+
     @classmethod
     def is_lc_serializable(cls) -> bool:
         """`BaseMessage` is serializable.
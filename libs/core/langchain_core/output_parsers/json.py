@@ -15,8 +15,12 @@ from typing_extensions import override
 from langchain_core.exceptions import OutputParserException
 from langchain_core.output_parsers.format_instructions import JSON_FORMAT_INSTRUCTIONS
 from langchain_core.output_parsers.transform import BaseCumulativeTransformOutputParser
-from langchain_core.outputs import Generation
+from langchain_core.outputs import (
+    Generation,
+)
+from langchain_core.runnables.config import run_in_executor
 from langchain_core.utils.json import (
+    PartialJsonParser,
     parse_and_check_json_markdown,
     parse_json_markdown,
     parse_partial_json,
@@ -28,6 +32,120 @@ PydanticBaseModel = BaseModel | pydantic.BaseModel
 TBaseModel = TypeVar("TBaseModel", bound=PydanticBaseModel)
 
 
+_STRIPPED_CHARS = " \n\r\t`"
+_ACTION_INPUT = '"action_input"'
+
+
+def _escape_pointer(key: str) -> str:
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def _streaming_patch(prev: Any, next_: Any, path: str, ops: list[dict]) -> bool:
+    """Build the patch `jsonpatch.make_patch` would produce for a streamed object.
+
+    Only handles objects that grew by adding keys or replacing scalar values, which is
+    the shape of almost every step of a streamed JSON object. Returns `False` for
+    anything else (removed keys, changed lists) so that the caller can fall back to
+    `jsonpatch`.
+    """
+    if not isinstance(prev, dict) or not isinstance(next_, dict):
+        return False
+    if any(key not in next_ for key in prev):
+        return False
+    ops.extend(
+        {"op": "add", "path": f"{path}/{_escape_pointer(str(key))}", "value": value}
+        for key, value in next_.items()
+        if key not in prev
+    )
+    for key, old in prev.items():
+        new = next_[key]
+        key_path = f"{path}/{_escape_pointer(str(key))}"
+        if isinstance(old, dict) and isinstance(new, dict):
+            if not _streaming_patch(old, new, key_path, ops):
+                return False
+        elif isinstance(old, list) and isinstance(new, list):
+            if json.dumps(old) != json.dumps(new):
+                return False
+        elif type(old) is not type(new) or old != new:
+            ops.append({"op": "replace", "path": key_path, "value": new})
+    return True
+
+
+class _StreamingJsonMarkdown:
+    """Incrementally parse streamed output the way `parse_json_markdown` would.
+
+    Handles output that is a bare JSON object or array, optionally wrapped in a
+    Markdown code fence. Anything else (and the `action_input` special case of
+    `parse_json_markdown`) makes `parse` return `_FALLBACK`, in which case the
+    caller should parse the full text instead.
+    """
+
+    def __init__(self) -> None:
+        self.text = ""
+        self._parser: PartialJsonParser | None = None
+        self._fallback = False
+        # Trailing whitespace and backticks are held back until more text arrives,
+        # since `parse_json_markdown` would strip them.
+        self._held = ""
+
+    def feed(self, chunk: str) -> None:
+        if not self._fallback and _ACTION_INPUT in self.text[-16:] + chunk:
+            self._fallback = True
+        self.text += chunk
+        if self._fallback:
+            return
+        if self._parser is None:
+            start = self._find_start()
+            if start is None:
+                return
+            self._parser = PartialJsonParser()
+            pending = self.text[start:]
+        else:
+            pending = self._held + chunk
+        end = len(pending)
+        while end and (pending[end - 1].isspace() or pending[end - 1] == "`"):
+            end -= 1
+        self._held = pending[end:]
+        self._parser.feed(pending[:end])
+
+    def _find_start(self) -> int | None:
+        """Find where the JSON starts, or `None` if it cannot be determined yet."""
+        text = self.text
+        start = len(text) - len(text.lstrip(_STRIPPED_CHARS))
+        if start == len(text):
+            return None
+        if text[start] in "{[":
+            return start
+        fence = text.lstrip(" \n\r\t")
+        if fence.startswith("```json"):
+            body = fence[len("```json") :]
+            offset = len(text) - len(body)
+            body_start = offset + len(body) - len(body.lstrip(_STRIPPED_CHARS))
+            if body_start == len(text):
+                return None
+            if text[body_start] in "{[":
+                return body_start
+        elif "```json".startswith(fence):
+            return None
+        self._fallback = True
+        return None
+
+    def parse(self) -> Any:
+        if self._fallback or self._parser is None:
+            return _FALLBACK
+        held = self._held.rstrip().rstrip(_STRIPPED_CHARS)
+        if held:
+            # Whitespace `str.strip` keeps but `parse_json_markdown` does not strip
+            return _FALLBACK
+        try:
+            return self._parser.parse()
+        except JSONDecodeError:
+            return None
+
+
+_FALLBACK = object()
+
+
 class JsonOutputParser(BaseCumulativeTransformOutputParser[Any]):
     """Parse the output of an LLM call to a JSON object.
 
@@ -47,8 +165,39 @@ class JsonOutputParser(BaseCumulativeTransformOutputParser[Any]):
 
     @override
     def _diff(self, prev: Any | None, next: Any) -> Any:
+        ops: list[dict] = []
+        if _streaming_patch(prev, next, "", ops):
+            return ops
         return jsonpatch.make_patch(prev, next).patch
 
+    @override
+    def _stream_state(self) -> _StreamingJsonMarkdown | None:
+        # Subclasses that override `parse_result` get the generic cumulative path.
+        if type(self).parse_result is JsonOutputParser.parse_result:
+            return _StreamingJsonMarkdown()
+        return None
+
+    @override
+    def _parse_partial(
+        self, acc_gen: Generation, state: _StreamingJsonMarkdown | None
+    ) -> Any:
+        if state is not None:
+            text = acc_gen.text
+            if text.startswith(state.text):
+                state.feed(text[len(state.text) :])
+                parsed = state.parse()
+                if parsed is not _FALLBACK:
+                    return parsed
+        return self.parse_result([acc_gen], partial=True)
+
+    @override
+    async def _aparse_partial(
+        self, acc_gen: Generation, state: _StreamingJsonMarkdown | None
+    ) -> Any:
+        if state is None:
+            return await super()._aparse_partial(acc_gen, state)
+        return await run_in_executor(None, self._parse_partial, acc_gen, state)
+
     @staticmethod
     def _get_schema(pydantic_object: type[TBaseModel]) -> dict[str, Any]:
         if issubclass(pydantic_object, pydantic.BaseModel):
@@ -122,10 +122,48 @@ class BaseCumulativeTransformOutputParser(BaseTransformOutputParser[T]):
         """
         raise NotImplementedError
 
+    def _stream_state(self) -> Any:
+        """Create the state shared by the partial parses of one stream.
+
+        Returns:
+            `None` by default. Parsers that can follow a stream incrementally return
+            an object that `_parse_partial` updates as the output grows.
+        """
+        return None
+
+    def _parse_partial(self, acc_gen: Generation, state: Any) -> T | None:  # noqa: ARG002
+        """Parse the output accumulated so far in a stream.
+
+        Args:
+            acc_gen: The output of the stream so far.
+            state: The object `_stream_state` returned for this stream.
+
+        Returns:
+            The parsed output, or `None` if nothing can be parsed yet.
+        """
+        return self.parse_result([acc_gen], partial=True)
+
+    async def _aparse_partial(
+        self,
+        acc_gen: Generation,
+        state: Any,  # noqa: ARG002
+    ) -> T | None:
+        """Async parse the output accumulated so far in a stream.
+
+        Args:
+            acc_gen: The output of the stream so far.
+            state: The object `_stream_state` returned for this stream.
+
+        Returns:
+            The parsed output, or `None` if nothing can be parsed yet.
+        """
+        return await self.aparse_result([acc_gen], partial=True)
+
     @override
     def _transform(self, input: Iterator[str | BaseMessage]) -> Iterator[Any]:
         prev_parsed = None
         acc_gen: GenerationChunk | ChatGenerationChunk | None = None
+        state = self._stream_state()
         for chunk in input:
             chunk_gen: GenerationChunk | ChatGenerationChunk
             if isinstance(chunk, BaseMessageChunk):
@@ -139,7 +177,7 @@ class BaseCumulativeTransformOutputParser(BaseTransformOutputParser[T]):
 
             acc_gen = chunk_gen if acc_gen is None else acc_gen + chunk_gen  # type: ignore[operator]
 
-            parsed = self.parse_result([acc_gen], partial=True)
+            parsed = self._parse_partial(acc_gen, state)
             if parsed is not None and parsed != prev_parsed:
                 if self.diff:
                     yield self._diff(prev_parsed, parsed)
@@ -153,6 +191,7 @@ class BaseCumulativeTransformOutputParser(BaseTransformOutputParser[T]):
     ) -> AsyncIterator[T]:
         prev_parsed = None
         acc_gen: GenerationChunk | ChatGenerationChunk | None = None
+        state = self._stream_state()
         async for chunk in input:
             chunk_gen: GenerationChunk | ChatGenerationChunk
             if isinstance(chunk, BaseMessageChunk):
@@ -166,7 +205,7 @@ class BaseCumulativeTransformOutputParser(BaseTransformOutputParser[T]):
 
             acc_gen = chunk_gen if acc_gen is None else acc_gen + chunk_gen  # type: ignore[operator]
 
-            parsed = await self.aparse_result([acc_gen], partial=True)
+            parsed = await self._aparse_partial(acc_gen, state)
             if parsed is not None and parsed != prev_parsed:
                 if self.diff:
                     yield await run_in_executor(None, self._diff, prev_parsed, parsed)
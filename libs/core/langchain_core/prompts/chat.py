@@ -41,6 +41,7 @@ from langchain_core.prompts.message import (
 )
 from langchain_core.prompts.prompt import PromptTemplate
 from langchain_core.prompts.string import (
+    DEFAULT_FORMATTER_MAPPING,
     PromptTemplateFormat,
     StringPromptTemplate,
     get_template_variables,
@@ -670,6 +671,35 @@ class SystemMessagePromptTemplate(_StringImageMessagePromptTemplate):
     _msg_class: type[BaseMessage] = SystemMessage
 
 
+# Message prompt templates that `ChatPromptTemplate` formats inline
+_FAST_PATH_MESSAGE_CLASSES: dict[type, type[BaseMessage]] = {
+    HumanMessagePromptTemplate: HumanMessage,
+    SystemMessagePromptTemplate: SystemMessage,
+}
+
+
+def _format_message_fast(
+    message_template: Any, kwargs: dict[str, Any]
+) -> BaseMessage | None:
+    """Format a plain human or system message template, or return `None`.
+
+    This skips the per-message variable merging and dispatch done by
+    `_StringImageMessagePromptTemplate.format` for the common case of a single
+    `PromptTemplate` without partial variables. Any other template returns `None`
+    and should be formatted normally.
+    """
+    message_class = _FAST_PATH_MESSAGE_CLASSES.get(type(message_template))
+    if message_class is None:
+        return None
+    prompt = message_template.prompt
+    if type(prompt) is not PromptTemplate or prompt.partial_variables:
+        return None
+    text = DEFAULT_FORMATTER_MAPPING[prompt.template_format](prompt.template, **kwargs)
+    return message_class(
+        content=text, additional_kwargs=message_template.additional_kwargs
+    )
+
+
 class BaseChatPromptTemplate(BasePromptTemplate, ABC):
     """Base class for chat prompt templates."""
 
@@ -1166,6 +1196,8 @@ class ChatPromptTemplate(BaseChatPromptTemplate):
         for message_template in self.messages:
             if isinstance(message_template, BaseMessage):
                 result.extend([message_template])
+            elif (fast := _format_message_fast(message_template, kwargs)) is not None:
+                result.append(fast)
             elif isinstance(
                 message_template, (BaseMessagePromptTemplate, BaseChatPromptTemplate)
             ):
@@ -1173,7 +1205,7 @@ class ChatPromptTemplate(BaseChatPromptTemplate):
                 result.extend(message)
             else:
                 msg = f"Unexpected input: {message_template}"
-                raise ValueError(msg)  # noqa: TRY004
+                raise ValueError(msg)
         return result
 
     async def aformat_messages(self, **kwargs: Any) -> list[BaseMessage]:
@@ -1194,6 +1226,8 @@ class ChatPromptTemplate(BaseChatPromptTemplate):
         for message_template in self.messages:
             if isinstance(message_template, BaseMessage):
                 result.extend([message_template])
+            elif (fast := _format_message_fast(message_template, kwargs)) is not None:
+                result.append(fast)
             elif isinstance(
                 message_template, (BaseMessagePromptTemplate, BaseChatPromptTemplate)
             ):
@@ -1201,7 +1235,7 @@ class ChatPromptTemplate(BaseChatPromptTemplate):
                 result.extend(message)
             else:
                 msg = f"Unexpected input: {message_template}"
-                raise ValueError(msg)  # noqa:TRY004
+                raise ValueError(msg)
         return result
 
     def partial(self, **kwargs: Any) -> ChatPromptTemplate:
@@ -45,6 +45,16 @@ class _TracerCore(ABC):
 
     log_missing_parent: bool = True
 
+    lazy_serialization: bool = False
+    """Whether to skip serializing the payloads of runs the tracer never reads.
+
+    By default, the messages of chat model inputs and of LLM outputs are serialized
+    with `dumpd` as soon as the run starts or ends. With `lazy_serialization`, this
+    only happens for runs for which `_reads_run_payloads` returns `True`; other
+    runs keep references to the original messages. Serialization still happens
+    before any hook or `_persist_run` can see a run that is read.
+    """
+
     def __init__(
         self,
         *,
@@ -171,11 +181,15 @@ class _TracerCore(ABC):
         start_time = datetime.now(timezone.utc)
         if metadata:
             kwargs.update({"metadata": metadata})
-        return Run(
+        run = Run(
             id=run_id,
             parent_run_id=parent_run_id,
             serialized=serialized,
-            inputs={"messages": [[dumpd(msg) for msg in batch] for batch in messages]},
+            inputs={
+                "messages": [list(batch) for batch in messages]
+                if self.lazy_serialization
+                else [[dumpd(msg) for msg in batch] for batch in messages]
+            },
             extra=kwargs,
             events=[{"name": "start", "time": start_time}],
             start_time=start_time,
@@ -186,6 +200,8 @@ class _TracerCore(ABC):
             tags=tags,
             name=name,  # type: ignore[arg-type]
         )
+        self._serialize_if_read(run)
+        return run
 
     def _create_llm_run(
         self,
@@ -266,21 +282,78 @@ class _TracerCore(ABC):
         )
         return llm_run
 
-    def _complete_llm_run(self, response: LLMResult, run_id: UUID) -> Run:
-        llm_run = self._get_run(run_id, run_type={"llm", "chat_model"})
+    def _update_llm_run_outputs(self, llm_run: Run, response: LLMResult) -> None:
         if getattr(llm_run, "outputs", None) is None:
             llm_run.outputs = {}
         else:
             llm_run.outputs = cast("dict[str, Any]", llm_run.outputs)
         if not llm_run.extra.get("__omit_auto_outputs", False):
-            llm_run.outputs.update(response.model_dump())
+            if self.lazy_serialization:
+                # Messages are attached by reference below, don't dump them
+                llm_run.outputs.update(
+                    response.model_dump(
+                        exclude={"generations": {"__all__": {"__all__": {"message"}}}}
+                    )
+                )
+            else:
+                llm_run.outputs.update(response.model_dump())
         for i, generations in enumerate(response.generations):
             for j, generation in enumerate(generations):
                 output_generation = llm_run.outputs["generations"][i][j]
-                if "message" in output_generation:
-                    output_generation["message"] = dumpd(
-                        cast("ChatGeneration", generation).message
+                message = getattr(generation, "message", None)
+                if "message" in output_generation or (
+                    self.lazy_serialization and message is not None
+                ):
+                    output_generation["message"] = (
+                        message
+                        if self.lazy_serialization
+                        else dumpd(cast("ChatGeneration", generation).message)
                     )
+        self._serialize_if_read(llm_run)
+
+    def _reads_run_payloads(self, run: Run) -> bool:  # noqa: ARG002
+        """Whether the tracer reads or persists the payloads of a run.
+
+        Only used with `lazy_serialization`. Return `False` only for runs whose
+        inputs and outputs no hook and no `_persist_run` ever looks at.
+
+        Args:
+            run: The run, when its payloads are set.
+
+        Returns:
+            Whether to serialize the payloads of the run.
+        """
+        return True
+
+    def _serialize_if_read(self, run: Run) -> None:
+        if self.lazy_serialization and self._reads_run_payloads(run):
+            self._serialize_run_payloads(run)
+
+    def _serialize_run_payloads(self, run: Run) -> None:
+        """Serialize the messages a run references, in place.
+
+        Runs that are already serialized are left unchanged.
+
+        Args:
+            run: The run to serialize.
+        """
+        if run.run_type == "chat_model" and isinstance(
+            run.inputs.get("messages"), list
+        ):
+            run.inputs["messages"] = [
+                [msg if isinstance(msg, dict) else dumpd(msg) for msg in batch]
+                for batch in run.inputs["messages"]
+            ]
+        if run.outputs and isinstance(run.outputs.get("generations"), list):
+            for generations in run.outputs["generations"]:
+                for output_generation in generations:
+                    message = output_generation.get("message")
+                    if message is not None and not isinstance(message, dict):
+                        output_generation["message"] = dumpd(message)
+
+    def _complete_llm_run(self, response: LLMResult, run_id: UUID) -> Run:
+        llm_run = self._get_run(run_id, run_type={"llm", "chat_model"})
+        self._update_llm_run_outputs(llm_run, response)
         llm_run.end_time = datetime.now(timezone.utc)
         llm_run.events.append({"name": "end", "time": llm_run.end_time})
 
@@ -292,19 +365,7 @@ class _TracerCore(ABC):
         llm_run = self._get_run(run_id, run_type={"llm", "chat_model"})
         llm_run.error = self._get_stacktrace(error)
         if response:
-            if getattr(llm_run, "outputs", None) is None:
-                llm_run.outputs = {}
-            else:
-                llm_run.outputs = cast("dict[str, Any]", llm_run.outputs)
-            if not llm_run.extra.get("__omit_auto_outputs", False):
-                llm_run.outputs.update(response.model_dump())
-            for i, generations in enumerate(response.generations):
-                for j, generation in enumerate(generations):
-                    output_generation = llm_run.outputs["generations"][i][j]
-                    if "message" in output_generation:
-                        output_generation["message"] = dumpd(
-                            cast("ChatGeneration", generation).message
-                        )
+            self._update_llm_run_outputs(llm_run, response)
         llm_run.end_time = datetime.now(timezone.utc)
         llm_run.events.append({"name": "error", "time": llm_run.end_time})
 
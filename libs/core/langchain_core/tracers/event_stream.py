@@ -856,7 +856,7 @@ async def _astream_events_implementation_v1(
         with_streamed_output_list=True,
         **kwargs,
     ):
-        run_log += log
+        run_log._apply_in_place(log, record_ops=False)  # noqa: SLF001
 
         if not encountered_start_event:
             # Yield the start event for the root runnable.
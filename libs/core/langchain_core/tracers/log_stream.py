@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import copy
+import re
 import threading
 from collections import defaultdict
 from pprint import pformat
@@ -29,7 +30,13 @@ from langchain_core.tracers.base import BaseTracer
 from langchain_core.tracers.memory_stream import _MemoryStream
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Iterator, Sequence
+    from collections.abc import (
+        AsyncIterator,
+        Callable,
+        Iterable,
+        Iterator,
+        Sequence,
+    )
     from uuid import UUID
 
     from langchain_core.runnables import Runnable
@@ -92,6 +99,171 @@ class RunState(TypedDict):
     contain only the runs that matched the filters."""
 
 
+_ARRAY_INDEX_RE = re.compile(r"0|[1-9][0-9]*")
+
+
+def _copy_containers(value: Any) -> Any:
+    """Copy the dicts and lists of a JSON-like value, sharing all other objects.
+
+    Patch ops only ever traverse dicts and lists, so this is enough to keep values
+    inserted into a state from aliasing the ops they came from.
+    """
+    if isinstance(value, dict):
+        return {k: _copy_containers(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_containers(v) for v in value]
+    return value
+
+
+def _unescape_pointer_part(part: str) -> str:
+    if "~" in part:
+        return part.replace("~1", "/").replace("~0", "~")
+    return part
+
+
+def _resolve_parent(
+    state: Any, path: str, own: Callable[[Any], Any] | None = None
+) -> tuple[Any, str] | None:
+    """Find the container addressed by all but the last part of a JSON pointer.
+
+    If `own` is given, each container below `state` on the way is replaced by
+    `own(container)`.
+
+    Returns `None` if the pointer does not go through dicts and lists only.
+    """
+    parts = path.split("/")
+    target = state
+    for part in parts[1:-1]:
+        key: str | int
+        if isinstance(target, dict):
+            key = _unescape_pointer_part(part)
+            if key not in target:
+                return None
+        elif isinstance(target, list) and _ARRAY_INDEX_RE.fullmatch(part):
+            key = int(part)
+            if key >= len(target):
+                return None
+        else:
+            return None
+        if own is not None:
+            target[key] = own(target[key])
+        target = target[key]
+    return target, _unescape_pointer_part(parts[-1])
+
+
+def _apply_op_in_place(
+    state: Any, op: dict[str, Any], own: Callable[[Any], Any] | None = None
+) -> Any:
+    """Apply a single JSONPatch op to `state` in place and return the new state.
+
+    `add` and `replace` ops on dicts and lists, including the appends to
+    `streamed_output` lists that make up most of a stream, are applied directly.
+    Everything else is delegated to `jsonpatch`.
+
+    With `own`, only the containers `own` returns are mutated: the root and each
+    container on the op's path are passed through it first.
+    """
+    kind = op["op"]
+    path = op["path"]
+    if kind in {"add", "replace"}:
+        if path == "":
+            return _copy_containers(op["value"])
+        if own is not None:
+            state = own(state)
+        resolved = _resolve_parent(state, path, own)
+        if resolved is not None:
+            parent, key = resolved
+            if isinstance(parent, dict) and (kind == "add" or key in parent):
+                parent[key] = _copy_containers(op["value"])
+                return state
+            if isinstance(parent, list):
+                if kind == "add" and key == "-":
+                    parent.append(_copy_containers(op["value"]))
+                    return state
+                if _ARRAY_INDEX_RE.fullmatch(key) and int(key) < len(parent) + (
+                    kind == "add"
+                ):
+                    if kind == "add":
+                        parent.insert(int(key), _copy_containers(op["value"]))
+                    else:
+                        parent[int(key)] = _copy_containers(op["value"])
+                    return state
+    if "value" in op:
+        op = {**op, "value": _copy_containers(op["value"])}
+    if own is not None:
+        state = _copy_containers(state)
+    return jsonpatch.apply_patch(state, [op], in_place=True)
+
+
+def _apply_ops_in_place(state: Any, ops: Iterable[dict[str, Any]]) -> Any:
+    for op in ops:
+        state = _apply_op_in_place(state, op)
+    return state
+
+
+def _apply_ops_copying(state: Any, ops: Iterable[dict[str, Any]]) -> Any:
+    """Apply ops to a copy of `state` that shares all untouched subtrees.
+
+    Only the containers on the paths of the ops are copied, each at most once, so
+    the cost depends on the ops and not on the size of the state.
+    """
+    owned: dict[int, Any] = {}
+
+    def own(value: Any) -> Any:
+        if id(value) in owned or not isinstance(value, (dict, list)):
+            return value
+        copy = dict(value) if isinstance(value, dict) else list(value)
+        owned[id(copy)] = copy
+        return copy
+
+    for op in ops:
+        state = _apply_op_in_place(state, op, own)
+    return state
+
+
+def _escape_pointer_part(key: str) -> str:
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def _diff_changed_subtrees(prev: Any, new: Any, path: str, ops: list) -> bool:
+    """Diff two successive outputs of a stream, descending only into changed dicts.
+
+    Mirrors the ops `jsonpatch.JsonPatch.from_diff` produces for dicts that gained
+    keys or changed values. Returns `False` when a key was removed or a list
+    changed, in which case the caller should fall back to `jsonpatch`.
+    """
+    if isinstance(prev, dict) and isinstance(new, dict):
+        if any(key not in new for key in prev):
+            return False
+        ops.extend(
+            {
+                "op": "add",
+                "path": f"{path}/{_escape_pointer_part(str(key))}",
+                "value": value,
+            }
+            for key, value in new.items()
+            if key not in prev
+        )
+        return all(
+            _diff_changed_subtrees(
+                value, new[key], f"{path}/{_escape_pointer_part(str(key))}", ops
+            )
+            for key, value in prev.items()
+        )
+    if isinstance(prev, list) and isinstance(new, list):
+        return prev == new
+    if type(prev) is not type(new) or prev != new:
+        ops.append({"op": "replace", "path": path, "value": new})
+    return True
+
+
+def _diff_final_output(prev: Any, new: Any) -> list[dict[str, Any]]:
+    ops: list[dict[str, Any]] = []
+    if _diff_changed_subtrees(prev, new, "", ops):
+        return ops
+    return list(jsonpatch.JsonPatch.from_diff(prev, new, dumps=dumps))
+
+
 class RunLogPatch:
     """Patch to the run log."""
 
@@ -124,7 +296,7 @@ class RunLogPatch:
         """
         if type(other) is RunLogPatch:
             ops = self.ops + other.ops
-            state = jsonpatch.apply_patch(None, copy.deepcopy(ops))
+            state = _apply_ops_in_place(None, ops)
             return RunLog(*ops, state=state)
 
         msg = f"unsupported operand type(s) for +: '{type(self)}' and '{type(other)}'"
@@ -148,6 +320,11 @@ class RunLog(RunLogPatch):
     state: RunState
     """Current state of the log, obtained from applying all ops in sequence."""
 
+    # Ops are kept as a chain of `(previous link, ops)` links, so that adding a
+    # patch does not copy the ops of the whole log. They are joined on access.
+    _op_chain: tuple[Any, list[dict[str, Any]]]
+    _ops: list[dict[str, Any]] | None
+
     def __init__(self, *ops: dict[str, Any], state: RunState) -> None:
         """Create a RunLog.
 
@@ -158,6 +335,29 @@ class RunLog(RunLogPatch):
         super().__init__(*ops)
         self.state = state
 
+    @property  # type: ignore[override]
+    def ops(self) -> list[dict[str, Any]]:
+        """List of JSONPatch operations that created the state from an empty dict."""
+        if self._ops is None:
+            chunks = []
+            link: tuple[Any, list[dict[str, Any]]] | None = self._op_chain
+            while link is not None:
+                link, chunk = link
+                chunks.append(chunk)
+            self.ops = [op for chunk in reversed(chunks) for op in chunk]
+        return self._ops  # type: ignore[return-value]
+
+    @ops.setter
+    def ops(self, ops: list[dict[str, Any]]) -> None:
+        self._ops = ops
+        self._op_chain = (None, ops)
+
+    def _with_patch(self, patch: RunLogPatch, state: RunState) -> RunLog:
+        log = RunLog(state=state)
+        log._ops = None
+        log._op_chain = (self._op_chain, list(patch.ops))
+        return log
+
     def __add__(self, other: RunLogPatch | Any) -> RunLog:
         """Combine two `RunLog`s.
 
@@ -171,13 +371,30 @@ class RunLog(RunLogPatch):
             A new `RunLog` representing the combination of the two.
         """
         if type(other) is RunLogPatch:
-            ops = self.ops + other.ops
-            state = jsonpatch.apply_patch(self.state, other.ops)
-            return RunLog(*ops, state=state)
+            return self._with_patch(other, _apply_ops_copying(self.state, other.ops))
 
         msg = f"unsupported operand type(s) for +: '{type(self)}' and '{type(other)}'"
         raise TypeError(msg)
 
+    def _apply_in_place(self, patch: RunLogPatch, *, record_ops: bool = True) -> None:
+        """Apply a patch to this log, mutating its state instead of copying it.
+
+        Unlike `+`, previously obtained references to the state observe the change.
+        The patch's ops are recorded only once it has been applied. Since logs
+        combined with `+` share untouched subtrees, only use this on a log whose
+        state was not combined with `+`.
+
+        Args:
+            patch: The patch to apply.
+            record_ops: Whether to append the patch's ops to `ops`. Consumers that
+                only read the state can skip this to avoid keeping every op alive.
+        """
+        self.state = _apply_ops_in_place(self.state, patch.ops)
+        if record_ops:
+            # Logs created by `+` may share the current links
+            self._op_chain = (self._op_chain, list(patch.ops))
+            self._ops = None
+
     @override
     def __repr__(self) -> str:
         return f"RunLog({pformat(self.state)})"
@@ -209,6 +426,9 @@ T = TypeVar("T")
 class LogStreamCallbackHandler(BaseTracer, _StreamingCallbackHandler):
     """Tracer that streams run logs to a stream."""
 
+    # Only serialize the payloads of runs that end up in the log
+    lazy_serialization = True
+
     def __init__(
         self,
         *,
@@ -403,6 +623,10 @@ class LogStreamCallbackHandler(BaseTracer, _StreamingCallbackHandler):
 
         return include
 
+    @override
+    def _reads_run_payloads(self, run: Run) -> bool:
+        return self.include_run(run)
+
     def _persist_run(self, run: Run) -> None:
         # This is a legacy method only called once for an entire run tree
         # therefore not useful here
@@ -721,9 +945,7 @@ async def _astream_log_implementation(
                     )
                 patches.extend(
                     {**op, "path": f"/final_output{op['path']}"}
-                    for op in jsonpatch.JsonPatch.from_diff(
-                        prev_final_output, final_output, dumps=dumps
-                    )
+                    for op in _diff_final_output(prev_final_output, final_output)
                 )
                 await stream.send_stream.send(RunLogPatch(*patches))
         finally:
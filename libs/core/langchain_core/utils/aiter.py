@@ -5,6 +5,7 @@ https://github.com/maxfischer2781/asyncstdlib/blob/master/asyncstdlib/itertools.
 MIT License.
 """
 
+import asyncio
 from collections import deque
 from collections.abc import (
     AsyncGenerator,
@@ -12,9 +13,12 @@ from collections.abc import (
     AsyncIterator,
     Awaitable,
     Callable,
+    Iterable,
     Iterator,
 )
 from contextlib import AbstractAsyncContextManager
+from contextvars import copy_context
+from itertools import islice
 from types import TracebackType
 from typing import (
     Any,
@@ -338,3 +342,82 @@ async def abatch_iterate(
 
     if batch:
         yield batch
+
+
+async def aiterate_in_thread(
+    iterable_factory: Callable[[], Iterable[T]],
+    *,
+    chunk_size: int = 64,
+    max_chunks: int = 2,
+) -> AsyncIterator[T]:
+    """Iterate a blocking iterable in the default executor, reading ahead in chunks.
+
+    Each chunk of `chunk_size` items is read in one hop to the default executor,
+    instead of one hop per item. Reading overlaps with consumption, and at most
+    `max_chunks` chunks are buffered. No executor thread is held between chunks,
+    so a slow consumer never parks a worker that other tasks may need.
+
+    Errors raised while iterating are re-raised in the consumer. If the consumer
+    stops early, reading stops after the chunk in progress and the iterator is
+    closed in the executor.
+
+    Args:
+        iterable_factory: Function returning the iterable, called in the executor.
+        chunk_size: Number of items handed over at a time.
+        max_chunks: Maximum number of chunks read ahead of the consumer.
+
+    Yields:
+        The items of the iterable.
+
+    Raises:
+        ValueError: If `chunk_size` or `max_chunks` is less than 1.
+    """
+    if chunk_size < 1 or max_chunks < 1:
+        msg = "chunk_size and max_chunks must be at least 1"
+        raise ValueError(msg)
+    loop = asyncio.get_running_loop()
+    context = copy_context()
+    # Chunks, then None when exhausted, or the error raised by the iterable
+    queue: asyncio.Queue[list[T] | BaseException | None] = asyncio.Queue()
+    slots = asyncio.Semaphore(max_chunks)
+    stopped = False
+
+    async def run(func: Callable[..., Any], *args: Any) -> Any:
+        # Hops run one at a time, so they can share the copied context
+        return await loop.run_in_executor(None, context.run, func, *args)
+
+    async def produce() -> None:
+        iterator: Iterator[T] | None = None
+        try:
+            iterator = await run(lambda: iter(iterable_factory()))
+            while True:
+                await slots.acquire()
+                if stopped:
+                    return
+                chunk = await run(lambda: list(islice(iterator, chunk_size)))
+                if not chunk:
+                    break
+                queue.put_nowait(chunk)
+        except Exception as e:
+            queue.put_nowait(e)
+            return
+        finally:
+            if hasattr(iterator, "close"):
+                await run(iterator.close)  # type: ignore[union-attr]
+        queue.put_nowait(None)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            slots.release()
+            for element in item:
+                yield element
+    finally:
+        stopped = True
+        slots.release()
+        await producer
@@ -1,13 +1,87 @@
 """Utilities for formatting strings."""
 
 from collections.abc import Mapping, Sequence
+from functools import lru_cache
 from string import Formatter
 from typing import Any
 
+# (literal text, field name, conversion, format spec); field name is None for the
+# trailing literal
+_Segment = tuple[str, str | None, str | None, str]
+
+_CONVERTERS = {"r": repr, "s": str, "a": ascii}
+
+
+@lru_cache(maxsize=512)
+def _compile_format_string(format_string: str) -> tuple[_Segment, ...] | None:
+    """Parse a format string into segments that can be rendered without re-parsing.
+
+    Returns `None` if the format string uses anything other than plain keyword
+    fields (positional fields, attribute access, indexing, nested fields or
+    invalid syntax), in which case it should be handled by `Formatter` itself.
+    """
+    segments: list[_Segment] = []
+    try:
+        parsed = list(Formatter().parse(format_string))
+    except ValueError:
+        return None
+    for literal, field_name, format_spec, conversion in parsed:
+        if field_name is None:
+            segments.append((literal, None, None, ""))
+            continue
+        if (
+            not field_name
+            or field_name.isdecimal()
+            or "." in field_name
+            or "[" in field_name
+            or "{" in (format_spec or "")
+            or (conversion is not None and conversion not in _CONVERTERS)
+        ):
+            return None
+        segments.append((literal, field_name, conversion, format_spec or ""))
+    return tuple(segments)
+
 
 class StrictFormatter(Formatter):
     """Formatter that checks for extra keys."""
 
+    def format(self, format_string: str, /, *args: Any, **kwargs: Any) -> str:
+        """Format a string with keyword arguments.
+
+        Format strings are parsed once and cached, so repeated formatting of the
+        same template only substitutes the fields.
+
+        Args:
+            format_string: The format string.
+            *args: Positional arguments, which are not allowed.
+            **kwargs: The keyword arguments.
+
+        Returns:
+            The formatted string.
+        """
+        segments = (
+            None
+            if args or type(self) is not StrictFormatter
+            else _compile_format_string(format_string)
+        )
+        if segments is None:
+            return super().format(format_string, *args, **kwargs)
+        parts: list[str] = []
+        for literal, field_name, conversion, format_spec in segments:
+            if literal:
+                parts.append(literal)
+            if field_name is None:
+                continue
+            value = kwargs[field_name]
+            if conversion is not None:
+                value = _CONVERTERS[conversion](value)
+            parts.append(
+                value
+                if not format_spec and type(value) is str
+                else format(value, format_spec)
+            )
+        return "".join(parts)
+
     def vformat(
         self, format_string: str, args: Sequence, kwargs: Mapping[str, Any]
     ) -> str:
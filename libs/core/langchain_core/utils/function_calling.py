@@ -8,6 +8,7 @@ import logging
 import types
 import typing
 import uuid
+import weakref
 from collections.abc import Mapping
 from typing import (
     TYPE_CHECKING,
@@ -358,6 +359,79 @@ def convert_to_openai_function(
         `description` and `parameters` keys are now optional. Only `name` is
         required and guaranteed to be part of the output.
     """
+    if isinstance(function, langchain_core.tools.base.BaseTool):
+        return _copy_json(
+            _convert_tool_to_openai_function_cached(function, strict=strict)
+        )
+    return _convert_to_openai_function(function, strict=strict)
+
+
+# id(tool) -> (weakref to tool, {strict: (snapshot of tool fields, function)})
+_TOOL_FUNCTIONS: dict[
+    int,
+    tuple[weakref.ref[Any], dict[bool | None, tuple[tuple[Any, ...], dict[str, Any]]]],
+] = {}
+
+
+def _drop_tool(key: int, ref: weakref.ref[Any]) -> None:
+    entry = _TOOL_FUNCTIONS.get(key)
+    if entry is not None and entry[0] is ref:
+        del _TOOL_FUNCTIONS[key]
+
+
+def _convert_tool_to_openai_function_cached(
+    tool: BaseTool, *, strict: bool | None
+) -> dict[str, Any]:
+    """Convert a tool, reusing the result of a previous conversion if still valid.
+
+    Agents bind the same tools to a model on every step, and building the schema of
+    a tool means generating a pydantic JSON schema. Results are memoized per tool
+    and `strict` value, and are reused only while every field of the tool is still
+    the same object, so assigning a new `name`, `description`, `args_schema`, etc.
+    invalidates them. Mutating a dict `args_schema` in place is not detected.
+
+    The returned dict is shared and must not be mutated.
+    """
+    tool_id = id(tool)
+    # The snapshot holds references to the field values, so their ids stay valid
+    snapshot = tuple(map(tool.__dict__.get, type(tool).model_fields))
+    entry = _TOOL_FUNCTIONS.get(tool_id)
+    if entry is not None and entry[0]() is tool:
+        cached = entry[1].get(strict)
+        if (
+            cached is not None
+            and len(cached[0]) == len(snapshot)
+            and all(a is b for a, b in zip(cached[0], snapshot, strict=True))
+        ):
+            return cached[1]
+    else:
+        entry = None
+    oai_function = _convert_to_openai_function(tool, strict=strict)
+    if entry is None:
+        try:
+            ref = weakref.ref(tool, lambda r: _drop_tool(tool_id, r))
+        except TypeError:
+            return oai_function
+        entry = (ref, {})
+        _TOOL_FUNCTIONS[tool_id] = entry
+    entry[1][strict] = (snapshot, oai_function)
+    return oai_function
+
+
+def _copy_json(obj: Any) -> Any:
+    """Copy the dicts and lists of a JSON-like object, sharing everything else."""
+    if isinstance(obj, dict):
+        return {k: _copy_json(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_copy_json(v) for v in obj]
+    return obj
+
+
+def _convert_to_openai_function(
+    function: Mapping[str, Any] | type | Callable | BaseTool,
+    *,
+    strict: bool | None = None,
+) -> dict[str, Any]:
     # an Anthropic format tool
     if isinstance(function, dict) and all(
         k in function for k in ("name", "input_schema")
@@ -129,6 +129,152 @@ def parse_partial_json(s: str, *, strict: bool = False) -> Any:
     return json.loads(s, strict=strict)
 
 
+_string_special_re = re.compile(r'["\\\n]')
+
+
+class PartialJsonParser:
+    """Incremental version of `parse_partial_json` for streamed JSON.
+
+    Text is fed in chunks with `feed`. Only the new characters are scanned on each
+    call, and the bracket stack and string state are kept between calls, so
+    following a stream no longer re-scans the whole accumulated string per chunk.
+
+    `parse` returns the same value `parse_partial_json` would return for all the
+    text fed so far. It still hands the whole repaired text to `json.loads`, so each
+    call is linear in the text size, but that work happens in C.
+
+    Example:
+        ```python
+        parser = PartialJsonParser()
+        for chunk in ['{"name": "Jo', 'hn", "tags": ["a"']:
+            parser.feed(chunk)
+            print(parser.parse())
+        # {'name': 'Jo'}
+        # {'name': 'John', 'tags': ['a']}
+        ```
+    """
+
+    def __init__(self, *, strict: bool = False) -> None:
+        """Initialize the parser.
+
+        Args:
+            strict: Whether to use strict parsing.
+        """
+        self.strict = strict
+        self.text = ""
+        """The text fed so far."""
+        # Repaired text, and the elements it is made of. Contents of a string between
+        # special characters are kept as a single element, the rest is one element
+        # per character. Elements are only used to drop a trailing part of the
+        # repaired text when it does not parse.
+        self._repaired = ""
+        self._chars: list[str] = []
+        self._stack: list[str] = []
+        self._is_inside_string = False
+        self._escaped = False
+        self._malformed = False
+
+    def feed(self, chunk: str) -> None:
+        """Consume the next chunk of text.
+
+        Args:
+            chunk: The text to append.
+        """
+        self.text += chunk
+        if self._malformed:
+            return
+        chars = self._chars
+        start = len(chars)
+        stack = self._stack
+        i = 0
+        n = len(chunk)
+        while i < n:
+            if self._is_inside_string:
+                if not self._escaped:
+                    match = _string_special_re.search(chunk, i)
+                    end = n if match is None else match.start()
+                    if end > i:
+                        chars.append(chunk[i:end])
+                        i = end
+                        continue
+                char = chunk[i]
+                if char == '"' and not self._escaped:
+                    self._is_inside_string = False
+                elif char == "\n" and not self._escaped:
+                    # Replace the newline character with the escape sequence.
+                    char = "\\n"
+                elif char == "\\":
+                    self._escaped = not self._escaped
+                else:
+                    self._escaped = False
+            else:
+                char = chunk[i]
+                if char == '"':
+                    self._is_inside_string = True
+                    self._escaped = False
+                elif char == "{":
+                    stack.append("}")
+                elif char == "[":
+                    stack.append("]")
+                elif char in {"}", "]"}:
+                    if stack and stack[-1] == char:
+                        stack.pop()
+                    else:
+                        # Mismatched closing character; the input is malformed.
+                        self._malformed = True
+                        return
+            chars.append(char)
+            i += 1
+        self._repaired += "".join(chars[start:])
+
+    def parse(self) -> Any:
+        """Parse the text fed so far.
+
+        Returns:
+            The parsed JSON object, or `None` if the text is malformed.
+
+        Raises:
+            json.JSONDecodeError: If no prefix of the text can be parsed.
+        """
+        if self._malformed:
+            return None
+        chars = self._chars
+        repaired = self._repaired
+        count = len(chars)
+        end = len(repaired)
+        closing = "".join(reversed(self._stack))
+        if self._is_inside_string:
+            if self._escaped:  # Remove unterminated escape character
+                count -= 1
+                end -= len(chars[count])
+            try:
+                return json.loads(repaired[:end] + '"' + closing, strict=self.strict)
+            except json.JSONDecodeError:
+                pass
+        while count:
+            try:
+                return json.loads(repaired[:end] + closing, strict=self.strict)
+            except json.JSONDecodeError:
+                # Remove the last element and try again
+                count -= 1
+                end -= len(chars[count])
+        return json.loads(self.text, strict=self.strict)
+
+
+def _feed_partial_json(
+    parser: PartialJsonParser | None, s: str, *, strict: bool = False
+) -> PartialJsonParser:
+    """Get a parser that has consumed `s`, e.g. the streamed args of a tool call.
+
+    `parser` is reused, and only the remainder of `s` scanned, if the text it has
+    consumed is a prefix of `s`. Otherwise a new parser is created.
+    """
+    if parser is None or parser.strict != strict or not s.startswith(parser.text):
+        parser = PartialJsonParser(strict=strict)
+    parser.feed(s[len(parser.text) :])
+    return parser
+
+
 _json_markdown_re = re.compile(r"```(json)?(.*)", re.DOTALL)
 
 
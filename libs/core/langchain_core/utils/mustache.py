@@ -6,6 +6,8 @@ MIT License.
 from __future__ import annotations
 
 import logging
+import threading
+from collections import OrderedDict
 from collections.abc import Iterator, Mapping, Sequence
 from types import MappingProxyType
 from typing import (
@@ -440,7 +442,27 @@ def _get_partial(name: str, partials_dict: Mapping[str, str]) -> str:
 #
 # The main rendering function
 #
-g_token_cache: dict[str, list[tuple[str, str]]] = {}
+# Bounded LRU of tokenized templates, keyed by template text
+_TOKEN_CACHE_MAXSIZE = 256
+g_token_cache: OrderedDict[str, list[tuple[str, str]]] = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+
+def _get_cached_tokens(template: str) -> list[tuple[str, str]] | None:
+    with _token_cache_lock:
+        tokens = g_token_cache.get(template)
+        if tokens is not None:
+            g_token_cache.move_to_end(template)
+        return tokens
+
+
+def _cache_tokens(template: str, tokens: list[tuple[str, str]]) -> None:
+    with _token_cache_lock:
+        g_token_cache[template] = tokens
+        g_token_cache.move_to_end(template)
+        while len(g_token_cache) > _TOKEN_CACHE_MAXSIZE:
+            g_token_cache.popitem(last=False)
+
 
 EMPTY_DICT: MappingProxyType[str, str] = MappingProxyType({})
 
@@ -490,8 +512,13 @@ def render(
         # Then we don't need to tokenize it
         # But it does need to be a generator
         tokens: Iterator[tuple[str, str]] = (token for token in template)
-    elif template in g_token_cache:
-        tokens = (token for token in g_token_cache[template])
+    elif (cached := _get_cached_tokens(template)) is not None:
+        tokens = iter(cached)
+    elif def_ldel == "{{" and def_rdel == "}}":
+        # Tokenize once and reuse the tokens for later renders of this template
+        token_list = list(tokenize(template, def_ldel, def_rdel))
+        _cache_tokens(template, token_list)
+        tokens = iter(token_list)
     else:
         # Otherwise make a generator
         tokens = tokenize(template, def_ldel, def_rdel)
@@ -587,7 +614,7 @@ def render(
                             def_rdel,
                         )
 
-                g_token_cache[text] = tags
+                _cache_tokens(text, tags)
 
                 rend = scope(
                     text,
@@ -602,6 +602,48 @@ class VectorStore(ABC):
                 )
         return docs_and_similarities
 
+    def similarity_search_with_vectors(
+        self, query: str, k: int = 4, **kwargs: Any
+    ) -> list[tuple[Document, list[float]]]:
+        """Return docs most similar to query together with their stored vectors.
+
+        Lets callers that need the document embeddings (e.g. embedding-based
+        filters) reuse the stored vectors instead of embedding the documents again.
+
+        Args:
+            query: Input text.
+            k: Number of `Document` objects to return.
+            **kwargs: Arguments to pass to the search method.
+
+        Returns:
+            List of tuples of `(doc, embedding)`.
+
+        Raises:
+            NotImplementedError: If the vector store does not return stored vectors.
+        """
+        msg = f"{self.__class__.__name__} does not return stored vectors."
+        raise NotImplementedError(msg)
+
+    async def asimilarity_search_with_vectors(
+        self, query: str, k: int = 4, **kwargs: Any
+    ) -> list[tuple[Document, list[float]]]:
+        """Async return docs most similar to query together with their stored vectors.
+
+        Args:
+            query: Input text.
+            k: Number of `Document` objects to return.
+            **kwargs: Arguments to pass to the search method.
+
+        Returns:
+            List of tuples of `(doc, embedding)`.
+
+        Raises:
+            NotImplementedError: If the vector store does not return stored vectors.
+        """
+        return await run_in_executor(
+            None, self.similarity_search_with_vectors, query, k=k, **kwargs
+        )
+
     async def asimilarity_search(
         self, query: str, k: int = 4, **kwargs: Any
     ) -> list[Document]:
@@ -969,6 +1011,15 @@ class VectorStoreRetriever(BaseRetriever):
     """Type of search to perform."""
     search_kwargs: dict = Field(default_factory=dict)
     """Keyword arguments to pass to the search function."""
+    vector_metadata_key: str | None = None
+    """If set, `'similarity'` search adds each document's stored embedding to
+    (a copy of) its metadata under this key, so downstream components such as
+    embedding-based filters need not embed the documents again.
+
+    Only used with vector stores implementing `similarity_search_with_vectors`;
+    other stores are searched as usual. The vector stays in the metadata until a
+    component consuming it, such as `EmbeddingsFilter`, removes it.
+    """
     allowed_search_types: ClassVar[Collection[str]] = (
         "similarity",
         "similarity_score_threshold",
@@ -1036,7 +1087,16 @@ class VectorStoreRetriever(BaseRetriever):
         self, query: str, *, run_manager: CallbackManagerForRetrieverRun, **kwargs: Any
     ) -> list[Document]:
         kwargs_ = self.search_kwargs | kwargs
-        if self.search_type == "similarity":
+        if self.search_type == "similarity" and self.vector_metadata_key:
+            try:
+                docs_and_vectors = self.vectorstore.similarity_search_with_vectors(
+                    query, **kwargs_
+                )
+            except NotImplementedError:
+                docs = self.vectorstore.similarity_search(query, **kwargs_)
+            else:
+                docs = self._with_vectors(docs_and_vectors, self.vector_metadata_key)
+        elif self.search_type == "similarity":
             docs = self.vectorstore.similarity_search(query, **kwargs_)
         elif self.search_type == "similarity_score_threshold":
             docs_and_similarities = (
@@ -1061,7 +1121,18 @@ class VectorStoreRetriever(BaseRetriever):
         **kwargs: Any,
     ) -> list[Document]:
         kwargs_ = self.search_kwargs | kwargs
-        if self.search_type == "similarity":
+        if self.search_type == "similarity" and self.vector_metadata_key:
+            try:
+                docs_and_vectors = (
+                    await self.vectorstore.asimilarity_search_with_vectors(
+                        query, **kwargs_
+                    )
+                )
+            except NotImplementedError:
+                docs = await self.vectorstore.asimilarity_search(query, **kwargs_)
+            else:
+                docs = self._with_vectors(docs_and_vectors, self.vector_metadata_key)
+        elif self.search_type == "similarity":
             docs = await self.vectorstore.asimilarity_search(query, **kwargs_)
         elif self.search_type == "similarity_score_threshold":
             docs_and_similarities = (
@@ -1079,6 +1150,15 @@ class VectorStoreRetriever(BaseRetriever):
             raise ValueError(msg)
         return docs
 
+    @staticmethod
+    def _with_vectors(
+        docs_and_vectors: list[tuple[Document, list[float]]], key: str
+    ) -> list[Document]:
+        return [
+            doc.model_copy(update={"metadata": {**doc.metadata, key: vector}})
+            for doc, vector in docs_and_vectors
+        ]
+
     def add_documents(self, documents: list[Document], **kwargs: Any) -> list[str]:
         """Add documents to the `VectorStore`.
 
@@ -379,6 +379,30 @@ class InMemoryVectorStore(VectorStore):
             **kwargs,
         )
 
+    @override
+    def similarity_search_with_vectors(
+        self, query: str, k: int = 4, **kwargs: Any
+    ) -> list[tuple[Document, list[float]]]:
+        embedding = self.embedding.embed_query(query)
+        return [
+            (doc, list(vector))
+            for doc, _, vector in self._similarity_search_with_score_by_vector(
+                embedding, k, filter=kwargs.get("filter")
+            )
+        ]
+
+    @override
+    async def asimilarity_search_with_vectors(
+        self, query: str, k: int = 4, **kwargs: Any
+    ) -> list[tuple[Document, list[float]]]:
+        embedding = await self.embedding.aembed_query(query)
+        return [
+            (doc, list(vector))
+            for doc, _, vector in self._similarity_search_with_score_by_vector(
+                embedding, k, filter=kwargs.get("filter")
+            )
+        ]
+
     @override
     def similarity_search_by_vector(
         self,
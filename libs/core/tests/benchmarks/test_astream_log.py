@@ -0,0 +1,38 @@
+import asyncio
+from itertools import cycle
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.output_parsers import StrOutputParser
+
+# GenericFakeChatModel streams one chunk per whitespace-separated token
+_LONG_ANSWER = AIMessage(content=" ".join(["token"] * 1_000))
+
+
+@pytest.mark.benchmark
+def test_astream_log_long_token_stream(benchmark: BenchmarkFixture) -> None:
+    chain = GenericFakeChatModel(messages=cycle([_LONG_ANSWER])) | StrOutputParser()
+
+    async def stream() -> None:
+        async for _ in chain.astream_log("meow"):
+            pass
+
+    @benchmark  # type: ignore[misc]
+    def run() -> None:
+        asyncio.run(stream())
+
+
+@pytest.mark.benchmark
+def test_astream_events_v1_long_token_stream(benchmark: BenchmarkFixture) -> None:
+    chain = GenericFakeChatModel(messages=cycle([_LONG_ANSWER])) | StrOutputParser()
+
+    async def stream() -> None:
+        async for _ in chain.astream_events("meow", version="v1"):
+            pass
+
+    @benchmark  # type: ignore[misc]
+    def run() -> None:
+        asyncio.run(stream())
@@ -0,0 +1,51 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from typing_extensions import override
+
+from langchain_core.document_loaders import BaseLoader
+from langchain_core.documents import Document
+from langchain_core.runnables import run_in_executor
+
+_N_DOCUMENTS = 20_000
+
+
+class _ReviewLoader(BaseLoader):
+    """Parses small review records, like a JSON lines file of reviews."""
+
+    @override
+    def lazy_load(self) -> Iterator[Document]:
+        for i in range(_N_DOCUMENTS):
+            record = {"review_id": str(i), "review": f"review {i} " * 8}
+            yield Document(
+                page_content=record["review"], metadata={"id": record["review_id"]}
+            )
+
+
+class _PerDocumentHopLoader(_ReviewLoader):
+    """The previous default: one executor hop per document."""
+
+    @override
+    async def alazy_load(self) -> AsyncIterator[Document]:
+        iterator = await run_in_executor(None, self.lazy_load)
+        done = object()
+        while True:
+            doc = await run_in_executor(None, next, iterator, done)
+            if doc is done:
+                break
+            yield doc  # type: ignore[misc]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("loader_cls", [_PerDocumentHopLoader, _ReviewLoader])
+def test_alazy_load_throughput(
+    benchmark: BenchmarkFixture, loader_cls: type[_ReviewLoader]
+) -> None:
+    loader = loader_cls()
+
+    @benchmark  # type: ignore[misc]
+    def aload() -> None:
+        docs = asyncio.run(loader.aload())
+        assert len(docs) == _N_DOCUMENTS
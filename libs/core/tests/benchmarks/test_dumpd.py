@@ -0,0 +1,43 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from langchain_core.documents import Document
+from langchain_core.load import dumpd
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+
+
+def _history(n: int) -> list[BaseMessage]:
+    messages: list[BaseMessage] = []
+    for i in range(n // 3):
+        messages.append(HumanMessage(content=f"question {i} " + "lorem " * 50))
+        messages.append(
+            AIMessage(
+                content="",
+                tool_calls=[{"name": "search", "args": {"q": str(i)}, "id": f"c{i}"}],
+            )
+        )
+        messages.append(ToolMessage(content="result " * 30, tool_call_id=f"c{i}"))
+    return messages
+
+
+@pytest.mark.benchmark
+def test_dumpd_messages(benchmark: BenchmarkFixture) -> None:
+    messages = _history(150)
+
+    @benchmark  # type: ignore[misc]
+    def dump() -> None:
+        for _ in range(10):
+            dumpd(messages)
+
+
+@pytest.mark.benchmark
+def test_dumpd_documents(benchmark: BenchmarkFixture) -> None:
+    documents = [
+        Document(page_content="text " * 100, metadata={"source": f"s{i}", "page": i})
+        for i in range(200)
+    ]
+
+    @benchmark  # type: ignore[misc]
+    def dump() -> None:
+        for _ in range(10):
+            dumpd(documents)
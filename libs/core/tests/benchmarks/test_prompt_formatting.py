@@ -0,0 +1,57 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from langchain_core.prompts import (
+    ChatPromptTemplate,
+    MessagesPlaceholder,
+    PromptTemplate,
+)
+
+# A multi-KB retrieved context, as rendered into a RAG prompt on every request
+_CONTEXT = "lorem ipsum dolor sit amet " * 400
+
+
+@pytest.mark.benchmark
+def test_prompt_template_format_rag(benchmark: BenchmarkFixture) -> None:
+    prompt = PromptTemplate.from_template(
+        "[SYSTEM]\n" + "Answer only from the context. " * 20 + "\n\n"
+        "[HISTORY]\n{history}\n\n[CONTEXT]\n{context}\n\n[USER]\n{question}\n\n"
+        "[ASSISTANT]\n"
+    )
+
+    @benchmark  # type: ignore[misc]
+    def render() -> None:
+        for _ in range(1_000):
+            prompt.format(history="", context=_CONTEXT, question="What is it?")
+
+
+@pytest.mark.benchmark
+def test_prompt_template_format_mustache(benchmark: BenchmarkFixture) -> None:
+    prompt = PromptTemplate.from_template(
+        "{{#docs}}- {{title}}: {{body}}\n{{/docs}}\n" + "Rules. " * 100 + "{{q}}",
+        template_format="mustache",
+    )
+    docs = [{"title": f"doc {i}", "body": "text " * 20} for i in range(5)]
+
+    @benchmark  # type: ignore[misc]
+    def render() -> None:
+        for _ in range(1_000):
+            prompt.format(docs=docs, q="What is it?")
+
+
+@pytest.mark.benchmark
+def test_chat_prompt_template_format_messages(benchmark: BenchmarkFixture) -> None:
+    prompt = ChatPromptTemplate(
+        [
+            ("system", "You are a helpful assistant. " * 20),
+            ("human", "Example question"),
+            ("ai", "Example answer"),
+            MessagesPlaceholder("history"),
+            ("human", "Context:\n{context}\n\nQuestion: {question}"),
+        ]
+    )
+
+    @benchmark  # type: ignore[misc]
+    def render() -> None:
+        for _ in range(1_000):
+            prompt.format_messages(history=[], context=_CONTEXT, question="Why?")
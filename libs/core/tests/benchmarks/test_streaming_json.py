@@ -0,0 +1,59 @@
+import json
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from langchain_core.messages import AIMessageChunk
+from langchain_core.output_parsers import JsonOutputParser
+
+# ~50 KB of tool call arguments, streamed in small chunks
+_ARGUMENTS = json.dumps(
+    {
+        "path": "src/main.py",
+        "content": "def handler(event):\n    return {'status': 200}\n" * 1_050,
+    }
+)
+_CHUNK_SIZE = 64
+_CHUNKS = [
+    _ARGUMENTS[i : i + _CHUNK_SIZE] for i in range(0, len(_ARGUMENTS), _CHUNK_SIZE)
+]
+
+
+@pytest.mark.benchmark
+def test_stream_tool_call_chunks_50kb(benchmark: BenchmarkFixture) -> None:
+    @benchmark  # type: ignore[misc]
+    def stream() -> None:
+        message = AIMessageChunk(
+            content="",
+            tool_call_chunks=[
+                {"name": "write_file", "args": "", "id": "call_1", "index": 0}
+            ],
+        )
+        for chunk in _CHUNKS:
+            message += AIMessageChunk(
+                content="",
+                tool_call_chunks=[
+                    {"name": None, "args": chunk, "id": None, "index": 0}
+                ],
+            )
+        assert message.tool_calls[0]["args"] == json.loads(_ARGUMENTS)
+
+
+@pytest.mark.benchmark
+def test_json_output_parser_stream_50kb(benchmark: BenchmarkFixture) -> None:
+    parser = JsonOutputParser()
+
+    @benchmark  # type: ignore[misc]
+    def stream() -> None:
+        for _ in parser.transform(iter(_CHUNKS)):
+            pass
+
+
+@pytest.mark.benchmark
+def test_json_output_parser_stream_diff_50kb(benchmark: BenchmarkFixture) -> None:
+    parser = JsonOutputParser(diff=True)
+
+    @benchmark  # type: ignore[misc]
+    def stream() -> None:
+        for _ in parser.transform(iter(_CHUNKS)):
+            pass
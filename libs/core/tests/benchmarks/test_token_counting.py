@@ -0,0 +1,86 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from langchain_core.language_models import FakeListChatModel
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+from langchain_core.messages.utils import count_tokens_approximately, trim_messages
+
+
+def _tool_heavy_history(n: int) -> list[BaseMessage]:
+    messages: list[BaseMessage] = [SystemMessage(content="You are a helpful agent.")]
+    while len(messages) < n:
+        i = len(messages)
+        messages.append(
+            HumanMessage(
+                content=[{"type": "text", "text": f"Question {i}: " + "lorem " * 20}]
+            )
+        )
+        messages.append(
+            AIMessage(
+                content="",
+                tool_calls=[
+                    {
+                        "name": "search",
+                        "args": {"query": f"query {i}", "filters": {"k": 10}},
+                        "id": f"call_{i}_{j}",
+                    }
+                    for j in range(3)
+                ],
+            )
+        )
+        messages.extend(
+            ToolMessage(
+                content=[{"type": "text", "text": "result " * 50}],
+                tool_call_id=f"call_{i}_{j}",
+            )
+            for j in range(3)
+        )
+    return messages[:n]
+
+
+@pytest.mark.benchmark
+def test_count_tokens_approximately_500_messages(benchmark: BenchmarkFixture) -> None:
+    messages = _tool_heavy_history(500)
+
+    @benchmark  # type: ignore[misc]
+    def count() -> None:
+        for _ in range(10):
+            count_tokens_approximately(messages)
+
+
+@pytest.mark.benchmark
+def test_trim_messages_500_messages(benchmark: BenchmarkFixture) -> None:
+    messages = _tool_heavy_history(500)
+
+    @benchmark  # type: ignore[misc]
+    def trim() -> None:
+        trim_messages(
+            messages,
+            max_tokens=2_000,
+            token_counter=count_tokens_approximately,
+            strategy="last",
+            start_on="human",
+            include_system=True,
+        )
+
+
+def _char_token_ids(text: str) -> list[int]:
+    # Stand-in for a real tokenizer, with a per-character cost
+    return [ord(char) for char in text]
+
+
+@pytest.mark.benchmark
+def test_get_num_tokens_from_messages_500_messages(benchmark: BenchmarkFixture) -> None:
+    messages = _tool_heavy_history(500)
+    model = FakeListChatModel(responses=[], custom_get_token_ids=_char_token_ids)
+
+    @benchmark  # type: ignore[misc]
+    def count() -> None:
+        for _ in range(10):
+            model.get_num_tokens_from_messages(messages)
@@ -0,0 +1,66 @@
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import pytest
+from pydantic import BaseModel, Field
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from langchain_core.language_models import GenericFakeChatModel, LanguageModelInput
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import Runnable
+from langchain_core.tools import BaseTool, StructuredTool
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+
+class _SearchArgs(BaseModel):
+    query: str = Field(description="The search query.")
+    limit: int = Field(default=10, description="Maximum number of results.")
+    tags: list[str] = Field(default_factory=list, description="Tags to filter by.")
+    since: str | None = Field(default=None, description="ISO date lower bound.")
+
+
+def _make_tools(n: int) -> list[BaseTool]:
+    return [
+        StructuredTool.from_function(
+            func=lambda **kwargs: str(kwargs),
+            name=f"search_{i}",
+            description=f"Search collection number {i}.",
+            args_schema=_SearchArgs,
+        )
+        for i in range(n)
+    ]
+
+
+class _ToolCallingFakeChatModel(GenericFakeChatModel):
+    """Fake chat model that converts tools on `bind_tools` like provider models."""
+
+    def bind_tools(
+        self,
+        tools: Sequence[dict[str, Any] | type | Callable | BaseTool],
+        **kwargs: Any,
+    ) -> Runnable[LanguageModelInput, AIMessage]:
+        formatted = [convert_to_openai_tool(t) for t in tools]
+        return self.bind(tools=formatted, **kwargs)
+
+
+@pytest.mark.benchmark
+def test_convert_30_tools_20_steps(benchmark: BenchmarkFixture) -> None:
+    tools = _make_tools(30)
+
+    @benchmark  # type: ignore[misc]
+    def convert() -> None:
+        for _ in range(20):
+            for t in tools:
+                convert_to_openai_tool(t, strict=True)
+
+
+@pytest.mark.benchmark
+def test_agent_steps_bind_tools(benchmark: BenchmarkFixture) -> None:
+    # Per-step overhead of an agent loop that binds 30 tools before every call
+    tools = _make_tools(30)
+    model = _ToolCallingFakeChatModel(messages=iter(()))
+
+    @benchmark  # type: ignore[misc]
+    def run_steps() -> None:
+        for _ in range(20):
+            model.bind_tools(tools, tool_choice="auto")
@@ -0,0 +1,43 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.tracers.base import BaseTracer
+from langchain_core.tracers.schemas import Run
+
+
+class _EagerTracer(BaseTracer):
+    def __init__(self) -> None:
+        super().__init__(_schema_format="original+chat")
+
+    def _persist_run(self, run: Run) -> None:
+        pass
+
+
+class _LazyTracer(_EagerTracer):
+    lazy_serialization = True
+
+
+def _history(n: int) -> list[BaseMessage]:
+    return [
+        HumanMessage(content=f"question {i} " + "lorem " * 50)
+        if i % 2 == 0
+        else AIMessage(content=f"answer {i} " + "ipsum " * 50)
+        for i in range(n)
+    ]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("tracer_cls", [_EagerTracer, _LazyTracer])
+def test_chat_model_invoke_traced_50_messages(
+    benchmark: BenchmarkFixture, tracer_cls: type[BaseTracer]
+) -> None:
+    messages = _history(50)
+    model = GenericFakeChatModel(messages=iter([]))
+
+    @benchmark  # type: ignore[misc]
+    def invoke() -> None:
+        model.messages = iter([AIMessage(content="done")] * 20)
+        for _ in range(20):
+            model.invoke(messages, config={"callbacks": [tracer_cls()]})
@@ -0,0 +1,126 @@
+import json
+import math
+from enum import Enum, IntEnum
+from typing import Any
+
+import pytest
+from pydantic import BaseModel, SecretStr
+
+from langchain_core.documents import Document
+from langchain_core.load import Serializable, dumpd, dumps
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+from langchain_core.outputs import ChatGeneration, Generation, LLMResult
+from langchain_core.prompts import ChatPromptTemplate, PromptTemplate
+from langchain_core.runnables import RunnableLambda
+
+
+class _Color(str, Enum):
+    RED = "red"
+
+    def __str__(self) -> str:
+        return "Color.RED"
+
+
+class _Level(IntEnum):
+    HIGH = 3
+
+
+class _Parsed(BaseModel):
+    answer: str
+
+
+class _WithSecret(Serializable):
+    api_key: SecretStr
+    name: str = "x"
+
+    @classmethod
+    def is_lc_serializable(cls) -> bool:
+        return True
+
+    @property
+    def lc_secrets(self) -> dict[str, str]:
+        return {"api_key": "MY_API_KEY"}
+
+
+class _Unserializable:
+    def __repr__(self) -> str:
+        return "<unserializable>"
+
+
+def _golden(obj: Any) -> Any:
+    return json.loads(dumps(obj))
+
+
+_CASES: list[Any] = [
+    None,
+    "text",
+    1,
+    1.5,
+    True,
+    [1, (2, 3), {"a": None}],
+    {1: "int key", 2.5: "float key", False: "bool", None: "none", "s": "str"},
+    {"nan": math.inf, "neg": -math.inf},
+    {_Color.RED: _Color.RED, "level": _Level.HIGH},
+    HumanMessage(content="hi", name="bob", id="1"),
+    HumanMessage(content=[{"type": "text", "text": "hi"}, {"type": "image_url"}]),
+    SystemMessage(content="be nice", additional_kwargs={"k": [1, 2]}),
+    AIMessage(
+        content="",
+        tool_calls=[{"name": "f", "args": {"a": 1}, "id": "c1", "type": "tool_call"}],
+        usage_metadata={"input_tokens": 1, "output_tokens": 2, "total_tokens": 3},
+    ),
+    AIMessageChunk(content="partial", tool_call_chunks=[]),
+    ToolMessage(content="result", tool_call_id="c1", artifact={"raw": [1]}),
+    Document(page_content="doc", metadata={"source": "a.txt", "page": 1}),
+    Document(page_content="doc", id="d1"),
+    ChatGeneration(
+        message=AIMessage(
+            content="x", additional_kwargs={"parsed": _Parsed(answer="a")}
+        )
+    ),
+    LLMResult(generations=[[Generation(text="a")]], llm_output={"m": 1}),
+    PromptTemplate.from_template("Hello {name}"),
+    ChatPromptTemplate([("system", "sys {x}"), ("human", "{q}")]),
+    PromptTemplate.from_template("{a}") | RunnableLambda(lambda x: x),
+    _WithSecret(api_key=SecretStr("secret")),
+    _Unserializable(),
+    _Parsed(answer="a"),
+    {"nested": [HumanMessage(content="a"), _Unserializable(), {"x": (1,)}]},
+    # Keys that json cannot encode make the whole object not implemented
+    {("tuple", "key"): 1},
+    [HumanMessage(content="a"), {object(): 1}],
+]
+
+
+@pytest.mark.parametrize("obj", _CASES)
+def test_dumpd_matches_json_round_trip(obj: Any) -> None:
+    # Compare as JSON so that object ids in reprs are the only thing that matters
+    assert json.dumps(dumpd(obj)) == json.dumps(_golden(obj))
+
+
+def test_dumpd_nan() -> None:
+    assert math.isnan(dumpd({"x": math.nan})["x"])
+    assert dumpd({math.nan: 1}) == {"NaN": 1}
+
+
+def test_dumpd_returns_new_containers() -> None:
+    message = HumanMessage(content=[{"type": "text", "text": "hi"}])
+    dumped = dumpd(message)
+    dumped["kwargs"]["content"][0]["text"] = "changed"
+    assert message.content == [{"type": "text", "text": "hi"}]
+
+
+def test_dumpd_circular_reference() -> None:
+    obj: list[Any] = []
+    obj.append(obj)
+    with pytest.raises(ValueError, match="Circular reference detected"):
+        dumpd(obj)
+    # Shared, non-circular references are fine
+    shared = {"a": 1}
+    assert dumpd([shared, shared]) == [{"a": 1}, {"a": 1}]
@@ -502,3 +502,76 @@ def test_content_blocks_reasoning_extraction() -> None:
     content_blocks = message.content_blocks
     assert len(content_blocks) == 1
     assert content_blocks[0]["type"] == "text"
+
+
+def test_streamed_tool_call_args() -> None:
+    args = '{"query": "weather in\\nSeoul", "days": [1, 2]}'
+
+    def stream(name: str) -> list[AIMessageChunk]:
+        chunks = [
+            AIMessageChunk(
+                content="",
+                tool_call_chunks=[
+                    create_tool_call_chunk(name=name, args="", id="call_1", index=0)
+                ],
+            )
+        ]
+        chunks.extend(
+            AIMessageChunk(
+                content="",
+                tool_call_chunks=[
+                    create_tool_call_chunk(
+                        name=None, args=args[i : i + 3], id=None, index=0
+                    )
+                ],
+            )
+            for i in range(0, len(args), 3)
+        )
+        return chunks
+
+    # Interleave two streams that share the same tool call id and index
+    first, second = stream("foo"), stream("bar")
+    acc_first, acc_second = first[0], second[0]
+    for chunk_first, chunk_second in zip(first[1:], second[1:], strict=True):
+        acc_first += chunk_first
+        acc_second += chunk_second
+        expected = AIMessageChunk(
+            content="", tool_call_chunks=acc_first.tool_call_chunks
+        ).tool_calls
+        assert acc_first.tool_calls == expected
+    assert acc_first.tool_calls[0]["args"] == {
+        "query": "weather in\nSeoul",
+        "days": [1, 2],
+    }
+    assert acc_second.tool_calls[0]["args"] == acc_first.tool_calls[0]["args"]
+    assert acc_second.tool_calls[0]["name"] == "bar"
+
+
+def test_streamed_tool_call_args_parser_is_per_stream() -> None:
+    def chunk(
+        args: str, name: str | None = None, id_: str | None = None
+    ) -> AIMessageChunk:
+        return AIMessageChunk(
+            content="",
+            tool_call_chunks=[
+                create_tool_call_chunk(name=name, args=args, id=id_, index=0)
+            ],
+        )
+
+    first = chunk('{"a": ', name="foo", id_="call_1")
+    summed = first + chunk('"b"}')
+    assert summed.tool_calls[0]["args"] == {"a": "b"}
+    key = ("call_1", 0)
+    assert summed._tool_call_parsers is not None
+    assert first._tool_call_parsers is not None
+    assert summed._tool_call_parsers[key] is first._tool_call_parsers[key]
+
+    # Another message with the same tool call id and index gets its own parser, and
+    # the parsers never make chunks unequal.
+    other = chunk('{"a": ', name="foo", id_="call_1")
+    assert other._tool_call_parsers is not None
+    assert other._tool_call_parsers[key] is not first._tool_call_parsers[key]
+    assert other == first
+    assert summed == AIMessageChunk(
+        content="", tool_call_chunks=summed.tool_call_chunks
+    )
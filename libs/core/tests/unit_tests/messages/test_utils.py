@@ -2,7 +2,7 @@ import base64
 import json
 import re
 from collections.abc import Callable, Sequence
-from typing import Any, TypedDict
+from typing import Any, TypedDict, cast
 
 import pytest
 from typing_extensions import NotRequired, override
@@ -1475,6 +1475,93 @@ def test_count_tokens_approximately_mixed_content_types() -> None:
     assert sum(count_tokens_approximately([m]) for m in messages) == token_count
 
 
+def test_count_tokens_approximately_cache_invalidation() -> None:
+    tool_calls = [
+        ToolCall(name="test_tool", args={"foo": "bar"}, id="1", type="tool_call")
+    ]
+    ai_message = AIMessage(content="", tool_calls=tool_calls)
+    human_message = HumanMessage(content=[{"type": "text", "text": "hi"}])
+    messages = [ai_message, human_message]
+    token_count = count_tokens_approximately(messages)
+    assert count_tokens_approximately(messages) == token_count
+
+    # In-place append is caught by the content version check
+    human_message.content.append({"type": "text", "text": "x" * 400})
+    expected = count_tokens_approximately(
+        [ai_message, HumanMessage(content=list(human_message.content))]
+    )
+    assert expected > token_count
+    assert count_tokens_approximately(messages) == expected
+
+    # Assignment drops memoized counts
+    human_message.content = [{"type": "text", "text": "hi"}]
+    assert count_tokens_approximately(messages) == token_count
+
+    ai_message.tool_calls = [*tool_calls, *tool_calls]
+    expected = count_tokens_approximately(
+        [AIMessage(content="", tool_calls=[*tool_calls, *tool_calls]), human_message]
+    )
+    assert expected > token_count
+    assert count_tokens_approximately(messages) == expected
+
+
+def test_get_num_tokens_from_messages_cache() -> None:
+    calls: list[str] = []
+
+    def get_token_ids(text: str) -> list[int]:
+        calls.append(text)
+        return list(range(len(text.split())))
+
+    model = FakeChatModel(custom_get_token_ids=get_token_ids)
+    messages = [HumanMessage(content="one two three"), AIMessage(content="four")]
+    # "Human: one two three" -> 4 tokens, "AI: four" -> 2 tokens
+    assert model.get_num_tokens_from_messages(messages) == 6
+    assert model.get_num_tokens_from_messages(messages) == 6
+    assert len(calls) == 2
+
+    messages[1].content = "four five"
+    assert model.get_num_tokens_from_messages(messages) == 7
+    assert len(calls) == 3
+
+    # Reconfiguring the model retires its memoized counts
+    model.custom_get_token_ids = lambda text: [0] * len(text)
+    assert model.get_num_tokens_from_messages(messages) == len(
+        "Human: one two three"
+    ) + len("AI: four five")
+
+
+def test_get_num_tokens_from_messages_cache_detects_nested_edits() -> None:
+    model = FakeChatModel(custom_get_token_ids=lambda text: text.split())
+    messages: list[BaseMessage] = [
+        HumanMessage(content=[{"type": "text", "text": "one two"}])
+    ]
+    count = model.get_num_tokens_from_messages(messages)
+    assert model.get_num_tokens_from_messages(messages) == count
+
+    cast("dict", messages[0].content[0])["text"] = "one two three four"
+    assert model.get_num_tokens_from_messages(messages) == count + 2
+
+
+def test_get_num_tokens_from_messages_cache_detects_reused_string_address() -> None:
+    model = FakeChatModel(custom_get_token_ids=lambda text: text.split())
+    word = "two"
+    messages: list[BaseMessage] = [
+        HumanMessage(content=[{"type": "text", "text": f"one {word}"}])
+    ]
+    block = cast("dict", messages[0].content[0])
+    count = model.get_num_tokens_from_messages(messages)
+
+    # Free the counted string before building a replacement of the same length,
+    # so the allocator can hand the freed address to the replacement
+    for _ in range(20):
+        del block["text"]
+        block["text"] = f"one{word} "
+        assert model.get_num_tokens_from_messages(messages) == count - 1
+        del block["text"]
+        block["text"] = f"one {word}"
+        assert model.get_num_tokens_from_messages(messages) == count
+
+
 def test_get_buffer_string_with_structured_content() -> None:
     """Test get_buffer_string with structured content in messages."""
     messages = [
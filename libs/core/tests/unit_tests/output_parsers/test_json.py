@@ -11,6 +11,7 @@ from langchain_core.output_parsers.json import (
 )
 from langchain_core.utils.function_calling import convert_to_openai_function
 from langchain_core.utils.json import (
+    PartialJsonParser,
     parse_and_check_json_markdown,
     parse_json_markdown,
     parse_partial_json,
@@ -264,6 +265,30 @@ def test_parse_partial_json(json_strings: tuple[str, str]) -> None:
     assert parsed == json.loads(expected)
 
 
+@pytest.mark.parametrize("json_strings", TEST_CASES_PARTIAL)
+def test_partial_json_parser(json_strings: tuple[str, str]) -> None:
+    case, _ = json_strings
+    parser = PartialJsonParser()
+    for i, char in enumerate(case):
+        parser.feed(char)
+        assert parser.parse() == parse_partial_json(case[: i + 1])
+
+
+def test_partial_json_parser_malformed() -> None:
+    parser = PartialJsonParser()
+    parser.feed('{"foo": ]')
+    assert parser.parse() is None
+    parser.feed("}")
+    assert parser.parse() is None
+
+
+def test_partial_json_parser_raises() -> None:
+    parser = PartialJsonParser()
+    parser.feed("hi")
+    with pytest.raises(json.JSONDecodeError):
+        parser.parse()
+
+
 STREAMED_TOKENS = """
 {
 
@@ -1636,3 +1636,34 @@ def test_mustache_template_attribute_access_vulnerability() -> None:
     )
     result_dict = prompt_dict.invoke({"person": {"name": "Alice"}})
     assert result_dict.messages[0].content == "Alice"  # type: ignore[attr-defined]
+
+
+async def test_chat_prompt_format_messages_fast_path() -> None:
+    template = ChatPromptTemplate(
+        [
+            ("system", "You answer questions about {topic}."),
+            ("human", "Static example"),
+            ("ai", "Static answer"),
+            HumanMessagePromptTemplate.from_template(
+                "{{question}}", template_format="mustache"
+            ),
+            HumanMessagePromptTemplate(
+                prompt=PromptTemplate.from_template(
+                    "{context} {question}", partial_variables={"context": "ctx"}
+                ),
+                additional_kwargs={"k": "v"},
+            ),
+        ]
+    )
+    expected = [
+        message
+        for message_template in template.messages
+        for message in message_template.format_messages(  # type: ignore[union-attr]
+            topic="cats", question="why?"
+        )
+    ]
+    messages = template.format_messages(topic="cats", question="why?")
+    assert messages == expected
+    assert messages == await template.aformat_messages(topic="cats", question="why?")
+    assert messages[3] == HumanMessage(content="why?")
+    assert messages[4] == HumanMessage(content="ctx why?", additional_kwargs={"k": "v"})
@@ -1,7 +1,11 @@
+from string import Formatter
+
 import pytest
 from packaging import version
 
-from langchain_core.prompts.string import mustache_schema
+from langchain_core.prompts.string import mustache_formatter, mustache_schema
+from langchain_core.utils import mustache
+from langchain_core.utils.formatting import formatter
 from langchain_core.utils.pydantic import PYDANTIC_VERSION
 
 PYDANTIC_VERSION_AT_LEAST_29 = version.parse("2.9") <= PYDANTIC_VERSION
@@ -30,3 +34,42 @@ def test_mustache_schema_parent_child() -> None:
     }
     actual = mustache_schema(template).model_json_schema()
     assert expected == actual
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "plain text",
+        "a {x} b {y!r} {z:>6.2f} {{literal}} {x}",
+        "{x!s:>4}|{y!a}",
+        "{x:{y}}",
+        "{0}",
+        "{}",
+        "{x.real}",
+        "{x[0]}",
+        "{x!z}",
+        "{x",
+        "{missing}",
+    ],
+)
+def test_formatter_matches_string_formatter(template: str) -> None:
+    kwargs = {"x": 1, "y": "é", "z": 3.14159}
+    try:
+        expected: object = Formatter().format(template, **kwargs)
+    except (IndexError, KeyError, TypeError, ValueError) as e:
+        expected = (type(e), str(e))
+    for _ in range(2):
+        try:
+            actual: object = formatter.format(template, **kwargs)
+        except (IndexError, KeyError, TypeError, ValueError) as e:
+            actual = (type(e), str(e))
+        assert actual == expected
+
+
+def test_mustache_token_cache_is_bounded() -> None:
+    for i in range(mustache._TOKEN_CACHE_MAXSIZE + 10):
+        assert mustache_formatter(f"{{{{x}}}} {i}", x="v") == f"v {i}"
+    assert len(mustache.g_token_cache) == mustache._TOKEN_CACHE_MAXSIZE
+    assert "{{x}} 0" not in mustache.g_token_cache
+    # Rendering from cached tokens gives the same output
+    assert mustache_formatter("{{x}} 20", x="w") == "w 20"
@@ -14,8 +14,8 @@ from langsmith import Client, traceable
 
 from langchain_core.callbacks import CallbackManager
 from langchain_core.exceptions import TracerException
-from langchain_core.messages import HumanMessage
-from langchain_core.outputs import LLMResult
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
 from langchain_core.runnables import chain as as_runnable
 from langchain_core.tracers.base import BaseTracer
 from langchain_core.tracers.schemas import Run
@@ -117,6 +117,50 @@ def test_tracer_chat_model_run() -> None:
     assert tracer.runs == [compare_run]
 
 
+class FakeChatTracer(FakeTracer):
+    """Fake tracer that records chat model runs."""
+
+    def __init__(self) -> None:
+        """Initialize the tracer."""
+        super().__init__()
+        self._schema_format = "original+chat"
+
+
+class LazyFakeChatTracer(FakeChatTracer):
+    """Fake chat tracer that only reads runs named `read`."""
+
+    lazy_serialization = True
+
+    def _reads_run_payloads(self, run: Run) -> bool:
+        return run.name == "read"
+
+
+@freeze_time("2023-01-01")
+def test_tracer_chat_model_run_lazy_serialization() -> None:
+    """Test that lazy tracers only skip serializing runs they never read."""
+    messages = [[HumanMessage(content="hi")]]
+    response = LLMResult(
+        generations=[[ChatGeneration(message=AIMessage(content="hello"))]]
+    )
+    eager, lazy = FakeChatTracer(), LazyFakeChatTracer()
+    run_id, skipped_id = uuid4(), uuid4()
+    for tracer in (eager, lazy):
+        tracer.on_chat_model_start(
+            SERIALIZED_CHAT, messages, run_id=run_id, name="read"
+        )
+        tracer.on_llm_end(response, run_id=run_id)
+    lazy.on_chat_model_start(SERIALIZED_CHAT, messages, run_id=skipped_id)
+    lazy.on_llm_end(response, run_id=skipped_id)
+
+    # Runs that are read are serialized before persisting, like eager ones
+    assert lazy.runs[0] == eager.runs[0]
+
+    skipped = lazy.runs[1]
+    assert skipped.inputs["messages"][0][0] is messages[0][0]
+    message = skipped.outputs["generations"][0][0]["message"]  # type: ignore[index]
+    assert message is response.generations[0][0].message  # type: ignore[attr-defined]
+
+
 @freeze_time("2023-01-01")
 def test_tracer_llm_run_errors_no_start() -> None:
     """Test tracer on an LLM run without a start."""
@@ -0,0 +1,94 @@
+import pytest
+from jsonpatch import JsonPointerException  # type: ignore[import-untyped]
+
+from langchain_core.tracers.log_stream import RunLog, RunLogPatch
+
+INITIAL_OPS = [
+    {
+        "op": "replace",
+        "path": "",
+        "value": {
+            "id": "1",
+            "streamed_output": [],
+            "final_output": None,
+            "logs": {},
+            "name": "chain",
+            "type": "chain",
+        },
+    },
+    {
+        "op": "add",
+        "path": "/logs/llm",
+        "value": {"streamed_output_str": [], "streamed_output": [], "end_time": None},
+    },
+]
+
+
+def test_run_log_add_does_not_alias_ops() -> None:
+    patch = RunLogPatch(*INITIAL_OPS)
+    log = patch + RunLogPatch(
+        {"op": "add", "path": "/logs/llm/streamed_output_str/-", "value": "Hi"}
+    )
+    assert log.state["logs"]["llm"]["streamed_output_str"] == ["Hi"]
+    assert INITIAL_OPS[1]["value"]["streamed_output_str"] == []  # type: ignore[index]
+
+    next_log = log + RunLogPatch(
+        {"op": "add", "path": "/logs/llm/streamed_output_str/-", "value": "!"},
+        {"op": "replace", "path": "/logs/llm/end_time", "value": "now"},
+    )
+    assert next_log.state["logs"]["llm"] == {
+        "streamed_output_str": ["Hi", "!"],
+        "streamed_output": [],
+        "end_time": "now",
+    }
+    # The previous log is left untouched
+    assert log.state["logs"]["llm"]["streamed_output_str"] == ["Hi"]
+    assert len(next_log.ops) == 5
+
+
+def test_run_log_add_shares_untouched_subtrees() -> None:
+    log = RunLogPatch(*INITIAL_OPS) + RunLogPatch(
+        {"op": "add", "path": "/logs/other", "value": {"streamed_output": [1]}}
+    )
+    next_log = log + RunLogPatch(
+        {"op": "add", "path": "/logs/llm/streamed_output/-", "value": 1}
+    )
+    assert next_log.state["logs"]["other"] is log.state["logs"]["other"]
+    assert next_log.state["logs"]["llm"] is not log.state["logs"]["llm"]
+    assert log.state["logs"]["llm"]["streamed_output"] == []
+
+    # Both logs share their ops up to `log`, and each keeps its own history
+    other_log = log + RunLogPatch(
+        {"op": "replace", "path": "/final_output", "value": 2}
+    )
+    log._apply_in_place(RunLogPatch({"op": "remove", "path": "/final_output"}))
+    assert [op["op"] for op in next_log.ops[3:]] == ["add"]
+    assert [op["op"] for op in other_log.ops[3:]] == ["replace"]
+    assert [op["op"] for op in log.ops[3:]] == ["remove"]
+    assert "final_output" in next_log.state
+
+
+def test_run_log_apply_in_place() -> None:
+    log = RunLog(state=None)  # type: ignore[arg-type]
+    log._apply_in_place(RunLogPatch(*INITIAL_OPS), record_ops=False)
+    state = log.state
+    log._apply_in_place(
+        RunLogPatch(
+            {"op": "add", "path": "/streamed_output/-", "value": {"a": 1}},
+            {"op": "replace", "path": "/final_output", "value": {"a": 1}},
+            {"op": "add", "path": "/final_output/b", "value": [1]},
+            {"op": "add", "path": "/final_output/b/0", "value": 0},
+        ),
+        record_ops=False,
+    )
+    assert log.state is state
+    assert state["streamed_output"] == [{"a": 1}]
+    assert state["final_output"] == {"a": 1, "b": [0, 1]}
+    assert log.ops == []
+
+    with pytest.raises(JsonPointerException):
+        log._apply_in_place(
+            RunLogPatch({"op": "replace", "path": "/logs/missing/x", "value": 1})
+        )
+    # Ops of a patch that failed to apply are not recorded
+    assert log.ops == []
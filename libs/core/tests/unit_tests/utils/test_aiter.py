@@ -1,8 +1,11 @@
-from collections.abc import AsyncIterator
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
-from langchain_core.utils.aiter import abatch_iterate
+from langchain_core.utils.aiter import abatch_iterate, aiterate_in_thread
 
 
 @pytest.mark.parametrize(
@@ -29,3 +32,68 @@ async def test_abatch_iterate(
 
     output = [el async for el in iterator_]
     assert output == expected_output
+
+
+async def test_aiterate_in_thread_reads_ahead_in_bounded_chunks() -> None:
+    produced: list[int] = []
+    threads: set[str] = set()
+    closed = threading.Event()
+
+    def numbers() -> Iterator[int]:
+        try:
+            for i in range(100):
+                threads.add(threading.current_thread().name)
+                produced.append(i)
+                yield i
+        finally:
+            closed.set()
+
+    items = aiterate_in_thread(numbers, chunk_size=4, max_chunks=2)
+    assert [await anext(items) for _ in range(5)] == [0, 1, 2, 3, 4]
+    # The second chunk is being consumed; at most two more are read ahead
+    assert len(produced) <= 16
+    await items.aclose()  # type: ignore[attr-defined]
+
+    assert closed.is_set()
+    assert len(produced) <= 16
+    assert threading.current_thread().name not in threads
+
+    assert [
+        i async for i in aiterate_in_thread(lambda: range(10), chunk_size=3)
+    ] == list(range(10))
+
+
+async def test_aiterate_in_thread_propagates_errors() -> None:
+    def failing() -> Iterator[int]:
+        yield 1
+        msg = "boom"
+        raise ValueError(msg)
+
+    items = aiterate_in_thread(failing, chunk_size=1)
+    assert await anext(items) == 1
+    with pytest.raises(ValueError, match="boom"):
+        await anext(items)
+
+    with pytest.raises(ValueError, match="at least 1"):
+        await anext(aiterate_in_thread(failing, chunk_size=0))
+
+
+async def test_aiterate_in_thread_does_not_hold_executor_threads() -> None:
+    # Consumers offloading their own work must not starve on a small executor
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=2)
+    loop.set_default_executor(executor)
+
+    async def consume() -> int:
+        count = 0
+        async for _ in aiterate_in_thread(lambda: range(1000), chunk_size=8):
+            count += await loop.run_in_executor(None, lambda: 1)
+        return count
+
+    try:
+        counts = await asyncio.wait_for(
+            asyncio.gather(*(consume() for _ in range(4))), timeout=10
+        )
+    finally:
+        executor.shutdown(wait=False)
+    assert counts == [1000] * 4
@@ -1168,3 +1168,50 @@ def test_convert_to_openai_function_strict_required() -> None:
     func = convert_to_openai_function(MyModel, strict=True)
     actual = func["parameters"]["required"]
     assert actual == expected
+
+
+def test_convert_to_openai_function_caches_tools() -> None:
+    calls = 0
+
+    class Args(BaseModel):
+        query: str = Field(description="The query.")
+        limit: int = 10
+
+    class OtherArgs(BaseModel):
+        text: str
+
+    class CountingTool(StructuredTool):
+        @property
+        def tool_call_schema(self) -> Any:
+            nonlocal calls
+            calls += 1
+            return super().tool_call_schema
+
+    search = CountingTool(
+        name="search",
+        description="Search things.",
+        args_schema=Args,
+        func=lambda **kwargs: kwargs["query"],
+    )
+
+    first = convert_to_openai_function(search)
+    assert convert_to_openai_function(search) == first
+    assert convert_to_openai_function(search, strict=True)["strict"] is True
+    assert convert_to_openai_function(search, strict=True)["strict"] is True
+    calls_after_first_conversions = calls
+
+    # Results are fresh copies that callers may mutate
+    first["parameters"]["properties"]["query"]["description"] = "changed"
+    assert convert_to_openai_function(search) != first
+    assert calls == calls_after_first_conversions
+
+    # Assigning a field invalidates the cached schema
+    search.description = "Search other things."
+    assert convert_to_openai_function(search)["description"] == "Search other things."
+    search.name = "find"
+    assert convert_to_openai_function(search)["name"] == "find"
+    search.args_schema = OtherArgs
+    assert list(convert_to_openai_function(search)["parameters"]["properties"]) == [
+        "text"
+    ]
+    assert calls > calls_after_first_conversions
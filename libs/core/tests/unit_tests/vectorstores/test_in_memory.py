@@ -47,6 +47,33 @@ async def test_inmemory_similarity_search_with_score() -> None:
     assert output[0][1] > output[1][1]
 
 
+async def test_inmemory_similarity_search_with_vectors() -> None:
+    """Test returning stored vectors, directly and through the retriever."""
+    embedding = DeterministicFakeEmbedding(size=3)
+    store = await InMemoryVectorStore.afrom_texts(
+        ["foo", "bar"], embedding, metadatas=[{"n": 1}, {"n": 2}]
+    )
+
+    (doc, vector), *_ = store.similarity_search_with_vectors("foo", k=1)
+    assert doc == _any_id_document(page_content="foo", metadata={"n": 1})
+    assert vector == embedding.embed_query("foo")
+    output = await store.asimilarity_search_with_vectors("foo", k=2)
+    assert [doc.page_content for doc, _ in output] == ["foo", "bar"]
+
+    retriever = store.as_retriever(
+        search_kwargs={"k": 1}, vector_metadata_key="embedding"
+    )
+    for docs in (retriever.invoke("bar"), await retriever.ainvoke("bar")):
+        assert docs == [
+            _any_id_document(
+                page_content="bar",
+                metadata={"n": 2, "embedding": embedding.embed_query("bar")},
+            )
+        ]
+    # Stored metadata is left unchanged
+    assert store.similarity_search("bar", k=1)[0].metadata == {"n": 2}
+
+
 async def test_add_by_ids() -> None:
     """Test add texts with ids."""
     vectorstore = InMemoryVectorStore(embedding=DeterministicFakeEmbedding(size=6))
@@ -292,3 +292,21 @@ async def test_default_afrom_documents(vs_class: type[VectorStore]) -> None:
     store = await vs_class.afrom_documents([original_document], embeddings, ids=["6"])
     assert original_document.id == "7"  # original document should not be modified
     assert await store.aget_by_ids(["6"]) == [Document(id="6", page_content="baz")]
+
+
+def test_retriever_vector_metadata_key_without_stored_vectors() -> None:
+    class SearchableVectorstore(CustomAddTextsVectorstore):
+        @override
+        def similarity_search(
+            self, query: str, k: int = 4, **kwargs: Any
+        ) -> list[Document]:
+            return list(self.store.values())[:k]
+
+    store = SearchableVectorstore()
+    store.add_texts(["foo"], ids=["1"])
+    with pytest.raises(NotImplementedError):
+        store.similarity_search_with_vectors("foo")
+
+    # Falls back to plain similarity search
+    retriever = store.as_retriever(vector_metadata_key="embedding")
+    assert retriever.invoke("foo") == [Document(page_content="foo", id="1")]
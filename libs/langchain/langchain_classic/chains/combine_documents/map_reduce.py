@@ -7,13 +7,18 @@ from typing import Any
 from langchain_core._api import deprecated
 from langchain_core.callbacks import Callbacks
 from langchain_core.documents import Document
+from langchain_core.rate_limiters import BaseRateLimiter
 from langchain_core.runnables.config import RunnableConfig
 from langchain_core.utils.pydantic import create_model
 from pydantic import BaseModel, ConfigDict, model_validator
 from typing_extensions import override
 
 from langchain_classic.chains.combine_documents.base import BaseCombineDocumentsChain
-from langchain_classic.chains.combine_documents.reduce import ReduceDocumentsChain
+from langchain_classic.chains.combine_documents.reduce import (
+    ReduceDocumentsChain,
+    _arun_concurrently,
+    _run_concurrently,
+)
 from langchain_classic.chains.llm import LLMChain
 
 
@@ -106,6 +111,19 @@ class MapReduceDocumentsChain(BaseCombineDocumentsChain):
     If only one variable in the llm_chain, this need not be provided."""
     return_intermediate_steps: bool = False
     """Return the results of the map steps in the output."""
+    max_concurrency: int | None = None
+    """Maximum number of map calls to run concurrently.
+
+    If `None`, all documents are mapped with a single `llm_chain.apply` call.
+    Otherwise each document is mapped with its own call. Set the limit of the
+    collapse calls on the `ReduceDocumentsChain`.
+    """
+    rate_limiter: BaseRateLimiter | None = None
+    """Rate limiter acquired before each map call; setting it maps each document
+    with its own call.
+
+    Pass the same instance to the `ReduceDocumentsChain` to share its limit.
+    """
 
     @override
     def get_output_schema(
@@ -233,11 +251,23 @@ class MapReduceDocumentsChain(BaseCombineDocumentsChain):
         Combine by mapping first chain over all documents, then reducing the results.
         This reducing can be done recursively if needed (if there are many documents).
         """
-        map_results = self.llm_chain.apply(
-            # FYI - this is parallelized and so it is fast.
-            [{self.document_variable_name: d.page_content, **kwargs} for d in docs],
-            callbacks=callbacks,
-        )
+        inputs = [{self.document_variable_name: d.page_content, **kwargs} for d in docs]
+        if self.max_concurrency is None and self.rate_limiter is None:
+            map_results = self.llm_chain.apply(
+                # FYI - this is parallelized and so it is fast.
+                inputs,
+                callbacks=callbacks,
+            )
+        else:
+
+            def _map(input_: dict[str, Any]) -> dict[str, str]:
+                return self.llm_chain.apply([input_], callbacks=callbacks)[0]
+
+            map_results = [{}] * len(inputs)
+            for i, output in _run_concurrently(
+                _map, inputs, self.max_concurrency, self.rate_limiter
+            ):
+                map_results[i] = output
         question_result_key = self.llm_chain.output_key
         result_docs = [
             Document(page_content=r[question_result_key], metadata=docs[i].metadata)
@@ -267,11 +297,23 @@ class MapReduceDocumentsChain(BaseCombineDocumentsChain):
         Combine by mapping first chain over all documents, then reducing the results.
         This reducing can be done recursively if needed (if there are many documents).
         """
-        map_results = await self.llm_chain.aapply(
-            # FYI - this is parallelized and so it is fast.
-            [{self.document_variable_name: d.page_content, **kwargs} for d in docs],
-            callbacks=callbacks,
-        )
+        inputs = [{self.document_variable_name: d.page_content, **kwargs} for d in docs]
+        if self.max_concurrency is None and self.rate_limiter is None:
+            map_results = await self.llm_chain.aapply(
+                # FYI - this is parallelized and so it is fast.
+                inputs,
+                callbacks=callbacks,
+            )
+        else:
+
+            async def _map(input_: dict[str, Any]) -> dict[str, str]:
+                return (await self.llm_chain.aapply([input_], callbacks=callbacks))[0]
+
+            map_results = [{}] * len(inputs)
+            async for i, output in _arun_concurrently(
+                _map, inputs, self.max_concurrency, self.rate_limiter
+            ):
+                map_results[i] = output
         question_result_key = self.llm_chain.output_key
         result_docs = [
             Document(page_content=r[question_result_key], metadata=docs[i].metadata)
@@ -2,16 +2,30 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import Any, Protocol
+import asyncio
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from concurrent.futures import as_completed
+from typing import Any, NamedTuple, Protocol, TypeVar
 
 from langchain_core._api import deprecated
 from langchain_core.callbacks import Callbacks
 from langchain_core.documents import Document
+from langchain_core.rate_limiters import BaseRateLimiter
+from langchain_core.runnables.config import ContextThreadPoolExecutor
 from pydantic import ConfigDict
 
 from langchain_classic.chains.combine_documents.base import BaseCombineDocumentsChain
 
+T = TypeVar("T")
+U = TypeVar("U")
+
 
 class CombineDocsProtocol(Protocol):
     """Interface for the combine_docs method."""
@@ -64,6 +78,149 @@ def split_list_of_docs(
     return new_result_doc_list
 
 
+class _TokenCounter:
+    """Packs documents using their cached individual prompt lengths.
+
+    The prompt length of a group is estimated as the length of the empty prompt,
+    plus the length each document adds alone, plus a separator estimate between
+    documents. Each packed group is then checked once with `length_func`, and
+    split exactly with `split_list_of_docs` in the rare case it does not fit.
+    """
+
+    def __init__(self, length_func: Callable, **kwargs: Any) -> None:
+        self.length_func = length_func
+        self.kwargs = kwargs
+        self.base: int = length_func([], **kwargs)
+        self.separator: int | None = None
+        self.counts: dict[int, tuple[Document, int]] = {}
+
+    def count(self, doc: Document) -> int:
+        entry = self.counts.get(id(doc))
+        if entry is None or entry[0] is not doc:
+            entry = (doc, self.length_func([doc], **self.kwargs) - self.base)
+            self.counts[id(doc)] = entry
+        return entry[1]
+
+    def split(self, docs: list[Document], token_max: int) -> list[list[Document]]:
+        counts = [self.count(doc) for doc in docs]
+        if self.separator is None and len(docs) > 1:
+            pair = self.length_func(docs[:2], **self.kwargs)
+            self.separator = max(pair - self.base - counts[0] - counts[1], 0)
+        separator = self.separator or 0
+
+        groups: list[list[Document]] = []
+        group: list[Document] = []
+        total = self.base
+        for doc, count in zip(docs, counts, strict=True):
+            if self.base + count > token_max:
+                msg = (
+                    "A single document was longer than the context length,"
+                    " we cannot handle this."
+                )
+                raise ValueError(msg)
+            if group and total + separator + count > token_max:
+                groups.append(group)
+                group, total = [], self.base
+            total += count + (separator if group else 0)
+            group.append(doc)
+        groups.append(group)
+
+        result = []
+        for group in groups:
+            if len(group) > 1 and self.length_func(group, **self.kwargs) > token_max:
+                result.extend(
+                    split_list_of_docs(
+                        group, self.length_func, token_max, **self.kwargs
+                    )
+                )
+            else:
+                result.append(group)
+        return result
+
+
+def _run_concurrently(
+    func: Callable[[T], U],
+    items: Sequence[T],
+    max_concurrency: int | None,
+    rate_limiter: BaseRateLimiter | None,
+) -> Iterator[tuple[int, U]]:
+    """Yield `(index, func(item))` as calls complete.
+
+    Calls run one at a time if `max_concurrency` is `None`, else in a thread pool.
+    """
+
+    def call(item: T) -> U:
+        if rate_limiter is not None:
+            rate_limiter.acquire(blocking=True)
+        return func(item)
+
+    if max_concurrency is None or len(items) <= 1:
+        for i, item in enumerate(items):
+            yield i, call(item)
+        return
+    with ContextThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        futures = {executor.submit(call, item): i for i, item in enumerate(items)}
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+async def _arun_concurrently(
+    func: Callable[[T], Awaitable[U]],
+    items: Sequence[T],
+    max_concurrency: int | None,
+    rate_limiter: BaseRateLimiter | None,
+) -> AsyncIterator[tuple[int, U]]:
+    """Yield `(index, await func(item))` as calls complete.
+
+    Calls run one at a time if `max_concurrency` is `None`.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency or 1)
+
+    async def call(i: int, item: T) -> tuple[int, U]:
+        async with semaphore:
+            if rate_limiter is not None:
+                await rate_limiter.aacquire(blocking=True)
+            return i, await func(item)
+
+    tasks = [asyncio.ensure_future(call(i, item)) for i, item in enumerate(items)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+class PartialReduction(NamedTuple):
+    """A document produced by a collapse step of `ReduceDocumentsChain`."""
+
+    round: int
+    """Collapse round, starting at 0."""
+    index: int
+    """Position of the collapsed group among the groups of its round."""
+    document: Document
+    """The collapsed document."""
+
+
+def _last_round(
+    docs: list[Document], partials: Iterable[PartialReduction]
+) -> list[Document]:
+    """Documents of the last collapse round in order, or `docs` if none."""
+    current = -1
+    collapsed: dict[int, Document] = {}
+    for partial in partials:
+        if partial.round != current:
+            current, collapsed = partial.round, {}
+        collapsed[partial.index] = partial.document
+    if current < 0:
+        return docs
+    return [collapsed[i] for i in range(len(collapsed))]
+
+
 def collapse_docs(
     docs: list[Document],
     combine_document_func: CombineDocsProtocol,
@@ -226,6 +383,17 @@ class ReduceDocumentsChain(BaseCombineDocumentsChain):
 
     Otherwise, after it reaches the max number, it will throw an error.
     """
+    max_concurrency: int | None = None
+    """Maximum number of collapse calls to run concurrently.
+
+    If `None`, the groups of each collapse round are collapsed one at a time.
+    """
+    rate_limiter: BaseRateLimiter | None = None
+    """Rate limiter acquired before each collapse call.
+
+    Pass the same instance to other chains calling the same provider to share
+    its limit.
+    """
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
@@ -306,16 +474,40 @@ class ReduceDocumentsChain(BaseCombineDocumentsChain):
             **kwargs,
         )
 
-    def _collapse(
+    def stream_collapse(
         self,
         docs: list[Document],
         token_max: int | None = None,
         callbacks: Callbacks = None,
         **kwargs: Any,
-    ) -> tuple[list[Document], dict]:
-        result_docs = docs
+    ) -> Iterator[PartialReduction]:
+        """Collapse documents until they fit, yielding each collapsed document.
+
+        Documents are packed into groups of at most `token_max` tokens using the
+        cached prompt length of each document, and each group is collapsed into
+        one document, up to `max_concurrency` at a time. Collapsed documents are
+        yielded as soon as they are ready; their `index` gives their position in
+        the round, which keeps the documents of the next round in input order.
+
+        Args:
+            docs: List of documents to collapse.
+            token_max: Recursively creates groups of documents less than this number
+                of tokens.
+            callbacks: Callbacks to be passed through
+            **kwargs: additional parameters to be passed to LLM calls (like other
+                input variables besides the documents)
+
+        Yields:
+            The collapsed documents of each round, in completion order.
+
+        Raises:
+            ValueError: If the documents do not fit after `collapse_max_retries`
+                rounds, or a single document does not fit in `token_max`.
+        """
         length_func = self.combine_documents_chain.prompt_length
-        num_tokens = length_func(result_docs, **kwargs)
+        num_tokens = length_func(docs, **kwargs)
+        if num_tokens is None:
+            return
 
         def _collapse_docs_func(docs: list[Document], **kwargs: Any) -> str:
             return self._collapse_chain.run(
@@ -324,37 +516,59 @@ class ReduceDocumentsChain(BaseCombineDocumentsChain):
                 **kwargs,
             )
 
+        def _collapse_group(group: list[Document]) -> Document:
+            return collapse_docs(group, _collapse_docs_func, **kwargs)
+
         _token_max = token_max or self.token_max
+        counter = _TokenCounter(length_func, **kwargs)
+        result_docs = docs
         retries: int = 0
-        while num_tokens is not None and num_tokens > _token_max:
-            new_result_doc_list = split_list_of_docs(
-                result_docs,
-                length_func,
-                _token_max,
-                **kwargs,
-            )
-            result_docs = [
-                collapse_docs(docs_, _collapse_docs_func, **kwargs)
-                for docs_ in new_result_doc_list
-            ]
+        while num_tokens > _token_max:
+            groups = counter.split(result_docs, _token_max)
+            collapsed: dict[int, Document] = {}
+            for index, doc in _run_concurrently(
+                _collapse_group, groups, self.max_concurrency, self.rate_limiter
+            ):
+                collapsed[index] = doc
+                yield PartialReduction(retries, index, doc)
+            result_docs = [collapsed[i] for i in range(len(groups))]
             num_tokens = length_func(result_docs, **kwargs)
             retries += 1
             if self.collapse_max_retries and retries == self.collapse_max_retries:
                 msg = f"Exceed {self.collapse_max_retries} tries to \
                         collapse document to {_token_max} tokens."
                 raise ValueError(msg)
-        return result_docs, {}
 
-    async def _acollapse(
+    async def astream_collapse(
         self,
         docs: list[Document],
         token_max: int | None = None,
         callbacks: Callbacks = None,
         **kwargs: Any,
-    ) -> tuple[list[Document], dict]:
-        result_docs = docs
+    ) -> AsyncIterator[PartialReduction]:
+        """Async collapse documents until they fit, yielding each collapsed document.
+
+        See `stream_collapse`.
+
+        Args:
+            docs: List of documents to collapse.
+            token_max: Recursively creates groups of documents less than this number
+                of tokens.
+            callbacks: Callbacks to be passed through
+            **kwargs: additional parameters to be passed to LLM calls (like other
+                input variables besides the documents)
+
+        Yields:
+            The collapsed documents of each round, in completion order.
+
+        Raises:
+            ValueError: If the documents do not fit after `collapse_max_retries`
+                rounds, or a single document does not fit in `token_max`.
+        """
         length_func = self.combine_documents_chain.prompt_length
-        num_tokens = length_func(result_docs, **kwargs)
+        num_tokens = length_func(docs, **kwargs)
+        if num_tokens is None:
+            return
 
         async def _collapse_docs_func(docs: list[Document], **kwargs: Any) -> str:
             return await self._collapse_chain.arun(
@@ -363,26 +577,55 @@ class ReduceDocumentsChain(BaseCombineDocumentsChain):
                 **kwargs,
             )
 
+        async def _collapse_group(group: list[Document]) -> Document:
+            return await acollapse_docs(group, _collapse_docs_func, **kwargs)
+
         _token_max = token_max or self.token_max
+        counter = _TokenCounter(length_func, **kwargs)
+        result_docs = docs
         retries: int = 0
-        while num_tokens is not None and num_tokens > _token_max:
-            new_result_doc_list = split_list_of_docs(
-                result_docs,
-                length_func,
-                _token_max,
-                **kwargs,
-            )
-            result_docs = [
-                await acollapse_docs(docs_, _collapse_docs_func, **kwargs)
-                for docs_ in new_result_doc_list
-            ]
+        while num_tokens > _token_max:
+            groups = counter.split(result_docs, _token_max)
+            collapsed: dict[int, Document] = {}
+            async for index, doc in _arun_concurrently(
+                _collapse_group, groups, self.max_concurrency, self.rate_limiter
+            ):
+                collapsed[index] = doc
+                yield PartialReduction(retries, index, doc)
+            result_docs = [collapsed[i] for i in range(len(groups))]
             num_tokens = length_func(result_docs, **kwargs)
             retries += 1
             if self.collapse_max_retries and retries == self.collapse_max_retries:
                 msg = f"Exceed {self.collapse_max_retries} tries to \
                         collapse document to {_token_max} tokens."
                 raise ValueError(msg)
-        return result_docs, {}
+
+    def _collapse(
+        self,
+        docs: list[Document],
+        token_max: int | None = None,
+        callbacks: Callbacks = None,
+        **kwargs: Any,
+    ) -> tuple[list[Document], dict]:
+        partials = self.stream_collapse(
+            docs, token_max=token_max, callbacks=callbacks, **kwargs
+        )
+        return _last_round(docs, partials), {}
+
+    async def _acollapse(
+        self,
+        docs: list[Document],
+        token_max: int | None = None,
+        callbacks: Callbacks = None,
+        **kwargs: Any,
+    ) -> tuple[list[Document], dict]:
+        partials = [
+            partial
+            async for partial in self.astream_collapse(
+                docs, token_max=token_max, callbacks=callbacks, **kwargs
+            )
+        ]
+        return _last_round(docs, partials), {}
 
     @property
     def _chain_type(self) -> str:
@@ -0,0 +1,215 @@
+"""Generic loader that parses blobs in parallel."""
+
+from __future__ import annotations
+
+import os
+import time
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+from langchain_core.document_loaders import BaseBlobParser, BaseLoader, BlobLoader
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from langchain_core.document_loaders import Blob
+    from langchain_core.documents import Document
+
+# Parser of the current worker process, set by the pool initializer so that it is
+# pickled once per worker rather than once per blob
+_worker_parser: BaseBlobParser | None = None
+
+
+def _init_worker(parser: BaseBlobParser) -> None:
+    global _worker_parser  # noqa: PLW0603
+    _worker_parser = parser
+
+
+def _parse_blob(parser: BaseBlobParser, blob: Blob) -> tuple[list[Document], float]:
+    start = time.perf_counter()
+    documents = list(parser.lazy_parse(blob))
+    return documents, time.perf_counter() - start
+
+
+def _parse_blob_in_worker(blob: Blob) -> tuple[list[Document], float]:
+    if _worker_parser is None:  # pragma: no cover
+        msg = "Worker process was not initialized with a parser"
+        raise RuntimeError(msg)
+    return _parse_blob(_worker_parser, blob)
+
+
+@dataclass
+class PipelineStats:
+    """Per-stage counters of a `ParallelGenericLoader` run."""
+
+    blobs_loaded: int = 0
+    """Blobs yielded by the blob loader."""
+    blobs_parsed: int = 0
+    """Blobs parsed by the parser."""
+    documents: int = 0
+    """Documents yielded."""
+    load_seconds: float = 0.0
+    """Time spent waiting on the blob loader."""
+    parse_seconds: float = 0.0
+    """Time spent parsing, summed over workers."""
+    wall_seconds: float = 0.0
+    """Time from the start of the run to its last document."""
+
+    @property
+    def load_throughput(self) -> float:
+        """Blobs loaded per second of loading."""
+        return self.blobs_loaded / self.load_seconds if self.load_seconds else 0.0
+
+    @property
+    def parse_throughput(self) -> float:
+        """Blobs parsed per second of parsing, for a single worker."""
+        return self.blobs_parsed / self.parse_seconds if self.parse_seconds else 0.0
+
+    @property
+    def documents_per_second(self) -> float:
+        """Documents yielded per second of wall time."""
+        return self.documents / self.wall_seconds if self.wall_seconds else 0.0
+
+
+class ParallelGenericLoader(BaseLoader):
+    """Generic document loader that parses blobs in a pool of workers.
+
+    Combines a blob loader with a blob parser like `GenericLoader`, but while the
+    blob loader runs in the calling thread, blobs are parsed concurrently in a
+    process pool (or a thread pool, for parsers that release the GIL or are not
+    picklable). At most `max_in_flight` blobs are submitted and not yet yielded at
+    any time, which bounds memory use.
+
+    With `ordered=True`, documents are yielded in exactly the order of serial
+    parsing. With `ordered=False`, the documents of each blob are yielded as soon
+    as it is parsed.
+
+    In a process pool, the parser is sent to each worker once and blobs are
+    pickled per task. Blobs backed by a path and without in-memory data are sent
+    as just the path, so each worker reads the file itself.
+
+    Example:
+        ```python
+        from langchain_community.document_loaders import FileSystemBlobLoader
+        from langchain_community.document_loaders.parsers import TextParser
+
+        loader = ParallelGenericLoader(
+            FileSystemBlobLoader("data", glob="**/*.md"),
+            TextParser(),
+            max_workers=8,
+        )
+        docs = loader.load()
+        print(loader.stats)
+        ```
+    """
+
+    def __init__(
+        self,
+        blob_loader: BlobLoader,
+        blob_parser: BaseBlobParser,
+        *,
+        max_workers: int | None = None,
+        max_in_flight: int | None = None,
+        ordered: bool = True,
+        executor: Literal["process", "thread"] = "process",
+    ) -> None:
+        """Initialize the loader.
+
+        Args:
+            blob_loader: Blob loader yielding the blobs to parse.
+            blob_parser: Parser turning each blob into documents. It must be
+                picklable with `executor="process"`.
+            max_workers: Number of workers. Defaults to the number of CPUs.
+            max_in_flight: Maximum number of blobs submitted and not yet yielded.
+                Defaults to twice `max_workers`.
+            ordered: Whether to yield documents in the order of the blobs.
+            executor: Whether to parse in a process pool or a thread pool.
+
+        Raises:
+            ValueError: If `max_workers` or `max_in_flight` is less than 1.
+        """
+        self.blob_loader = blob_loader
+        self.blob_parser = blob_parser
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_in_flight = max_in_flight or 2 * self.max_workers
+        if self.max_workers < 1 or self.max_in_flight < 1:
+            msg = "max_workers and max_in_flight must be at least 1"
+            raise ValueError(msg)
+        self.ordered = ordered
+        self.executor = executor
+        self.stats = PipelineStats()
+        """Counters of the latest `lazy_load` run."""
+
+    def _create_executor(self) -> Executor:
+        if self.executor == "process":
+            return ProcessPoolExecutor(
+                self.max_workers,
+                initializer=_init_worker,
+                initargs=(self.blob_parser,),
+            )
+        return ThreadPoolExecutor(self.max_workers)
+
+    def _submit(self, executor: Executor, blob: Blob) -> Future:
+        if self.executor == "process":
+            return executor.submit(_parse_blob_in_worker, blob)
+        return executor.submit(_parse_blob, self.blob_parser, blob)
+
+    def _next_blob(self, blobs: Iterator[Blob]) -> Blob | None:
+        start = time.perf_counter()
+        blob = next(blobs, None)
+        self.stats.load_seconds += time.perf_counter() - start
+        if blob is not None:
+            self.stats.blobs_loaded += 1
+        return blob
+
+    def _collect(self, future: Future, start: float) -> list[Document]:
+        documents, seconds = future.result()
+        self.stats.blobs_parsed += 1
+        self.stats.parse_seconds += seconds
+        self.stats.documents += len(documents)
+        self.stats.wall_seconds = time.perf_counter() - start
+        return documents
+
+    def lazy_load(self) -> Iterator[Document]:
+        """Load documents, parsing blobs in parallel.
+
+        Yields:
+            The `Document` objects.
+        """
+        self.stats = stats = PipelineStats()
+        start = time.perf_counter()
+        blobs = iter(self.blob_loader.yield_blobs())
+        executor = self._create_executor()
+        pending: deque[Future] = deque()
+        try:
+            while (blob := self._next_blob(blobs)) is not None:
+                pending.append(self._submit(executor, blob))
+                if len(pending) < self.max_in_flight:
+                    continue
+                if self.ordered:
+                    yield from self._collect(pending.popleft(), start)
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in [f for f in pending if f in done]:
+                        pending.remove(future)
+                        yield from self._collect(future, start)
+            while pending:
+                if self.ordered:
+                    future = pending.popleft()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    future = next(f for f in pending if f in done)
+                    pending.remove(future)
+                yield from self._collect(future, start)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            stats.wall_seconds = time.perf_counter() - start
@@ -0,0 +1,37 @@
+"""Helpers for retrievers that batch concurrent async requests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, MutableMapping
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+def loop_local(
+    objects: MutableMapping[asyncio.AbstractEventLoop, T], factory: Callable[[], T]
+) -> T:
+    """Get the object of the running event loop, creating it if needed.
+
+    Batchers hold futures bound to one event loop, so a component used from several
+    loops keeps one per loop. When a new object is created, those of event loops
+    that have been closed are dropped.
+
+    Args:
+        objects: The objects created so far, by event loop. Updated in place.
+        factory: Function creating the object for a loop that has none yet.
+
+    Returns:
+        The object of the running event loop.
+
+    Raises:
+        RuntimeError: If there is no running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    obj = objects.get(loop)
+    if obj is None:
+        for closed in [other for other in list(objects) if other.is_closed()]:
+            objects.pop(closed, None)
+        obj = objects[loop] = factory()
+    return obj
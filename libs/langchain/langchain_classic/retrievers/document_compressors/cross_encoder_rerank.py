@@ -1,32 +1,190 @@
 from __future__ import annotations
 
-import operator
-from collections.abc import Sequence
+import asyncio
+import hashlib
+import heapq
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
 
 from langchain_core.callbacks import Callbacks
 from langchain_core.documents import BaseDocumentCompressor, Document
-from pydantic import ConfigDict
+from pydantic import ConfigDict, PrivateAttr
 from typing_extensions import override
 
+from langchain_classic.retrievers._batching import loop_local
 from langchain_classic.retrievers.document_compressors.cross_encoder import (
     BaseCrossEncoder,
 )
 
 
+def _pair_key(query: str, text: str) -> bytes:
+    # Length prefix keeps ("ab", "c") and ("a", "bc") apart
+    data = f"{len(query)}:{query}{text}".encode()
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _top_n_indices(scores: Sequence[float], n: int) -> list[int]:
+    """Indices of the `n` highest scores, best first; ties keep input order."""
+    if n <= 0:
+        return []
+    try:
+        import numpy as np
+    except ImportError:
+        return heapq.nlargest(n, range(len(scores)), key=scores.__getitem__)
+
+    values = np.asarray(scores, dtype=float)
+    if n >= len(values):
+        return np.argsort(-values, kind="stable").tolist()
+    # Select with argpartition, then sort only the selected scores
+    cut = len(values) - n
+    threshold = values[np.argpartition(values, cut)[cut]]
+    above = np.flatnonzero(values > threshold)
+    ties = np.flatnonzero(values == threshold)[: n - len(above)]
+    selected = np.concatenate([above, ties])
+    return selected[np.argsort(-values[selected], kind="stable")].tolist()
+
+
+@dataclass
+class _PendingScores:
+    pairs: list[tuple[str, str]]
+    keys: list[bytes]
+    future: asyncio.Future[list[float]]
+
+
+class _ScoreBatcher:
+    """Coalesces the uncached pairs of concurrent async calls on one event loop."""
+
+    def __init__(
+        self,
+        score_pairs: Callable[[list[tuple[str, str]], list[bytes]], list[float]],
+        worker: Callable[[], Executor],
+    ) -> None:
+        self.score_pairs = score_pairs
+        self.worker = worker
+        self.loop = asyncio.get_running_loop()
+        self.pending: deque[_PendingScores] = deque()
+        self.task: asyncio.Task[None] | None = None
+
+    def submit(
+        self, pairs: list[tuple[str, str]], keys: list[bytes]
+    ) -> asyncio.Future[list[float]]:
+        future = self.loop.create_future()
+        self.pending.append(_PendingScores(pairs, keys, future))
+        if self.task is None or self.task.done():
+            self.task = self.loop.create_task(self._run())
+        return future
+
+    async def _run(self) -> None:
+        # Let callers scheduled in the same iteration enqueue their pairs; calls
+        # arriving while the model runs are picked up by the next round
+        await asyncio.sleep(0)
+        while self.pending:
+            items = [item for item in self.pending if not item.future.done()]
+            self.pending.clear()
+            unique: dict[bytes, tuple[str, str]] = {}
+            for item in items:
+                unique.update(zip(item.keys, item.pairs, strict=True))
+            if not unique:
+                continue
+            try:
+                scores = await self.loop.run_in_executor(
+                    self.worker(),
+                    self.score_pairs,
+                    list(unique.values()),
+                    list(unique),
+                )
+            except Exception as e:  # noqa: BLE001
+                for item in items:
+                    if not item.future.done():
+                        item.future.set_exception(e)
+                continue
+            by_key = dict(zip(unique, scores, strict=True))
+            for item in items:
+                if not item.future.done():
+                    item.future.set_result([by_key[key] for key in item.keys])
+
+
 class CrossEncoderReranker(BaseDocumentCompressor):
-    """Document compressor that uses CrossEncoder for reranking."""
+    """Document compressor that uses CrossEncoder for reranking.
+
+    Pairs are scored in batches of at most `batch_size`, and scores are cached in
+    an LRU keyed by a hash of the `(query, page_content)` pair, so repeated or
+    overlapping queries only score new pairs.
+
+    The async path runs the model on a dedicated worker thread instead of the event
+    loop. Pairs from concurrent `acompress_documents` calls are coalesced into
+    shared `model.score` calls, and pairs needed by several calls are scored once.
+    """
 
     model: BaseCrossEncoder
     """CrossEncoder model to use for scoring similarity
       between the query and documents."""
     top_n: int = 3
     """Number of documents to return."""
+    batch_size: int = 32
+    """Maximum number of pairs per `model.score` call."""
+    cache_size: int = 1024
+    """Maximum number of cached pair scores. Set to `0` to disable caching."""
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
         extra="forbid",
     )
 
+    _cache: OrderedDict[bytes, float] = PrivateAttr(default_factory=OrderedDict)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _executor: ThreadPoolExecutor | None = PrivateAttr(default=None)
+    _batchers: dict[asyncio.AbstractEventLoop, _ScoreBatcher] = PrivateAttr(
+        default_factory=dict
+    )
+
+    def _worker(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="cross-encoder"
+                )
+            return self._executor
+
+    def _cached_scores(
+        self, query: str, documents: Sequence[Document]
+    ) -> tuple[list[float | None], list[bytes]]:
+        keys = [_pair_key(query, doc.page_content) for doc in documents]
+        if not self.cache_size:
+            return [None] * len(keys), keys
+        with self._lock:
+            scores = []
+            for key in keys:
+                score = self._cache.get(key)
+                if score is not None:
+                    self._cache.move_to_end(key)
+                scores.append(score)
+        return scores, keys
+
+    def _score_pairs(
+        self, pairs: list[tuple[str, str]], keys: list[bytes]
+    ) -> list[float]:
+        """Score `pairs` in batches and cache the results."""
+        scores: list[float] = []
+        for start in range(0, len(pairs), self.batch_size):
+            scores.extend(self.model.score(pairs[start : start + self.batch_size]))
+        if self.cache_size:
+            with self._lock:
+                for key, score in zip(keys, scores, strict=True):
+                    self._cache[key] = score
+                    self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return scores
+
+    def _rerank(
+        self, documents: Sequence[Document], scores: Sequence[float]
+    ) -> list[Document]:
+        return [documents[i] for i in _top_n_indices(scores, self.top_n)]
+
     @override
     def compress_documents(
         self,
@@ -44,7 +202,46 @@ class CrossEncoderReranker(BaseDocumentCompressor):
         Returns:
             A sequence of compressed documents.
         """
-        scores = self.model.score([(query, doc.page_content) for doc in documents])
-        docs_with_scores = list(zip(documents, scores, strict=False))
-        result = sorted(docs_with_scores, key=operator.itemgetter(1), reverse=True)
-        return [doc for doc, _ in result[: self.top_n]]
+        scores, keys = self._cached_scores(query, documents)
+        missing = [i for i, score in enumerate(scores) if score is None]
+        if missing:
+            new_scores = self._score_pairs(
+                [(query, documents[i].page_content) for i in missing],
+                [keys[i] for i in missing],
+            )
+            for i, score in zip(missing, new_scores, strict=True):
+                scores[i] = score
+        return self._rerank(documents, scores)  # type: ignore[arg-type]
+
+    @override
+    async def acompress_documents(
+        self,
+        documents: Sequence[Document],
+        query: str,
+        callbacks: Callbacks | None = None,
+    ) -> Sequence[Document]:
+        """Rerank documents using CrossEncoder without blocking the event loop.
+
+        Args:
+            documents: A sequence of documents to compress.
+            query: The query to use for compressing the documents.
+            callbacks: Callbacks to run during the compression process.
+
+        Returns:
+            A sequence of compressed documents.
+        """
+        scores, keys = self._cached_scores(query, documents)
+        missing = [i for i, score in enumerate(scores) if score is None]
+        if missing:
+            new_scores = await self._batcher().submit(
+                [(query, documents[i].page_content) for i in missing],
+                [keys[i] for i in missing],
+            )
+            for i, score in zip(missing, new_scores, strict=True):
+                scores[i] = score
+        return self._rerank(documents, scores)  # type: ignore[arg-type]
+
+    def _batcher(self) -> _ScoreBatcher:
+        return loop_local(
+            self._batchers, lambda: _ScoreBatcher(self._score_pairs, self._worker)
+        )
@@ -1,4 +1,5 @@
 from collections.abc import Callable, Sequence
+from typing import Any
 
 from langchain_core.callbacks import Callbacks
 from langchain_core.documents import BaseDocumentCompressor, Document
@@ -20,10 +21,100 @@ def _get_similarity_function() -> Callable:
     return cosine_similarity
 
 
+def _known_vectors(
+    documents: Sequence[Document], vector_metadata_key: str | None
+) -> list[Any]:
+    """Vectors already available for `documents`, `None` where there is none."""
+    vectors: list[Any] = []
+    for doc in documents:
+        state = getattr(doc, "state", None)
+        vector = state.get("embedded_doc") if isinstance(state, dict) else None
+        if vector is None and vector_metadata_key is not None:
+            vector = doc.metadata.get(vector_metadata_key)
+        vectors.append(vector)
+    return vectors
+
+
+def _fill_vectors(
+    documents: Sequence[Document],
+    vectors: list[Any],
+    missing: list[int],
+    embedded: list[list[float]],
+) -> list[list[float]]:
+    for i, vector in zip(missing, embedded, strict=True):
+        vectors[i] = vector
+    for doc, vector in zip(documents, vectors, strict=True):
+        state = getattr(doc, "state", None)
+        if isinstance(state, dict):
+            # Cache like `_get_embeddings_from_stateful_docs` does
+            state["embedded_doc"] = vector
+    return vectors
+
+
+def _without_vector(document: Document, vector_metadata_key: str | None) -> Document:
+    """Drop the stored vector from the metadata of a document being returned."""
+    if vector_metadata_key is not None and vector_metadata_key in document.metadata:
+        # Rebuild rather than pop: the metadata may be shared with the input document
+        document.metadata = {
+            key: value
+            for key, value in document.metadata.items()
+            if key != vector_metadata_key
+        }
+    return document
+
+
+def _get_document_embeddings(
+    embeddings: Embeddings,
+    documents: Sequence[Document],
+    vector_metadata_key: str | None = None,
+) -> list[list[float]]:
+    """Embed `documents`, reusing vectors they already carry."""
+    vectors = _known_vectors(documents, vector_metadata_key)
+    missing = [i for i, vector in enumerate(vectors) if vector is None]
+    embedded = (
+        embeddings.embed_documents([documents[i].page_content for i in missing])
+        if missing
+        else []
+    )
+    return _fill_vectors(documents, vectors, missing, embedded)
+
+
+async def _aget_document_embeddings(
+    embeddings: Embeddings,
+    documents: Sequence[Document],
+    vector_metadata_key: str | None = None,
+) -> list[list[float]]:
+    """Async embed `documents`, reusing vectors they already carry."""
+    vectors = _known_vectors(documents, vector_metadata_key)
+    missing = [i for i, vector in enumerate(vectors) if vector is None]
+    embedded = (
+        await embeddings.aembed_documents([documents[i].page_content for i in missing])
+        if missing
+        else []
+    )
+    return _fill_vectors(documents, vectors, missing, embedded)
+
+
 class EmbeddingsFilter(BaseDocumentCompressor):
     """Embeddings Filter.
 
     Document compressor that uses embeddings to drop documents unrelated to the query.
+
+    Documents that already carry their embedding are not embedded again: the
+    vector is taken from the document state (`state["embedded_doc"]`, set by
+    the embeddings transformers) or from `metadata[vector_metadata_key]`.
+
+    Example:
+        ```python
+        retriever = vectorstore.as_retriever(
+            search_kwargs={"k": 20}, vector_metadata_key="embedding"
+        )
+        compressor = EmbeddingsFilter(
+            embeddings=embeddings,
+            similarity_threshold=0.76,
+            vector_metadata_key="embedding",
+        )
+        ```
     """
 
     embeddings: Embeddings
@@ -39,6 +130,11 @@ class EmbeddingsFilter(BaseDocumentCompressor):
     """Threshold for determining when two documents are similar enough
     to be considered redundant. Defaults to `None`, must be specified if `k` is set
     to None."""
+    vector_metadata_key: str | None = None
+    """Metadata key holding the stored document embedding, e.g. as added by a
+    `VectorStoreRetriever` with the same `vector_metadata_key`. It must have been
+    computed with the same embedding model. The key is removed from the metadata of
+    the returned documents, which keep the vector in `state["embedded_doc"]`."""
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
@@ -62,7 +158,6 @@ class EmbeddingsFilter(BaseDocumentCompressor):
         """Filter documents based on similarity of their embeddings to the query."""
         try:
             from langchain_community.document_transformers.embeddings_redundant_filter import (  # noqa: E501
-                _get_embeddings_from_stateful_docs,
                 get_stateful_documents,
             )
         except ImportError as e:
@@ -78,9 +173,10 @@ class EmbeddingsFilter(BaseDocumentCompressor):
             msg = "Could not import numpy, please install with `pip install numpy`."
             raise ImportError(msg) from e
         stateful_documents = get_stateful_documents(documents)
-        embedded_documents = _get_embeddings_from_stateful_docs(
+        embedded_documents = _get_document_embeddings(
             self.embeddings,
             stateful_documents,
+            self.vector_metadata_key,
         )
         embedded_query = self.embeddings.embed_query(query)
         similarity = self.similarity_fn([embedded_query], embedded_documents)[0]
@@ -94,7 +190,10 @@ class EmbeddingsFilter(BaseDocumentCompressor):
             included_idxs = included_idxs[similar_enough]
         for i in included_idxs:
             stateful_documents[i].state["query_similarity_score"] = similarity[i]
-        return [stateful_documents[i] for i in included_idxs]
+        return [
+            _without_vector(stateful_documents[i], self.vector_metadata_key)
+            for i in included_idxs
+        ]
 
     @override
     async def acompress_documents(
@@ -106,7 +205,6 @@ class EmbeddingsFilter(BaseDocumentCompressor):
         """Filter documents based on similarity of their embeddings to the query."""
         try:
             from langchain_community.document_transformers.embeddings_redundant_filter import (  # noqa: E501
-                _aget_embeddings_from_stateful_docs,
                 get_stateful_documents,
             )
         except ImportError as e:
@@ -122,9 +220,10 @@ class EmbeddingsFilter(BaseDocumentCompressor):
             msg = "Could not import numpy, please install with `pip install numpy`."
             raise ImportError(msg) from e
         stateful_documents = get_stateful_documents(documents)
-        embedded_documents = await _aget_embeddings_from_stateful_docs(
+        embedded_documents = await _aget_document_embeddings(
             self.embeddings,
             stateful_documents,
+            self.vector_metadata_key,
         )
         embedded_query = await self.embeddings.aembed_query(query)
         similarity = self.similarity_fn([embedded_query], embedded_documents)[0]
@@ -138,4 +237,7 @@ class EmbeddingsFilter(BaseDocumentCompressor):
             included_idxs = included_idxs[similar_enough]
         for i in included_idxs:
             stateful_documents[i].state["query_similarity_score"] = similarity[i]
-        return [stateful_documents[i] for i in included_idxs]
+        return [
+            _without_vector(stateful_documents[i], self.vector_metadata_key)
+            for i in included_idxs
+        ]
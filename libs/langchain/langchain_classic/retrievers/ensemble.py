@@ -5,11 +5,11 @@ multiple retrievers by using weighted  Reciprocal Rank Fusion.
 """
 
 import asyncio
-from collections import defaultdict
+import heapq
 from collections.abc import Callable, Hashable, Iterable, Iterator
-from itertools import chain
 from typing import (
     Any,
+    Literal,
     TypeVar,
     cast,
 )
@@ -21,7 +21,11 @@ from langchain_core.callbacks import (
 from langchain_core.documents import Document
 from langchain_core.retrievers import BaseRetriever, RetrieverLike
 from langchain_core.runnables import RunnableConfig
-from langchain_core.runnables.config import ensure_config, patch_config
+from langchain_core.runnables.config import (
+    ensure_config,
+    get_executor_for_config,
+    patch_config,
+)
 from langchain_core.runnables.utils import (
     ConfigurableFieldSpec,
     get_unique_config_specs,
@@ -63,12 +67,33 @@ class EnsembleRetriever(BaseRetriever):
             of high-ranked items and the consideration given to lower-ranked items.
         id_key: The key in the document's metadata used to determine unique documents.
             If not specified, page_content is used.
+        fusion: How the ranked lists are combined:
+
+            - `'rrf'`: weighted Reciprocal Rank Fusion, `weight / (rank + c)`.
+            - `'comb_sum'`: CombSUM, the weighted sum of the retrievers' scores.
+            - `'min_max'`: the weighted sum of scores min-max normalized per
+                retriever, so retrievers with different score scales are comparable.
+
+            Score-based fusions read the score from `doc.metadata[input_score_key]`.
+            Documents without it are scored by rank, linearly from 1 (first) down
+            to `1 / len(results)` (last).
+        top_k: Return only the `top_k` best documents. Selected with a heap instead
+            of sorting every fused document.
+        score_key: If set, the fused score is written to this metadata key of the
+            returned documents (which are copies; retriever results are not
+            modified).
+        input_score_key: Metadata key holding retriever scores for `'comb_sum'` and
+            `'min_max'` fusion.
     """
 
     retrievers: list[RetrieverLike]
     weights: list[float]
     c: int = 60
     id_key: str | None = None
+    fusion: Literal["rrf", "comb_sum", "min_max"] = "rrf"
+    top_k: int | None = None
+    score_key: str | None = None
+    input_score_key: str = "score"
 
     @property
     def config_specs(self) -> list[ConfigurableFieldSpec]:
@@ -219,17 +244,26 @@ class EnsembleRetriever(BaseRetriever):
         Returns:
             A list of reranked documents.
         """
-        # Get the results of all retrievers.
-        retriever_docs = [
-            retriever.invoke(
+
+        # Get the results of all retrievers, in parallel when there are several.
+        def _retrieve(i: int, retriever: RetrieverLike) -> list[Document]:
+            return retriever.invoke(
                 query,
                 patch_config(
                     config,
                     callbacks=run_manager.get_child(tag=f"retriever_{i + 1}"),
                 ),
             )
-            for i, retriever in enumerate(self.retrievers)
-        ]
+
+        if len(self.retrievers) == 1:
+            retriever_docs = [_retrieve(0, self.retrievers[0])]
+        else:
+            with get_executor_for_config(config) as executor:
+                retriever_docs = list(
+                    executor.map(
+                        _retrieve, range(len(self.retrievers)), self.retrievers
+                    )
+                )
 
         # Enforce that retrieved docs are Documents for each list in retriever_docs
         for i in range(len(retriever_docs)):
@@ -239,7 +273,7 @@ class EnsembleRetriever(BaseRetriever):
             ]
 
         # apply rank fusion
-        return self.weighted_reciprocal_rank(retriever_docs)
+        return self.fuse_documents(retriever_docs)
 
     async def arank_fusion(
         self,
@@ -283,7 +317,22 @@ class EnsembleRetriever(BaseRetriever):
             ]
 
         # apply rank fusion
-        return self.weighted_reciprocal_rank(retriever_docs)
+        return self.fuse_documents(retriever_docs)
+
+    def fuse_documents(
+        self,
+        doc_lists: list[list[Document]],
+    ) -> list[Document]:
+        """Combine ranked lists with the configured `fusion` method.
+
+        Args:
+            doc_lists: A list of rank lists, one per retriever.
+
+        Returns:
+            The deduplicated documents sorted by fused score in descending order
+            (at most `top_k` of them). Ties keep the order of first appearance.
+        """
+        return self._fuse(doc_lists, self.fusion)
 
     def weighted_reciprocal_rank(
         self,
@@ -301,36 +350,62 @@ class EnsembleRetriever(BaseRetriever):
             The final aggregated list of items sorted by their weighted RRF
             scores in descending order.
         """
+        return self._fuse(doc_lists, "rrf")
+
+    def _list_scores(self, doc_list: list[Document], fusion: str) -> list[float]:
+        """Per-position scores of one ranked list before weighting."""
+        n = len(doc_list)
+        if fusion == "rrf":
+            return [1 / (rank + self.c) for rank in range(1, n + 1)]
+        scores = [
+            float(score)
+            if (score := doc.metadata.get(self.input_score_key)) is not None
+            else (n - rank) / n
+            for rank, doc in enumerate(doc_list)
+        ]
+        if fusion == "min_max" and scores:
+            low, high = min(scores), max(scores)
+            if high == low:
+                return [1.0] * n
+            return [(score - low) / (high - low) for score in scores]
+        return scores
+
+    def _fuse(
+        self,
+        doc_lists: list[list[Document]],
+        fusion: str,
+    ) -> list[Document]:
         if len(doc_lists) != len(self.weights):
             msg = "Number of rank lists must be equal to the number of weights."
             raise ValueError(msg)
 
-        # Associate each doc's content with its RRF score for later sorting by it
-        # Duplicated contents across retrievers are collapsed & scored cumulatively
-        rrf_score: dict[str, float] = defaultdict(float)
+        # Duplicated documents across retrievers are collapsed & scored cumulatively.
+        # Each key is computed once; the first occurrence of a document is kept.
+        id_key = self.id_key
+        fused: dict[Any, float] = {}
+        first: dict[Any, Document] = {}
         for doc_list, weight in zip(doc_lists, self.weights, strict=False):
-            for rank, doc in enumerate(doc_list, start=1):
-                rrf_score[
-                    (
-                        doc.page_content
-                        if self.id_key is None
-                        else doc.metadata[self.id_key]
-                    )
-                ] += weight / (rank + self.c)
-
-        # Docs are deduplicated by their contents then sorted by their scores
-        all_docs = chain.from_iterable(doc_lists)
-        return sorted(
-            unique_by_key(
-                all_docs,
-                lambda doc: (
-                    doc.page_content
-                    if self.id_key is None
-                    else doc.metadata[self.id_key]
-                ),
-            ),
-            reverse=True,
-            key=lambda doc: rrf_score[
-                doc.page_content if self.id_key is None else doc.metadata[self.id_key]
-            ],
-        )
+            for doc, score in zip(
+                doc_list, self._list_scores(doc_list, fusion), strict=True
+            ):
+                key = doc.page_content if id_key is None else doc.metadata[id_key]
+                if key in fused:
+                    fused[key] += weight * score
+                else:
+                    fused[key] = weight * score
+                    first[key] = doc
+
+        # Both keep ties in order of first appearance
+        if self.top_k is None:
+            ranked = sorted(fused, key=fused.__getitem__, reverse=True)
+        else:
+            ranked = heapq.nlargest(self.top_k, fused, key=fused.__getitem__)
+
+        if self.score_key is None:
+            return [first[key] for key in ranked]
+        return [
+            first[key].model_copy(
+                update={"metadata": {**first[key].metadata, self.score_key: fused[key]}}
+            )
+            for key in ranked
+        ]
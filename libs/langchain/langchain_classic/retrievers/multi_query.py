@@ -1,18 +1,22 @@
-import asyncio
 import logging
-from collections.abc import Sequence
+from collections.abc import Callable, Hashable, Sequence
+from typing import Any, cast
 
 from langchain_core.callbacks import (
     AsyncCallbackManagerForRetrieverRun,
     CallbackManagerForRetrieverRun,
 )
 from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 from langchain_core.language_models import BaseLanguageModel
 from langchain_core.output_parsers import BaseOutputParser
 from langchain_core.prompts import BasePromptTemplate
 from langchain_core.prompts.prompt import PromptTemplate
 from langchain_core.retrievers import BaseRetriever
 from langchain_core.runnables import Runnable
+from langchain_core.runnables.config import get_executor_for_config
+from langchain_core.runnables.utils import gather_with_concurrency
+from langchain_core.vectorstores import VectorStoreRetriever
 from typing_extensions import override
 
 from langchain_classic.chains.llm import LLMChain
@@ -42,8 +46,59 @@ DEFAULT_QUERY_PROMPT = PromptTemplate(
 )
 
 
+_UNHASHABLE = object()
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable fingerprint of a metadata value; equal values get equal ones."""
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list | tuple):
+        return type(value), tuple(_freeze(v) for v in value)
+    if isinstance(value, set | frozenset):
+        return frozenset, frozenset(value)
+    try:
+        hash(value)
+    except TypeError:
+        # Documents sharing this fingerprint are compared with `==`
+        return _UNHASHABLE
+    return value
+
+
+def _document_key(doc: Document) -> Hashable:
+    return doc.id, doc.page_content, _freeze(doc.metadata)
+
+
 def _unique_documents(documents: Sequence[Document]) -> list[Document]:
-    return [doc for i, doc in enumerate(documents) if doc not in documents[:i]]
+    # Bucket by fingerprint, then compare with `==` only inside a bucket
+    buckets: dict[Hashable, list[Document]] = {}
+    unique = []
+    for doc in documents:
+        bucket = buckets.setdefault(_document_key(doc), [])
+        if doc not in bucket:
+            bucket.append(doc)
+            unique.append(doc)
+    return unique
+
+
+def _reciprocal_rank_fusion(
+    document_lists: Sequence[Sequence[Document]], c: int = 60
+) -> list[Document]:
+    buckets: dict[Hashable, list[Document]] = {}
+    scores: dict[tuple[Hashable, int], float] = {}
+    for docs in document_lists:
+        for rank, doc in enumerate(docs, start=1):
+            key = _document_key(doc)
+            bucket = buckets.setdefault(key, [])
+            try:
+                slot = (key, bucket.index(doc))
+            except ValueError:
+                slot = (key, len(bucket))
+                bucket.append(doc)
+            scores[slot] = scores.get(slot, 0.0) + 1 / (rank + c)
+    # Ties keep the order of first appearance
+    ranked = sorted(scores, key=scores.__getitem__, reverse=True)
+    return [buckets[key][index] for key, index in ranked]
 
 
 class MultiQueryRetriever(BaseRetriever):
@@ -59,6 +114,19 @@ class MultiQueryRetriever(BaseRetriever):
     """DEPRECATED. parser_key is no longer used and should not be specified."""
     include_original: bool = False
     """Whether to include the original query in the list of generated queries."""
+    max_concurrency: int | None = None
+    """Maximum number of queries retrieved at once. By default sync retrieval uses
+    the default thread pool size and async retrieval is unbounded."""
+    rank_fusion: bool = False
+    """Order the results by Reciprocal Rank Fusion of the per-query rankings instead
+    of by first appearance, so documents found by several queries come first."""
+    batch_query_embeddings: bool = False
+    """If the retriever is a `VectorStoreRetriever` (similarity or MMR search), embed
+    all queries with one `embed_documents` call and search by vector.
+
+    Only use this with symmetric embedding models, i.e. ones that embed queries
+    and documents the same way. Per-query retriever callbacks are not emitted.
+    """
 
     @classmethod
     def from_llm(
@@ -68,6 +136,7 @@ class MultiQueryRetriever(BaseRetriever):
         prompt: BasePromptTemplate = DEFAULT_QUERY_PROMPT,
         parser_key: str | None = None,  # noqa: ARG003
         include_original: bool = False,  # noqa: FBT001,FBT002
+        **kwargs: Any,
     ) -> "MultiQueryRetriever":
         """Initialize from llm using default template.
 
@@ -80,6 +149,7 @@ class MultiQueryRetriever(BaseRetriever):
                 specified.
             include_original: Whether to include the original query in the list of
                 generated queries.
+            **kwargs: Other fields, e.g. `max_concurrency` or `rank_fusion`.
 
         Returns:
             MultiQueryRetriever
@@ -90,6 +160,7 @@ class MultiQueryRetriever(BaseRetriever):
             retriever=retriever,
             llm_chain=llm_chain,
             include_original=include_original,
+            **kwargs,
         )
 
     async def _aget_relevant_documents(
@@ -110,6 +181,10 @@ class MultiQueryRetriever(BaseRetriever):
         queries = await self.agenerate_queries(query, run_manager)
         if self.include_original:
             queries.append(query)
+        if self.rank_fusion:
+            return _reciprocal_rank_fusion(
+                await self._aretrieve_document_lists(queries, run_manager)
+            )
         documents = await self.aretrieve_documents(queries, run_manager)
         return self.unique_union(documents)
 
@@ -150,7 +225,26 @@ class MultiQueryRetriever(BaseRetriever):
         Returns:
             List of retrieved Documents
         """
-        document_lists = await asyncio.gather(
+        document_lists = await self._aretrieve_document_lists(queries, run_manager)
+        return [doc for docs in document_lists for doc in docs]
+
+    async def _aretrieve_document_lists(
+        self,
+        queries: list[str],
+        run_manager: AsyncCallbackManagerForRetrieverRun,
+    ) -> list[list[Document]]:
+        embeddings = self._query_embeddings()
+        if embeddings is not None and queries:
+            vectors = await embeddings.aembed_documents(queries)
+            try:
+                return await gather_with_concurrency(
+                    self.max_concurrency,
+                    *(self._asearch_by_vector(vector) for vector in vectors),
+                )
+            except NotImplementedError:
+                logger.debug("Vector store does not support search by vector")
+        return await gather_with_concurrency(
+            self.max_concurrency,
             *(
                 self.retriever.ainvoke(
                     query,
@@ -159,7 +253,6 @@ class MultiQueryRetriever(BaseRetriever):
                 for query in queries
             ),
         )
-        return [doc for docs in document_lists for doc in docs]
 
     def _get_relevant_documents(
         self,
@@ -179,6 +272,10 @@ class MultiQueryRetriever(BaseRetriever):
         queries = self.generate_queries(query, run_manager)
         if self.include_original:
             queries.append(query)
+        if self.rank_fusion:
+            return _reciprocal_rank_fusion(
+                self._retrieve_document_lists(queries, run_manager)
+            )
         documents = self.retrieve_documents(queries, run_manager)
         return self.unique_union(documents)
 
@@ -219,14 +316,71 @@ class MultiQueryRetriever(BaseRetriever):
         Returns:
             List of retrieved Documents
         """
-        documents = []
-        for query in queries:
-            docs = self.retriever.invoke(
+        document_lists = self._retrieve_document_lists(queries, run_manager)
+        return [doc for docs in document_lists for doc in docs]
+
+    def _retrieve_document_lists(
+        self,
+        queries: list[str],
+        run_manager: CallbackManagerForRetrieverRun,
+    ) -> list[list[Document]]:
+        search = self._run_in_parallel
+        embeddings = self._query_embeddings()
+        if embeddings is not None and queries:
+            vectors = embeddings.embed_documents(queries)
+            try:
+                return search(self._search_by_vector, vectors)
+            except NotImplementedError:
+                logger.debug("Vector store does not support search by vector")
+
+        def _retrieve(query: str) -> list[Document]:
+            return self.retriever.invoke(
                 query,
                 config={"callbacks": run_manager.get_child()},
             )
-            documents.extend(docs)
-        return documents
+
+        return search(_retrieve, queries)
+
+    def _run_in_parallel(
+        self, func: Callable[[Any], list[Document]], inputs: list[Any]
+    ) -> list[list[Document]]:
+        if len(inputs) <= 1:
+            return [func(item) for item in inputs]
+        with get_executor_for_config(
+            {"max_concurrency": self.max_concurrency}
+        ) as executor:
+            return list(executor.map(func, inputs))
+
+    def _query_embeddings(self) -> Embeddings | None:
+        """The embeddings to batch queries with, if batching applies."""
+        retriever = self.retriever
+        if (
+            self.batch_query_embeddings
+            and isinstance(retriever, VectorStoreRetriever)
+            and retriever.search_type in {"similarity", "mmr"}
+        ):
+            return retriever.vectorstore.embeddings
+        return None
+
+    def _search_by_vector(self, vector: list[float]) -> list[Document]:
+        retriever = cast("VectorStoreRetriever", self.retriever)
+        if retriever.search_type == "mmr":
+            return retriever.vectorstore.max_marginal_relevance_search_by_vector(
+                vector, **retriever.search_kwargs
+            )
+        return retriever.vectorstore.similarity_search_by_vector(
+            vector, **retriever.search_kwargs
+        )
+
+    async def _asearch_by_vector(self, vector: list[float]) -> list[Document]:
+        retriever = cast("VectorStoreRetriever", self.retriever)
+        if retriever.search_type == "mmr":
+            return await retriever.vectorstore.amax_marginal_relevance_search_by_vector(
+                vector, **retriever.search_kwargs
+            )
+        return await retriever.vectorstore.asimilarity_search_by_vector(
+            vector, **retriever.search_kwargs
+        )
 
     def unique_union(self, documents: list[Document]) -> list[Document]:
         """Get unique Documents.
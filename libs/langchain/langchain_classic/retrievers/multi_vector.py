@@ -1,3 +1,7 @@
+import asyncio
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine, Sequence
 from enum import Enum
 from typing import Any
 
@@ -9,9 +13,10 @@ from langchain_core.documents import Document
 from langchain_core.retrievers import BaseRetriever
 from langchain_core.stores import BaseStore, ByteStore
 from langchain_core.vectorstores import VectorStore
-from pydantic import Field, model_validator
+from pydantic import Field, PrivateAttr, model_validator
 from typing_extensions import override
 
+from langchain_classic.retrievers._batching import loop_local
 from langchain_classic.storage._lc_store import create_kv_docstore
 
 
@@ -26,8 +31,109 @@ class SearchType(str, Enum):
     """Maximal Marginal Relevance reranking of similarity search."""
 
 
+def _document_size(document: Document) -> int:
+    """Approximate size of a document in bytes."""
+    return len(document.page_content) + len(str(document.metadata))
+
+
+class _ParentCache:
+    """LRU of parent documents bounded by their total approximate size."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.entries: OrderedDict[str, tuple[Document, int]] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get_many(self, ids: Sequence[str]) -> dict[str, Document]:
+        hits = {}
+        with self.lock:
+            for _id in ids:
+                entry = self.entries.get(_id)
+                if entry is not None:
+                    self.entries.move_to_end(_id)
+                    # Callers may mutate metadata, keep the cached copy intact
+                    hits[_id] = entry[0].model_copy(
+                        update={"metadata": dict(entry[0].metadata)}
+                    )
+        return hits
+
+    def put_many(self, documents: dict[str, Document]) -> None:
+        with self.lock:
+            for _id, document in documents.items():
+                size = _document_size(document)
+                if size > self.max_bytes:
+                    continue
+                self._pop(_id)
+                self.entries[_id] = (
+                    document.model_copy(update={"metadata": dict(document.metadata)}),
+                    size,
+                )
+                self.size += size
+            while self.size > self.max_bytes:
+                self.size -= self.entries.popitem(last=False)[1][1]
+
+    def discard(self, ids: Sequence[str] | None) -> None:
+        with self.lock:
+            if ids is None:
+                self.entries.clear()
+                self.size = 0
+                return
+            for _id in ids:
+                self._pop(_id)
+
+    def _pop(self, _id: str) -> None:
+        entry = self.entries.pop(_id, None)
+        if entry is not None:
+            self.size -= entry[1]
+
+
+class _LookupBatcher:
+    """Coalesces concurrent `amget` calls on one event loop into one call."""
+
+    def __init__(
+        self,
+        amget: Callable[[Sequence[str]], Coroutine[Any, Any, list[Document | None]]],
+    ) -> None:
+        self.amget = amget
+        self.loop = asyncio.get_running_loop()
+        self.pending: list[tuple[list[str], asyncio.Future]] = []
+        self.task: asyncio.Task[None] | None = None
+
+    def submit(self, ids: list[str]) -> asyncio.Future:
+        future = self.loop.create_future()
+        if not self.pending:
+            self.task = self.loop.create_task(self._run())
+        self.pending.append((ids, future))
+        return future
+
+    async def _run(self) -> None:
+        # Let concurrent queries join until an iteration brings no new lookup
+        queued = 0
+        while queued != len(self.pending):
+            queued = len(self.pending)
+            await asyncio.sleep(0)
+        pending, self.pending = self.pending, []
+        keys = list(dict.fromkeys(_id for ids, _ in pending for _id in ids))
+        try:
+            documents = dict(zip(keys, await self.amget(keys), strict=True))
+        except Exception as e:  # noqa: BLE001
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for ids, future in pending:
+            if not future.done():
+                future.set_result([documents[_id] for _id in ids])
+
+
 class MultiVectorRetriever(BaseRetriever):
-    """Retrieve from a set of multiple embeddings for the same document."""
+    """Retrieve from a set of multiple embeddings for the same document.
+
+    Parent documents can be cached in an LRU bounded by `parent_cache_bytes`, in
+    front of the docstore. Asynchronous docstore lookups of concurrent queries are
+    coalesced into a single `amget` call.
+    """
 
     vectorstore: VectorStore
     """The underlying `VectorStore` to use to store small chunks
@@ -47,6 +153,22 @@ class MultiVectorRetriever(BaseRetriever):
     search_type: SearchType = SearchType.similarity
     """Type of search to perform (similarity / mmr)"""
 
+    child_fetch_k: int | None = None
+    """Number of child documents to search for, so that enough unique parents are
+    found. When set, at most `search_kwargs["k"]` (default 4) parents are
+    returned. If `None`, `search_kwargs["k"]` children are searched for and all
+    their parents are returned."""
+
+    parent_cache_bytes: int = 0
+    """Maximum approximate size in bytes of the parent documents cached in memory.
+    `0` disables the cache. Docstore writes made outside of this retriever are not
+    seen by the cache: call `clear_parent_cache` after them."""
+
+    _parent_cache: _ParentCache | None = PrivateAttr(default=None)
+    _batchers: dict[asyncio.AbstractEventLoop, _LookupBatcher] = PrivateAttr(
+        default_factory=dict
+    )
+
     @model_validator(mode="before")
     @classmethod
     def _shim_docstore(cls, values: dict) -> Any:
@@ -60,6 +182,77 @@ class MultiVectorRetriever(BaseRetriever):
         values["docstore"] = docstore
         return values
 
+    def clear_parent_cache(self, ids: Sequence[str] | None = None) -> None:
+        """Drop parent documents from the cache.
+
+        Args:
+            ids: Ids of the parents to drop. If `None`, clear the whole cache.
+        """
+        if self._parent_cache is not None:
+            self._parent_cache.discard(ids)
+
+    def _cache(self) -> _ParentCache | None:
+        if self.parent_cache_bytes <= 0:
+            return None
+        if self._parent_cache is None:
+            self._parent_cache = _ParentCache(self.parent_cache_bytes)
+        return self._parent_cache
+
+    def _search_kwargs(self) -> dict:
+        if self.child_fetch_k is None:
+            return self.search_kwargs
+        search_kwargs = {**self.search_kwargs, "k": self.child_fetch_k}
+        if self.search_type == SearchType.mmr:
+            search_kwargs["fetch_k"] = max(
+                self.search_kwargs.get("fetch_k", 20), self.child_fetch_k
+            )
+        return search_kwargs
+
+    def _parent_ids(self, sub_docs: list[Document]) -> list[str]:
+        # We do this to maintain the order of the IDs that are returned
+        ids = list(
+            dict.fromkeys(
+                d.metadata[self.id_key] for d in sub_docs if self.id_key in d.metadata
+            )
+        )
+        if self.child_fetch_k is not None:
+            ids = ids[: self.search_kwargs.get("k", 4)]
+        return ids
+
+    def _get_parents(self, ids: list[str]) -> list[Document]:
+        cache = self._cache()
+        hits = cache.get_many(ids) if cache is not None else {}
+        missing = [_id for _id in ids if _id not in hits]
+        if missing:
+            fetched = {
+                _id: doc
+                for _id, doc in zip(missing, self.docstore.mget(missing), strict=True)
+                if doc is not None
+            }
+            if cache is not None:
+                cache.put_many(fetched)
+            hits.update(fetched)
+        return [hits[_id] for _id in ids if _id in hits]
+
+    async def _aget_parents(self, ids: list[str]) -> list[Document]:
+        cache = self._cache()
+        hits = cache.get_many(ids) if cache is not None else {}
+        missing = [_id for _id in ids if _id not in hits]
+        if missing:
+            docs = await self._batcher().submit(missing)
+            fetched = {
+                _id: doc
+                for _id, doc in zip(missing, docs, strict=True)
+                if doc is not None
+            }
+            if cache is not None:
+                cache.put_many(fetched)
+            hits.update(fetched)
+        return [hits[_id] for _id in ids if _id in hits]
+
+    def _batcher(self) -> _LookupBatcher:
+        return loop_local(self._batchers, lambda: _LookupBatcher(self.docstore.amget))
+
     @override
     def _get_relevant_documents(
         self,
@@ -75,29 +268,24 @@ class MultiVectorRetriever(BaseRetriever):
         Returns:
             List of relevant documents.
         """
+        search_kwargs = self._search_kwargs()
         if self.search_type == SearchType.mmr:
             sub_docs = self.vectorstore.max_marginal_relevance_search(
                 query,
-                **self.search_kwargs,
+                **search_kwargs,
             )
         elif self.search_type == SearchType.similarity_score_threshold:
             sub_docs_and_similarities = (
                 self.vectorstore.similarity_search_with_relevance_scores(
                     query,
-                    **self.search_kwargs,
+                    **search_kwargs,
                 )
             )
             sub_docs = [sub_doc for sub_doc, _ in sub_docs_and_similarities]
         else:
-            sub_docs = self.vectorstore.similarity_search(query, **self.search_kwargs)
+            sub_docs = self.vectorstore.similarity_search(query, **search_kwargs)
 
-        # We do this to maintain the order of the IDs that are returned
-        ids = []
-        for d in sub_docs:
-            if self.id_key in d.metadata and d.metadata[self.id_key] not in ids:
-                ids.append(d.metadata[self.id_key])
-        docs = self.docstore.mget(ids)
-        return [d for d in docs if d is not None]
+        return self._get_parents(self._parent_ids(sub_docs))
 
     @override
     async def _aget_relevant_documents(
@@ -114,29 +302,24 @@ class MultiVectorRetriever(BaseRetriever):
         Returns:
             List of relevant documents.
         """
+        search_kwargs = self._search_kwargs()
         if self.search_type == SearchType.mmr:
             sub_docs = await self.vectorstore.amax_marginal_relevance_search(
                 query,
-                **self.search_kwargs,
+                **search_kwargs,
             )
         elif self.search_type == SearchType.similarity_score_threshold:
             sub_docs_and_similarities = (
                 await self.vectorstore.asimilarity_search_with_relevance_scores(
                     query,
-                    **self.search_kwargs,
+                    **search_kwargs,
                 )
             )
             sub_docs = [sub_doc for sub_doc, _ in sub_docs_and_similarities]
         else:
             sub_docs = await self.vectorstore.asimilarity_search(
                 query,
-                **self.search_kwargs,
+                **search_kwargs,
             )
 
-        # We do this to maintain the order of the IDs that are returned
-        ids = []
-        for d in sub_docs:
-            if self.id_key in d.metadata and d.metadata[self.id_key] not in ids:
-                ids.append(d.metadata[self.id_key])
-        docs = await self.docstore.amget(ids)
-        return [d for d in docs if d is not None]
+        return await self._aget_parents(self._parent_ids(sub_docs))
@@ -1,12 +1,31 @@
+import asyncio
+import hashlib
+import json
 import uuid
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future
 from typing import Any
 
 from langchain_core.documents import Document
+from langchain_core.indexing import IndexingResult
+from langchain_core.runnables.config import ContextThreadPoolExecutor
+from langchain_core.utils.iter import batch_iterate
 from langchain_text_splitters import TextSplitter
 
 from langchain_classic.retrievers import MultiVectorRetriever
 
+_NAMESPACE_UUID = uuid.UUID(int=2024)
+
+
+def _content_id(document: Document) -> str:
+    """Deterministic id of a document, from its content and metadata."""
+    serialized = json.dumps(
+        [document.page_content, document.metadata], sort_keys=True, default=str
+    )
+    return str(
+        uuid.uuid5(_NAMESPACE_UUID, hashlib.sha256(serialized.encode()).hexdigest())
+    )
+
 
 class ParentDocumentRetriever(MultiVectorRetriever):
     """Retrieve small chunks then retrieve their parent documents.
@@ -100,19 +119,228 @@ class ParentDocumentRetriever(MultiVectorRetriever):
         full_docs = []
         for i, doc in enumerate(documents):
             _id = doc_ids[i]
-            sub_docs = self.child_splitter.split_documents([doc])
-            if self.child_metadata_fields is not None:
-                for _doc in sub_docs:
-                    _doc.metadata = {
-                        k: _doc.metadata[k] for k in self.child_metadata_fields
-                    }
-            for _doc in sub_docs:
-                _doc.metadata[self.id_key] = _id
-            docs.extend(sub_docs)
+            docs.extend(self._split_parent(_id, doc))
             full_docs.append((_id, doc))
 
         return docs, full_docs
 
+    def _split_parent(self, parent_id: str, parent: Document) -> list[Document]:
+        sub_docs = self.child_splitter.split_documents([parent])
+        for _doc in sub_docs:
+            if self.child_metadata_fields is not None:
+                _doc.metadata = {
+                    k: _doc.metadata[k] for k in self.child_metadata_fields
+                }
+            _doc.metadata[self.id_key] = parent_id
+        return sub_docs
+
+    def _parent_batches(
+        self, documents: Iterable[Document], batch_size: int
+    ) -> Iterator[list[tuple[str, Document]]]:
+        """Split parents lazily and batch them with their content ids."""
+        parents: Iterable[Document] = documents
+        if self.parent_splitter is not None:
+            parents = (
+                parent
+                for doc in documents
+                for parent in self.parent_splitter.split_documents([doc])
+            )
+        for batch in batch_iterate(batch_size, parents):
+            yield [(_content_id(parent), parent) for parent in batch]
+
+    @staticmethod
+    def _with_child_ids(parent_id: str, children: list[Document]) -> list[Document]:
+        for i, child in enumerate(children):
+            child.id = str(uuid.uuid5(_NAMESPACE_UUID, f"{parent_id}:{i}"))
+        return children
+
+    def _write_batch(
+        self,
+        parents: dict[str, Document],
+        children: list[Document],
+        kwargs: dict[str, Any],
+    ) -> None:
+        # Parents last: a parent in the docstore marks its children as written
+        if children:
+            self.vectorstore.add_documents(
+                children, ids=[child.id for child in children], **kwargs
+            )
+        self.docstore.mset(list(parents.items()))
+        self.clear_parent_cache(list(parents))
+
+    async def _awrite_batch(
+        self,
+        parents: dict[str, Document],
+        children: list[Document],
+        kwargs: dict[str, Any],
+    ) -> None:
+        if children:
+            await self.vectorstore.aadd_documents(
+                children, ids=[child.id for child in children], **kwargs
+            )
+        await self.docstore.amset(list(parents.items()))
+        self.clear_parent_cache(list(parents))
+
+    def ingest(
+        self,
+        documents: Iterable[Document],
+        *,
+        batch_size: int = 256,
+        max_workers: int | None = None,
+        skip_existing: bool = True,
+        **kwargs: Any,
+    ) -> IndexingResult:
+        """Stream documents into the vectorstore and docstore in bounded batches.
+
+        Unlike `add_documents`, documents are consumed lazily, `batch_size`
+        parents at a time. The children of a batch are split in a thread pool
+        while the previous batch is being written, so at most two batches are held
+        in memory.
+
+        Parent ids are derived from a hash of the parent content and metadata,
+        and child ids from their parent id and position. Ingesting the same
+        documents again therefore writes the same ids, and with `skip_existing`
+        parents already in the docstore are not split or written again. Changing
+        the child splitter does not change the ids: re-ingest with
+        `skip_existing=False` in that case. Outdated versions of changed
+        documents are not deleted.
+
+        Args:
+            documents: Documents to ingest, consumed lazily.
+            batch_size: Number of parent documents per batch.
+            max_workers: Maximum number of threads splitting children.
+            skip_existing: Whether to skip parents already in the docstore.
+            **kwargs: Additional keyword arguments passed to the `VectorStore`.
+
+        Returns:
+            The number of parents added and skipped.
+        """
+        result = IndexingResult(
+            num_added=0, num_updated=0, num_skipped=0, num_deleted=0
+        )
+        seen: set[str] = set()
+        with (
+            ContextThreadPoolExecutor(max_workers=max_workers) as split_executor,
+            ContextThreadPoolExecutor(max_workers=1) as write_executor,
+        ):
+            write: Future | None = None
+            for batch in self._parent_batches(documents, batch_size):
+                existing = (
+                    self.docstore.mget([_id for _id, _ in batch])
+                    if skip_existing
+                    else None
+                )
+                parents = self._new_parents(batch, seen, existing)
+                result["num_skipped"] += len(batch) - len(parents)
+                if not parents:
+                    continue
+                children = [
+                    child
+                    for _id, docs in zip(
+                        parents,
+                        split_executor.map(
+                            self._split_parent, parents, parents.values()
+                        ),
+                        strict=True,
+                    )
+                    for child in self._with_child_ids(_id, docs)
+                ]
+                if write is not None:
+                    write.result()
+                write = write_executor.submit(
+                    self._write_batch, parents, children, kwargs
+                )
+                result["num_added"] += len(parents)
+            if write is not None:
+                write.result()
+        return result
+
+    async def aingest(
+        self,
+        documents: Iterable[Document],
+        *,
+        batch_size: int = 256,
+        max_workers: int | None = None,
+        skip_existing: bool = True,
+        **kwargs: Any,
+    ) -> IndexingResult:
+        """Stream documents into the vectorstore and docstore in bounded batches.
+
+        See `ingest`. Splitting runs in a thread pool, off the event loop.
+
+        Args:
+            documents: Documents to ingest, consumed lazily.
+            batch_size: Number of parent documents per batch.
+            max_workers: Maximum number of threads splitting children.
+            skip_existing: Whether to skip parents already in the docstore.
+            **kwargs: Additional keyword arguments passed to the `VectorStore`.
+
+        Returns:
+            The number of parents added and skipped.
+        """
+        result = IndexingResult(
+            num_added=0, num_updated=0, num_skipped=0, num_deleted=0
+        )
+        seen: set[str] = set()
+        loop = asyncio.get_running_loop()
+        batches = self._parent_batches(documents, batch_size)
+        write: asyncio.Task | None = None
+        with ContextThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                while batch := await loop.run_in_executor(
+                    executor, next, batches, None
+                ):
+                    existing = (
+                        await self.docstore.amget([_id for _id, _ in batch])
+                        if skip_existing
+                        else None
+                    )
+                    parents = self._new_parents(batch, seen, existing)
+                    result["num_skipped"] += len(batch) - len(parents)
+                    if not parents:
+                        continue
+                    split = await asyncio.gather(
+                        *(
+                            loop.run_in_executor(
+                                executor, self._split_parent, _id, parent
+                            )
+                            for _id, parent in parents.items()
+                        )
+                    )
+                    children = [
+                        child
+                        for _id, docs in zip(parents, split, strict=True)
+                        for child in self._with_child_ids(_id, docs)
+                    ]
+                    if write is not None:
+                        await write
+                    write = asyncio.create_task(
+                        self._awrite_batch(parents, children, kwargs)
+                    )
+                    result["num_added"] += len(parents)
+                if write is not None:
+                    await write
+            finally:
+                if write is not None and not write.done():
+                    write.cancel()
+        return result
+
+    @staticmethod
+    def _new_parents(
+        batch: list[tuple[str, Document]],
+        seen: set[str],
+        existing: Sequence[Document | None] | None,
+    ) -> dict[str, Document]:
+        """Parents of `batch` neither ingested in this run nor in the docstore."""
+        if existing is None:
+            existing = [None] * len(batch)
+        parents = {}
+        for (_id, parent), stored in zip(batch, existing, strict=True):
+            if _id not in seen and stored is None:
+                parents[_id] = parent
+            seen.add(_id)
+        return parents
+
     def add_documents(
         self,
         documents: list[Document],
@@ -143,6 +371,7 @@ class ParentDocumentRetriever(MultiVectorRetriever):
         self.vectorstore.add_documents(docs, **kwargs)
         if add_to_docstore:
             self.docstore.mset(full_docs)
+            self.clear_parent_cache([_id for _id, _ in full_docs])
 
     async def aadd_documents(
         self,
@@ -174,3 +403,4 @@ class ParentDocumentRetriever(MultiVectorRetriever):
         await self.vectorstore.aadd_documents(docs, **kwargs)
         if add_to_docstore:
             await self.docstore.amset(full_docs)
+            self.clear_parent_cache([_id for _id, _ in full_docs])
@@ -1,16 +1,34 @@
 """Test functionality related to combining documents."""
 
+import asyncio
 import re
+import threading
+import time
 from typing import Any
 
 import pytest
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
 from langchain_core.documents import Document
+from langchain_core.language_models import LLM
 from langchain_core.prompts import PromptTemplate, aformat_document, format_document
+from langchain_core.rate_limiters import InMemoryRateLimiter
+from typing_extensions import override
 
+from langchain_classic.chains.combine_documents.map_reduce import (
+    MapReduceDocumentsChain,
+)
 from langchain_classic.chains.combine_documents.reduce import (
+    PartialReduction,
+    ReduceDocumentsChain,
+    _TokenCounter,
     collapse_docs,
     split_list_of_docs,
 )
+from langchain_classic.chains.combine_documents.stuff import StuffDocumentsChain
+from langchain_classic.chains.llm import LLMChain
 from langchain_classic.chains.qa_with_sources import load_qa_with_sources_chain
 from tests.unit_tests.llms.fake_llm import FakeLLM
 
@@ -77,6 +95,154 @@ def test__split_list_works_correctly() -> None:
     assert doc_list == expected_result
 
 
+def test__token_counter_split_matches_split_list_of_docs() -> None:
+    docs = [
+        Document(page_content=text)
+        for text in ["foo", "bar", "baz", "foo" * 2, "bar", "baz", "b" * 9, "a"]
+    ]
+
+    def joined_len(docs: list[Document], sep: str = " ") -> int:
+        return len(sep.join(d.page_content for d in docs)) + 1
+
+    for token_max in (10, 11, 14):
+        counter = _TokenCounter(joined_len, sep=", ")
+        assert counter.split(docs, token_max) == split_list_of_docs(
+            docs, joined_len, token_max, sep=", "
+        )
+
+    with pytest.raises(ValueError, match="single document was longer"):
+        _TokenCounter(joined_len).split(docs, 9)
+
+
+def test__token_counter_split_respects_token_max() -> None:
+    """Groups are checked with the exact length, whatever the estimate."""
+    docs = [Document(page_content=text) for text in "abcdef"]
+
+    def superadditive_len(docs: list[Document]) -> int:
+        return len(docs) ** 2
+
+    groups = _TokenCounter(superadditive_len).split(docs, 5)
+    assert [d for group in groups for d in group] == docs
+    assert all(superadditive_len(group) <= 5 for group in groups)
+
+
+_LOCK = threading.Lock()
+
+
+class _SummaryLLM(LLM):
+    """Keeps the first word of each line; slower for prompts starting with "a"."""
+
+    delay: float = 0.0
+    running: int = 0
+    max_running: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "summary"
+
+    def get_num_tokens(self, text: str) -> int:
+        return len(text.split())
+
+    def _summarize(self, prompt: str) -> str:
+        return " ".join(line.split()[0] for line in prompt.splitlines() if line)
+
+    @override
+    def _call(
+        self,
+        prompt: str,
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> str:
+        with _LOCK:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay * 3 if prompt.startswith("a") else self.delay)
+        self.running -= 1
+        return self._summarize(prompt)
+
+    @override
+    async def _acall(
+        self,
+        prompt: str,
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> str:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(self.delay * 3 if prompt.startswith("a") else self.delay)
+        self.running -= 1
+        return self._summarize(prompt)
+
+
+def _reduce_chain(llm: _SummaryLLM, **kwargs: Any) -> ReduceDocumentsChain:
+    stuff_chain = StuffDocumentsChain(
+        llm_chain=LLMChain(llm=llm, prompt=PromptTemplate.from_template("{context}")),
+        document_variable_name="context",
+        document_separator="\n",
+    )
+    return ReduceDocumentsChain(
+        combine_documents_chain=stuff_chain, token_max=7, **kwargs
+    )
+
+
+_REVIEWS = [
+    Document(page_content=f"{word} great {i}", metadata={"i": i})
+    for i, word in enumerate(["a", "b", "c", "d", "e", "f", "g", "h"])
+]
+
+
+def test_reduce_documents_chain_stream_collapse() -> None:
+    llm = _SummaryLLM(delay=0.01)
+    chain = _reduce_chain(llm, max_concurrency=4)
+
+    partials = list(chain.stream_collapse(_REVIEWS))
+    assert llm.max_running > 1
+    # Groups of two reviews, then of three summaries; the slow "a" group last
+    assert [p.round for p in partials] == [0, 0, 0, 0, 1, 1]
+    assert partials[3] == PartialReduction(
+        0, 0, Document(page_content="a b", metadata={"i": "0, 1"})
+    )
+    assert {p.index for p in partials[:4]} == {0, 1, 2, 3}
+
+    result_docs, _ = chain._collapse(_REVIEWS)
+    assert [d.page_content for d in result_docs] == ["a c e", "g"]
+    sequential = _reduce_chain(_SummaryLLM())._collapse(_REVIEWS)[0]
+    assert result_docs == sequential
+
+
+async def test_reduce_documents_chain_astream_collapse() -> None:
+    llm = _SummaryLLM(delay=0.01)
+    rate_limiter = InMemoryRateLimiter(requests_per_second=1000, max_bucket_size=10)
+    chain = _reduce_chain(llm, max_concurrency=2, rate_limiter=rate_limiter)
+
+    partials = [p async for p in chain.astream_collapse(_REVIEWS)]
+    assert llm.max_running == 2
+    assert len(partials) == 6
+    result_docs, _ = await chain._acollapse(_REVIEWS)
+    assert result_docs == chain._collapse(_REVIEWS)[0]
+
+
+async def test_map_reduce_documents_chain_max_concurrency() -> None:
+    llm = _SummaryLLM(delay=0.01)
+    map_chain = LLMChain(llm=llm, prompt=PromptTemplate.from_template("{text}"))
+    chain = MapReduceDocumentsChain(
+        llm_chain=map_chain,
+        reduce_documents_chain=_reduce_chain(llm, max_concurrency=3),
+        max_concurrency=3,
+        return_intermediate_steps=True,
+    )
+    output, extra = chain.combine_docs(_REVIEWS)
+    assert extra["intermediate_steps"] == list("abcdefgh")
+    assert output == "a h"
+    assert llm.max_running == 3
+
+    llm.max_running = 0
+    assert await chain.acombine_docs(_REVIEWS) == (output, extra)
+    assert llm.max_running == 3
+
+
 def test__collapse_docs_no_metadata() -> None:
     """Test collapse documents functionality when no metadata."""
     docs = [
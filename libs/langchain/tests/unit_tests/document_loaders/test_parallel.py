@@ -0,0 +1,114 @@
+import json
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Literal
+
+import pytest
+from langchain_core.document_loaders import BaseBlobParser, Blob, BlobLoader
+from langchain_core.documents import Document
+from typing_extensions import override
+
+from langchain_classic.document_loaders.parallel import ParallelGenericLoader
+
+
+class _JSONParser(BaseBlobParser):
+    """Yields one document per review of a JSON list of reviews."""
+
+    @override
+    def lazy_parse(self, blob: Blob) -> Iterator[Document]:
+        reviews = json.loads(blob.as_string())
+        if len(reviews) % 2:
+            # Uneven parsing cost, so that blobs finish out of order
+            time.sleep(0.01)
+        for review in reviews:
+            if review == "bad":
+                msg = f"Bad review in {blob.source}"
+                raise ValueError(msg)
+            yield Document(page_content=review, metadata={"source": blob.source})
+
+
+class _PathBlobLoader(BlobLoader):
+    def __init__(self, paths: Iterable[Path]) -> None:
+        self.paths = list(paths)
+        self.loaded = 0
+
+    @override
+    def yield_blobs(self) -> Iterator[Blob]:
+        for path in self.paths:
+            self.loaded += 1
+            yield Blob.from_path(path)
+
+
+@pytest.fixture
+def paths(tmp_path: Path) -> list[Path]:
+    paths = []
+    for i in range(12):
+        path = tmp_path / f"{i:02}.json"
+        path.write_text(json.dumps([f"review {i}-{j}" for j in range(i % 3 + 1)]))
+        paths.append(path)
+    return paths
+
+
+def _serial(paths: list[Path]) -> list[Document]:
+    parser = _JSONParser()
+    return [doc for path in paths for doc in parser.lazy_parse(Blob.from_path(path))]
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_output_matches_serial_parsing(
+    paths: list[Path], executor: Literal["process", "thread"]
+) -> None:
+    loader = ParallelGenericLoader(
+        _PathBlobLoader(paths), _JSONParser(), max_workers=3, executor=executor
+    )
+    expected = _serial(paths)
+    assert loader.load() == expected
+
+    stats = loader.stats
+    assert stats.blobs_loaded == stats.blobs_parsed == len(paths)
+    assert stats.documents == len(expected)
+    assert stats.parse_seconds > 0
+    assert stats.parse_throughput > 0
+
+
+def test_unordered_output(paths: list[Path]) -> None:
+    loader = ParallelGenericLoader(
+        _PathBlobLoader(paths),
+        _JSONParser(),
+        max_workers=4,
+        ordered=False,
+        executor="thread",
+    )
+    docs = loader.load()
+    expected = _serial(paths)
+    assert sorted(doc.page_content for doc in docs) == sorted(
+        doc.page_content for doc in expected
+    )
+    # Documents of a blob stay together and in order
+    by_source: dict[str, list[str]] = {}
+    for doc in docs:
+        by_source.setdefault(doc.metadata["source"], []).append(doc.page_content)
+    for doc_list in by_source.values():
+        assert doc_list == sorted(doc_list)
+
+
+def test_in_flight_blobs_are_bounded(paths: list[Path]) -> None:
+    blob_loader = _PathBlobLoader(paths)
+    loader = ParallelGenericLoader(
+        blob_loader, _JSONParser(), max_workers=2, max_in_flight=3, executor="thread"
+    )
+    docs = loader.lazy_load()
+    next(docs)
+    assert blob_loader.loaded == 3
+    docs.close()
+    assert blob_loader.loaded == 3
+
+
+def test_parse_errors_propagate(paths: list[Path]) -> None:
+    paths[4].write_text(json.dumps(["bad"]))
+    loader = ParallelGenericLoader(
+        _PathBlobLoader(paths), _JSONParser(), max_workers=2, executor="thread"
+    )
+    with pytest.raises(ValueError, match=r"04\.json"):
+        loader.load()
@@ -0,0 +1,114 @@
+import asyncio
+import threading
+
+import pytest
+from langchain_core.documents import Document
+
+from langchain_classic.retrievers.document_compressors.cross_encoder import (
+    BaseCrossEncoder,
+)
+from langchain_classic.retrievers.document_compressors.cross_encoder_rerank import (
+    CrossEncoderReranker,
+    _top_n_indices,
+)
+
+
+class _FakeCrossEncoder(BaseCrossEncoder):
+    """Scores a pair by the number of query words found in the text."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[tuple[str, str]]] = []
+        self.threads: set[str] = set()
+        self.fail = False
+
+    def score(self, text_pairs: list[tuple[str, str]]) -> list[float]:
+        if self.fail:
+            msg = "model error"
+            raise RuntimeError(msg)
+        self.batches.append(list(text_pairs))
+        self.threads.add(threading.current_thread().name)
+        return [
+            float(sum(word in text for word in query.split()))
+            for query, text in text_pairs
+        ]
+
+
+_DOCS = [
+    Document(page_content=text)
+    for text in ["a b", "c", "a", "a b c", "b", "x", "a c", "b c"]
+]
+
+
+def _sorted_top_n(scores: list[float], n: int) -> list[int]:
+    return sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:n]
+
+
+@pytest.mark.parametrize("n", [0, 1, 3, 5, 20])
+def test_top_n_indices_matches_stable_sort(n: int) -> None:
+    scores = [1.0, 3.0, 2.0, 3.0, 0.5, 2.0, 2.0, 3.0, 1.0]
+    assert _top_n_indices(scores, n) == _sorted_top_n(scores, n)
+
+
+def test_compress_documents_batches_and_caches() -> None:
+    model = _FakeCrossEncoder()
+    reranker = CrossEncoderReranker(model=model, top_n=3, batch_size=3)
+
+    result = reranker.compress_documents(_DOCS, "a b c")
+    assert [doc.page_content for doc in result] == ["a b c", "a b", "a c"]
+    assert [len(batch) for batch in model.batches] == [3, 3, 2]
+
+    # Cached pairs are not scored again; only the new document is
+    model.batches.clear()
+    new_doc = Document(page_content="a b c d")
+    result = reranker.compress_documents([*_DOCS, new_doc], "a b c")
+    assert [doc.page_content for doc in result] == ["a b c", "a b c d", "a b"]
+    assert model.batches == [[("a b c", "a b c d")]]
+
+
+def test_cache_is_bounded() -> None:
+    model = _FakeCrossEncoder()
+    reranker = CrossEncoderReranker(model=model, cache_size=2)
+    reranker.compress_documents(_DOCS[:3], "a")
+    model.batches.clear()
+    reranker.compress_documents(_DOCS[:3], "a")
+    # Only the two most recently scored pairs were kept
+    assert model.batches == [[("a", "a b")]]
+
+
+async def test_acompress_documents_coalesces_concurrent_calls() -> None:
+    model = _FakeCrossEncoder()
+    reranker = CrossEncoderReranker(model=model, top_n=2, batch_size=64)
+
+    results = await asyncio.gather(
+        reranker.acompress_documents(_DOCS, "a"),
+        reranker.acompress_documents(_DOCS, "b c"),
+        reranker.acompress_documents(_DOCS[:4], "a"),
+    )
+    assert [[doc.page_content for doc in docs] for docs in results] == [
+        ["a b", "a"],
+        ["a b c", "b c"],
+        ["a b", "a"],
+    ]
+    # One model call for both queries, scored on the worker thread; shared pairs once
+    assert len(model.batches) == 1
+    assert len(model.batches[0]) == 2 * len(_DOCS)
+    assert threading.current_thread().name not in model.threads
+
+    assert await reranker.acompress_documents(_DOCS, "b c") == results[1]
+    assert len(model.batches) == 1
+
+
+async def test_acompress_documents_propagates_errors() -> None:
+    model = _FakeCrossEncoder()
+    model.fail = True
+    reranker = CrossEncoderReranker(model=model)
+    results = await asyncio.gather(
+        reranker.acompress_documents(_DOCS, "a"),
+        reranker.acompress_documents(_DOCS, "b"),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    model.fail = False
+    docs = await reranker.acompress_documents(_DOCS, "a")
+    assert docs[0].page_content == "a b"
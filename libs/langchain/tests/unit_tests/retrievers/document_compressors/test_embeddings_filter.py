@@ -0,0 +1,70 @@
+from typing import Any
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from langchain_classic.retrievers.document_compressors.embeddings_filter import (
+    _aget_document_embeddings,
+    _get_document_embeddings,
+    _without_vector,
+)
+
+
+class _CountingEmbeddings(DeterministicFakeEmbedding):
+    embedded: list[str] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.embedded.extend(texts)
+        return super().embed_documents(texts)
+
+
+class _DocumentWithState(Document):
+    state: dict[str, Any] = {}
+
+
+def test_get_document_embeddings_reuses_vectors() -> None:
+    embeddings = _CountingEmbeddings(size=4)
+    documents = [
+        Document(page_content="stored", metadata={"embedding": [1.0, 0, 0, 0]}),
+        _DocumentWithState(
+            page_content="state", state={"embedded_doc": [0, 1.0, 0, 0]}
+        ),
+        _DocumentWithState(page_content="missing"),
+        Document(page_content="plain"),
+    ]
+    vectors = _get_document_embeddings(embeddings, documents, "embedding")
+
+    assert embeddings.embedded == ["missing", "plain"]
+    assert vectors[:2] == [[1.0, 0, 0, 0], [0, 1.0, 0, 0]]
+    assert vectors[2:] == embeddings.embed_documents(["missing", "plain"])
+    # Computed vectors are cached in the document state
+    assert documents[2].state["embedded_doc"] == vectors[2]  # type: ignore[attr-defined]
+
+    # Without a metadata key, metadata vectors are ignored
+    embeddings.embedded.clear()
+    _get_document_embeddings(embeddings, documents[:1])
+    assert embeddings.embedded == ["stored"]
+
+
+async def test_aget_document_embeddings_skips_embedding_when_all_known() -> None:
+    embeddings = _CountingEmbeddings(size=4)
+    documents = [
+        Document(page_content="a", metadata={"embedding": [1.0, 0, 0, 0]}),
+        Document(page_content="b", metadata={"embedding": [0, 1.0, 0, 0]}),
+    ]
+    vectors = await _aget_document_embeddings(embeddings, documents, "embedding")
+    assert vectors == [[1.0, 0, 0, 0], [0, 1.0, 0, 0]]
+    assert embeddings.embedded == []
+
+
+def test_without_vector_keeps_input_metadata() -> None:
+    metadata = {"source": "a", "embedding": [1.0, 0, 0, 0]}
+    document = _DocumentWithState(page_content="a", metadata=metadata)
+    # Share the dict with the input, as stateful copies of documents may
+    document.metadata = metadata
+    assert _without_vector(document, "embedding").metadata == {"source": "a"}
+    assert metadata == {"source": "a", "embedding": [1.0, 0, 0, 0]}
+
+    plain = Document(page_content="b", metadata={"source": "b"})
+    assert _without_vector(plain, None) is plain
+    assert _without_vector(plain, "embedding").metadata == {"source": "b"}
@@ -0,0 +1,25 @@
+import asyncio
+
+import pytest
+
+from langchain_classic.retrievers._batching import loop_local
+
+
+def test_loop_local() -> None:
+    objects: dict[asyncio.AbstractEventLoop, object] = {}
+
+    async def get() -> object:
+        return loop_local(objects, object)
+
+    async def get_twice() -> tuple[object, object]:
+        return await get(), await get()
+
+    first, again = asyncio.run(get_twice())
+    assert first is again
+    # The entry of the closed loop is dropped when the next loop gets its own
+    second = asyncio.run(get())
+    assert second is not first
+    assert list(objects.values()) == [second]
+
+    with pytest.raises(RuntimeError):
+        loop_local(objects, object)
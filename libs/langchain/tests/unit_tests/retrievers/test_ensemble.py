@@ -1,3 +1,7 @@
+import threading
+from typing import Any
+
+import pytest
 from langchain_core.callbacks.manager import CallbackManagerForRetrieverRun
 from langchain_core.documents import Document
 from langchain_core.retrievers import BaseRetriever
@@ -92,3 +96,83 @@ def test_invoke() -> None:
     # Additionally, the document with page_content "b" will be ranked 1st.
     assert len(ranked_documents) == 3
     assert ranked_documents[0].page_content == "b"
+
+
+def test_fusion_methods_and_scores() -> None:
+    documents1 = [
+        Document(page_content="a", metadata={"score": 10.0}),
+        Document(page_content="b", metadata={"score": 8.0}),
+        Document(page_content="c", metadata={"score": 0.0}),
+    ]
+    documents2 = [
+        Document(page_content="c", metadata={"score": 0.9}),
+        Document(page_content="b", metadata={"score": 0.8}),
+    ]
+    retrievers = [MockRetriever(docs=documents1), MockRetriever(docs=documents2)]
+
+    def fuse(**kwargs: Any) -> list[tuple[str, float]]:
+        ensemble_retriever = EnsembleRetriever(
+            retrievers=retrievers, weights=[0.5, 0.5], score_key="fused", **kwargs
+        )
+        return [
+            (doc.page_content, doc.metadata["fused"])
+            for doc in ensemble_retriever.invoke("_")
+        ]
+
+    rrf = fuse()
+    assert [content for content, _ in rrf] == ["c", "b", "a"]
+    assert rrf[0][1] == pytest.approx(0.5 / 63 + 0.5 / 61)
+
+    # Raw scores: the first retriever's scale dominates
+    comb_sum = fuse(fusion="comb_sum")
+    assert [content for content, _ in comb_sum] == ["a", "b", "c"]
+    assert comb_sum[1][1] == pytest.approx(0.5 * 8.0 + 0.5 * 0.8)
+
+    # Normalized per retriever: b is 0.8 and 0.0, c is 0.0 and 1.0
+    min_max = fuse(fusion="min_max")
+    assert min_max == [
+        ("a", pytest.approx(0.5)),
+        ("c", pytest.approx(0.5)),
+        ("b", pytest.approx(0.4)),
+    ]
+
+    # The retrievers' documents are not modified
+    assert "fused" not in documents1[0].metadata
+
+
+def test_top_k_matches_full_ranking() -> None:
+    lists = [
+        [Document(page_content=str(i * step % 50)) for i in range(50)]
+        for step in (1, 7, 13)
+    ]
+    full = EnsembleRetriever(
+        retrievers=[MockRetriever(docs=docs) for docs in lists]
+    ).weighted_reciprocal_rank(lists)
+    top = EnsembleRetriever(
+        retrievers=[MockRetriever(docs=docs) for docs in lists], top_k=10
+    ).weighted_reciprocal_rank(lists)
+    assert len(full) == 50
+    assert top == full[:10]
+
+
+def test_sync_retrievers_run_in_parallel() -> None:
+    barrier = threading.Barrier(2, timeout=5)
+
+    class BarrierRetriever(BaseRetriever):
+        name_: str
+
+        @override
+        def _get_relevant_documents(
+            self,
+            query: str,
+            *,
+            run_manager: CallbackManagerForRetrieverRun | None = None,
+        ) -> list[Document]:
+            # Deadlocks (and times out) unless both retrievers run concurrently
+            barrier.wait()
+            return [Document(page_content=self.name_)]
+
+    ensemble_retriever = EnsembleRetriever(
+        retrievers=[BarrierRetriever(name_="x"), BarrierRetriever(name_="y")],
+    )
+    assert [doc.page_content for doc in ensemble_retriever.invoke("_")] == ["x", "y"]
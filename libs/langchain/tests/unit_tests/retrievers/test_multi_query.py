@@ -1,12 +1,32 @@
+import asyncio
+import threading
+
 import pytest
+from langchain_core.callbacks.manager import CallbackManagerForRetrieverRun
 from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.retrievers import BaseRetriever
+from langchain_core.runnables import RunnableLambda
+from langchain_core.vectorstores import InMemoryVectorStore
+from typing_extensions import override
 
 from langchain_classic.retrievers.multi_query import (
     LineListOutputParser,
+    MultiQueryRetriever,
     _unique_documents,
 )
 
 
+class _Unhashable:
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Unhashable) and other.value == self.value
+
+
 @pytest.mark.parametrize(
     ("documents", "expected"),
     [
@@ -35,6 +55,31 @@ from langchain_classic.retrievers.multi_query import (
                 Document(page_content="foo", metadata={"bar": [2, 1]}),
             ],
         ),
+        (
+            [
+                Document(page_content="foo", metadata={"bar": _Unhashable(1)}),
+                Document(page_content="foo", metadata={"bar": _Unhashable(2)}),
+                Document(page_content="foo", metadata={"bar": _Unhashable(1)}),
+            ],
+            [
+                Document(page_content="foo", metadata={"bar": _Unhashable(1)}),
+                Document(page_content="foo", metadata={"bar": _Unhashable(2)}),
+            ],
+        ),
+        (
+            [
+                Document(page_content="foo", id="1"),
+                Document(page_content="foo", id="2"),
+                Document(page_content="foo", id="1"),
+                Document(page_content="foo", metadata={"a": {"b": {1}}}),
+                Document(page_content="foo", metadata={"a": {"b": frozenset([1])}}),
+            ],
+            [
+                Document(page_content="foo", id="1"),
+                Document(page_content="foo", id="2"),
+                Document(page_content="foo", metadata={"a": {"b": {1}}}),
+            ],
+        ),
     ],
 )
 def test__unique_documents(documents: list[Document], expected: list[Document]) -> None:
@@ -52,3 +97,80 @@ def test__unique_documents(documents: list[Document], expected: list[Document])
 def test_line_list_output_parser(text: str, expected: list[str]) -> None:
     parser = LineListOutputParser()
     assert parser.parse(text) == expected
+
+
+class _BarrierRetriever(BaseRetriever):
+    barrier: threading.Barrier
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    @override
+    def _get_relevant_documents(
+        self,
+        query: str,
+        *,
+        run_manager: CallbackManagerForRetrieverRun | None = None,
+    ) -> list[Document]:
+        # Times out unless all queries are retrieved concurrently
+        self.barrier.wait()
+        return [Document(page_content=f"{query}-doc"), Document(page_content="shared")]
+
+
+def test_sync_queries_run_in_parallel() -> None:
+    retriever = MultiQueryRetriever(
+        retriever=_BarrierRetriever(barrier=threading.Barrier(3, timeout=5)),
+        llm_chain=RunnableLambda(lambda _: ["a", "b", "c"]),
+    )
+    assert [doc.page_content for doc in retriever.invoke("q")] == [
+        "a-doc",
+        "shared",
+        "b-doc",
+        "c-doc",
+    ]
+
+
+def test_rank_fusion() -> None:
+    retriever = MultiQueryRetriever(
+        retriever=_BarrierRetriever(barrier=threading.Barrier(1)),
+        llm_chain=RunnableLambda(lambda _: ["a", "b"]),
+        rank_fusion=True,
+        max_concurrency=1,
+    )
+    # "shared" is found by both queries
+    assert [doc.page_content for doc in retriever.invoke("q")] == [
+        "shared",
+        "a-doc",
+        "b-doc",
+    ]
+
+
+def test_batch_query_embeddings() -> None:
+    class CountingEmbedding(DeterministicFakeEmbedding):
+        calls: list[str] = []
+
+        def embed_documents(self, texts: list[str]) -> list[list[float]]:
+            self.calls.append("embed_documents")
+            return super().embed_documents(texts)
+
+        def embed_query(self, text: str) -> list[float]:
+            self.calls.append("embed_query")
+            return super().embed_query(text)
+
+    embeddings = CountingEmbedding(size=8)
+    store = InMemoryVectorStore.from_texts(["a", "b", "c", "d"], embeddings)
+    embeddings.calls.clear()
+
+    def make(*, batch: bool) -> MultiQueryRetriever:
+        return MultiQueryRetriever(
+            retriever=store.as_retriever(search_kwargs={"k": 2}),
+            llm_chain=RunnableLambda(lambda _: ["a", "b", "c"]),
+            batch_query_embeddings=batch,
+        )
+
+    expected = make(batch=False).invoke("q")
+    assert embeddings.calls == ["embed_query"] * 3
+    embeddings.calls.clear()
+
+    assert make(batch=True).invoke("q") == expected
+    assert asyncio.run(make(batch=True).ainvoke("q")) == expected
+    assert embeddings.calls == ["embed_documents"] * 2
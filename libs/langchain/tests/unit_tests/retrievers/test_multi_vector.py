@@ -1,7 +1,10 @@
-from collections.abc import Callable
+import asyncio
+from collections.abc import Callable, Sequence
 from typing import Any
 
 from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.vectorstores import InMemoryVectorStore as CoreInMemoryVectorStore
 from typing_extensions import override
 
 from langchain_classic.retrievers.multi_vector import MultiVectorRetriever, SearchType
@@ -132,3 +135,101 @@ async def test_multi_vector_retriever_similarity_search_with_score_async() -> No
     await retriever.docstore.amset(list(zip(["1"], documents, strict=False)))
     results = retriever.invoke("1")
     assert len(results) == 0
+
+
+class RankedVectorStore(CoreInMemoryVectorStore):
+    """Returns children in insertion order, whatever the query."""
+
+    def __init__(self) -> None:
+        super().__init__(DeterministicFakeEmbedding(size=4))
+
+    @override
+    def similarity_search(
+        self, query: str, k: int = 4, **kwargs: Any
+    ) -> list[Document]:
+        return [
+            Document(page_content=doc["text"], metadata=doc["metadata"])
+            for doc in list(self.store.values())[:k]
+        ]
+
+    @override
+    async def asimilarity_search(
+        self, query: str, k: int = 4, **kwargs: Any
+    ) -> list[Document]:
+        return self.similarity_search(query, k, **kwargs)
+
+
+class CountingStore(InMemoryStore):
+    """Records lookups; `amget` of `InMemoryStore` goes through `mget`."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.lookups: list[list[str]] = []
+
+    @override
+    def mget(self, keys: Sequence[str]) -> list[Document | None]:
+        self.lookups.append(list(keys))
+        return super().mget(keys)
+
+
+def _ranked_retriever(**kwargs: Any) -> MultiVectorRetriever:
+    vectorstore = RankedVectorStore()
+    # Parent "a" has the three best children
+    vectorstore.add_documents(
+        [
+            Document(page_content=f"child {i}", metadata={"doc_id": doc_id})
+            for i, doc_id in enumerate(["a", "a", "a", "b", "c", "d"])
+        ]
+    )
+    docstore = CountingStore()
+    docstore.mset([(doc_id, Document(page_content=doc_id * 10)) for doc_id in "abcd"])
+    return MultiVectorRetriever(vectorstore=vectorstore, docstore=docstore, **kwargs)
+
+
+def test_multi_vector_retriever_child_fetch_k() -> None:
+    retriever = _ranked_retriever(search_kwargs={"k": 3})
+    assert [doc.page_content[0] for doc in retriever.invoke("q")] == ["a"]
+
+    retriever = _ranked_retriever(search_kwargs={"k": 3}, child_fetch_k=6)
+    assert [doc.page_content[0] for doc in retriever.invoke("q")] == ["a", "b", "c"]
+    assert retriever.docstore.lookups == [["a", "b", "c"]]  # type: ignore[attr-defined]
+
+
+def test_multi_vector_retriever_parent_cache() -> None:
+    # Room for three parents of 12 bytes
+    retriever = _ranked_retriever(
+        search_kwargs={"k": 3}, child_fetch_k=6, parent_cache_bytes=36
+    )
+    docstore = retriever.docstore
+    assert isinstance(docstore, CountingStore)
+
+    first = retriever.invoke("q")
+    first[0].metadata["mutated"] = True
+    assert retriever.invoke("q") == [
+        Document(page_content=doc_id * 10) for doc_id in "abc"
+    ]
+    assert docstore.lookups == [["a", "b", "c"]]
+    # `InMemoryStore` returns the stored instance itself
+    first[0].metadata.clear()
+
+    # The least recently used parent is evicted to make room for "d"
+    retriever.search_kwargs = {"k": 4}
+    retriever.invoke("q")
+    retriever.invoke("q")
+    assert docstore.lookups[1:] == [["d"], ["a"]]
+
+    docstore.mset([("c", Document(page_content="new"))])
+    assert retriever.invoke("q")[2].page_content == "c" * 10
+    retriever.clear_parent_cache(["c"])
+    assert retriever.invoke("q")[2].page_content == "new"
+
+
+async def test_multi_vector_retriever_batches_concurrent_lookups() -> None:
+    retriever = _ranked_retriever(search_kwargs={"k": 2}, child_fetch_k=6)
+    results = await asyncio.gather(
+        retriever.ainvoke("q1"), retriever.ainvoke("q2"), retriever.ainvoke("q3")
+    )
+    assert all(
+        [doc.page_content for doc in docs] == ["a" * 10, "b" * 10] for docs in results
+    )
+    assert retriever.docstore.lookups == [["a", "b"]]  # type: ignore[attr-defined]
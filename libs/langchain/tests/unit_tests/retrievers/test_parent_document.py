@@ -2,6 +2,8 @@ from collections.abc import Sequence
 from typing import Any
 
 from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.vectorstores import InMemoryVectorStore as CoreInMemoryVectorStore
 from langchain_text_splitters.character import CharacterTextSplitter
 from typing_extensions import override
 
@@ -46,3 +48,73 @@ def test_parent_document_retriever_initialization() -> None:
     results = retriever.invoke("0")
     assert len(results) > 0
     assert results[0].page_content == "test document"
+
+
+class CountingVectorStore(CoreInMemoryVectorStore):
+    def __init__(self) -> None:
+        super().__init__(DeterministicFakeEmbedding(size=4))
+        self.batches: list[list[str]] = []
+
+    @override
+    def add_documents(self, documents: list[Document], **kwargs: Any) -> list[str]:
+        self.batches.append([doc.page_content for doc in documents])
+        return super().add_documents(documents, **kwargs)
+
+
+def _ingest_retriever() -> ParentDocumentRetriever:
+    return ParentDocumentRetriever(
+        vectorstore=CountingVectorStore(),
+        docstore=InMemoryStore(),
+        child_splitter=CharacterTextSplitter(
+            separator=" ", chunk_size=5, chunk_overlap=0
+        ),
+    )
+
+
+def test_parent_document_retriever_ingest_is_batched_and_idempotent() -> None:
+    retriever = _ingest_retriever()
+    vectorstore = retriever.vectorstore
+    assert isinstance(vectorstore, CountingVectorStore)
+    documents = [Document(page_content=f"doc {i} aaaa bbbb") for i in range(5)]
+
+    result = retriever.ingest(iter(documents), batch_size=2, max_workers=2)
+    assert result["num_added"] == 5
+    assert result["num_skipped"] == 0
+    # 2 + 2 + 1 parents, 3 children each
+    assert [len(batch) for batch in vectorstore.batches] == [6, 6, 3]
+    assert len(vectorstore.store) == 15
+
+    # Children are split as by `add_documents`, with deterministic ids
+    children = [vectorstore.store[_id] for _id in vectorstore.store]
+    assert [child["text"] for child in children[:3]] == ["doc 0", "aaaa", "bbbb"]
+    parent_id = children[0]["metadata"]["doc_id"]
+    assert retriever.docstore.mget([parent_id]) == [documents[0]]
+
+    # Re-ingesting unchanged documents writes nothing
+    vectorstore.batches.clear()
+    changed = Document(page_content="doc 3 changed")
+    result = retriever.ingest([*documents[:3], changed, documents[4], changed])
+    assert result["num_added"] == 1
+    assert result["num_skipped"] == 5
+    assert vectorstore.batches == [["doc 3", "changed"]]
+
+    # Without skipping, the same ids are overwritten
+    retriever.ingest(documents, skip_existing=False)
+    assert len(vectorstore.store) == 17
+
+
+async def test_parent_document_retriever_aingest() -> None:
+    retriever = _ingest_retriever()
+    documents = [Document(page_content=f"doc {i} aaaa bbbb") for i in range(5)]
+    result = await retriever.aingest(documents, batch_size=2)
+    assert result["num_added"] == 5
+
+    sync_retriever = _ingest_retriever()
+    sync_retriever.ingest(documents, batch_size=2)
+    assert list(retriever.vectorstore.store) == list(  # type: ignore[attr-defined]
+        sync_retriever.vectorstore.store  # type: ignore[attr-defined]
+    )
+
+    result = await retriever.aingest(documents)
+    assert result["num_added"] == 0
+    assert result["num_skipped"] == 5
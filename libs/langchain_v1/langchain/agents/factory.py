@@ -75,6 +75,9 @@ FALLBACK_MODELS_WITH_STRUCTURED_OUTPUT = [
     "o3-mini",
 ]
 
+# Number of recently bound models each agent keeps for reuse across model calls
+_BOUND_MODEL_CACHE_SIZE = 8
+
 
 def _normalize_to_model_response(result: ModelResponse | AIMessage) -> ModelResponse:
     """Normalize middleware return value to ModelResponse."""
@@ -398,6 +401,38 @@ def _supports_provider_strategy(model: str | BaseChatModel, tools: list | None =
     )
 
 
+def _binding_key(request: ModelRequest) -> tuple[tuple[Any, ...], tuple[Any, ...]]:
+    """Get the inputs that determine how a request's model is bound.
+
+    Returns a pair of tuples: objects to compare by identity and values to compare
+    by equality. Tools are converted to provider schemas when they are bound, so the
+    field values of every tool are included: assigning a new `description`,
+    `args_schema`, etc. to a tool changes the key.
+    """
+    identities: list[Any] = [request.model, request.response_format]
+    values: list[Any] = [request.tool_choice, request.model_settings]
+    for t in request.tools:
+        if isinstance(t, dict):
+            # Built-in provider tools are plain dicts that may be rebuilt every call
+            identities.append(None)
+            values.append(t)
+        else:
+            identities.append(t)
+            identities.extend(map(t.__dict__.get, type(t).model_fields))
+    return tuple(identities), tuple(values)
+
+
+def _same_binding(
+    key: tuple[tuple[Any, ...], tuple[Any, ...]],
+    other: tuple[tuple[Any, ...], tuple[Any, ...]],
+) -> bool:
+    return (
+        len(key[0]) == len(other[0])
+        and all(a is b for a, b in zip(key[0], other[0], strict=True))
+        and key[1] == other[1]
+    )
+
+
 def _handle_structured_output_error(
     exception: Exception,
     response_format: ResponseFormat,
@@ -973,10 +1008,19 @@ def create_agent(
 
         return {"messages": [output]}
 
+    # Recently bound models, oldest first. Binding converts every tool to a
+    # provider schema, so the result is reused while a request's model, tools,
+    # response format and settings are unchanged (i.e. on every step of most runs).
+    bound_models: list[
+        tuple[tuple[tuple[Any, ...], tuple[Any, ...]], tuple[Runnable, ResponseFormat | None]]
+    ] = []
+
     def _get_bound_model(request: ModelRequest) -> tuple[Runnable, ResponseFormat | None]:
         """Get the model with appropriate tool bindings.
 
         Performs auto-detection of strategy if needed based on model capabilities.
+        The bound model is reused across calls with the same model, tools, response
+        format, tool choice and model settings.
 
         Args:
             request: The model request containing model, tools, and response format.
@@ -1018,6 +1062,18 @@ def create_agent(
             )
             raise ValueError(msg)
 
+        key = _binding_key(request)
+        for cached_key, cached in bound_models:
+            if _same_binding(key, cached_key):
+                return cached
+        bound = _bind_model(request)
+        bound_models.append((key, bound))
+        if len(bound_models) > _BOUND_MODEL_CACHE_SIZE:
+            del bound_models[0]
+        return bound
+
+    def _bind_model(request: ModelRequest) -> tuple[Runnable, ResponseFormat | None]:
+        """Bind tools and the response format of a request to its model."""
         # Determine effective response format (auto-detect if needed)
         effective_response_format: ResponseFormat | None
         if isinstance(request.response_format, AutoStrategy):
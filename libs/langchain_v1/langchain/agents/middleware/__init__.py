@@ -12,7 +12,7 @@ from .human_in_the_loop import (
 from .model_call_limit import ModelCallLimitMiddleware
 from .model_fallback import ModelFallbackMiddleware
 from .model_retry import ModelRetryMiddleware
-from .pii import PIIDetectionError, PIIMiddleware
+from .pii import CombinedPIIMiddleware, PIIDetectionError, PIIMiddleware
 from .shell_tool import (
     CodexSandboxExecutionPolicy,
     DockerExecutionPolicy,
@@ -25,7 +25,7 @@ from .todo import TodoListMiddleware
 from .tool_call_limit import ToolCallLimitMiddleware
 from .tool_emulator import LLMToolEmulator
 from .tool_retry import ToolRetryMiddleware
-from .tool_selection import LLMToolSelectorMiddleware
+from .tool_selection import EmbeddingToolSelectorMiddleware, LLMToolSelectorMiddleware
 from .types import (
     AgentMiddleware,
     AgentState,
@@ -46,8 +46,10 @@ __all__ = [
     "AgentState",
     "ClearToolUsesEdit",
     "CodexSandboxExecutionPolicy",
+    "CombinedPIIMiddleware",
     "ContextEditingMiddleware",
     "DockerExecutionPolicy",
+    "EmbeddingToolSelectorMiddleware",
     "FilesystemFileSearchMiddleware",
     "HostExecutionPolicy",
     "HumanInTheLoopMiddleware",
@@ -7,7 +7,7 @@ import ipaddress
 import re
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass
-from typing import Literal
+from typing import Literal, NamedTuple
 from urllib.parse import urlparse
 
 from typing_extensions import TypedDict
@@ -46,9 +46,42 @@ Detector = Callable[[str], list[PIIMatch]]
 """Callable signature for detectors that locate sensitive values."""
 
 
+_EMAIL_PATTERN = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
+_CREDIT_CARD_PATTERN = r"\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b"
+_IPV4_PATTERN = r"\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b"
+_MAC_ADDRESS_PATTERN = r"\b(?:[0-9A-Fa-f]{2}[:-]){5}[0-9A-Fa-f]{2}\b"
+_SCHEME_URL_PATTERN = r"https?://[^\s<>\"{}|\\^`\[\]]+"
+_BARE_URL_PATTERN = (
+    r"\b(?:www\.)?[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?"
+    r"(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)+(?:/[^\s]*)?"
+)
+
+
+def _is_ip_address(value: str) -> bool:
+    try:
+        ipaddress.ip_address(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _is_scheme_url(value: str) -> bool:
+    result = urlparse(value)
+    return result.scheme in ("http", "https") and bool(result.netloc)
+
+
+def _is_bare_url(value: str) -> bool:
+    # Only accept if it has a path or starts with www
+    # This reduces false positives like "example.com" in prose
+    if "/" not in value and not value.startswith("www."):
+        return False
+    # Add scheme for validation (required for urlparse to work correctly)
+    netloc = urlparse(f"http://{value}").netloc
+    return bool(netloc) and "." in netloc
+
+
 def detect_email(content: str) -> list[PIIMatch]:
     """Detect email addresses in content."""
-    pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
     return [
         PIIMatch(
             type="email",
@@ -56,16 +89,15 @@ def detect_email(content: str) -> list[PIIMatch]:
             start=match.start(),
             end=match.end(),
         )
-        for match in re.finditer(pattern, content)
+        for match in re.finditer(_EMAIL_PATTERN, content)
     ]
 
 
 def detect_credit_card(content: str) -> list[PIIMatch]:
     """Detect credit card numbers in content using Luhn validation."""
-    pattern = r"\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b"
     matches = []
 
-    for match in re.finditer(pattern, content):
+    for match in re.finditer(_CREDIT_CARD_PATTERN, content):
         card_number = match.group()
         if _passes_luhn(card_number):
             matches.append(
@@ -83,13 +115,10 @@ def detect_credit_card(content: str) -> list[PIIMatch]:
 def detect_ip(content: str) -> list[PIIMatch]:
     """Detect IPv4 or IPv6 addresses in content."""
     matches: list[PIIMatch] = []
-    ipv4_pattern = r"\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b"
 
-    for match in re.finditer(ipv4_pattern, content):
+    for match in re.finditer(_IPV4_PATTERN, content):
         ip_candidate = match.group()
-        try:
-            ipaddress.ip_address(ip_candidate)
-        except ValueError:
+        if not _is_ip_address(ip_candidate):
             continue
         matches.append(
             PIIMatch(
@@ -105,7 +134,6 @@ def detect_ip(content: str) -> list[PIIMatch]:
 
 def detect_mac_address(content: str) -> list[PIIMatch]:
     """Detect MAC addresses in content."""
-    pattern = r"\b([0-9A-Fa-f]{2}[:-]){5}[0-9A-Fa-f]{2}\b"
     return [
         PIIMatch(
             type="mac_address",
@@ -113,7 +141,7 @@ def detect_mac_address(content: str) -> list[PIIMatch]:
             start=match.start(),
             end=match.end(),
         )
-        for match in re.finditer(pattern, content)
+        for match in re.finditer(_MAC_ADDRESS_PATTERN, content)
     ]
 
 
@@ -122,12 +150,9 @@ def detect_url(content: str) -> list[PIIMatch]:
     matches: list[PIIMatch] = []
 
     # Pattern 1: URLs with scheme (http:// or https://)
-    scheme_pattern = r"https?://[^\s<>\"{}|\\^`\[\]]+"
-
-    for match in re.finditer(scheme_pattern, content):
+    for match in re.finditer(_SCHEME_URL_PATTERN, content):
         url = match.group()
-        result = urlparse(url)
-        if result.scheme in ("http", "https") and result.netloc:
+        if _is_scheme_url(url):
             matches.append(
                 PIIMatch(
                     type="url",
@@ -139,33 +164,22 @@ def detect_url(content: str) -> list[PIIMatch]:
 
     # Pattern 2: URLs without scheme (www.example.com or example.com/path)
     # More conservative to avoid false positives
-    bare_pattern = (
-        r"\b(?:www\.)?[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?"
-        r"(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)+(?:/[^\s]*)?"
-    )
-
-    for match in re.finditer(bare_pattern, content):
+    for match in re.finditer(_BARE_URL_PATTERN, content):
         start, end = match.start(), match.end()
         # Skip if already matched with scheme
         if any(m["start"] <= start < m["end"] or m["start"] < end <= m["end"] for m in matches):
             continue
 
         url = match.group()
-        # Only accept if it has a path or starts with www
-        # This reduces false positives like "example.com" in prose
-        if "/" in url or url.startswith("www."):
-            # Add scheme for validation (required for urlparse to work correctly)
-            test_url = f"http://{url}"
-            result = urlparse(test_url)
-            if result.netloc and "." in result.netloc:
-                matches.append(
-                    PIIMatch(
-                        type="url",
-                        value=url,
-                        start=start,
-                        end=end,
-                    )
+        if _is_bare_url(url):
+            matches.append(
+                PIIMatch(
+                    type="url",
+                    value=url,
+                    start=start,
+                    end=end,
                 )
+            )
 
     return matches
 
@@ -200,70 +214,65 @@ def _passes_luhn(card_number: str) -> bool:
     return checksum % 10 == 0
 
 
-def _apply_redact_strategy(content: str, matches: list[PIIMatch]) -> str:
-    result = content
-    for match in sorted(matches, key=lambda item: item["start"], reverse=True):
-        replacement = f"[REDACTED_{match['type'].upper()}]"
-        result = result[: match["start"]] + replacement + result[match["end"] :]
-    return result
+def _redacted_value(match: PIIMatch) -> str:
+    return f"[REDACTED_{match['type'].upper()}]"
 
 
 _UNMASKED_CHAR_NUMBER = 4
 _IPV4_PARTS_NUMBER = 4
 
 
-def _apply_mask_strategy(content: str, matches: list[PIIMatch]) -> str:
-    result = content
-    for match in sorted(matches, key=lambda item: item["start"], reverse=True):
-        value = match["value"]
-        pii_type = match["type"]
-        if pii_type == "email":
-            parts = value.split("@")
-            if len(parts) == 2:  # noqa: PLR2004
-                domain_parts = parts[1].split(".")
-                masked = (
-                    f"{parts[0]}@****.{domain_parts[-1]}"
-                    if len(domain_parts) > 1
-                    else f"{parts[0]}@****"
-                )
-            else:
-                masked = "****"
-        elif pii_type == "credit_card":
-            digits_only = "".join(c for c in value if c.isdigit())
-            separator = "-" if "-" in value else " " if " " in value else ""
-            if separator:
-                masked = (
-                    f"****{separator}****{separator}****{separator}"
-                    f"{digits_only[-_UNMASKED_CHAR_NUMBER:]}"
-                )
-            else:
-                masked = f"************{digits_only[-_UNMASKED_CHAR_NUMBER:]}"
-        elif pii_type == "ip":
-            octets = value.split(".")
-            masked = f"*.*.*.{octets[-1]}" if len(octets) == _IPV4_PARTS_NUMBER else "****"
-        elif pii_type == "mac_address":
-            separator = ":" if ":" in value else "-"
-            masked = (
-                f"**{separator}**{separator}**{separator}**{separator}**{separator}{value[-2:]}"
+def _masked_value(match: PIIMatch) -> str:
+    value = match["value"]
+    pii_type = match["type"]
+    if pii_type == "email":
+        parts = value.split("@")
+        if len(parts) == 2:  # noqa: PLR2004
+            domain_parts = parts[1].split(".")
+            return (
+                f"{parts[0]}@****.{domain_parts[-1]}"
+                if len(domain_parts) > 1
+                else f"{parts[0]}@****"
             )
-        elif pii_type == "url":
-            masked = "[MASKED_URL]"
-        else:
-            masked = (
-                f"****{value[-_UNMASKED_CHAR_NUMBER:]}"
-                if len(value) > _UNMASKED_CHAR_NUMBER
-                else "****"
+        return "****"
+    if pii_type == "credit_card":
+        digits_only = "".join(c for c in value if c.isdigit())
+        separator = "-" if "-" in value else " " if " " in value else ""
+        if separator:
+            return (
+                f"****{separator}****{separator}****{separator}"
+                f"{digits_only[-_UNMASKED_CHAR_NUMBER:]}"
             )
-        result = result[: match["start"]] + masked + result[match["end"] :]
-    return result
+        return f"************{digits_only[-_UNMASKED_CHAR_NUMBER:]}"
+    if pii_type == "ip":
+        octets = value.split(".")
+        return f"*.*.*.{octets[-1]}" if len(octets) == _IPV4_PARTS_NUMBER else "****"
+    if pii_type == "mac_address":
+        separator = ":" if ":" in value else "-"
+        return f"**{separator}**{separator}**{separator}**{separator}**{separator}{value[-2:]}"
+    if pii_type == "url":
+        return "[MASKED_URL]"
+    return f"****{value[-_UNMASKED_CHAR_NUMBER:]}" if len(value) > _UNMASKED_CHAR_NUMBER else "****"
+
+
+def _hashed_value(match: PIIMatch) -> str:
+    digest = hashlib.sha256(match["value"].encode()).hexdigest()[:8]
+    return f"<{match['type']}_hash:{digest}>"
+
+
+_REPLACEMENTS: dict[str, Callable[[PIIMatch], str]] = {
+    "redact": _redacted_value,
+    "mask": _masked_value,
+    "hash": _hashed_value,
+}
 
 
-def _apply_hash_strategy(content: str, matches: list[PIIMatch]) -> str:
+def _replace_matches(
+    content: str, matches: list[PIIMatch], replacement: Callable[[PIIMatch], str]
+) -> str:
     result = content
     for match in sorted(matches, key=lambda item: item["start"], reverse=True):
-        digest = hashlib.sha256(match["value"].encode()).hexdigest()[:8]
-        replacement = f"<{match['type']}_hash:{digest}>"
-        result = result[: match["start"]] + replacement + result[match["end"] :]
+        result = result[: match["start"]] + replacement(match) + result[match["end"] :]
     return result
 
 
@@ -275,12 +284,8 @@ def apply_strategy(
     """Apply the configured strategy to matches within content."""
     if not matches:
         return content
-    if strategy == "redact":
-        return _apply_redact_strategy(content, matches)
-    if strategy == "mask":
-        return _apply_mask_strategy(content, matches)
-    if strategy == "hash":
-        return _apply_hash_strategy(content, matches)
+    if strategy in _REPLACEMENTS:
+        return _replace_matches(content, matches, _REPLACEMENTS[strategy])
     if strategy == "block":
         raise PIIDetectionError(matches[0]["type"], matches)
     msg = f"Unknown redaction strategy: {strategy}"
@@ -350,9 +355,253 @@ class ResolvedRedactionRule:
         return updated, matches
 
 
+class _ScanBranch(NamedTuple):
+    rule_index: int
+    regex: re.Pattern[str]
+    # Substrings of which any accepted match contains at least one
+    triggers: tuple[str, ...]
+    validate: Callable[[str], bool] | None
+
+
+_DIGITS = tuple("0123456789")
+
+# Built-in types that are a single pattern plus an optional validator. URLs are
+# not: `detect_url` resolves overlaps between its two patterns in its own way, so
+# the scanner runs it as a separate detector.
+_BUILTIN_BRANCHES: dict[str, tuple[str, tuple[str, ...], Callable[[str], bool] | None]] = {
+    "email": (_EMAIL_PATTERN, ("@",), None),
+    "credit_card": (_CREDIT_CARD_PATTERN, _DIGITS, _passes_luhn),
+    "ip": (_IPV4_PATTERN, (".",), _is_ip_address),
+    "mac_address": (_MAC_ADDRESS_PATTERN, (":", "-"), None),
+}
+
+_DEFAULT_REGEX_FLAGS = re.compile("").flags
+
+
+def _is_combinable(regex: re.Pattern[str]) -> bool:
+    # Groups would shift the branch groups and global inline flags such as `(?i)`
+    # are not allowed in the middle of a pattern
+    return regex.groups == 0 and regex.flags == _DEFAULT_REGEX_FLAGS
+
+
+class PIIScanner:
+    """Apply several redaction rules to content in a single pass.
+
+    Built-in types and custom regex patterns are compiled into one alternation, so
+    content is scanned once no matter how many rules are configured, and checks
+    such as Luhn or IP address validation only run on candidates. Built-in types
+    whose trigger characters (e.g. `@` for emails) do not occur in the content are
+    left out of the scan. URLs, callable detectors and patterns with groups or
+    inline flags are run separately.
+
+    The result is the same as running the detector of every rule and merging their
+    matches: the leftmost match wins, and among matches starting at the same
+    position the earlier rule wins. A match overlapping one that won is dropped
+    whole, it is not cut down to its remaining part. To find where such a match
+    ends, the pattern of its rule is also searched on its own, once per candidate.
+    """
+
+    def __init__(self, rules: Sequence[RedactionRule]) -> None:
+        """Initialize the scanner.
+
+        Args:
+            rules: Rules to apply, in order of precedence.
+
+        Raises:
+            ValueError: If a rule has an unknown PII type or strategy.
+        """
+        self.rules = tuple(rule.resolve() for rule in rules)
+        self._branches: list[_ScanBranch] = []
+        self._detectors: list[tuple[int, Detector]] = []
+        for index, (rule, resolved) in enumerate(zip(rules, self.rules, strict=True)):
+            if resolved.strategy != "block" and resolved.strategy not in _REPLACEMENTS:
+                msg = f"Unknown redaction strategy: {resolved.strategy}"
+                raise ValueError(msg)
+            if rule.detector is None and rule.pii_type in _BUILTIN_BRANCHES:
+                pattern, triggers, validate = _BUILTIN_BRANCHES[rule.pii_type]
+                self._branches.append(_ScanBranch(index, re.compile(pattern), triggers, validate))
+            elif isinstance(rule.detector, str) and _is_combinable(
+                regex := re.compile(rule.detector)
+            ):
+                self._branches.append(_ScanBranch(index, regex, (), None))
+            else:
+                self._detectors.append((index, resolved.detector))
+        # Active branch indices -> combined pattern
+        self._patterns: dict[tuple[int, ...], re.Pattern[str]] = {}
+
+    def _combined_pattern(self, active: tuple[int, ...]) -> re.Pattern[str]:
+        pattern = self._patterns.get(active)
+        if pattern is None:
+            pattern = re.compile(
+                "|".join(f"(?P<_{i}>{self._branches[i].regex.pattern})" for i in active)
+            )
+            self._patterns[active] = pattern
+        return pattern
+
+    def _accepts(self, branch: _ScanBranch, value: str) -> bool:
+        return bool(value) and (branch.validate is None or branch.validate(value))
+
+    def _skip_overlapping(
+        self,
+        index: int,
+        content: str,
+        start: int,
+        end: int,
+        resume: dict[int, int],
+        ahead: dict[int, re.Match[str] | None],
+    ) -> None:
+        """Move a branch past its candidates that start in `[start, end)`.
+
+        `ahead` holds the next candidate found for each branch, which stays valid
+        while searches start before it, so every branch is searched about once per
+        candidate. The branch is left out of the combined scan until its next
+        candidate.
+        """
+        regex = self._branches[index].regex
+        pos = start
+        while True:
+            candidate = ahead.get(index, False)
+            if candidate is False or (candidate is not None and candidate.start() < pos):
+                candidate = ahead[index] = regex.search(content, pos)
+            if candidate is None or candidate.start() >= end:
+                break
+            first, last = candidate.span()
+            pos = last if last > first else first + 1
+        resume_at = len(content) + 1 if candidate is None else candidate.start()
+        if resume_at > end:
+            resume[index] = resume_at
+        else:
+            resume.pop(index, None)
+
+    def _next_branch_match(
+        self,
+        content: str,
+        pos: int,
+        triggered: tuple[int, ...],
+        resume: dict[int, int],
+    ) -> tuple[int, re.Match[str]] | None:
+        """Find the leftmost candidate from `pos` that passes validation."""
+        while True:
+            for i in [i for i, end in resume.items() if end <= pos]:
+                del resume[i]
+            active = tuple(i for i in triggered if i not in resume)
+            limit = min(resume.values(), default=len(content) + 1)
+            match = self._combined_pattern(active).search(content, pos) if active else None
+            if match is None or match.start() >= limit:
+                if not resume:
+                    return None
+                pos = limit
+                continue
+            start, end = match.span()
+            index = int(match.lastgroup[1:])  # type: ignore[index]
+            if self._accepts(self._branches[index], match.group()):
+                return index, match
+            resume[index] = end if end > start else start + 1
+
+    def _scan(self, content: str) -> list[tuple[int, PIIMatch]]:
+        triggered = tuple(
+            i
+            for i, branch in enumerate(self._branches)
+            if not branch.triggers or any(t in content for t in branch.triggers)
+        )
+        # Matches of the detectors that are run separately, by position and rule
+        pending = sorted(
+            (
+                (match["start"], index, match)
+                for index, detector in self._detectors
+                for match in detector(content)
+            ),
+            key=lambda item: item[:2],
+        )
+        next_pending = 0
+        found: list[tuple[int, PIIMatch]] = []
+        # Branch index -> where the branch resumes scanning. Like `finditer` on its
+        # own pattern, a branch resumes after the end of a rejected candidate, while
+        # the other branches keep scanning from its start.
+        resume: dict[int, int] = {}
+        ahead: dict[int, re.Match[str] | None] = {}
+        pos = 0
+        while True:
+            candidate = self._next_branch_match(content, pos, triggered, resume)
+            # Separate detector matches that overlap an accepted match are dropped
+            while next_pending < len(pending) and pending[next_pending][0] < pos:
+                next_pending += 1
+            if next_pending < len(pending) and (
+                candidate is None
+                or pending[next_pending][:2]
+                < (candidate[1].start(), self._branches[candidate[0]].rule_index)
+            ):
+                _, rule_index, match = pending[next_pending]
+                next_pending += 1
+                branch_index: int | None = None
+            elif candidate is not None:
+                branch_index, regex_match = candidate
+                rule_index = self._branches[branch_index].rule_index
+                match = PIIMatch(
+                    type=self.rules[rule_index].pii_type,
+                    value=regex_match.group(),
+                    start=regex_match.start(),
+                    end=regex_match.end(),
+                )
+            else:
+                return found
+            found.append((rule_index, match))
+            start, end = match["start"], match["end"]
+            pos = end if end > start else start + 1
+            # The detector of another rule would consume its candidates that overlap
+            # this match whole, so those rules resume after them
+            for other in triggered:
+                if other != branch_index:
+                    self._skip_overlapping(
+                        other, content, resume.get(other, start), pos, resume, ahead
+                    )
+
+    def scan(self, content: str) -> list[PIIMatch]:
+        """Find the matches of all rules in content.
+
+        Args:
+            content: The text to scan.
+
+        Returns:
+            Non-overlapping matches, ordered by position.
+        """
+        return [match for _, match in self._scan(content)]
+
+    def apply(self, content: str) -> tuple[str, list[PIIMatch]]:
+        """Apply all rules to content, returning new content and matches.
+
+        Args:
+            content: The text to scan.
+
+        Returns:
+            The content with every match handled by the strategy of its rule, and
+                the matches.
+
+        Raises:
+            PIIDetectionError: If a rule with the `block` strategy has matches.
+        """
+        found = self._scan(content)
+        if not found:
+            return content, []
+        for index, rule in enumerate(self.rules):
+            if rule.strategy == "block":
+                blocked = [match for i, match in found if i == index]
+                if blocked:
+                    raise PIIDetectionError(rule.pii_type, blocked)
+        parts: list[str] = []
+        last = 0
+        for index, match in found:
+            parts.append(content[last : match["start"]])
+            parts.append(_REPLACEMENTS[self.rules[index].strategy](match))
+            last = match["end"]
+        parts.append(content[last:])
+        return "".join(parts), [match for _, match in found]
+
+
 __all__ = [
     "PIIDetectionError",
     "PIIMatch",
+    "PIIScanner",
     "RedactionRule",
     "ResolvedRedactionRule",
     "apply_strategy",
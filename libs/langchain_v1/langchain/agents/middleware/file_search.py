@@ -9,16 +9,23 @@ from __future__ import annotations
 import fnmatch
 import json
 import re
+import stat
 import subprocess
+import threading
 from contextlib import suppress
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from langchain_core.tools import tool
 
 from langchain.agents.middleware.types import AgentMiddleware
 
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable
+
 
 def _expand_include_patterns(pattern: str) -> list[str] | None:
     """Expand brace patterns like `*.{py,pyi}` into a list of globs."""
@@ -84,6 +91,270 @@ def _match_include_pattern(basename: str, pattern: str) -> bool:
     return any(fnmatch.fnmatch(basename, candidate) for candidate in expanded)
 
 
+_QUANTIFIER_PATTERN = re.compile(r"\{\d*(?:,\d*)?\}")
+# Escapes that consume more than one character or depend on flags
+_UNSUPPORTED_ESCAPES = frozenset("xuUN0123456789")
+
+
+def _skip_class(pattern: str, i: int) -> int:
+    """Return the index after the character class starting at `pattern[i]`."""
+    i += 1
+    if i < len(pattern) and pattern[i] == "^":
+        i += 1
+    if i < len(pattern) and pattern[i] == "]":
+        i += 1
+    while i < len(pattern) and pattern[i] != "]":
+        i += 2 if pattern[i] == "\\" else 1
+    return i + 1
+
+
+def _skip_group(pattern: str, i: int) -> int:
+    """Return the index after the group starting at `pattern[i]`."""
+    depth = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == "[":
+            i = _skip_class(pattern, i)
+            continue
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return i
+
+
+def _pattern_literals(pattern: str) -> list[list[str]] | None:
+    """Find literal strings that every match of a regex must contain.
+
+    Returns one list of literals per top-level alternative, or `None` if the
+    pattern uses syntax this parser does not handle (inline flags, numeric
+    escapes). Groups, character classes and optional characters are skipped, so
+    literals may be missed but a literal is never returned that a match could lack.
+    """
+    if re.search(r"\(\?[aiLmsux-]", pattern):
+        return None
+    branches: list[list[str]] = [[]]
+    run: list[str] = []
+
+    def flush() -> None:
+        if run:
+            branches[-1].append("".join(run))
+            run.clear()
+
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        quantifier = _QUANTIFIER_PATTERN.match(pattern, i) if char == "{" else None
+        if char in "*?" or quantifier:
+            # The preceding character may not occur at all
+            if run:
+                run.pop()
+            flush()
+            i = quantifier.end() if quantifier else i + 1
+            if i < len(pattern) and pattern[i] in "?+":
+                i += 1
+        elif char == "+":
+            # The preceding character occurs, but may be followed by itself
+            flush()
+            i += 1
+            if i < len(pattern) and pattern[i] in "?+":
+                i += 1
+        elif char == "\\":
+            if i + 1 >= len(pattern) or pattern[i + 1] in _UNSUPPORTED_ESCAPES:
+                return None
+            if pattern[i + 1].isalnum():
+                # Character classes, anchors and control characters
+                flush()
+            else:
+                run.append(pattern[i + 1])
+            i += 2
+        elif char == "[":
+            flush()
+            i = _skip_class(pattern, i)
+        elif char == "(":
+            flush()
+            i = _skip_group(pattern, i)
+        elif char == "|":
+            flush()
+            branches.append([])
+            i += 1
+        elif char in ".^$)":
+            flush()
+            i += 1
+        else:
+            run.append(char)
+            i += 1
+    flush()
+    return branches
+
+
+def _token_trigrams(tokens: Iterable[str]) -> set[tuple[str, str, str]]:
+    """Trigrams of a set of whitespace-free strings."""
+    trigrams: set[tuple[str, str, str]] = set()
+    for token in tokens:
+        trigrams.update(zip(token, token[1:], token[2:], strict=False))
+    return trigrams
+
+
+def _pattern_trigrams(pattern: str) -> list[set[tuple[str, str, str]]] | None:
+    """Trigrams that a line must contain to match, as alternatives.
+
+    Only trigrams without whitespace are used, which are also the only ones kept
+    in the index. Returns `None` if some alternative of the pattern requires no
+    trigram.
+    """
+    branches = _pattern_literals(pattern)
+    if branches is None:
+        return None
+    alternatives = []
+    for literals in branches:
+        trigrams = _token_trigrams(piece for literal in literals for piece in literal.split())
+        if not trigrams:
+            return None
+        alternatives.append(trigrams)
+    return alternatives
+
+
+# Rough per-file overhead of an index entry, in bytes
+_INDEX_ENTRY_OVERHEAD = 256
+_MIN_FILTER_BITS = 512
+_MAX_FILTER_BITS = 1 << 20
+
+
+def _file_signature(file_stat: os.stat_result) -> tuple[int, int, int, int]:
+    # The change time also catches permission changes and replaced files
+    return (file_stat.st_mtime_ns, file_stat.st_ctime_ns, file_stat.st_size, file_stat.st_ino)
+
+
+@dataclass
+class _IndexedFile:
+    signature: tuple[int, int, int, int]
+    # Whether the file could be read as text
+    readable: bool
+    # Bitmap of the trigrams in the file (a Bloom filter with one hash function),
+    # or `None` if the file is not indexed
+    trigram_filter: bytearray | None
+
+    @property
+    def memory(self) -> int:
+        filter_size = len(self.trigram_filter) if self.trigram_filter is not None else 0
+        return _INDEX_ENTRY_OVERHEAD + filter_size
+
+    def may_contain(self, trigram_hashes: list[list[int]]) -> bool:
+        """Whether the file may contain all trigrams of one of the alternatives."""
+        bitmap = self.trigram_filter
+        if bitmap is None:
+            return True
+        mask = len(bitmap) * 8 - 1
+        return any(
+            all(bitmap[(h & mask) >> 3] & (1 << (h & 7)) for h in hashes)
+            for hashes in trigram_hashes
+        )
+
+
+def _trigram_filter(content: str) -> bytearray:
+    # Trigrams within whitespace-separated tokens; deduplicating tokens first is
+    # much cheaper than slicing the content at every position
+    trigrams = _token_trigrams(set(content.split()))
+    size = _MIN_FILTER_BITS
+    # Keep the filter at most a quarter full, for a low false positive rate
+    while size < 4 * len(trigrams) and size < _MAX_FILTER_BITS:
+        size *= 2
+    bitmap = bytearray(size // 8)
+    mask = size - 1
+    for trigram in trigrams:
+        h = hash(trigram) & mask
+        bitmap[h >> 3] |= 1 << (h & 7)
+    return bitmap
+
+
+class _TrigramIndex:
+    """In-memory index of the files under a root, used to skip files in grep.
+
+    Every file is tracked with its modification time, change time, size and inode,
+    and a trigram filter of its content. A file is only read when it is new, has changed, or may
+    contain all trigrams that a match of the regex requires, so repeated searches
+    over the same tree mostly cost one `stat` per file.
+
+    Trigram filters are only built while the index uses less than `max_memory_bytes`;
+    files indexed beyond that are always read.
+    """
+
+    def __init__(self, max_memory_bytes: int) -> None:
+        self.max_memory_bytes = max_memory_bytes
+        self.memory = 0
+        self._files: dict[str, _IndexedFile] = {}
+        self._lock = threading.Lock()
+
+    def read_candidate(
+        self,
+        file_path: Path,
+        file_stat: os.stat_result,
+        trigram_hashes: list[list[int]] | None,
+    ) -> str | None:
+        """Read a file unless the index shows that it cannot match.
+
+        Args:
+            file_path: The file to read.
+            file_stat: The current `stat` of the file.
+            trigram_hashes: Hashes of the trigrams required by each alternative of
+                the regex, or `None` to read the file regardless.
+
+        Returns:
+            The content of the file, or `None` if it cannot match or is not text.
+        """
+        key = str(file_path)
+        with self._lock:
+            entry = self._files.get(key)
+        if entry is not None and entry.signature == _file_signature(file_stat):
+            if not entry.readable:
+                return None
+            if trigram_hashes is not None and not entry.may_contain(trigram_hashes):
+                return None
+            try:
+                return file_path.read_text()
+            except (UnicodeDecodeError, PermissionError):
+                return None
+
+        try:
+            content: str | None = file_path.read_text()
+        except (UnicodeDecodeError, PermissionError):
+            content = None
+        self._set(key, file_stat, content)
+        return content
+
+    def _set(self, key: str, file_stat: os.stat_result, content: str | None) -> None:
+        entry = _IndexedFile(
+            signature=_file_signature(file_stat),
+            readable=content is not None,
+            trigram_filter=None,
+        )
+        if content is not None and self.memory < self.max_memory_bytes:
+            entry.trigram_filter = _trigram_filter(content)
+        with self._lock:
+            previous = self._files.pop(key, None)
+            if previous is not None:
+                self.memory -= previous.memory
+            self._files[key] = entry
+            self.memory += entry.memory
+
+    def prune(self, seen: set[str]) -> None:
+        """Drop entries of files that no longer exist.
+
+        Args:
+            seen: Keys of all files currently under the root.
+        """
+        with self._lock:
+            for key in [key for key in self._files if key not in seen]:
+                self.memory -= self._files.pop(key).memory
+
+
 class FilesystemFileSearchMiddleware(AgentMiddleware):
     """Provides Glob and Grep search over filesystem files.
 
@@ -92,6 +363,12 @@ class FilesystemFileSearchMiddleware(AgentMiddleware):
     - Glob: Fast file pattern matching by file path
     - Grep: Fast content search using ripgrep or Python fallback
 
+    When `ripgrep` is not available, the Python fallback can keep an in-memory
+    index of the tree (`use_index=True`). The index tracks the modification time
+    and size of every file along with a trigram filter of its content, so repeated
+    searches only read files that are new, have changed, or may contain the
+    literal parts of the regex. Results are the same as without the index.
+
     Example:
         ```python
         from langchain.agents import create_agent
@@ -115,6 +392,8 @@ class FilesystemFileSearchMiddleware(AgentMiddleware):
         root_path: str,
         use_ripgrep: bool = True,
         max_file_size_mb: int = 10,
+        use_index: bool = False,
+        index_max_memory_mb: int = 64,
     ) -> None:
         """Initialize the search middleware.
 
@@ -124,10 +403,17 @@ class FilesystemFileSearchMiddleware(AgentMiddleware):
 
                 Falls back to Python if `ripgrep` unavailable.
             max_file_size_mb: Maximum file size to search in MB.
+            use_index: Whether the Python search keeps an in-memory index of the
+                files under `root_path` between searches.
+            index_max_memory_mb: Approximate memory budget of the index in MB.
+
+                Files indexed once the budget is used up are searched without
+                prefiltering.
         """
         self.root_path = Path(root_path).resolve()
         self.use_ripgrep = use_ripgrep
         self.max_file_size_bytes = max_file_size_mb * 1024 * 1024
+        self._index = _TrigramIndex(index_max_memory_mb * 1024 * 1024) if use_index else None
 
         # Create tool instances as closures that capture self
         @tool
@@ -322,6 +608,9 @@ class FilesystemFileSearchMiddleware(AgentMiddleware):
             return {}
 
         regex = re.compile(pattern)
+        if self._index is not None:
+            return self._indexed_search(regex, base_full, include)
+
         results: dict[str, list[tuple[int, str]]] = {}
 
         # Walk directory tree
@@ -342,16 +631,69 @@ class FilesystemFileSearchMiddleware(AgentMiddleware):
             except (UnicodeDecodeError, PermissionError):
                 continue
 
-            # Search content
-            for line_num, line in enumerate(content.splitlines(), 1):
-                if regex.search(line):
-                    virtual_path = "/" + str(file_path.relative_to(self.root_path))
-                    if virtual_path not in results:
-                        results[virtual_path] = []
-                    results[virtual_path].append((line_num, line))
+            self._search_content(regex, file_path, content, results)
 
         return results
 
+    def _indexed_search(
+        self, regex: re.Pattern[str], base_full: Path, include: str | None
+    ) -> dict[str, list[tuple[int, str]]]:
+        """Search using Python regex, skipping files the index shows cannot match."""
+        index = self._index
+        if index is None:
+            msg = "Index is not enabled"
+            raise RuntimeError(msg)
+
+        trigrams = _pattern_trigrams(regex.pattern)
+        trigram_hashes = (
+            [[hash(trigram) for trigram in alternative] for alternative in trigrams]
+            if trigrams is not None
+            else None
+        )
+        results: dict[str, list[tuple[int, str]]] = {}
+        seen: set[str] = set()
+
+        # Walk directory tree, with the same filters as `_python_search`
+        for file_path in base_full.rglob("*"):
+            try:
+                file_stat = file_path.stat()
+            except OSError:
+                continue
+            if not stat.S_ISREG(file_stat.st_mode):
+                continue
+            seen.add(str(file_path))
+
+            if include and not _match_include_pattern(file_path.name, include):
+                continue
+
+            if file_stat.st_size > self.max_file_size_bytes:
+                continue
+
+            content = index.read_candidate(file_path, file_stat, trigram_hashes)
+            if content is None:
+                continue
+
+            self._search_content(regex, file_path, content, results)
+
+        if base_full == self.root_path:
+            index.prune(seen)
+        return results
+
+    def _search_content(
+        self,
+        regex: re.Pattern[str],
+        file_path: Path,
+        content: str,
+        results: dict[str, list[tuple[int, str]]],
+    ) -> None:
+        """Add the lines of a file that match the regex to the results."""
+        for line_num, line in enumerate(content.splitlines(), 1):
+            if regex.search(line):
+                virtual_path = "/" + str(file_path.relative_to(self.root_path))
+                if virtual_path not in results:
+                    results[virtual_path] = []
+                results[virtual_path].append((line_num, line))
+
     def _format_grep_results(
         self,
         results: dict[str, list[tuple[int, str]]],
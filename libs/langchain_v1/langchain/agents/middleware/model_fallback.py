@@ -2,7 +2,15 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import contextvars
+import math
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, cast
 
 from langchain.agents.middleware.types import (
     AgentMiddleware,
@@ -13,11 +21,63 @@ from langchain.agents.middleware.types import (
 from langchain.chat_models import init_chat_model
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Iterable
 
     from langchain_core.language_models.chat_models import BaseChatModel
 
 
+class _Attempt:
+    """A model call in flight."""
+
+    __slots__ = ("hedged", "model", "started")
+
+    def __init__(self, model: BaseChatModel, *, hedged: bool, started: float | None) -> None:
+        self.model = model
+        self.hedged = hedged
+        # Monotonic time the call began, `None` while it waits for a pool thread
+        self.started = started
+
+
+# Below this many samples the configured `hedge_delay` is used as is
+_MIN_LATENCY_SAMPLES = 10
+
+
+class _LatencyTracker:
+    """Rolling window of call latencies per model instance."""
+
+    def __init__(self, window_size: int) -> None:
+        self.window_size = window_size
+        # id(model) -> (weakref to model, latencies in seconds)
+        self._windows: dict[int, tuple[weakref.ref[BaseChatModel], deque[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, model: BaseChatModel, seconds: float) -> None:
+        key = id(model)
+        with self._lock:
+            entry = self._windows.get(key)
+            if entry is None or entry[0]() is not model:
+                ref = weakref.ref(model, lambda _, key=key: self._drop(key))
+                entry = self._windows[key] = (ref, deque(maxlen=self.window_size))
+            entry[1].append(seconds)
+
+    def _drop(self, key: int) -> None:
+        with self._lock:
+            entry = self._windows.get(key)
+            if entry is not None and entry[0]() is None:
+                del self._windows[key]
+
+    def quantile(self, model: BaseChatModel, q: float) -> float | None:
+        """Nearest-rank quantile of the model's latencies, if enough are recorded."""
+        with self._lock:
+            entry = self._windows.get(id(model))
+            if entry is None or entry[0]() is not model:
+                return None
+            samples = sorted(entry[1])
+        if len(samples) < _MIN_LATENCY_SAMPLES:
+            return None
+        return samples[max(0, math.ceil(q * len(samples)) - 1)]
+
+
 class ModelFallbackMiddleware(AgentMiddleware):
     """Automatic fallback to alternative models on errors.
 
@@ -42,21 +102,94 @@ class ModelFallbackMiddleware(AgentMiddleware):
         # If primary fails: tries gpt-4o-mini, then claude-sonnet-4-5-20250929
         result = await agent.invoke({"messages": [HumanMessage("Hello")]})
         ```
+
+    With `hedge_delay` set, a slow model is also treated as a failure candidate:
+    if it has not answered after the hedge delay, the next model is started
+    alongside it and whichever succeeds first wins. At most two calls are in flight
+    at once. The delay adapts to the `hedge_quantile` of each model's recent
+    latencies once enough calls have been observed. Async losers are cancelled.
+
+    Sync calls run on a pool of `max_workers` threads owned by the middleware and
+    shared by all its runs. A call waiting for a free thread has not started yet:
+    the wait neither starts its hedge delay nor counts towards its latency. Sync
+    calls cannot be interrupted, so a losing sync call finishes in the background
+    and its result is discarded. While `max_abandoned_calls` such calls are still
+    running, slow sync calls are not hedged.
+
+    Hedged calls cost extra, so `calls`, `hedged_calls` and `hedge_wins` count model
+    calls started, duplicate calls started by hedging, and hedges that won.
+
+    Example:
+        ```python
+        fallback = ModelFallbackMiddleware(
+            "openai:gpt-4o-mini",
+            hedge_delay=2.0,  # Until the primary's p95 latency is known
+        )
+        ```
     """
 
     def __init__(
         self,
         first_model: str | BaseChatModel,
         *additional_models: str | BaseChatModel,
+        hedge_delay: float | None = None,
+        hedge_quantile: float | None = 0.95,
+        latency_window: int = 100,
+        max_abandoned_calls: int = 4,
+        max_workers: int = 32,
     ) -> None:
         """Initialize model fallback middleware.
 
         Args:
             first_model: First fallback model (string name or instance).
             *additional_models: Additional fallbacks in order.
+            hedge_delay: Seconds to wait for a model before also starting the next one.
+
+                `None` disables hedging: the next model is only tried after an error.
+            hedge_quantile: Quantile of a model's recent latencies used as its hedge
+                delay once enough calls have been observed.
+
+                `None` always uses `hedge_delay`.
+            latency_window: Number of recent latencies kept per model.
+            max_abandoned_calls: Maximum number of losing sync calls left running in
+                the background. Hedging of sync calls pauses while this many are
+                running.
+            max_workers: Number of threads running sync calls when `hedge_delay` is
+                set. Sync runs beyond this many concurrent model calls wait for a
+                free thread.
+
+        Raises:
+            ValueError: If `hedge_delay` is negative, `hedge_quantile` is not in
+                `(0, 1]`, `max_abandoned_calls` is negative or `max_workers` is not
+                positive.
         """
         super().__init__()
 
+        if hedge_delay is not None and hedge_delay < 0:
+            msg = f"hedge_delay must be >= 0, got {hedge_delay}"
+            raise ValueError(msg)
+        if hedge_quantile is not None and not 0 < hedge_quantile <= 1:
+            msg = f"hedge_quantile must be in (0, 1], got {hedge_quantile}"
+            raise ValueError(msg)
+        if max_abandoned_calls < 0:
+            msg = f"max_abandoned_calls must be >= 0, got {max_abandoned_calls}"
+            raise ValueError(msg)
+        if max_workers < 1:
+            msg = f"max_workers must be >= 1, got {max_workers}"
+            raise ValueError(msg)
+        self.hedge_delay = hedge_delay
+        self.hedge_quantile = hedge_quantile
+        self.max_abandoned_calls = max_abandoned_calls
+        self.max_workers = max_workers
+        self._latencies = _LatencyTracker(latency_window)
+        self._stats_lock = threading.Lock()
+        # Thread pool for sync hedged calls, created on first use
+        self._executor: ThreadPoolExecutor | None = None
+        self._abandoned = 0
+        self.calls = 0
+        self.hedged_calls = 0
+        self.hedge_wins = 0
+
         # Initialize all fallback models
         all_models = (first_model, *additional_models)
         self.models: list[BaseChatModel] = []
@@ -66,6 +199,68 @@ class ModelFallbackMiddleware(AgentMiddleware):
             else:
                 self.models.append(model)
 
+    def _delay_for(self, model: BaseChatModel) -> float:
+        if self.hedge_quantile is not None:
+            observed = self._latencies.quantile(model, self.hedge_quantile)
+            if observed is not None:
+                return observed
+        return cast("float", self.hedge_delay)
+
+    def _count(self, *, hedged: bool = False, won: bool = False) -> None:
+        with self._stats_lock:
+            if won:
+                self.hedge_wins += 1
+            else:
+                self.calls += 1
+                self.hedged_calls += hedged
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._stats_lock:
+            if self._executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="model-fallback"
+                )
+                weakref.finalize(self, executor.shutdown, wait=False)
+                self._executor = executor
+            return self._executor
+
+    def _abandon(self, futures: Iterable[Future[ModelResponse]]) -> None:
+        """Leave losing sync calls running in the background, counting them."""
+        for future in futures:
+            if future.cancel():
+                continue
+            with self._stats_lock:
+                self._abandoned += 1
+            future.add_done_callback(self._release_abandoned)
+
+    def _release_abandoned(self, _: Future[ModelResponse]) -> None:
+        with self._stats_lock:
+            self._abandoned -= 1
+
+    def _hedge_timeout(
+        self, in_flight: Iterable[_Attempt], remaining: int, *, sync: bool = False
+    ) -> float | None:
+        """Seconds until the next model should be started alongside the running one."""
+        attempts = list(in_flight)
+        if remaining == 0 or len(attempts) != 1:
+            return None
+        if sync and self._abandoned >= self.max_abandoned_calls:
+            return None
+        attempt = attempts[0]
+        if attempt.started is None:
+            # Still queued for a pool thread: check again once a full delay has passed
+            return self._delay_for(attempt.model)
+        elapsed = time.monotonic() - attempt.started
+        return max(0.0, self._delay_for(attempt.model) - elapsed)
+
+    def _record_losers(self, losers: Iterable[_Attempt]) -> None:
+        # Elapsed time of an abandoned call is a lower bound on its latency. Leaving
+        # it out would bias the window towards fast calls and shrink the delay.
+        now = time.monotonic()
+        for attempt in losers:
+            if attempt.started is not None:
+                self._latencies.observe(attempt.model, now - attempt.started)
+
     def wrap_model_call(
         self,
         request: ModelRequest,
@@ -83,9 +278,13 @@ class ModelFallbackMiddleware(AgentMiddleware):
         Raises:
             Exception: If all models fail, re-raises last exception.
         """
+        if self.hedge_delay is not None:
+            return self._hedged_call(request, handler)
+
         # Try primary model first
         last_exception: Exception
         try:
+            self._count()
             return handler(request)
         except Exception as e:
             last_exception = e
@@ -93,6 +292,7 @@ class ModelFallbackMiddleware(AgentMiddleware):
         # Try fallback models
         for fallback_model in self.models:
             try:
+                self._count()
                 return handler(request.override(model=fallback_model))
             except Exception as e:
                 last_exception = e
@@ -117,9 +317,13 @@ class ModelFallbackMiddleware(AgentMiddleware):
         Raises:
             Exception: If all models fail, re-raises last exception.
         """
+        if self.hedge_delay is not None:
+            return await self._ahedged_call(request, handler)
+
         # Try primary model first
         last_exception: Exception
         try:
+            self._count()
             return await handler(request)
         except Exception as e:
             last_exception = e
@@ -127,9 +331,121 @@ class ModelFallbackMiddleware(AgentMiddleware):
         # Try fallback models
         for fallback_model in self.models:
             try:
+                self._count()
                 return await handler(request.override(model=fallback_model))
             except Exception as e:
                 last_exception = e
                 continue
 
         raise last_exception
+
+    def _hedged_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], ModelResponse],
+    ) -> ModelResponse:
+        candidates = [request.model, *self.models]
+        next_index = 0
+        in_flight: dict[Future[ModelResponse], _Attempt] = {}
+        last_exception: Exception
+        executor = self._get_executor()
+
+        def run(attempt: _Attempt, call: ModelRequest) -> ModelResponse:
+            attempt.started = time.monotonic()
+            return handler(call)
+
+        def launch(*, hedged: bool) -> None:
+            nonlocal next_index
+            model = candidates[next_index]
+            next_index += 1
+            self._count(hedged=hedged)
+            call = request if next_index == 1 else request.override(model=model)
+            attempt = _Attempt(model, hedged=hedged, started=None)
+            context = contextvars.copy_context()
+            in_flight[executor.submit(context.run, run, attempt, call)] = attempt
+
+        try:
+            launch(hedged=False)
+            while in_flight:
+                timeout = self._hedge_timeout(
+                    in_flight.values(), len(candidates) - next_index, sync=True
+                )
+                done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    # The call may have waited for a pool thread, so only hedge it
+                    # once it has been running for the whole delay
+                    remaining = self._hedge_timeout(
+                        in_flight.values(), len(candidates) - next_index, sync=True
+                    )
+                    if remaining == 0:
+                        launch(hedged=True)
+                    continue
+                for future in done:
+                    attempt = in_flight.pop(future)
+                    try:
+                        response = future.result()
+                    except Exception as e:
+                        last_exception = e
+                        continue
+                    started = cast("float", attempt.started)
+                    self._latencies.observe(attempt.model, time.monotonic() - started)
+                    self._record_losers(in_flight.values())
+                    if attempt.hedged:
+                        self._count(won=True)
+                    return response
+                if not in_flight and next_index < len(candidates):
+                    launch(hedged=False)
+        finally:
+            self._abandon(in_flight)
+
+        raise last_exception
+
+    async def _ahedged_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], Awaitable[ModelResponse]],
+    ) -> ModelResponse:
+        candidates = [request.model, *self.models]
+        next_index = 0
+        in_flight: dict[asyncio.Task[ModelResponse], _Attempt] = {}
+        last_exception: Exception
+
+        def launch(*, hedged: bool) -> None:
+            nonlocal next_index
+            model = candidates[next_index]
+            next_index += 1
+            self._count(hedged=hedged)
+            call = request if next_index == 1 else request.override(model=model)
+            task = asyncio.ensure_future(handler(call))
+            in_flight[task] = _Attempt(model, hedged=hedged, started=time.monotonic())
+
+        try:
+            launch(hedged=False)
+            while in_flight:
+                timeout = self._hedge_timeout(in_flight.values(), len(candidates) - next_index)
+                done, _ = await asyncio.wait(
+                    in_flight, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    launch(hedged=True)
+                    continue
+                for task in done:
+                    attempt = in_flight.pop(task)
+                    try:
+                        response = task.result()
+                    except Exception as e:
+                        last_exception = e
+                        continue
+                    started = cast("float", attempt.started)
+                    self._latencies.observe(attempt.model, time.monotonic() - started)
+                    self._record_losers(in_flight.values())
+                    if attempt.hedged:
+                        self._count(won=True)
+                    return response
+                if not in_flight and next_index < len(candidates):
+                    launch(hedged=False)
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+        raise last_exception
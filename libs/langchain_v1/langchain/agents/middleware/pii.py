@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any, Literal
 
 from langchain_core.messages import AIMessage, AnyMessage, HumanMessage, ToolMessage
@@ -10,7 +14,9 @@ from typing_extensions import override
 from langchain.agents.middleware._redaction import (
     PIIDetectionError,
     PIIMatch,
+    PIIScanner,
     RedactionRule,
+    RedactionStrategy,
     ResolvedRedactionRule,
     apply_strategy,
     detect_credit_card,
@@ -22,143 +28,82 @@ from langchain.agents.middleware._redaction import (
 from langchain.agents.middleware.types import AgentMiddleware, AgentState, hook_config
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Sequence
 
     from langgraph.runtime import Runtime
 
 
-class PIIMiddleware(AgentMiddleware):
-    """Detect and handle Personally Identifiable Information (PII) in conversations.
-
-    This middleware detects common PII types and applies configurable strategies
-    to handle them. It can detect emails, credit cards, IP addresses, MAC addresses, and
-    URLs in both user input and agent output.
+# Maximum number of scanned message contents remembered per middleware instance
+_SCANNED_MESSAGES_MAXSIZE = 1024
 
-    Built-in PII types:
-
-    - `email`: Email addresses
-    - `credit_card`: Credit card numbers (validated with Luhn algorithm)
-    - `ip`: IP addresses (validated with stdlib)
-    - `mac_address`: MAC addresses
-    - `url`: URLs (both `http`/`https` and bare URLs)
-
-    Strategies:
-
-    - `block`: Raise an exception when PII is detected
-    - `redact`: Replace PII with `[REDACTED_TYPE]` placeholders
-    - `mask`: Partially mask PII (e.g., `****-****-****-1234` for credit card)
-    - `hash`: Replace PII with deterministic hash (e.g., `<email_hash:a1b2c3d4>`)
 
-    Strategy Selection Guide:
-
-    | Strategy | Preserves Identity? | Best For                                |
-    | -------- | ------------------- | --------------------------------------- |
-    | `block`  | N/A                 | Avoid PII completely                    |
-    | `redact` | No                  | General compliance, log sanitization    |
-    | `mask`   | No                  | Human readability, customer service UIs |
-    | `hash`   | Yes (pseudonymous)  | Analytics, debugging                    |
-
-    Example:
-        ```python
-        from langchain.agents.middleware import PIIMiddleware
-        from langchain.agents import create_agent
-
-        # Redact all emails in user input
-        agent = create_agent(
-            "openai:gpt-5",
-            middleware=[
-                PIIMiddleware("email", strategy="redact"),
-            ],
-        )
+class _ScannedMessages:
+    """Bounded record of message contents that were scanned and found clean.
 
-        # Use different strategies for different PII types
-        agent = create_agent(
-            "openai:gpt-4o",
-            middleware=[
-                PIIMiddleware("credit_card", strategy="mask"),
-                PIIMiddleware("url", strategy="redact"),
-                PIIMiddleware("ip", strategy="hash"),
-            ],
-        )
+    Entries are keyed by message id and content, so a message is scanned again if
+    its content changes. Messages without an id are always scanned.
+    """
 
-        # Custom PII type with regex
-        agent = create_agent(
-            "openai:gpt-5",
-            middleware=[
-                PIIMiddleware("api_key", detector=r"sk-[a-zA-Z0-9]{32}", strategy="block"),
-            ],
-        )
-        ```
+    def __init__(self, maxsize: int = _SCANNED_MESSAGES_MAXSIZE) -> None:
+        self._keys: OrderedDict[tuple[str, int, int], None] = OrderedDict()
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: tuple[str, int, int] | None) -> bool:
+        if key is None:
+            return False
+        with self._lock:
+            if key not in self._keys:
+                return False
+            self._keys.move_to_end(key)
+            return True
+
+    def add(self, key: tuple[str, int, int] | None) -> None:
+        if key is None:
+            return
+        with self._lock:
+            self._keys[key] = None
+            if len(self._keys) > self._maxsize:
+                self._keys.popitem(last=False)
+
+
+class _PIIMiddlewareBase(AgentMiddleware, ABC):
+    """Apply PII handling to user input, tool results and model output.
+
+    Subclasses implement `_process_content`. Messages that were scanned and found
+    clean are remembered, so the last user message is not rescanned on every
+    model call of an agent run.
     """
 
     def __init__(
         self,
-        # From a typing point of view, the literals are covered by 'str'.
-        # Nonetheless, we escape PYI051 to keep hints and autocompletion for the caller.
-        pii_type: Literal["email", "credit_card", "ip", "mac_address", "url"] | str,  # noqa: PYI051
         *,
-        strategy: Literal["block", "redact", "mask", "hash"] = "redact",
-        detector: Callable[[str], list[PIIMatch]] | str | None = None,
-        apply_to_input: bool = True,
-        apply_to_output: bool = False,
-        apply_to_tool_results: bool = False,
+        apply_to_input: bool,
+        apply_to_output: bool,
+        apply_to_tool_results: bool,
     ) -> None:
-        """Initialize the PII detection middleware.
-
-        Args:
-            pii_type: Type of PII to detect.
-
-                Can be a built-in type (`email`, `credit_card`, `ip`, `mac_address`,
-                `url`) or a custom type name.
-            strategy: How to handle detected PII.
-
-                Options:
-
-                * `block`: Raise `PIIDetectionError` when PII is detected
-                * `redact`: Replace with `[REDACTED_TYPE]` placeholders
-                * `mask`: Partially mask PII (show last few characters)
-                * `hash`: Replace with deterministic hash (format: `<type_hash:digest>`)
-
-            detector: Custom detector function or regex pattern.
-
-                * If `Callable`: Function that takes content string and returns
-                    list of `PIIMatch` objects
-                * If `str`: Regex pattern to match PII
-                * If `None`: Uses built-in detector for the `pii_type`
-            apply_to_input: Whether to check user messages before model call.
-            apply_to_output: Whether to check AI messages after model call.
-            apply_to_tool_results: Whether to check tool result messages after tool execution.
-
-        Raises:
-            ValueError: If `pii_type` is not built-in and no detector is provided.
-        """
         super().__init__()
 
         self.apply_to_input = apply_to_input
         self.apply_to_output = apply_to_output
         self.apply_to_tool_results = apply_to_tool_results
+        self._scanned = _ScannedMessages()
 
-        self._resolved_rule: ResolvedRedactionRule = RedactionRule(
-            pii_type=pii_type,
-            strategy=strategy,
-            detector=detector,
-        ).resolve()
-        self.pii_type = self._resolved_rule.pii_type
-        self.strategy = self._resolved_rule.strategy
-        self.detector = self._resolved_rule.detector
-
-    @property
-    def name(self) -> str:
-        """Name of the middleware."""
-        return f"{self.__class__.__name__}[{self.pii_type}]"
-
+    @abstractmethod
     def _process_content(self, content: str) -> tuple[str, list[PIIMatch]]:
-        """Apply the configured redaction rule to the provided content."""
-        matches = self.detector(content)
+        """Return the sanitized content and the matches found in it."""
+
+    def _scan_message(self, message: AnyMessage) -> str | None:
+        """Return the sanitized content of a message, or `None` if it has no PII."""
+        content = str(message.content)
+        key = (message.id, len(content), hash(content)) if message.id else None
+        if key in self._scanned:
+            return None
+        new_content, matches = self._process_content(content)
         if not matches:
-            return content, []
-        sanitized = apply_strategy(content, matches, self.strategy)
-        return sanitized, matches
+            self._scanned.add(key)
+            return None
+        return new_content
 
     @hook_config(can_jump_to=["end"])
     @override
@@ -203,10 +148,9 @@ class PIIMiddleware(AgentMiddleware):
 
             if last_user_idx is not None and last_user_msg and last_user_msg.content:
                 # Detect PII in message content
-                content = str(last_user_msg.content)
-                new_content, matches = self._process_content(content)
+                new_content = self._scan_message(last_user_msg)
 
-                if matches:
+                if new_content is not None:
                     updated_message: AnyMessage = HumanMessage(
                         content=new_content,
                         id=last_user_msg.id,
@@ -234,10 +178,9 @@ class PIIMiddleware(AgentMiddleware):
                         if not tool_msg.content:
                             continue
 
-                        content = str(tool_msg.content)
-                        new_content, matches = self._process_content(content)
+                        new_content = self._scan_message(tool_msg)
 
-                        if not matches:
+                        if new_content is None:
                             continue
 
                         # Create updated tool message
@@ -317,10 +260,9 @@ class PIIMiddleware(AgentMiddleware):
             return None
 
         # Detect PII in message content
-        content = str(last_ai_msg.content)
-        new_content, matches = self._process_content(content)
+        new_content = self._scan_message(last_ai_msg)
 
-        if not matches:
+        if new_content is None:
             return None
 
         # Create updated message
@@ -358,7 +300,231 @@ class PIIMiddleware(AgentMiddleware):
         return self.after_model(state, runtime)
 
 
+class PIIMiddleware(_PIIMiddlewareBase):
+    """Detect and handle Personally Identifiable Information (PII) in conversations.
+
+    This middleware detects common PII types and applies configurable strategies
+    to handle them. It can detect emails, credit cards, IP addresses, MAC addresses, and
+    URLs in both user input and agent output.
+
+    Built-in PII types:
+
+    - `email`: Email addresses
+    - `credit_card`: Credit card numbers (validated with Luhn algorithm)
+    - `ip`: IP addresses (validated with stdlib)
+    - `mac_address`: MAC addresses
+    - `url`: URLs (both `http`/`https` and bare URLs)
+
+    Strategies:
+
+    - `block`: Raise an exception when PII is detected
+    - `redact`: Replace PII with `[REDACTED_TYPE]` placeholders
+    - `mask`: Partially mask PII (e.g., `****-****-****-1234` for credit card)
+    - `hash`: Replace PII with deterministic hash (e.g., `<email_hash:a1b2c3d4>`)
+
+    Strategy Selection Guide:
+
+    | Strategy | Preserves Identity? | Best For                                |
+    | -------- | ------------------- | --------------------------------------- |
+    | `block`  | N/A                 | Avoid PII completely                    |
+    | `redact` | No                  | General compliance, log sanitization    |
+    | `mask`   | No                  | Human readability, customer service UIs |
+    | `hash`   | Yes (pseudonymous)  | Analytics, debugging                    |
+
+    Example:
+        ```python
+        from langchain.agents.middleware import PIIMiddleware
+        from langchain.agents import create_agent
+
+        # Redact all emails in user input
+        agent = create_agent(
+            "openai:gpt-5",
+            middleware=[
+                PIIMiddleware("email", strategy="redact"),
+            ],
+        )
+
+        # Use different strategies for different PII types
+        agent = create_agent(
+            "openai:gpt-4o",
+            middleware=[
+                PIIMiddleware("credit_card", strategy="mask"),
+                PIIMiddleware("url", strategy="redact"),
+                PIIMiddleware("ip", strategy="hash"),
+            ],
+        )
+
+        # Custom PII type with regex
+        agent = create_agent(
+            "openai:gpt-5",
+            middleware=[
+                PIIMiddleware("api_key", detector=r"sk-[a-zA-Z0-9]{32}", strategy="block"),
+            ],
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        # From a typing point of view, the literals are covered by 'str'.
+        # Nonetheless, we escape PYI051 to keep hints and autocompletion for the caller.
+        pii_type: Literal["email", "credit_card", "ip", "mac_address", "url"] | str,  # noqa: PYI051
+        *,
+        strategy: Literal["block", "redact", "mask", "hash"] = "redact",
+        detector: Callable[[str], list[PIIMatch]] | str | None = None,
+        apply_to_input: bool = True,
+        apply_to_output: bool = False,
+        apply_to_tool_results: bool = False,
+    ) -> None:
+        """Initialize the PII detection middleware.
+
+        Args:
+            pii_type: Type of PII to detect.
+
+                Can be a built-in type (`email`, `credit_card`, `ip`, `mac_address`,
+                `url`) or a custom type name.
+            strategy: How to handle detected PII.
+
+                Options:
+
+                * `block`: Raise `PIIDetectionError` when PII is detected
+                * `redact`: Replace with `[REDACTED_TYPE]` placeholders
+                * `mask`: Partially mask PII (show last few characters)
+                * `hash`: Replace with deterministic hash (format: `<type_hash:digest>`)
+
+            detector: Custom detector function or regex pattern.
+
+                * If `Callable`: Function that takes content string and returns
+                    list of `PIIMatch` objects
+                * If `str`: Regex pattern to match PII
+                * If `None`: Uses built-in detector for the `pii_type`
+            apply_to_input: Whether to check user messages before model call.
+            apply_to_output: Whether to check AI messages after model call.
+            apply_to_tool_results: Whether to check tool result messages after tool execution.
+
+        Raises:
+            ValueError: If `pii_type` is not built-in and no detector is provided.
+        """
+        super().__init__(
+            apply_to_input=apply_to_input,
+            apply_to_output=apply_to_output,
+            apply_to_tool_results=apply_to_tool_results,
+        )
+
+        self._resolved_rule: ResolvedRedactionRule = RedactionRule(
+            pii_type=pii_type,
+            strategy=strategy,
+            detector=detector,
+        ).resolve()
+        self.pii_type = self._resolved_rule.pii_type
+        self.strategy = self._resolved_rule.strategy
+        self.detector = self._resolved_rule.detector
+
+    @property
+    def name(self) -> str:
+        """Name of the middleware."""
+        return f"{self.__class__.__name__}[{self.pii_type}]"
+
+    def _process_content(self, content: str) -> tuple[str, list[PIIMatch]]:
+        """Apply the configured redaction rule to the provided content."""
+        matches = self.detector(content)
+        if not matches:
+            return content, []
+        sanitized = apply_strategy(content, matches, self.strategy)
+        return sanitized, matches
+
+
+class CombinedPIIMiddleware(_PIIMiddlewareBase):
+    """Detect and handle several PII types with a single scan per message.
+
+    All rules run in one hook and each message is scanned once: built-in types and
+    regex detectors are compiled into a single pattern, and validation (Luhn checks,
+    IP address parsing) only runs on candidates. Messages that were already found
+    clean are not scanned again on later model calls.
+
+    The matches are those of a `PIIMiddleware` per rule, merged: the leftmost match
+    wins, among matches starting at the same position the earlier rule wins, and a
+    match overlapping one that won is dropped whole. Stacked `PIIMiddleware`
+    instances instead each scan the output of the previous one. If a rule with the
+    `block` strategy has any match, `PIIDetectionError` is raised.
+
+    Example:
+        ```python
+        from langchain.agents import create_agent
+        from langchain.agents.middleware import CombinedPIIMiddleware, RedactionRule
+
+        agent = create_agent(
+            "openai:gpt-5",
+            middleware=[
+                CombinedPIIMiddleware(
+                    {"email": "redact", "credit_card": "mask", "ip": "hash", "url": "redact"},
+                    apply_to_tool_results=True,
+                ),
+            ],
+        )
+
+        # Custom types are configured with `RedactionRule`
+        middleware = CombinedPIIMiddleware(
+            [
+                RedactionRule("email", strategy="mask"),
+                RedactionRule("api_key", strategy="block", detector=r"sk-[a-zA-Z0-9]{32}"),
+            ]
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        rules: Mapping[str, RedactionStrategy] | Sequence[RedactionRule],
+        *,
+        apply_to_input: bool = True,
+        apply_to_output: bool = False,
+        apply_to_tool_results: bool = False,
+    ) -> None:
+        """Initialize the combined PII detection middleware.
+
+        Args:
+            rules: Rules to apply, in order of precedence.
+
+                Either a mapping of built-in PII type to strategy, or a sequence of
+                `RedactionRule` objects (required for custom detectors).
+            apply_to_input: Whether to check user messages before model call.
+            apply_to_output: Whether to check AI messages after model call.
+            apply_to_tool_results: Whether to check tool result messages after tool execution.
+
+        Raises:
+            ValueError: If a rule has an unknown PII type without a detector, or an
+                unknown strategy.
+        """
+        super().__init__(
+            apply_to_input=apply_to_input,
+            apply_to_output=apply_to_output,
+            apply_to_tool_results=apply_to_tool_results,
+        )
+
+        redaction_rules = (
+            [
+                RedactionRule(pii_type=pii_type, strategy=strategy)
+                for pii_type, strategy in rules.items()
+            ]
+            if isinstance(rules, Mapping)
+            else list(rules)
+        )
+        self.scanner = PIIScanner(redaction_rules)
+
+    @property
+    def name(self) -> str:
+        """Name of the middleware."""
+        pii_types = ",".join(rule.pii_type for rule in self.scanner.rules)
+        return f"{self.__class__.__name__}[{pii_types}]"
+
+    def _process_content(self, content: str) -> tuple[str, list[PIIMatch]]:
+        """Apply all configured redaction rules to the provided content."""
+        return self.scanner.apply(content)
+
+
 __all__ = [
+    "CombinedPIIMiddleware",
     "PIIDetectionError",
     "PIIMiddleware",
     "detect_credit_card",
@@ -1,18 +1,23 @@
-"""LLM-based tool selector middleware."""
+"""LLM- and embedding-based tool selector middleware."""
 
 from __future__ import annotations
 
 import logging
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Annotated, Literal, Union
+from typing import TYPE_CHECKING, Annotated, Literal, Union, cast
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
     from langchain.tools import BaseTool
 
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import HumanMessage, ToolMessage
+from langchain_core.vectorstores import InMemoryVectorStore
 from pydantic import Field, TypeAdapter
 from typing_extensions import TypedDict
 
@@ -23,6 +28,7 @@ from langchain.agents.middleware.types import (
     ModelResponse,
 )
 from langchain.chat_models.base import init_chat_model
+from langchain.embeddings.base import init_embeddings
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +36,10 @@ DEFAULT_SYSTEM_PROMPT = (
     "Your goal is to select the most relevant tools for answering the user's query."
 )
 
+# Tool results can be long; only their start is used as selection context
+_MAX_TOOL_CONTEXT_CHARS = 1000
+_QUERY_CACHE_SIZE = 128
+
 
 @dataclass
 class _SelectionRequest:
@@ -221,8 +231,12 @@ class LLMToolSelectorMiddleware(AgentMiddleware):
         available_tools: list[BaseTool],
         valid_tool_names: list[str],
         request: ModelRequest,
+        *,
+        max_tools: int | None = None,
     ) -> ModelRequest:
         """Process the selection response and return filtered `ModelRequest`."""
+        if max_tools is None:
+            max_tools = self.max_tools
         selected_tool_names: list[str] = []
         invalid_tool_selections = []
 
@@ -233,7 +247,7 @@ class LLMToolSelectorMiddleware(AgentMiddleware):
 
             # Only add if not already selected and within max_tools limit
             if tool_name not in selected_tool_names and (
-                self.max_tools is None or len(selected_tool_names) < self.max_tools
+                max_tools is None or len(selected_tool_names) < max_tools
             ):
                 selected_tool_names.append(tool_name)
 
@@ -318,3 +332,243 @@ class LLMToolSelectorMiddleware(AgentMiddleware):
             response, selection_request.available_tools, selection_request.valid_tool_names, request
         )
         return await handler(modified_request)
+
+
+def _selection_context(request: ModelRequest) -> str:
+    """Text of the latest user message and the tool results that followed it."""
+    parts: list[str] = []
+    for message in reversed(request.messages):
+        if isinstance(message, HumanMessage):
+            parts.append(message.text)
+            break
+        if isinstance(message, ToolMessage):
+            parts.append(message.text[:_MAX_TOOL_CONTEXT_CHARS])
+    else:
+        msg = "No user message found in request messages"
+        raise AssertionError(msg)
+    parts.reverse()
+    return "\n".join(part for part in parts if part)
+
+
+class EmbeddingToolSelectorMiddleware(LLMToolSelectorMiddleware):
+    """Selects relevant tools by embedding similarity before calling the main model.
+
+    Tool names and descriptions are embedded once and kept in an
+    `InMemoryVectorStore`. On each model call, the latest user message (plus any tool
+    results that followed it) is embedded and the `max_tools` most similar tools are
+    kept. This avoids the extra LLM round-trip of `LLMToolSelectorMiddleware`.
+
+    When the cut-off is ambiguous, i.e. the similarity of the last selected tool is
+    within `ambiguity_margin` of the first excluded one, the selection falls back to
+    an LLM call over the `2 * max_tools` most similar tools.
+
+    Examples:
+        !!! example "Select 3 tools by similarity"
+
+            ```python
+            from langchain.agents.middleware import EmbeddingToolSelectorMiddleware
+
+            middleware = EmbeddingToolSelectorMiddleware(
+                "openai:text-embedding-3-small",
+                max_tools=3,
+            )
+
+            agent = create_agent(
+                model="openai:gpt-4o",
+                tools=[tool1, tool2, tool3, tool4, tool5],
+                middleware=[middleware],
+            )
+            ```
+
+        !!! example "Never call an LLM for selection"
+
+            ```python
+            middleware = EmbeddingToolSelectorMiddleware(
+                embeddings, max_tools=3, ambiguity_margin=None
+            )
+            ```
+    """
+
+    def __init__(
+        self,
+        embeddings: str | Embeddings,
+        *,
+        max_tools: int = 5,
+        ambiguity_margin: float | None = 0.02,
+        model: str | BaseChatModel | None = None,
+        system_prompt: str = DEFAULT_SYSTEM_PROMPT,
+        always_include: list[str] | None = None,
+    ) -> None:
+        """Initialize the tool selector.
+
+        Args:
+            embeddings: Embeddings used for tools and selection context.
+
+                Can be a model identifier string or `Embeddings` instance.
+            max_tools: Maximum number of tools to select.
+            ambiguity_margin: Similarity gap below which the cut-off between selected
+                and excluded tools is considered ambiguous and an LLM decides.
+
+                `None` never calls an LLM.
+            model: Model used when the selection is ambiguous.
+
+                If not provided, uses the agent's main model.
+            system_prompt: Instructions for the selection model.
+            always_include: Tool names to always include regardless of selection.
+
+                These do not count against the `max_tools` limit.
+
+        Raises:
+            ValueError: If `max_tools` is less than 1.
+        """
+        if max_tools < 1:
+            msg = f"max_tools must be >= 1, got {max_tools}"
+            raise ValueError(msg)
+        super().__init__(
+            model=model,
+            system_prompt=system_prompt,
+            max_tools=max_tools,
+            always_include=always_include,
+        )
+        self.max_tools: int = max_tools
+        self.ambiguity_margin = ambiguity_margin
+        self.embeddings = (
+            embeddings if isinstance(embeddings, Embeddings) else init_embeddings(embeddings)
+        )
+        self.vector_store = InMemoryVectorStore(self.embeddings)
+        # (name, description) -> document id in the vector store
+        self._tool_ids: dict[tuple[str, str], str] = {}
+        self._query_vectors: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _missing_tools(self, tools: list[BaseTool]) -> list[tuple[str, str]]:
+        with self._lock:
+            missing = {
+                (tool.name, tool.description): None
+                for tool in tools
+                if (tool.name, tool.description) not in self._tool_ids
+            }
+        return list(missing)
+
+    @staticmethod
+    def _tool_documents(keys: list[tuple[str, str]]) -> list[Document]:
+        # Same rendering as the tool list shown to the LLM selector
+        return [
+            Document(page_content=f"{name}: {description}", metadata={"name": name})
+            for name, description in keys
+        ]
+
+    def _store_tool_ids(self, keys: list[tuple[str, str]], ids: list[str]) -> None:
+        with self._lock:
+            self._tool_ids.update(zip(keys, ids, strict=True))
+
+    def _cached_query_vector(self, context: str) -> list[float] | None:
+        with self._lock:
+            vector = self._query_vectors.get(context)
+            if vector is not None:
+                self._query_vectors.move_to_end(context)
+            return vector
+
+    def _store_query_vector(self, context: str, vector: list[float]) -> None:
+        with self._lock:
+            self._query_vectors[context] = vector
+            if len(self._query_vectors) > _QUERY_CACHE_SIZE:
+                self._query_vectors.popitem(last=False)
+
+    def _rank_tools(
+        self, available_tools: list[BaseTool], query_vector: list[float]
+    ) -> tuple[list[BaseTool], bool]:
+        """Rank tools by similarity.
+
+        Returns:
+            The ranked tools and whether the `max_tools` cut-off is ambiguous.
+        """
+        with self._lock:
+            tools_by_id = {
+                self._tool_ids[tool.name, tool.description]: tool for tool in available_tools
+            }
+        results = self.vector_store.similarity_search_with_score_by_vector(
+            query_vector,
+            k=len(tools_by_id),
+            filter=lambda doc: doc.id in tools_by_id,
+        )
+        ranked = [tools_by_id[cast("str", doc.id)] for doc, _ in results]
+        scores = [score for _, score in results]
+        k = self.max_tools
+        ambiguous = (
+            self.ambiguity_margin is not None
+            and len(scores) > k
+            and scores[k - 1] - scores[k] < self.ambiguity_margin
+        )
+        return ranked, ambiguous
+
+    def _select_tools(
+        self, request: ModelRequest, ranked: list[BaseTool], *, ambiguous: bool
+    ) -> ModelRequest:
+        """Return `request` restricted to the top-ranked tools.
+
+        For an ambiguous ranking, the shortlist handed to the LLM selector is kept
+        instead.
+        """
+        keep = ranked[: 2 * self.max_tools] if ambiguous else ranked[: self.max_tools]
+        return self._process_selection_response(
+            {"tools": [tool.name for tool in keep]},
+            ranked,
+            [tool.name for tool in ranked],
+            request,
+            max_tools=len(keep),
+        )
+
+    def wrap_model_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], ModelResponse],
+    ) -> ModelCallResult:
+        """Filter tools based on embedding similarity before invoking the model."""
+        selection_request = self._prepare_selection_request(request)
+        if selection_request is None or len(selection_request.available_tools) <= self.max_tools:
+            return handler(request)
+
+        missing = self._missing_tools(selection_request.available_tools)
+        if missing:
+            ids = self.vector_store.add_documents(self._tool_documents(missing))
+            self._store_tool_ids(missing, ids)
+
+        context = _selection_context(request)
+        query_vector = self._cached_query_vector(context)
+        if query_vector is None:
+            query_vector = self.embeddings.embed_query(context)
+            self._store_query_vector(context, query_vector)
+
+        ranked, ambiguous = self._rank_tools(selection_request.available_tools, query_vector)
+        modified_request = self._select_tools(request, ranked, ambiguous=ambiguous)
+        if ambiguous:
+            return super().wrap_model_call(modified_request, handler)
+        return handler(modified_request)
+
+    async def awrap_model_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], Awaitable[ModelResponse]],
+    ) -> ModelCallResult:
+        """Filter tools based on embedding similarity before invoking the model."""
+        selection_request = self._prepare_selection_request(request)
+        if selection_request is None or len(selection_request.available_tools) <= self.max_tools:
+            return await handler(request)
+
+        missing = self._missing_tools(selection_request.available_tools)
+        if missing:
+            ids = await self.vector_store.aadd_documents(self._tool_documents(missing))
+            self._store_tool_ids(missing, ids)
+
+        context = _selection_context(request)
+        query_vector = self._cached_query_vector(context)
+        if query_vector is None:
+            query_vector = await self.embeddings.aembed_query(context)
+            self._store_query_vector(context, query_vector)
+
+        ranked, ambiguous = self._rank_tools(selection_request.available_tools, query_vector)
+        modified_request = self._select_tools(request, ranked, ambiguous=ambiguous)
+        if ambiguous:
+            return await super().awrap_model_call(modified_request, handler)
+        return await handler(modified_request)
@@ -0,0 +1,90 @@
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import pytest
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel, LanguageModelInput
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import Runnable
+from langchain_core.tools import BaseTool, StructuredTool
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import BaseModel, Field
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from langchain.agents import create_agent
+
+
+class _SearchArgs(BaseModel):
+    query: str = Field(description="The search query.")
+    limit: int = Field(default=10, description="Maximum number of results.")
+    tags: list[str] = Field(default_factory=list, description="Tags to filter by.")
+    since: str | None = Field(default=None, description="ISO date lower bound.")
+
+
+def _make_tools(n: int) -> list[BaseTool]:
+    return [
+        StructuredTool.from_function(
+            func=lambda **kwargs: str(kwargs),
+            name=f"search_{i}",
+            description=f"Search collection number {i}.",
+            args_schema=_SearchArgs,
+        )
+        for i in range(n)
+    ]
+
+
+class _ToolCallingFakeChatModel(BaseChatModel):
+    """Fake chat model that calls a tool until it has seen `steps` tool results.
+
+    Tools are converted on `bind_tools` like provider models do.
+    """
+
+    steps: int
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,  # noqa: ARG002
+        run_manager: CallbackManagerForLLMRun | None = None,  # noqa: ARG002
+        **kwargs: Any,  # noqa: ARG002
+    ) -> ChatResult:
+        step = sum(isinstance(m, ToolMessage) for m in messages)
+        if step < self.steps:
+            message = AIMessage(
+                content="",
+                tool_calls=[
+                    {
+                        "name": f"search_{step % 30}",
+                        "args": {"query": f"step {step}"},
+                        "id": f"call_{step}",
+                    }
+                ],
+            )
+        else:
+            message = AIMessage(content="done")
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    @property
+    def _llm_type(self) -> str:
+        return "tool-calling-fake"
+
+    def bind_tools(
+        self,
+        tools: Sequence[dict[str, Any] | type | Callable | BaseTool],
+        **kwargs: Any,
+    ) -> Runnable[LanguageModelInput, AIMessage]:
+        formatted = [convert_to_openai_tool(t) for t in tools]
+        return self.bind(tools=formatted, **kwargs)
+
+
+@pytest.mark.benchmark
+def test_agent_loop_30_tools_20_steps(benchmark: BenchmarkFixture) -> None:
+    # Each step sends a request with the same model and tools, so the model is
+    # bound once per agent and reused by every later step and run
+    agent = create_agent(_ToolCallingFakeChatModel(steps=20), tools=_make_tools(30))
+
+    @benchmark  # type: ignore[misc]
+    def run_agent() -> None:
+        result = agent.invoke({"messages": [("user", "search")]})
+        assert result["messages"][-1].content == "done"
@@ -336,3 +336,85 @@ def test_tool_node_not_accepted() -> None:
             tools=tool_node,  # type: ignore[arg-type]
             system_prompt="You are a helpful assistant.",
         )
+
+
+def test_bound_model_reused_across_steps() -> None:
+    """Test that tools are bound once while the model, tools and format are unchanged."""
+    bound_tool_names: list[list[str]] = []
+
+    class CountingModel(FakeToolCallingModel):
+        def bind_tools(self, tools, **kwargs):  # type: ignore[no-untyped-def]
+            bound_tool_names.append([t.name for t in tools])
+            return super().bind_tools(tools, **kwargs)
+
+    @tool
+    def search(query: str) -> str:
+        """Search for information."""
+        return f"Results for: {query}"
+
+    @tool
+    def calculator(expression: str) -> str:
+        """Calculate a mathematical expression."""
+        return f"Result: {expression}"
+
+    model = CountingModel(
+        tool_calls=[
+            [{"args": {"query": "a"}, "id": "1", "name": "search"}],
+            [{"args": {"expression": "1+1"}, "id": "2", "name": "calculator"}],
+            [],
+        ]
+    )
+    agent = create_agent(model=model, tools=[search, calculator])
+
+    result = agent.invoke({"messages": [HumanMessage("Hello")]})
+    assert len([m for m in result["messages"] if isinstance(m, AIMessage)]) == 3
+    assert bound_tool_names == [["search", "calculator"]]
+
+    # Changing a tool's schema binds the tools again
+    search.description = "Search the web."
+    model.index = 0
+    agent.invoke({"messages": [HumanMessage("Hello")]})
+    assert bound_tool_names == [["search", "calculator"]] * 2
+
+
+def test_bound_model_rebound_when_tools_change() -> None:
+    """Test that a different tool set from middleware gets its own binding."""
+    bound_tool_names: list[list[str]] = []
+
+    class CountingModel(FakeToolCallingModel):
+        def bind_tools(self, tools, **kwargs):  # type: ignore[no-untyped-def]
+            bound_tool_names.append([t.name for t in tools])
+            return super().bind_tools(tools, **kwargs)
+
+    @tool
+    def search(query: str) -> str:
+        """Search for information."""
+        return f"Results for: {query}"
+
+    @tool
+    def admin_tool(command: str) -> str:
+        """Admin-only tool."""
+        return f"Admin: {command}"
+
+    class AlternatingToolsMiddleware(AgentMiddleware):
+        calls = 0
+
+        def wrap_model_call(
+            self,
+            request: ModelRequest,
+            handler: Callable[[ModelRequest], AIMessage],
+        ) -> AIMessage:
+            self.calls += 1
+            if self.calls % 2:
+                request = request.override(tools=[t for t in request.tools if t.name == "search"])
+            return handler(request)
+
+    agent = create_agent(
+        model=CountingModel(),
+        tools=[search, admin_tool],
+        middleware=[AlternatingToolsMiddleware()],
+    )
+    for _ in range(4):
+        agent.invoke({"messages": [HumanMessage("Hello")]})
+
+    assert bound_tool_names == [["search"], ["search", "admin_tool"]]
@@ -10,6 +10,7 @@ from langchain.agents.middleware.file_search import (
     _expand_include_patterns,
     _is_valid_include_pattern,
     _match_include_pattern,
+    _pattern_literals,
 )
 
 
@@ -362,3 +363,127 @@ class TestGrepEdgeCases:
 
         # Large file should be skipped
         assert "/small.txt" in result
+
+
+class TestIndexedGrepSearch:
+    """Tests for grep search with the in-memory trigram index."""
+
+    @staticmethod
+    def _make_tree(root: Path) -> None:
+        (root / "src").mkdir()
+        (root / "src" / "app.py").write_text(
+            "import os\n\ndef handler(event):\n    return os.environ['HOME']\n",
+            encoding="utf-8",
+        )
+        (root / "src" / "util.py").write_text(
+            "def colour():\n    return 'red'\n\nclass Helper:\n    pass\n", encoding="utf-8"
+        )
+        (root / "README.md").write_text("# Project\nUse handler(event) or color.\n")
+        (root / "data.bin").write_bytes(b"\xff\xfe\x00handler")
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            "handler",
+            r"def \w+\(",
+            "colou?r",
+            "import (os|sys)",
+            "Helper|README",
+            r"os\.environ\[",
+            "(?i)HANDLER",
+            "^#",
+            "missing_token",
+        ],
+    )
+    @pytest.mark.parametrize("output_mode", ["files_with_matches", "content", "count"])
+    @pytest.mark.parametrize("include", [None, "*.py", "*.{md,py}"])
+    def test_results_match_python_search(
+        self, tmp_path: Path, pattern: str, output_mode: Any, include: str | None
+    ) -> None:
+        """Indexed search returns exactly what the plain Python search returns."""
+        self._make_tree(tmp_path)
+        plain = FilesystemFileSearchMiddleware(root_path=str(tmp_path), use_ripgrep=False)
+        indexed = FilesystemFileSearchMiddleware(
+            root_path=str(tmp_path), use_ripgrep=False, use_index=True
+        )
+
+        expected = plain.grep_search.func(pattern=pattern, include=include, output_mode=output_mode)
+        # Twice: once to build the index, once using it
+        for _ in range(2):
+            result = indexed.grep_search.func(
+                pattern=pattern, include=include, output_mode=output_mode
+            )
+            assert result == expected
+
+    def test_skips_files_that_cannot_match(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Files without the pattern's trigrams are not read once indexed."""
+        self._make_tree(tmp_path)
+        middleware = FilesystemFileSearchMiddleware(
+            root_path=str(tmp_path), use_ripgrep=False, use_index=True
+        )
+        middleware.grep_search.func(pattern="anything")
+
+        read: list[str] = []
+        original_read_text = Path.read_text
+
+        def read_text(self: Path, *args: Any, **kwargs: Any) -> str:
+            read.append(self.name)
+            return original_read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", read_text)
+
+        assert middleware.grep_search.func(pattern="class Helper") == "/src/util.py"
+        assert read == ["util.py"]
+
+    def test_picks_up_changes(self, tmp_path: Path) -> None:
+        """New, modified and deleted files are reflected in later searches."""
+        self._make_tree(tmp_path)
+        middleware = FilesystemFileSearchMiddleware(
+            root_path=str(tmp_path), use_ripgrep=False, use_index=True
+        )
+        assert middleware.grep_search.func(pattern="new_feature") == "No matches found"
+
+        (tmp_path / "src" / "util.py").write_text("def new_feature():\n    pass\n")
+        (tmp_path / "src" / "extra.py").write_text("new_feature()\n")
+        assert middleware.grep_search.func(pattern="new_feature") == ("/src/extra.py\n/src/util.py")
+
+        (tmp_path / "src" / "extra.py").unlink()
+        assert middleware.grep_search.func(pattern="new_feature") == "/src/util.py"
+        assert middleware._index is not None
+        assert len(middleware._index._files) == 4
+
+    def test_memory_budget(self, tmp_path: Path) -> None:
+        """Files beyond the memory budget are searched without a trigram filter."""
+        self._make_tree(tmp_path)
+        middleware = FilesystemFileSearchMiddleware(
+            root_path=str(tmp_path), use_ripgrep=False, use_index=True, index_max_memory_mb=0
+        )
+
+        assert middleware.grep_search.func(pattern="Helper") == "/src/util.py"
+        assert middleware.grep_search.func(pattern="Helper") == "/src/util.py"
+        assert middleware._index is not None
+        assert all(entry.trigram_filter is None for entry in middleware._index._files.values())
+
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [
+            ("foo", [["foo"]]),
+            ("foo|bar", [["foo"], ["bar"]]),
+            ("colou?r", [["colo", "r"]]),
+            ("ab*cde", [["a", "cde"]]),
+            ("x{2,3}yzw", [["yzw"]]),
+            ("a{b}cd", [["a{b}cd"]]),
+            ("foo+bar", [["foo", "bar"]]),
+            (r"def \w+\(self", [["def ", "(self"]]),
+            ("import (os|sys)", [["import "]]),
+            ("[abc]+defg", [["defg"]]),
+            (r"\.py$", [[".py"]]),
+            ("(?i)foo", None),
+            (r"\x41bcd", None),
+        ],
+    )
+    def test_pattern_literals(self, pattern: str, expected: list[list[str]] | None) -> None:
+        """Only literals that every match must contain are extracted."""
+        assert _pattern_literals(pattern) == expected
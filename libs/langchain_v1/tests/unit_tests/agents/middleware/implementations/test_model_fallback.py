@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 import warnings
-from typing import cast
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, cast
 
 import pytest
 from langchain_core.language_models.chat_models import BaseChatModel
@@ -355,3 +358,202 @@ def test_model_request_is_frozen() -> None:
     # Original request should be unchanged
     assert request2.model != new_model
     assert request2.system_prompt != "override prompt"
+
+
+def _delayed_handlers(
+    delays: dict[str, float], failures: frozenset[str] = frozenset()
+) -> tuple[Any, Any, list[str]]:
+    """Sync and async handlers that answer after a per-model delay."""
+    started: list[str] = []
+
+    def respond(req: ModelRequest) -> ModelResponse:
+        name = cast("Any", req.model).messages_name
+        if name in failures:
+            msg = f"{name} failed"
+            raise ValueError(msg)
+        return ModelResponse(result=[AIMessage(content=name)])
+
+    def handler(req: ModelRequest) -> ModelResponse:
+        name = cast("Any", req.model).messages_name
+        started.append(name)
+        time.sleep(delays[name])
+        return respond(req)
+
+    async def ahandler(req: ModelRequest) -> ModelResponse:
+        name = cast("Any", req.model).messages_name
+        started.append(name)
+        await asyncio.sleep(delays[name])
+        return respond(req)
+
+    return handler, ahandler, started
+
+
+class _NamedModel(GenericFakeChatModel):
+    messages_name: str
+
+
+def _named(name: str) -> BaseChatModel:
+    return _NamedModel(messages=iter([]), messages_name=name)
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+async def test_hedged_fallback_wins_over_slow_primary(*, use_async: bool) -> None:
+    """A slow primary is hedged with the fallback, which answers first."""
+    middleware = ModelFallbackMiddleware(_named("fallback"), hedge_delay=0.05)
+    request = _make_request().override(model=_named("primary"))
+    handler, ahandler, started = _delayed_handlers({"primary": 1.0, "fallback": 0.0})
+
+    begin = time.monotonic()
+    if use_async:
+        response = await middleware.awrap_model_call(request, ahandler)
+    else:
+        response = middleware.wrap_model_call(request, handler)
+
+    assert isinstance(response, ModelResponse)
+    assert response.result[0].content == "fallback"
+    assert time.monotonic() - begin < 0.5
+    assert started == ["primary", "fallback"]
+    assert (middleware.calls, middleware.hedged_calls, middleware.hedge_wins) == (2, 1, 1)
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+async def test_hedging_not_started_for_fast_primary(*, use_async: bool) -> None:
+    """No duplicate call is made when the primary answers within the hedge delay."""
+    middleware = ModelFallbackMiddleware(_named("fallback"), hedge_delay=1.0)
+    request = _make_request().override(model=_named("primary"))
+    handler, ahandler, started = _delayed_handlers({"primary": 0.0, "fallback": 0.0})
+
+    if use_async:
+        response = await middleware.awrap_model_call(request, ahandler)
+    else:
+        response = middleware.wrap_model_call(request, handler)
+
+    assert isinstance(response, ModelResponse)
+    assert response.result[0].content == "primary"
+    assert started == ["primary"]
+    assert (middleware.calls, middleware.hedged_calls, middleware.hedge_wins) == (1, 0, 0)
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+async def test_hedged_errors_fall_through(*, use_async: bool) -> None:
+    """Errors still move on to the next model and the last error is re-raised."""
+    middleware = ModelFallbackMiddleware(_named("second"), _named("third"), hedge_delay=1.0)
+    request = _make_request().override(model=_named("primary"))
+    delays = {"primary": 0.0, "second": 0.0, "third": 0.0}
+    handler, ahandler, started = _delayed_handlers(delays, frozenset({"primary", "second"}))
+
+    if use_async:
+        response = await middleware.awrap_model_call(request, ahandler)
+    else:
+        response = middleware.wrap_model_call(request, handler)
+    assert isinstance(response, ModelResponse)
+    assert response.result[0].content == "third"
+    assert started == ["primary", "second", "third"]
+    assert middleware.hedged_calls == 0
+
+    handler, ahandler, _ = _delayed_handlers(delays, frozenset(delays))
+    with pytest.raises(ValueError, match="third failed"):
+        if use_async:
+            await middleware.awrap_model_call(request, ahandler)
+        else:
+            middleware.wrap_model_call(request, handler)
+
+
+async def test_hedged_loser_is_cancelled_async() -> None:
+    """The slower async call is cancelled once the other one succeeds."""
+    middleware = ModelFallbackMiddleware(_named("fallback"), hedge_delay=0.0)
+    request = _make_request().override(model=_named("primary"))
+    cancelled = asyncio.Event()
+
+    async def handler(req: ModelRequest) -> ModelResponse:
+        name = cast("Any", req.model).messages_name
+        if name == "primary":
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return ModelResponse(result=[AIMessage(content=name)])
+
+    response = await middleware.awrap_model_call(request, handler)
+
+    assert isinstance(response, ModelResponse)
+    assert response.result[0].content == "fallback"
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+def test_hedge_delay_adapts_to_observed_latency() -> None:
+    """Once enough latencies are recorded, the hedge delay follows the quantile."""
+    primary = _named("primary")
+    middleware = ModelFallbackMiddleware(_named("fallback"), hedge_delay=5.0, hedge_quantile=0.5)
+    assert middleware._delay_for(primary) == 5.0
+
+    for i in range(20):
+        middleware._latencies.observe(primary, i / 100)
+    assert middleware._delay_for(primary) == 0.09
+
+    fixed = ModelFallbackMiddleware(_named("fallback"), hedge_delay=5.0, hedge_quantile=None)
+    for _ in range(20):
+        fixed._latencies.observe(primary, 0.01)
+    assert fixed._delay_for(primary) == 5.0
+
+
+def test_hedging_parameters_are_validated() -> None:
+    """Invalid hedging parameters are rejected."""
+    with pytest.raises(ValueError, match="hedge_delay"):
+        ModelFallbackMiddleware(_named("fallback"), hedge_delay=-1)
+    with pytest.raises(ValueError, match="hedge_quantile"):
+        ModelFallbackMiddleware(_named("fallback"), hedge_delay=1, hedge_quantile=1.5)
+
+
+def test_sync_hedging_bounds_abandoned_calls() -> None:
+    """Losing sync calls share one pool, and hedging pauses while too many run."""
+    middleware = ModelFallbackMiddleware(
+        _named("fallback"), hedge_delay=0.05, max_abandoned_calls=1
+    )
+    request = _make_request().override(model=_named("primary"))
+    handler, _, started = _delayed_handlers({"primary": 0.3, "fallback": 0.0})
+
+    response = middleware.wrap_model_call(request, handler)
+    assert isinstance(response, ModelResponse)
+    assert response.result[0].content == "fallback"
+    executor = middleware._executor
+    assert executor is not None
+    assert middleware._abandoned == 1
+
+    # The losing primary call is still running, so this call is not hedged
+    response = middleware.wrap_model_call(request, handler)
+    assert isinstance(response, ModelResponse)
+    assert response.result[0].content == "primary"
+    assert started == ["primary", "fallback", "primary"]
+    assert middleware.hedged_calls == 1
+    assert middleware._executor is executor
+
+    deadline = time.monotonic() + 5
+    while middleware._abandoned and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert middleware._abandoned == 0
+
+
+def test_max_abandoned_calls_must_not_be_negative() -> None:
+    with pytest.raises(ValueError, match="max_abandoned_calls"):
+        ModelFallbackMiddleware(_named("fallback"), max_abandoned_calls=-1)
+    with pytest.raises(ValueError, match="max_workers"):
+        ModelFallbackMiddleware(_named("fallback"), max_workers=0)
+
+
+def test_sync_hedging_ignores_time_queued_for_a_thread() -> None:
+    """Concurrent sync calls queued behind a full pool are not hedged."""
+    middleware = ModelFallbackMiddleware(_named("fallback"), hedge_delay=0.15, max_workers=2)
+    request = _make_request().override(model=_named("primary"))
+    handler, _, started = _delayed_handlers({"primary": 0.1, "fallback": 0.0})
+
+    # Most calls wait longer than the hedge delay for one of the two threads
+    with ThreadPoolExecutor(max_workers=8) as callers:
+        responses = list(
+            callers.map(lambda _: middleware.wrap_model_call(request, handler), range(8))
+        )
+
+    assert all(cast("Any", r).result[0].content == "primary" for r in responses)
+    assert started == ["primary"] * 8
+    assert (middleware.calls, middleware.hedged_calls) == (8, 0)
@@ -1,10 +1,14 @@
 """Tests for PII detection middleware."""
 
+import random
+
 import pytest
 from langchain_core.messages import AIMessage, HumanMessage, ToolCall, ToolMessage
 
 from langchain.agents.factory import create_agent
+from langchain.agents.middleware._redaction import BUILTIN_DETECTORS, RedactionRule
 from langchain.agents.middleware.pii import (
+    CombinedPIIMiddleware,
     PIIDetectionError,
     PIIMiddleware,
     detect_credit_card,
@@ -636,3 +640,165 @@ class TestMultipleMiddleware:
         content = result["messages"][0].content
         assert "test@example.com" not in content
         assert "10.0.0.1" not in content
+
+
+class TestCombinedPIIMiddleware:
+    """Test scanning for several PII types in one pass."""
+
+    MIXED_CONTENT = (
+        "Mail john.doe@example.com or alice@test.com from 192.168.1.1 (not 999.1.1.1). "
+        "Card 4532-0151-1283-0366, not 1234 5678 9012 3456. MAC 00:1A:2B:3C:4D:5E. "
+        "See https://example.com/a?b=1 and www.example.org/docs. Version 1.2.3.4 "
+    ) * 3
+
+    def test_matches_individual_detectors(self):
+        middleware = CombinedPIIMiddleware(dict.fromkeys(BUILTIN_DETECTORS, "redact"))
+
+        expected = sorted(
+            (
+                match
+                for detector in BUILTIN_DETECTORS.values()
+                for match in detector(self.MIXED_CONTENT)
+            ),
+            key=lambda match: match["start"],
+        )
+        assert middleware.scanner.scan(self.MIXED_CONTENT) == expected
+
+    @pytest.mark.parametrize("pii_type", sorted(BUILTIN_DETECTORS))
+    @pytest.mark.parametrize(
+        "content",
+        [
+            MIXED_CONTENT,
+            # Rejected candidates overlapping a valid-looking span
+            "addr 999.1.1.1.5 ok, 300.300.1.1.2.3.4 and 10.0.0.1",
+            "card 1234 5678 9012 3456 4532 0151 1283 0366 end",
+            "mac 00:1A:2B:3C:4D:5E:6F:7A and a@b.co@c.io",
+            "http://a.com/x<y.com/z see example.com/p and www.x.com/http://a.com",
+        ],
+    )
+    def test_each_rule_matches_its_detector(self, pii_type, content):
+        scanner = CombinedPIIMiddleware({pii_type: "redact"}).scanner
+        expected = sorted(BUILTIN_DETECTORS[pii_type](content), key=lambda m: m["start"])
+        assert scanner.scan(content) == expected
+
+    def test_rejected_candidate_does_not_hide_other_types(self):
+        # The bare URL candidate "john.doe" is rejected, the email at the same position is not
+        middleware = CombinedPIIMiddleware({"url": "redact", "email": "redact"})
+        assert middleware.scanner.scan("john.doe@example.com") == detect_email(
+            "john.doe@example.com"
+        )
+
+    def test_candidate_overlapping_a_match_is_dropped_whole(self):
+        # detect_email finds "1.2.3.4-a@b.co", which loses to the IP address, so no
+        # email is reported for the remaining "-a@b.co"
+        scanner = CombinedPIIMiddleware({"ip": "redact", "email": "redact"}).scanner
+        assert scanner.scan("1.2.3.4-a@b.co") == detect_ip("1.2.3.4-a@b.co")
+
+    def test_matches_merged_detectors(self):
+        def merged(rules, content):
+            found = sorted(
+                (
+                    (match["start"], index, match)
+                    for index, rule in enumerate(rules)
+                    for match in rule.resolve().detector(content)
+                ),
+                key=lambda item: item[:2],
+            )
+            matches, end = [], 0
+            for start, _, match in found:
+                if start >= end:
+                    matches.append(match)
+                    end = match["end"]
+            return matches
+
+        rng = random.Random(0)
+        types = [*sorted(BUILTIN_DETECTORS), "custom"]
+        for _ in range(2000):
+            rules = [
+                RedactionRule(pii_type, detector=r"[0-9]+-[a-z]+")
+                if pii_type == "custom"
+                else RedactionRule(pii_type)
+                for pii_type in rng.sample(types, rng.randint(1, len(types)))
+            ]
+            content = "".join(rng.choices("1.2-a@b:co9 /h4F5wtp", k=rng.randint(0, 30)))
+            scanner = CombinedPIIMiddleware(rules).scanner
+            assert scanner.scan(content) == merged(rules, content), (rules, content)
+
+    def test_strategy_per_type(self):
+        middleware = CombinedPIIMiddleware({"email": "redact", "ip": "mask", "credit_card": "mask"})
+        state = {
+            "messages": [HumanMessage("test@example.com at 192.168.1.1 pays 4532015112830366")]
+        }
+
+        result = middleware.before_model(state, None)
+
+        assert result["messages"][0].content == (
+            "[REDACTED_EMAIL] at *.*.*.1 pays ************0366"
+        )
+
+    def test_custom_rules_and_block(self):
+        middleware = CombinedPIIMiddleware(
+            [
+                RedactionRule("email"),
+                RedactionRule("api_key", strategy="block", detector=r"sk-[a-zA-Z0-9]{32}"),
+                RedactionRule(
+                    "employee_id",
+                    detector=lambda content: [
+                        {"type": "employee_id", "value": "EMP-1", "start": i, "end": i + 5}
+                        for i in range(len(content))
+                        if content.startswith("EMP-1", i)
+                    ],
+                ),
+            ]
+        )
+        assert middleware.name == "CombinedPIIMiddleware[email,api_key,employee_id]"
+
+        content, matches = middleware.scanner.apply("EMP-1 and test@example.com")
+        assert content == "[REDACTED_EMPLOYEE_ID] and [REDACTED_EMAIL]"
+        assert [match["type"] for match in matches] == ["employee_id", "email"]
+
+        with pytest.raises(PIIDetectionError) as exc_info:
+            middleware.scanner.apply("key sk-" + "a" * 32)
+        assert exc_info.value.pii_type == "api_key"
+
+    def test_unknown_strategy_raises_error(self):
+        with pytest.raises(ValueError, match="Unknown redaction strategy"):
+            CombinedPIIMiddleware({"email": "encrypt"})
+
+    def test_clean_messages_are_not_rescanned(self):
+        scanned: list[str] = []
+
+        def detector(content):
+            scanned.append(content)
+            return detect_email(content)
+
+        middleware = CombinedPIIMiddleware(
+            [RedactionRule("email", detector=detector)], apply_to_tool_results=True
+        )
+        messages = [
+            HumanMessage("Look up the order", id="h1"),
+            AIMessage("", id="a1"),
+            ToolMessage("order shipped", tool_call_id="c1", id="t1"),
+        ]
+
+        for _ in range(3):
+            assert middleware.before_model({"messages": messages}, None) is None
+        assert scanned == ["Look up the order", "order shipped"]
+
+        # A changed message is scanned again
+        messages[0] = HumanMessage("Mail test@example.com", id="h1")
+        result = middleware.before_model({"messages": messages}, None)
+        assert result["messages"][0].content == "Mail [REDACTED_EMAIL]"
+
+    def test_with_agent(self):
+        model = FakeToolCallingModel()
+        agent = create_agent(
+            model=model,
+            middleware=[CombinedPIIMiddleware({"email": "redact", "ip": "mask"})],
+        )
+
+        result = agent.invoke(
+            {"messages": [HumanMessage("Contact: test@example.com, IP: 10.0.0.1")]}
+        )
+
+        assert result["messages"][0].content == "Contact: [REDACTED_EMAIL], IP: *.*.*.1"
@@ -5,15 +5,22 @@ from itertools import cycle
 from typing import Any, Literal
 
 import pytest
+from langchain_core.embeddings import Embeddings
 from langchain_core.language_models import LanguageModelInput
 from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
-from langchain_core.messages import BaseMessage, HumanMessage
+from langchain_core.messages import BaseMessage, HumanMessage, ToolMessage
 from langchain_core.runnables import Runnable
 from langchain_core.tools import BaseTool, tool
 from pydantic import BaseModel
 
 from langchain.agents import create_agent
-from langchain.agents.middleware import LLMToolSelectorMiddleware, wrap_model_call
+from langchain.agents.middleware import (
+    EmbeddingToolSelectorMiddleware,
+    LLMToolSelectorMiddleware,
+    ModelRequest,
+    ModelResponse,
+    wrap_model_call,
+)
 from langchain.agents.middleware.tool_selection import _create_tool_selection_response
 from langchain.messages import AIMessage
 
@@ -594,3 +601,130 @@ class TestEdgeCases:
         """Test that empty tools list raises an error in schema creation."""
         with pytest.raises(AssertionError, match="tools must be non-empty"):
             _create_tool_selection_response([])
+
+
+class KeywordEmbeddings(Embeddings):
+    """Bag-of-keywords embeddings with predictable similarities."""
+
+    vocabulary = ("weather", "search", "calculations", "email", "stock", "price")
+
+    def __init__(self) -> None:
+        self.embedded: list[str] = []
+
+    def _embed(self, text: str) -> list[float]:
+        self.embedded.append(text)
+        lowered = text.lower()
+        return [float(word in lowered) for word in self.vocabulary] + [0.1]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._embed(text)
+
+
+def _selected_tool_names(middleware: Any, messages: list[Any]) -> list[list[str]]:
+    model_requests = []
+
+    @wrap_model_call
+    def trace_model_requests(request, handler):
+        model_requests.append(request)
+        return handler(request)
+
+    model = FakeModel(messages=cycle([AIMessage(content="done")]))
+    agent = create_agent(
+        model=model,
+        tools=[get_weather, search_web, calculate, send_email, get_stock_price],
+        middleware=[middleware, trace_model_requests],
+    )
+    agent.invoke({"messages": messages})
+    return [[tool.name for tool in request.tools] for request in model_requests]
+
+
+class TestEmbeddingToolSelector:
+    """Test embedding-based tool selection."""
+
+    def test_selects_most_similar_tools(self) -> None:
+        """The most similar tools are kept, most similar first."""
+        embeddings = KeywordEmbeddings()
+        middleware = EmbeddingToolSelectorMiddleware(
+            embeddings, max_tools=2, always_include=["search_web"]
+        )
+
+        selected = _selected_tool_names(
+            middleware, [HumanMessage("What is the stock price and the weather in Paris?")]
+        )
+
+        assert selected == [["get_stock_price", "get_weather", "search_web"]]
+
+    def test_tool_vectors_and_queries_are_cached(self) -> None:
+        """Tools are embedded once and identical contexts are not re-embedded."""
+        embeddings = KeywordEmbeddings()
+        middleware = EmbeddingToolSelectorMiddleware(embeddings, max_tools=2)
+
+        for _ in range(2):
+            _selected_tool_names(middleware, [HumanMessage("weather and email please")])
+
+        assert len(embeddings.embedded) == 5 + 1
+
+    async def test_async_uses_tool_results_as_context(self) -> None:
+        """Tool results after the last user message are part of the context."""
+        embeddings = KeywordEmbeddings()
+        middleware = EmbeddingToolSelectorMiddleware(embeddings, max_tools=1)
+        request = ModelRequest(
+            model=FakeModel(messages=cycle([AIMessage(content="done")])),
+            messages=[
+                HumanMessage("Let the team know"),
+                AIMessage("", tool_calls=[{"name": "x", "args": {}, "id": "1"}]),
+                ToolMessage("Team contact: send an email to team@example.com", tool_call_id="1"),
+            ],
+            tools=[get_weather, calculate, send_email],
+        )
+        seen: list[list[str]] = []
+
+        async def handler(req: ModelRequest) -> ModelResponse:
+            seen.append([tool.name for tool in req.tools])
+            return ModelResponse(result=[AIMessage("done")])
+
+        await middleware.awrap_model_call(request, handler)
+
+        assert embeddings.embedded[-1] == (
+            "Let the team know\nTeam contact: send an email to team@example.com"
+        )
+        assert seen == [["send_email"]]
+
+    def test_ambiguous_cutoff_falls_back_to_llm(self) -> None:
+        """A tie at the cut-off is resolved by the LLM over a shortlist."""
+        selection_model = FakeModel(
+            messages=cycle(
+                [
+                    AIMessage(
+                        content="",
+                        tool_calls=[
+                            {
+                                "name": "ToolSelectionResponse",
+                                "id": "1",
+                                "args": {"tools": ["send_email"]},
+                            }
+                        ],
+                    ),
+                ]
+            )
+        )
+        middleware = EmbeddingToolSelectorMiddleware(
+            KeywordEmbeddings(), max_tools=1, model=selection_model
+        )
+
+        selected = _selected_tool_names(middleware, [HumanMessage("weather or email?")])
+        assert selected == [["send_email"]]
+
+        unambiguous = EmbeddingToolSelectorMiddleware(
+            KeywordEmbeddings(), max_tools=1, model=selection_model, ambiguity_margin=None
+        )
+        selected = _selected_tool_names(unambiguous, [HumanMessage("weather or email?")])
+        assert len(selected[0]) == 1
+
+    def test_invalid_max_tools(self) -> None:
+        """`max_tools` must be positive."""
+        with pytest.raises(ValueError, match="max_tools"):
+            EmbeddingToolSelectorMiddleware(KeywordEmbeddings(), max_tools=0)
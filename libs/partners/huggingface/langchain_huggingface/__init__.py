@@ -6,11 +6,13 @@ from langchain_huggingface.embeddings import (
     HuggingFaceEndpointEmbeddings,
 )
 from langchain_huggingface.llms import (
+    BatchedHuggingFacePipeline,
     HuggingFaceEndpoint,
     HuggingFacePipeline,
 )
 
 __all__ = [
+    "BatchedHuggingFacePipeline",
     "ChatHuggingFace",
     "HuggingFaceEmbeddings",
     "HuggingFaceEndpoint",
@@ -1,9 +1,13 @@
+from langchain_huggingface.llms.batched_huggingface_pipeline import (
+    BatchedHuggingFacePipeline,
+)
 from langchain_huggingface.llms.huggingface_endpoint import (
     HuggingFaceEndpoint,  # type: ignore[import-not-found]
 )
 from langchain_huggingface.llms.huggingface_pipeline import HuggingFacePipeline
 
 __all__ = [
+    "BatchedHuggingFacePipeline",
     "HuggingFaceEndpoint",
     "HuggingFacePipeline",
 ]
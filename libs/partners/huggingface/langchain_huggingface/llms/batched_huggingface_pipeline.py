@@ -0,0 +1,203 @@
+"""HuggingFace pipeline that batches prompts from concurrent async calls."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun
+from langchain_core.outputs import Generation, LLMResult
+from pydantic import PrivateAttr, model_validator
+from typing_extensions import Self
+
+from langchain_huggingface.llms.huggingface_pipeline import HuggingFacePipeline
+
+_DECODER_TASKS = ("text-generation", "image-text-to-text")
+
+
+def _truncate_at_stop(text: str, stop: list[str] | None) -> str:
+    """Cut `text` at the earliest occurrence of any stop sequence."""
+    if not stop:
+        return text
+    end = min((i for s in stop if (i := text.find(s)) != -1), default=len(text))
+    return text[:end]
+
+
+@dataclass
+class _PendingPrompt:
+    prompt: str
+    stop: list[str] | None
+    # Only prompts with the same generation settings can share a pipeline call
+    group: str
+    pipeline_kwargs: dict[str, Any]
+    skip_prompt: bool
+    future: asyncio.Future[str]
+
+
+class _PromptBatcher:
+    """Collects prompts on one event loop and runs them through the pipeline."""
+
+    def __init__(self, llm: BatchedHuggingFacePipeline) -> None:
+        self.llm = llm
+        self.loop = asyncio.get_running_loop()
+        self.pending: deque[_PendingPrompt] = deque()
+        self.task: asyncio.Task[None] | None = None
+
+    def submit(self, item: _PendingPrompt) -> None:
+        self.pending.append(item)
+        if self.task is None or self.task.done():
+            self.task = self.loop.create_task(self._run())
+
+    def _take_batch(self) -> list[_PendingPrompt]:
+        """Take the oldest prompt plus later ones with the same settings, in order.
+
+        Prompts that do not fit keep their place in the queue, so the oldest prompt
+        always goes into the next batch.
+        """
+        batch: list[_PendingPrompt] = []
+        rest: deque[_PendingPrompt] = deque()
+        group: str | None = None
+        while self.pending:
+            item = self.pending.popleft()
+            if item.future.done():
+                # Cancelled by the caller
+                continue
+            if group is None:
+                group = item.group
+            if item.group == group and len(batch) < self.llm.batch_size:
+                batch.append(item)
+            else:
+                rest.append(item)
+        self.pending = rest
+        return batch
+
+    async def _run(self) -> None:
+        # Only wait for more prompts when starting from idle; prompts that arrive
+        # while a batch is running are picked up right after it
+        if len(self.pending) < self.llm.batch_size and self.llm.batch_wait > 0:
+            await asyncio.sleep(self.llm.batch_wait)
+        while self.pending:
+            batch = self._take_batch()
+            if not batch:
+                break
+            try:
+                texts = await self.loop.run_in_executor(
+                    None, self.llm._run_batch, batch
+                )
+            except Exception as e:
+                for item in batch:
+                    if not item.future.done():
+                        item.future.set_exception(e)
+                continue
+            for item, text in zip(batch, texts, strict=True):
+                if not item.future.done():
+                    item.future.set_result(text)
+
+
+class BatchedHuggingFacePipeline(HuggingFacePipeline):
+    """HuggingFace Pipeline that coalesces prompts from concurrent async calls.
+
+    `HuggingFacePipeline` only batches the prompts of a single call. A server that
+    calls the model once per request therefore decodes one prompt at a time. This
+    class gathers the prompts of concurrent `ainvoke`/`agenerate` calls for up to
+    `batch_wait` seconds and runs them as one padded pipeline batch of at most
+    `batch_size` prompts. Prompts are served in arrival order, and each caller
+    gets back its own generation, with the completion truncated at its own `stop`
+    sequences.
+
+    Only calls with the same `pipeline_kwargs` and `skip_prompt` share a batch.
+    Synchronous calls behave as in `HuggingFacePipeline`.
+
+    For decoder-only models the tokenizer is switched to left padding (and the
+    EOS token is used for padding if there is no pad token), which batched
+    generation requires.
+
+    Example:
+        ```python
+        from langchain_huggingface import BatchedHuggingFacePipeline
+
+        llm = BatchedHuggingFacePipeline.from_model_id(
+            model_id="gpt2",
+            task="text-generation",
+            pipeline_kwargs={"max_new_tokens": 10},
+            batch_size=8,
+            batch_wait=0.01,
+        )
+        answers = await asyncio.gather(*(llm.ainvoke(q) for q in questions))
+        ```
+    """
+
+    batch_wait: float = 0.01
+    """Seconds to wait for concurrent prompts before running a batch."""
+
+    _batchers: dict[asyncio.AbstractEventLoop, _PromptBatcher] = PrivateAttr(
+        default_factory=dict
+    )
+
+    @model_validator(mode="after")
+    def _configure_padding(self) -> Self:
+        tokenizer = getattr(self.pipeline, "tokenizer", None)
+        task = getattr(self.pipeline, "task", None)
+        if tokenizer is None or task not in _DECODER_TASKS:
+            return self
+        tokenizer.padding_side = "left"
+        if tokenizer.pad_token_id is None and tokenizer.eos_token_id is not None:
+            tokenizer.pad_token = tokenizer.eos_token
+        return self
+
+    def _run_batch(self, batch: list[_PendingPrompt]) -> list[str]:
+        """Run one pipeline call for `batch` and return the text for each prompt."""
+        prompts = [item.prompt for item in batch]
+        responses = self.pipeline(
+            prompts, batch_size=len(prompts), **batch[0].pipeline_kwargs
+        )
+        texts = []
+        for item, response in zip(batch, responses, strict=True):
+            text = self._response_text(response)
+            # Stop sequences only end the completion, even if the prompt has them
+            prompt_end = len(item.prompt)
+            completion = _truncate_at_stop(text[prompt_end:], item.stop)
+            if not item.skip_prompt:
+                completion = text[:prompt_end] + completion
+            texts.append(completion)
+        return texts
+
+    def _batcher(self) -> _PromptBatcher:
+        loop = asyncio.get_running_loop()
+        batcher = self._batchers.get(loop)
+        if batcher is None:
+            # Drop batchers of event loops that have been closed
+            for closed in [other for other in self._batchers if other.is_closed()]:
+                del self._batchers[closed]
+            batcher = self._batchers[loop] = _PromptBatcher(self)
+        return batcher
+
+    async def _agenerate(
+        self,
+        prompts: list[str],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> LLMResult:
+        pipeline_kwargs = kwargs.get("pipeline_kwargs", {})
+        skip_prompt = kwargs.get("skip_prompt", False)
+        group = json.dumps([pipeline_kwargs, skip_prompt], sort_keys=True, default=repr)
+        batcher = self._batcher()
+        futures: list[asyncio.Future[str]] = []
+        for prompt in prompts:
+            future = batcher.loop.create_future()
+            batcher.submit(
+                _PendingPrompt(
+                    prompt, stop, group, pipeline_kwargs, skip_prompt, future
+                )
+            )
+            futures.append(future)
+        try:
+            texts = await asyncio.gather(*futures)
+        finally:
+            for future in futures:
+                future.cancel()
+        return LLMResult(generations=[[Generation(text=text)] for text in texts])
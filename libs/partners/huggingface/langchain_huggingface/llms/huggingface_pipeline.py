@@ -313,6 +313,28 @@ class HuggingFacePipeline(BaseLLM):
     def _llm_type(self) -> str:
         return "huggingface_pipeline"
 
+    def _response_text(self, response: Any) -> str:
+        """Extract the generated text from a single pipeline response."""
+        if isinstance(response, list):
+            # if model returns multiple generations, pick the top one
+            response = response[0]
+
+        if (
+            self.pipeline.task == "text-generation"
+            or self.pipeline.task == "text2text-generation"
+            or self.pipeline.task == "image-text-to-text"
+        ):
+            return response["generated_text"]
+        if self.pipeline.task == "summarization":
+            return response["summary_text"]
+        if self.pipeline.task in "translation":
+            return response["translation_text"]
+        msg = (
+            f"Got invalid task {self.pipeline.task}, "
+            f"currently only {VALID_TASKS} are supported"
+        )
+        raise ValueError(msg)
+
     def _generate(
         self,
         prompts: list[str],
@@ -336,26 +358,7 @@ class HuggingFacePipeline(BaseLLM):
 
             # Process each response in the batch
             for j, response in enumerate(responses):
-                if isinstance(response, list):
-                    # if model returns multiple generations, pick the top one
-                    response = response[0]
-
-                if (
-                    self.pipeline.task == "text-generation"
-                    or self.pipeline.task == "text2text-generation"
-                    or self.pipeline.task == "image-text-to-text"
-                ):
-                    text = response["generated_text"]
-                elif self.pipeline.task == "summarization":
-                    text = response["summary_text"]
-                elif self.pipeline.task in "translation":
-                    text = response["translation_text"]
-                else:
-                    msg = (
-                        f"Got invalid task {self.pipeline.task}, "
-                        f"currently only {VALID_TASKS} are supported"
-                    )
-                    raise ValueError(msg)
+                text = self._response_text(response)
                 if skip_prompt:
                     text = text[len(batch_prompts[j]) :]
                 # Append the processed text to results
@@ -1,6 +1,7 @@
+import asyncio
 from collections.abc import Generator
 
-from langchain_huggingface.llms import HuggingFacePipeline
+from langchain_huggingface.llms import BatchedHuggingFacePipeline, HuggingFacePipeline
 
 
 def test_huggingface_pipeline_streaming() -> None:
@@ -18,3 +19,24 @@ def test_huggingface_pipeline_streaming() -> None:
         assert isinstance(chunk, str)
         stream_results_string = chunk
     assert len(stream_results_string.strip()) > 0
+
+
+async def test_batched_huggingface_pipeline_tiny_gpt2() -> None:
+    """Concurrent calls to a tiny GPT-2 match unbatched generation on CPU."""
+    llm = BatchedHuggingFacePipeline.from_model_id(
+        model_id="sshleifer/tiny-gpt2",
+        task="text-generation",
+        device=-1,
+        pipeline_kwargs={"max_new_tokens": 5, "do_sample": False},
+        batch_size=4,
+    )
+    prompts = [
+        "Hello",
+        "The capital of France is",
+        "1 2 3",
+        "A much longer prompt here",
+    ]
+
+    batched = await asyncio.gather(*(llm.ainvoke(prompt) for prompt in prompts))
+
+    assert batched == [llm.invoke(prompt) for prompt in prompts]
@@ -1,6 +1,8 @@
+import asyncio
+from typing import Any
 from unittest.mock import MagicMock, patch
 
-from langchain_huggingface import HuggingFacePipeline
+from langchain_huggingface import BatchedHuggingFacePipeline, HuggingFacePipeline
 
 DEFAULT_MODEL_ID = "gpt2"
 
@@ -45,3 +47,98 @@ def test_initialization_with_from_model_id(
     )
 
     assert llm.model_id == "mock-model-id"
+
+
+class _FakeTokenizer:
+    padding_side = "right"
+    pad_token_id = None
+    eos_token_id = 0
+    eos_token = "<eos>"  # noqa: S105
+    pad_token = None
+
+
+class _FakeTextGenerationPipeline:
+    """Echoes prompts and records how they were batched."""
+
+    task = "text-generation"
+
+    def __init__(self) -> None:
+        self.tokenizer = _FakeTokenizer()
+        self.model = MagicMock(name_or_path="fake")
+        self.calls: list[list[str]] = []
+
+    def __call__(self, prompts: list[str], **kwargs: Any) -> list[Any]:
+        self.calls.append(list(prompts))
+        if any("boom" in prompt for prompt in prompts):
+            msg = "generation failed"
+            raise RuntimeError(msg)
+        suffix = kwargs.get("suffix", " answer. More")
+        return [[{"generated_text": prompt + suffix}] for prompt in prompts]
+
+
+async def test_batched_pipeline_coalesces_concurrent_calls() -> None:
+    """Concurrent async calls share one pipeline call, in arrival order."""
+    pipe = _FakeTextGenerationPipeline()
+    llm = BatchedHuggingFacePipeline(pipeline=pipe, batch_size=3, batch_wait=0.05)
+
+    assert pipe.tokenizer.padding_side == "left"
+    assert pipe.tokenizer.pad_token == "<eos>"  # noqa: S105
+
+    results = await asyncio.gather(
+        *(llm.ainvoke(f"q{i}", stop=["."] if i % 2 else None) for i in range(5))
+    )
+
+    assert pipe.calls == [["q0", "q1", "q2"], ["q3", "q4"]]
+    assert results == [
+        "q0 answer. More",
+        "q1 answer",
+        "q2 answer. More",
+        "q3 answer",
+        "q4 answer. More",
+    ]
+
+
+async def test_batched_pipeline_groups_by_pipeline_kwargs() -> None:
+    """Only calls with the same generation settings share a batch."""
+    pipe = _FakeTextGenerationPipeline()
+    llm = BatchedHuggingFacePipeline(pipeline=pipe, batch_size=4, batch_wait=0.05)
+
+    results = await asyncio.gather(
+        llm.ainvoke("a"),
+        llm.ainvoke("b", pipeline_kwargs={"suffix": "!"}),
+        llm.ainvoke("c"),
+        llm.ainvoke("d", pipeline_kwargs={"suffix": "!"}, skip_prompt=True),
+    )
+
+    assert pipe.calls == [["a", "c"], ["b"], ["d"]]
+    assert results == ["a answer. More", "b!", "c answer. More", "!"]
+
+
+async def test_batched_pipeline_errors_reach_every_caller_in_batch() -> None:
+    """A failing batch fails its callers and later batches still run."""
+    pipe = _FakeTextGenerationPipeline()
+    llm = BatchedHuggingFacePipeline(pipeline=pipe, batch_size=2, batch_wait=0.05)
+
+    results = await asyncio.gather(
+        llm.ainvoke("boom"),
+        llm.ainvoke("x"),
+        llm.ainvoke("y"),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], RuntimeError)
+    assert isinstance(results[1], RuntimeError)
+    assert results[2] == "y answer. More"
+
+
+async def test_batched_pipeline_ignores_stop_sequences_in_prompt() -> None:
+    """A stop sequence in the prompt does not cut the completion."""
+    pipe = _FakeTextGenerationPipeline()
+    llm = BatchedHuggingFacePipeline(pipeline=pipe, batch_size=2, batch_wait=0.05)
+
+    results = await asyncio.gather(
+        llm.ainvoke("Q: hi.\nA:", stop=["."]),
+        llm.ainvoke("Q: hi.\nA:", stop=["."], skip_prompt=True),
+    )
+
+    assert results == ["Q: hi.\nA: answer", " answer"]
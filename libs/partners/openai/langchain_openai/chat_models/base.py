@@ -1744,6 +1744,22 @@ class BaseChatOpenAI(BaseChatModel):
             )
         if sys.version_info[1] <= 7:
             return super().get_num_tokens_from_messages(messages)
+        # Raises for unsupported models even if there are no messages to count
+        overhead = self._get_message_token_overhead()
+        if hasattr(BaseChatModel, "_sum_message_tokens"):
+            # Memoizes per-message counts; missing from older langchain-core releases
+            num_tokens = self._sum_message_tokens(
+                messages, self._count_message_tokens, *overhead
+            )
+        else:
+            num_tokens = sum(
+                self._count_message_tokens(message, *overhead) for message in messages
+            )
+        # every reply is primed with <im_start>assistant
+        return num_tokens + 3
+
+    def _get_message_token_overhead(self) -> tuple[tiktoken.Encoding, int, int]:
+        """Get the encoding, tokens per message and tokens per name of the model."""
         model, encoding = self._get_encoding_model()
         if model.startswith("gpt-3.5-turbo-0301"):
             # every message follows <im_start>{role/name}\n{content}<im_end>\n
@@ -1761,55 +1777,57 @@ class BaseChatOpenAI(BaseChatModel):
                 " for information on how messages are converted to tokens."
             )
             raise NotImplementedError(msg)
-        num_tokens = 0
-        messages_dict = [_convert_message_to_dict(m) for m in messages]
-        for message in messages_dict:
-            num_tokens += tokens_per_message
-            for key, value in message.items():
-                # This is an inferred approximation. OpenAI does not document how to
-                # count tool message tokens.
-                if key == "tool_call_id":
-                    num_tokens += 3
-                    continue
-                if isinstance(value, list):
-                    # content or tool calls
-                    for val in value:
-                        if isinstance(val, str) or val["type"] == "text":
-                            text = val["text"] if isinstance(val, dict) else val
-                            num_tokens += len(encoding.encode(text))
-                        elif val["type"] == "image_url":
-                            if val["image_url"].get("detail") == "low":
-                                num_tokens += 85
-                            else:
-                                image_size = _url_to_size(val["image_url"]["url"])
-                                if not image_size:
-                                    continue
-                                num_tokens += _count_image_tokens(*image_size)
-                        # Tool/function call token counting is not documented by OpenAI.
-                        # This is an approximation.
-                        elif val["type"] == "function":
-                            num_tokens += len(
-                                encoding.encode(val["function"]["arguments"])
-                            )
-                            num_tokens += len(encoding.encode(val["function"]["name"]))
-                        elif val["type"] == "file":
-                            warnings.warn(
-                                "Token counts for file inputs are not supported. "
-                                "Ignoring file inputs."
-                            )
+        return encoding, tokens_per_message, tokens_per_name
+
+    def _count_message_tokens(
+        self,
+        message: BaseMessage,
+        encoding: tiktoken.Encoding,
+        tokens_per_message: int,
+        tokens_per_name: int,
+    ) -> int:
+        num_tokens = tokens_per_message
+        for key, value in _convert_message_to_dict(message).items():
+            # This is an inferred approximation. OpenAI does not document how to
+            # count tool message tokens.
+            if key == "tool_call_id":
+                num_tokens += 3
+                continue
+            if isinstance(value, list):
+                # content or tool calls
+                for val in value:
+                    if isinstance(val, str) or val["type"] == "text":
+                        text = val["text"] if isinstance(val, dict) else val
+                        num_tokens += len(encoding.encode(text))
+                    elif val["type"] == "image_url":
+                        if val["image_url"].get("detail") == "low":
+                            num_tokens += 85
                         else:
-                            msg = f"Unrecognized content block type\n\n{val}"
-                            raise ValueError(msg)
-                elif not value:
-                    continue
-                else:
-                    # Cast str(value) in case the message value is not a string
-                    # This occurs with function messages
-                    num_tokens += len(encoding.encode(str(value)))
-                if key == "name":
-                    num_tokens += tokens_per_name
-        # every reply is primed with <im_start>assistant
-        num_tokens += 3
+                            image_size = _url_to_size(val["image_url"]["url"])
+                            if not image_size:
+                                continue
+                            num_tokens += _count_image_tokens(*image_size)
+                    # Tool/function call token counting is not documented by OpenAI.
+                    # This is an approximation.
+                    elif val["type"] == "function":
+                        num_tokens += len(encoding.encode(val["function"]["arguments"]))
+                        num_tokens += len(encoding.encode(val["function"]["name"]))
+                    elif val["type"] == "file":
+                        warnings.warn(
+                            "Token counts for file inputs are not supported. "
+                            "Ignoring file inputs."
+                        )
+                    else:
+                        msg = f"Unrecognized content block type\n\n{val}"
+                        raise ValueError(msg)
+            elif not value:
+                continue
+            else:
+                # Cast str(value) in case the message value is not a string
+                # This occurs with function messages
+                num_tokens += len(encoding.encode(str(value)))
+            if key == "name":
+                num_tokens += tokens_per_name
         return num_tokens
 
     def bind_tools(
@@ -62,16 +62,26 @@ else:
             )
             raise RuntimeError(msg) from e2
 
+from core.hybrid import document_key  # type: ignore  # noqa: E402
+
 router = APIRouter(tags=["Search & Documents"])
 
 # Global reference (will be set by main app)
 vector_store: Any = None
+bm25_retriever: Any = None
 
 
-def set_dependencies(vs):
-    """Set vector store dependency."""
-    global vector_store
+def set_dependencies(vs, bm25=None):
+    """Set vector store and optional BM25 retriever dependencies."""
+    global vector_store, bm25_retriever
     vector_store = vs
+    bm25_retriever = bm25
+
+
+def _index_lexical(docs: list) -> None:
+    # Keep the hybrid search BM25 index in sync with the vector store
+    if bm25_retriever is not None:
+        bm25_retriever.add_documents(docs, ids=[document_key(doc) for doc in docs])
 
 
 @router.post("/retrieve", response_model=SearchResponse)
@@ -127,6 +137,7 @@ async def add_document(request: DocumentRequest):
             metadata=request.metadata or {},
         )
         await vector_store.aadd_documents([doc])
+        _index_lexical([doc])
 
         return {
             "message": "Document added successfully",
@@ -160,6 +171,7 @@ async def add_documents(request: DocumentListRequest):
             for doc in request.documents
         ]
         await vector_store.aadd_documents(docs)
+        _index_lexical(docs)
 
         return {
             "message": f"{len(docs)} documents added successfully",
@@ -0,0 +1,390 @@
+"""Incremental clean-up of generated RAG answers.
+
+`AnswerFilter` consumes generated text in arbitrary chunks (single tokens,
+stream deltas or the whole answer) and applies the old whole-string
+post-processing:
+
+- `<think>...</think>` reasoning is dropped,
+- prompt residue and special tokens are removed,
+- the answer is cut at the first stop sequence,
+- text before a trailing "답변:" marker is dropped,
+- runs of blank lines are collapsed and the answer is capped at 300 chars.
+
+The result is what the old post-processing returns for the text consumed up to
+the point where the filter stopped, with two differences:
+
+- Text after a stop sequence or the length cap is never looked at, so think
+  tags and markers that come later do not change the answer. For example
+  `".질문:<think></think>"` gives `"."`, where the old code gave `""`.
+- Leading and trailing whitespace is always trimmed. The old code kept
+  whitespace left behind by a removed special token.
+
+Special tokens and stop sequences are matched with Aho-Corasick automata, so
+each character is looked at once no matter how many patterns there are. Text is
+held back only while it could still be the start of a pattern.
+
+`feed()` returns `True` as soon as a stop sequence or the length cap is hit,
+so callers can stop the generator instead of decoding up to `max_new_tokens`.
+"""
+
+from __future__ import annotations
+
+import copy
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple, cast
+
+SPECIAL_TOKENS: Tuple[str, ...] = (
+    "<|start_header_id|>",
+    "<|end_header_id|>",
+    "<|eot_id|>",
+    "<|begin_of_text|>",
+    "[SYSTEM]",
+    "[HISTORY]",
+    "[CONTEXT]",
+    "[USER]",
+    "[ASSISTANT]",
+)
+STOP_SEQUENCES: Tuple[str, ...] = (
+    "질문:",
+    "참고 정보:",
+    "규칙:",
+    "\n\n참고",
+    "\n\n질문",
+)
+MAX_ANSWER_CHARS = 300
+
+_THINK_OPEN = "<think>"
+_THINK_CLOSE = "</think>"
+_ANSWER_MARKER = "답변:"
+
+
+class _Automaton:
+    """Aho-Corasick automaton reporting the longest pattern ending at each position."""
+
+    def __init__(self, patterns: Sequence[str]) -> None:
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.depth: List[int] = [0]
+        self.output: List[Optional[str]] = [None]
+        for pattern in patterns:
+            state = 0
+            for ch in pattern:
+                nxt = self.goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.depth.append(self.depth[state] + 1)
+                    self.output.append(None)
+                state = nxt
+            self.output[state] = pattern
+
+        queue: Deque[int] = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0) if state else 0
+                if self.output[nxt] is None:
+                    self.output[nxt] = self.output[self.fail[nxt]]
+
+        first_chars = "".join(sorted(self.goto[0]))
+        self.first_char = re.compile(f"[{re.escape(first_chars)}]") if first_chars else None
+
+    def step(self, state: int, ch: str) -> int:
+        while state and ch not in self.goto[state]:
+            state = self.fail[state]
+        return self.goto[state].get(ch, 0)
+
+
+class _StreamMatcher:
+    """Splits a character stream into literal text and pattern matches."""
+
+    def __init__(self, patterns: Sequence[str]) -> None:
+        self.automaton = _Automaton(patterns)
+        self.state = 0
+        # Characters that may still turn out to be part of a match
+        self.pending: List[str] = []
+
+    def feed(self, text: str) -> Iterator[Tuple[bool, str]]:
+        """Yield `(False, literal)` and `(True, pattern)` events for `text`."""
+        automaton = self.automaton
+        i, n = 0, len(text)
+        while i < n:
+            if self.state == 0 and automaton.first_char is not None:
+                # Fast path: skip straight to the next possible pattern start
+                found = automaton.first_char.search(text, i)
+                j = found.start() if found else n
+                if j > i:
+                    yield False, text[i:j]
+                    i = j
+                    continue
+            ch = text[i]
+            i += 1
+            self.state = automaton.step(self.state, ch)
+            self.pending.append(ch)
+            match = automaton.output[self.state]
+            if match is not None:
+                keep = len(self.pending) - len(match)
+                if keep:
+                    yield False, "".join(self.pending[:keep])
+                self.pending.clear()
+                self.state = 0
+                yield True, match
+                continue
+            release = len(self.pending) - automaton.depth[self.state]
+            if release:
+                yield False, "".join(self.pending[:release])
+                del self.pending[:release]
+
+    def flush(self) -> str:
+        """Give up on any partial match and return the held-back text."""
+        text = "".join(self.pending)
+        self.pending.clear()
+        self.state = 0
+        return text
+
+
+@dataclass
+class _Output:
+    """Committed answer text with the bookkeeping needed to clean it incrementally."""
+
+    parts: List[str] = field(default_factory=list)
+    size: int = 0
+    newlines: int = 0
+    trailing_ws: int = 0
+    lstrip: bool = False
+    answer_prefixed: bool = False
+
+    def append(self, text: str) -> None:
+        if self.lstrip:
+            text = text.lstrip()
+            if not text:
+                return
+            self.lstrip = False
+        if "\n" in text:
+            # Collapse runs of three or more newlines into two
+            kept: List[str] = []
+            for ch in text:
+                if ch == "\n":
+                    if self.newlines >= 2:
+                        continue
+                    self.newlines += 1
+                else:
+                    self.newlines = 0
+                kept.append(ch)
+            text = "".join(kept)
+        else:
+            self.newlines = 0
+        stripped = len(text.rstrip())
+        self.trailing_ws = (
+            len(text) - stripped if stripped else self.trailing_ws + len(text)
+        )
+        self.parts.append(text)
+        self.size += len(text)
+
+    def copy(self) -> _Output:
+        return _Output(
+            list(self.parts),
+            self.size,
+            self.newlines,
+            self.trailing_ws,
+            self.lstrip,
+            self.answer_prefixed,
+        )
+
+    def text(self) -> str:
+        return "".join(self.parts)
+
+
+class _Pipeline:
+    """Stop-sequence matching and clean-up for one candidate answer."""
+
+    def __init__(self, stops: Sequence[str], stop_sequences: FrozenSet[str], max_chars: int) -> None:
+        self.stops = _StreamMatcher(stops)
+        self.stop_sequences = stop_sequences
+        self.max_chars = max_chars
+        self.out = _Output(lstrip=True)
+        self.lstrip_raw = True
+        # Whether any text, even whitespace left after a removed token, came first
+        self.started = False
+        self.reset = False
+        self.stopped = False
+        # The answer to use if no stop sequence follows, where that differs
+        self.no_stop: Optional[_Pipeline] = None
+
+    def copy(self) -> _Pipeline:
+        other = copy.copy(self)
+        other.stops = copy.copy(self.stops)
+        other.stops.pending = list(self.stops.pending)
+        other.out = self.out.copy()
+        if self.no_stop is not None:
+            other.no_stop = self.no_stop.copy()
+        return other
+
+    def feed(self, text: str) -> None:
+        if self.stopped:
+            return
+        if self.lstrip_raw:
+            text = text.lstrip()
+            if not text:
+                return
+            self.lstrip_raw = False
+        for is_match, value in self.stops.feed(text):
+            self._handle(is_match, value)
+            if self.stopped:
+                return
+        final = self.no_stop or self
+        if final.out.size - final.out.trailing_ws > self.max_chars:
+            self.stopped = True
+
+    def _handle(self, is_match: bool, value: str) -> None:
+        if self.no_stop is not None:
+            self.no_stop._handle(is_match, value)
+        if not is_match:
+            self.started = True
+            self.out.append(value)
+        elif value in self.stop_sequences:
+            self.stopped = True
+            self.no_stop = None
+        elif self.out.answer_prefixed or not (self.started or self.reset):
+            # The answer itself starts with the marker, so keep all of it
+            self.out.answer_prefixed = True
+            self.out.append(value)
+        elif self.out.size == 0 and not self.reset:
+            # Only whitespace left after a removed token came first. The old code
+            # stripped it only when cutting at a stop sequence, so the marker starts
+            # the answer if one follows and is prompt residue otherwise.
+            self.no_stop = self.copy()
+            self.no_stop._reset()
+            self.out.answer_prefixed = True
+            self.out.append(value)
+        else:
+            # Prompt residue before the marker
+            self._reset()
+
+    def _reset(self) -> None:
+        self.out = _Output(lstrip=True)
+        self.reset = True
+
+    def flush(self) -> None:
+        if not self.stopped:
+            self._handle(False, self.stops.flush())
+
+    def answer(self) -> str:
+        return (self.no_stop or self).out.text().strip()
+
+
+class AnswerFilter:
+    """Incremental post-processor for generated answers.
+
+    Example:
+        answer_filter = AnswerFilter()
+        async for chunk in llm.astream(prompt):
+            if answer_filter.feed(chunk):
+                break  # stop sequence or length cap reached
+        answer = answer_filter.finish()
+    """
+
+    def __init__(
+        self,
+        *,
+        special_tokens: Sequence[str] = SPECIAL_TOKENS,
+        stop_sequences: Sequence[str] = STOP_SEQUENCES,
+        max_chars: int = MAX_ANSWER_CHARS,
+    ) -> None:
+        self.max_chars = max_chars
+        self._stop_patterns = (*stop_sequences, _ANSWER_MARKER)
+        self._stop_sequences = frozenset(stop_sequences)
+        self._tokens = _StreamMatcher((_THINK_OPEN, _THINK_CLOSE, *special_tokens))
+        # Like the whole-string version, think tags only count when both kinds
+        # appear: the answer is then what follows the last `</think>`, while an
+        # unterminated `<think>` keeps what came before it.
+        self._plain: Optional[_Pipeline] = self._pipeline()
+        self._before_open: Optional[_Pipeline] = None
+        self._after_close: Optional[_Pipeline] = None
+
+    def _pipeline(self) -> _Pipeline:
+        return _Pipeline(self._stop_patterns, self._stop_sequences, self.max_chars)
+
+    def _active(self) -> _Pipeline:
+        if self._before_open is not None:
+            if self._after_close is not None:
+                return self._after_close
+            return self._before_open
+        return cast(_Pipeline, self._plain)
+
+    @property
+    def stopped(self) -> bool:
+        """Whether the answer is complete and generation can stop."""
+        active = self._active()
+        # An unterminated `<think>` block may still be followed by `</think>`
+        return active.stopped and active is not self._before_open
+
+    def feed(self, text: str) -> bool:
+        """Consume the next chunk of generated text.
+
+        Returns:
+            `True` once generation can stop: the answer hit a stop sequence or
+            exceeded `max_chars`. Later chunks are ignored.
+        """
+        if not text or self.stopped:
+            return self.stopped
+        for is_match, value in self._tokens.feed(text):
+            live = [p for p in (self._plain, self._after_close) if p is not None]
+            if not is_match:
+                for pipeline in live:
+                    pipeline.feed(value)
+            elif value == _THINK_OPEN and self._before_open is None:
+                plain = cast(_Pipeline, self._plain)
+                self._before_open = plain.copy()
+                self._before_open.flush()
+                # Without `<think>` tags being literal, the plain answer is no
+                # longer a candidate
+                self._plain = None
+                if self._after_close is not None:
+                    self._after_close.feed(value)
+            elif value == _THINK_CLOSE:
+                if self._plain is not None:
+                    self._plain.feed(value)
+                self._after_close = self._pipeline()
+            else:
+                for pipeline in live:
+                    if value in (_THINK_OPEN, _THINK_CLOSE):
+                        pipeline.feed(value)
+                    else:
+                        # A removed special token ends leading whitespace stripping
+                        pipeline.lstrip_raw = False
+            if self.stopped:
+                break
+        return self.stopped
+
+    def finish(self) -> str:
+        """Flush held-back text and return the cleaned answer."""
+        tail = self._tokens.flush()
+        for pipeline in (self._plain, self._after_close):
+            if pipeline is not None:
+                pipeline.feed(tail)
+                pipeline.flush()
+        answer = self._active().answer()
+        if len(answer) > self.max_chars:
+            answer_prefix = answer[: self.max_chars]
+            last_period = answer_prefix.rfind(".")
+            if last_period > self.max_chars * 2 // 3:
+                answer = answer[: last_period + 1]
+            else:
+                answer = answer_prefix + "..."
+        return answer
+
+
+def postprocess_answer(answer: str) -> str:
+    """Clean up a complete answer (see `AnswerFilter`)."""
+    answer_filter = AnswerFilter()
+    answer_filter.feed(answer)
+    return answer_filter.finish()
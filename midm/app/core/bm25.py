@@ -0,0 +1,295 @@
+"""In-memory BM25 index and retriever for lexical (keyword) search.
+
+Dense retrieval misses queries that hinge on exact names and titles. `BM25Index`
+scores documents with Okapi BM25 over an inverted index whose postings are
+`array`-backed (document slot + term frequency per entry), so the index stays
+compact even for many short reviews.
+
+Korean has no reliable word boundaries for search: particles attach to nouns
+("원빈이다", "영화판에"). The default tokenizer therefore splits Hangul runs into
+character n-grams, so "원빈" matches "원빈이다" without a morphological analyzer.
+Any `Callable[[str], list[str]]` can be plugged in instead.
+
+Documents can be added and deleted incrementally. Deleted documents leave
+tombstones that are skipped while scoring and dropped by an occasional compaction.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+import threading
+import uuid
+from array import array
+from collections import Counter, defaultdict
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForRetrieverRun,
+    CallbackManagerForRetrieverRun,
+)
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+from pydantic import ConfigDict
+
+Tokenizer = Callable[[str], List[str]]
+
+_HANGUL_OR_WORD = re.compile(r"[가-힣]+|[^\W_가-힣]+")
+_MIN_COMPACT_TOMBSTONES = 64
+
+
+def whitespace_tokenizer(text: str) -> List[str]:
+    """Lowercased whitespace tokens."""
+    return text.lower().split()
+
+
+def char_ngram_tokenizer(n: int = 2) -> Tokenizer:
+    """Build a tokenizer that splits Hangul runs into character n-grams.
+
+    Non-Hangul words (Latin letters, digits) are kept whole and lowercased. Hangul
+    runs shorter than `n` are kept whole.
+
+    Args:
+        n: Length of the Hangul character n-grams.
+
+    Returns:
+        The tokenizer function.
+    """
+    if n < 1:
+        msg = f"n must be >= 1, got {n}"
+        raise ValueError(msg)
+
+    def tokenize(text: str) -> List[str]:
+        tokens: List[str] = []
+        for match in _HANGUL_OR_WORD.finditer(text.lower()):
+            word = match.group()
+            if "가" <= word[0] <= "힣" and len(word) > n:
+                tokens.extend(word[i : i + n] for i in range(len(word) - n + 1))
+            else:
+                tokens.append(word)
+        return tokens
+
+    return tokenize
+
+
+class BM25Index:
+    """Okapi BM25 inverted index with incremental add/delete.
+
+    Each document gets an integer slot. For every term the index keeps two
+    parallel `array`s: the slots of the documents containing it and the term's
+    frequency in each of them.
+    """
+
+    def __init__(
+        self,
+        tokenizer: Optional[Tokenizer] = None,
+        *,
+        k1: float = 1.5,
+        b: float = 0.75,
+    ) -> None:
+        self.tokenizer: Tokenizer = tokenizer or char_ngram_tokenizer()
+        self.k1 = k1
+        self.b = b
+        self._term_ids: Dict[str, int] = {}
+        self._postings: List[array] = []  # term id -> document slots
+        self._freqs: List[array] = []  # term id -> term frequency per slot
+        self._df: List[int] = []  # term id -> number of live documents
+        self._docs: List[Optional[Document]] = []  # slot -> document (None: deleted)
+        self._ids: List[Optional[str]] = []  # slot -> document id
+        self._lengths = array("I")  # slot -> number of tokens
+        self._slots: Dict[str, int] = {}  # document id -> slot
+        self._total_length = 0
+        self._tombstones = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def add_documents(
+        self, documents: Sequence[Document], ids: Optional[Sequence[str]] = None
+    ) -> List[str]:
+        """Index `documents`, replacing any existing documents with the same ids.
+
+        Args:
+            documents: Documents to index.
+            ids: Document ids. Defaults to `document.id`, or a new UUID.
+
+        Returns:
+            The ids of the indexed documents.
+        """
+        if ids is not None and len(ids) != len(documents):
+            msg = "Number of ids must match number of documents."
+            raise ValueError(msg)
+        doc_ids = [
+            ids[i] if ids is not None else (doc.id or str(uuid.uuid4()))
+            for i, doc in enumerate(documents)
+        ]
+        # Tokenize outside the lock
+        tokenized = [self.tokenizer(doc.page_content) for doc in documents]
+        with self._lock:
+            for doc_id, doc, tokens in zip(doc_ids, documents, tokenized):
+                if doc_id in self._slots:
+                    self._delete(doc_id)
+                self._add(doc_id, doc, tokens)
+            self._maybe_compact()
+        return doc_ids
+
+    def _add(self, doc_id: str, doc: Document, tokens: List[str]) -> None:
+        slot = len(self._docs)
+        self._docs.append(doc)
+        self._ids.append(doc_id)
+        self._lengths.append(len(tokens))
+        self._slots[doc_id] = slot
+        self._total_length += len(tokens)
+        for term, freq in Counter(tokens).items():
+            term_id = self._term_ids.get(term)
+            if term_id is None:
+                term_id = self._term_ids[term] = len(self._postings)
+                self._postings.append(array("I"))
+                self._freqs.append(array("I"))
+                self._df.append(0)
+            self._postings[term_id].append(slot)
+            self._freqs[term_id].append(freq)
+            self._df[term_id] += 1
+
+    def delete(self, ids: Iterable[str]) -> int:
+        """Remove documents by id; unknown ids are ignored.
+
+        Returns:
+            The number of documents removed.
+        """
+        removed = 0
+        with self._lock:
+            for doc_id in ids:
+                if doc_id in self._slots:
+                    self._delete(doc_id)
+                    removed += 1
+            self._maybe_compact()
+        return removed
+
+    def _delete(self, doc_id: str) -> None:
+        slot = self._slots.pop(doc_id)
+        doc = self._docs[slot]
+        assert doc is not None  # noqa: S101
+        for term in set(self.tokenizer(doc.page_content)):
+            self._df[self._term_ids[term]] -= 1
+        self._docs[slot] = None
+        self._ids[slot] = None
+        self._total_length -= self._lengths[slot]
+        self._tombstones += 1
+
+    def _maybe_compact(self) -> None:
+        if self._tombstones < max(_MIN_COMPACT_TOMBSTONES, len(self._slots)):
+            return
+        # Renumber live slots and drop tombstones from every postings list
+        remap: Dict[int, int] = {}
+        docs: List[Optional[Document]] = []
+        doc_ids: List[Optional[str]] = []
+        lengths = array("I")
+        for slot, doc in enumerate(self._docs):
+            if doc is not None:
+                remap[slot] = len(docs)
+                docs.append(doc)
+                doc_ids.append(self._ids[slot])
+                lengths.append(self._lengths[slot])
+        for term_id, postings in enumerate(self._postings):
+            kept = [
+                (remap[slot], freq)
+                for slot, freq in zip(postings, self._freqs[term_id])
+                if slot in remap
+            ]
+            self._postings[term_id] = array("I", [slot for slot, _ in kept])
+            self._freqs[term_id] = array("I", [freq for _, freq in kept])
+        self._docs, self._ids, self._lengths = docs, doc_ids, lengths
+        self._slots = {
+            doc_id: slot for slot, doc_id in enumerate(doc_ids) if doc_id is not None
+        }
+        self._tombstones = 0
+
+    def search(self, query: str, k: int = 4) -> List[Tuple[Document, float]]:
+        """Return the `k` highest scoring documents for `query`.
+
+        Args:
+            query: Query text, tokenized with the index tokenizer.
+            k: Number of documents to return.
+
+        Returns:
+            `(document, score)` pairs, best first. Documents sharing no term with the
+            query are never returned.
+        """
+        query_terms = Counter(self.tokenizer(query))
+        with self._lock:
+            n_docs = len(self._slots)
+            if not n_docs or k <= 0:
+                return []
+            k1, b = self.k1, self.b
+            avg_length = self._total_length / n_docs or 1.0
+            docs, lengths = self._docs, self._lengths
+            scores: Dict[int, float] = defaultdict(float)
+            for term, query_freq in query_terms.items():
+                term_id = self._term_ids.get(term)
+                if term_id is None or not self._df[term_id]:
+                    continue
+                df = self._df[term_id]
+                weight = query_freq * math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+                for slot, freq in zip(self._postings[term_id], self._freqs[term_id]):
+                    if docs[slot] is None:
+                        continue
+                    norm = k1 * (1.0 - b + b * lengths[slot] / avg_length)
+                    scores[slot] += weight * freq * (k1 + 1.0) / (freq + norm)
+            top = heapq.nlargest(k, scores.items(), key=itemgetter(1))
+            return [(docs[slot], score) for slot, score in top]  # type: ignore[misc]
+
+
+class BM25Retriever(BaseRetriever):
+    """Retriever over a `BM25Index`.
+
+    Example:
+        ```python
+        retriever = BM25Retriever.from_documents(docs, k=5)
+        retriever.invoke("원빈 주연 영화")
+        ```
+    """
+
+    index: BM25Index
+    k: int = 4
+    """Number of documents to return."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @classmethod
+    def from_documents(
+        cls,
+        documents: Sequence[Document],
+        *,
+        ids: Optional[Sequence[str]] = None,
+        tokenizer: Optional[Tokenizer] = None,
+        **kwargs: object,
+    ) -> BM25Retriever:
+        """Build a retriever with a new index over `documents`."""
+        index = BM25Index(tokenizer)
+        index.add_documents(documents, ids=ids)
+        return cls(index=index, **kwargs)
+
+    def add_documents(
+        self, documents: Sequence[Document], ids: Optional[Sequence[str]] = None
+    ) -> List[str]:
+        """Add documents to the index (see `BM25Index.add_documents`)."""
+        return self.index.add_documents(documents, ids=ids)
+
+    def delete(self, ids: Iterable[str]) -> int:
+        """Remove documents from the index (see `BM25Index.delete`)."""
+        return self.index.delete(ids)
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        return [doc for doc, _ in self.index.search(query, self.k)]
+
+    async def _aget_relevant_documents(
+        self, query: str, *, run_manager: AsyncCallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        # In-memory scoring is cheap; no need for a thread hop
+        return [doc for doc, _ in self.index.search(query, self.k)]
@@ -0,0 +1,201 @@
+"""Hybrid lexical + dense retrieval.
+
+The BM25 index (`core.bm25`) is built at startup from the documents stored in the
+PGVector collection, so documents added through the document endpoints are still
+indexed after a restart. If the collection cannot be read, the index falls back to
+the movie review JSON files. While running, each process keeps its index in sync
+with the documents it adds itself; with several workers, documents added through
+another worker only reach this index at the next restart.
+
+The index is fused with the PGVector retriever through `EnsembleRetriever`
+(weighted reciprocal rank fusion). Dense candidates go through the same distance
+cut-off as plain vector search (`relevance_threshold`), so a query with no close
+match only returns the BM25 hits instead of filling every slot.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForRetrieverRun,
+    CallbackManagerForRetrieverRun,
+)
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+from pydantic import ConfigDict
+
+from core.bm25 import BM25Retriever  # type: ignore
+
+try:
+    from langchain_classic.retrievers import EnsembleRetriever  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover
+    EnsembleRetriever = None  # type: ignore[assignment,misc]
+
+_DEFAULT_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
+
+
+def hybrid_enabled() -> bool:
+    return os.getenv("RAG_HYBRID", "0").lower() in {"1", "true", "yes", "on"}
+
+
+def relevance_threshold() -> float:
+    """PGVector distance above which a document is not relevant.
+
+    Read from env `RAG_RELEVANCE_THRESHOLD` (default 0.8). PGVector scores are
+    distances: lower is more similar.
+    """
+    return float(os.getenv("RAG_RELEVANCE_THRESHOLD", "0.8"))
+
+
+class DenseRetriever(BaseRetriever):
+    """Vector store retriever that drops candidates at or beyond `max_distance`."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    vector_store: Any
+    k: int = 20
+    max_distance: float = 0.8
+
+    def _filter(self, docs_and_scores: List[Tuple[Document, float]]) -> List[Document]:
+        return [doc for doc, score in docs_and_scores if score < self.max_distance]
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        return self._filter(self.vector_store.similarity_search_with_score(query, k=self.k))
+
+    async def _aget_relevant_documents(
+        self, query: str, *, run_manager: AsyncCallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        return self._filter(
+            await self.vector_store.asimilarity_search_with_score(query, k=self.k)
+        )
+
+
+def review_to_document(review: Dict[str, Any], source: str) -> Document:
+    """Build the document for one review, in the same format as `load_data.py`."""
+    content = f"""영화 ID: {review.get('movie_id', 'N/A')}
+작성자: {review.get('author', 'N/A')}
+평점: {review.get('rating', 'N/A')}/10
+날짜: {review.get('date', 'N/A')}
+
+리뷰:
+{review.get('review', '')}
+"""
+    metadata = {
+        "movie_id": review.get("movie_id", ""),
+        "review_id": review.get("review_id", ""),
+        "author": review.get("author", ""),
+        "rating": review.get("rating", ""),
+        "date": review.get("date", ""),
+        "source": source,
+    }
+    return Document(page_content=content, metadata=metadata)
+
+
+def load_review_documents(data_dir: Optional[str] = None) -> List[Document]:
+    """Load every review in the `*.json` files of `data_dir`."""
+    documents: List[Document] = []
+    for path in sorted(Path(data_dir or _DEFAULT_DATA_DIR).glob("*.json")):
+        with open(path, encoding="utf-8") as f:
+            reviews = json.load(f)
+        documents.extend(review_to_document(review, path.name) for review in reviews)
+    return documents
+
+
+async def load_vector_store_documents(vector_store: Any) -> Optional[List[Document]]:
+    """Load every document stored in the collection of a PGVector `vector_store`.
+
+    Returns:
+        The documents, or `None` if `vector_store` cannot be listed (not a
+        langchain-postgres `PGVector`, or SQLAlchemy is missing).
+    """
+    make_session = getattr(vector_store, "_make_async_session", None)
+    embedding_store = getattr(vector_store, "EmbeddingStore", None)
+    if make_session is None or embedding_store is None:
+        return None
+    try:
+        from sqlalchemy import select  # type: ignore
+    except ModuleNotFoundError:  # pragma: no cover
+        return None
+    post_init = getattr(vector_store, "__apost_init__", None)
+    if post_init is not None:
+        await post_init()  # Lazy async init (creates the collection if needed)
+    async with make_session() as session:
+        collection = await vector_store.aget_collection(session)
+        if collection is None:
+            return []
+        rows = await session.execute(
+            select(embedding_store.document, embedding_store.cmetadata).where(
+                embedding_store.collection_id == collection.uuid
+            )
+        )
+        return [
+            Document(page_content=content or "", metadata=metadata or {})
+            for content, metadata in rows
+        ]
+
+
+def document_key(doc: Document) -> str:
+    """BM25 document id: the review id when there is one, else the content."""
+    return str(doc.metadata.get("review_id") or doc.page_content)
+
+
+def build_bm25_retriever(
+    documents: Sequence[Document], *, k: Optional[int] = None
+) -> BM25Retriever:
+    """Index `documents` (keyed by `document_key`) in a new BM25 retriever."""
+    return BM25Retriever.from_documents(
+        documents,
+        ids=[document_key(doc) for doc in documents],
+        k=k or int(os.getenv("RAG_HYBRID_FETCH_K", "20")),
+    )
+
+
+def create_hybrid_retriever(
+    vector_store: Any,
+    bm25_retriever: BM25Retriever,
+    *,
+    fetch_k: Optional[int] = None,
+    bm25_weight: Optional[float] = None,
+    max_distance: Optional[float] = None,
+) -> Any:
+    """Fuse dense PGVector search with BM25 via weighted reciprocal rank fusion.
+
+    Args:
+        vector_store: Vector store providing the dense retriever.
+        bm25_retriever: Lexical retriever.
+        fetch_k: Candidates taken from each retriever before fusion
+            (default: env `RAG_HYBRID_FETCH_K`, 20).
+        bm25_weight: Weight of the BM25 ranking; the dense ranking gets the rest
+            (default: env `RAG_HYBRID_BM25_WEIGHT`, 0.5).
+        max_distance: Dense candidates at or beyond this distance are dropped
+            before fusion (default: `relevance_threshold()`).
+
+    Returns:
+        An `EnsembleRetriever`; truncate its results to the number of documents
+        needed.
+    """
+    if EnsembleRetriever is None:  # pragma: no cover
+        msg = (
+            "Hybrid retrieval requires langchain-classic. "
+            "Install with: pip install -U langchain-classic"
+        )
+        raise ModuleNotFoundError(msg)
+    fetch_k = fetch_k or int(os.getenv("RAG_HYBRID_FETCH_K", "20"))
+    if bm25_weight is None:
+        bm25_weight = float(os.getenv("RAG_HYBRID_BM25_WEIGHT", "0.5"))
+    if max_distance is None:
+        max_distance = relevance_threshold()
+    bm25_retriever.k = fetch_k
+    dense_retriever = DenseRetriever(
+        vector_store=vector_store, k=fetch_k, max_distance=max_distance
+    )
+    return EnsembleRetriever(
+        retrievers=[dense_retriever, bm25_retriever],
+        weights=[1.0 - bm25_weight, bm25_weight],
+    )
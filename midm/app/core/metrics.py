@@ -0,0 +1,342 @@
+"""Latency instrumentation for the RAG API.
+
+Every request gets a `RequestTimings` record (bound to a context variable by the
+HTTP middleware). Code on the hot path attributes time to named stages with
+`stage(...)`, and `StageTimingCallbackHandler` attributes time to each Runnable
+step, LLM call and retriever call that runs inside a chain. When the request
+finishes, its stage durations are aggregated into per-endpoint latency windows
+(p50/p95/p99, exported on `/metrics` in Prometheus text format) and the full
+breakdown is kept in a ring buffer of recent requests.
+
+Instrumentation is controlled by the `RAG_METRICS` env var (enabled by default),
+read on first use so that a `.env` loaded after import is honored. When
+disabled, `stage(...)` returns a shared no-op context manager and no callback
+handler is attached, so the overhead is a context variable lookup.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+_QUANTILES = (0.5, 0.95, 0.99)
+_NULL_STAGE: AbstractContextManager[None] = nullcontext()
+
+
+def _env_enabled() -> bool:
+    return os.getenv("RAG_METRICS", "1").lower() not in {"0", "false", "no", "off"}
+
+
+class RequestTimings:
+    """Stage durations recorded for a single request."""
+
+    __slots__ = ("endpoint", "request_id", "start", "stages", "_lock")
+
+    def __init__(self, endpoint: str, request_id: str = "-") -> None:
+        self.endpoint = endpoint
+        self.request_id = request_id
+        self.start = time.perf_counter()
+        self.stages: List[Tuple[str, float]] = []
+        self._lock = threading.Lock()
+
+    def add(self, stage_name: str, seconds: float) -> None:
+        """Record `seconds` spent in `stage_name`."""
+        # Sync chain steps may run in executor threads
+        with self._lock:
+            self.stages.append((stage_name, seconds))
+
+    def breakdown(self) -> Dict[str, float]:
+        """Total seconds per stage, in order of first occurrence."""
+        totals: Dict[str, float] = {}
+        with self._lock:
+            for stage_name, seconds in self.stages:
+                totals[stage_name] = totals.get(stage_name, 0.0) + seconds
+        return totals
+
+
+_current: contextvars.ContextVar[Optional[RequestTimings]] = contextvars.ContextVar(
+    "rag_request_timings", default=None
+)
+
+
+class _StageTimer:
+    __slots__ = ("_timings", "_name", "_start")
+
+    def __init__(self, timings: RequestTimings, name: str) -> None:
+        self._timings = timings
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._timings.add(self._name, time.perf_counter() - self._start)
+
+
+def stage(name: str) -> AbstractContextManager[None]:
+    """Time a block of code as stage `name` of the current request.
+
+    Outside of an instrumented request this is a no-op.
+
+    Example:
+        with stage("retrieve"):
+            docs = await vector_store.asimilarity_search_with_score(q)
+    """
+    timings = _current.get()
+    if timings is None:
+        return _NULL_STAGE
+    return _StageTimer(timings, name)
+
+
+class StageTimingCallbackHandler(BaseCallbackHandler):
+    """Callback handler attributing time to Runnable steps, LLM and retriever calls.
+
+    Stages are named `<kind>:<run name>`, e.g. `chain:PromptTemplate`,
+    `llm:ChatOpenAI` or `retriever:VectorStoreRetriever`.
+    """
+
+    # Called directly from async chains instead of via an executor
+    run_inline = True
+
+    def __init__(self, timings: RequestTimings) -> None:
+        self.timings = timings
+        self._started: Dict[UUID, Tuple[str, float]] = {}
+
+    def _start(self, run_id: UUID, kind: str, serialized: Any, kwargs: Any) -> None:
+        name = kwargs.get("name")
+        if not name and isinstance(serialized, dict):
+            name = serialized.get("name") or (serialized.get("id") or ["?"])[-1]
+        self._started[run_id] = (f"{kind}:{name or '?'}", time.perf_counter())
+
+    def _end(self, run_id: UUID) -> None:
+        started = self._started.pop(run_id, None)
+        if started is not None:
+            self.timings.add(started[0], time.perf_counter() - started[1])
+
+    def on_chain_start(
+        self, serialized: Dict[str, Any], inputs: Any, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._start(run_id, "chain", serialized, kwargs)
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end(run_id)
+
+    def on_chain_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._end(run_id)
+
+    def on_llm_start(
+        self, serialized: Dict[str, Any], prompts: Any, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._start(run_id, "llm", serialized, kwargs)
+
+    def on_chat_model_start(
+        self, serialized: Dict[str, Any], messages: Any, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._start(run_id, "llm", serialized, kwargs)
+
+    def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end(run_id)
+
+    def on_llm_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._end(run_id)
+
+    def on_retriever_start(
+        self, serialized: Dict[str, Any], query: str, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._start(run_id, "retriever", serialized, kwargs)
+
+    def on_retriever_end(self, documents: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end(run_id)
+
+    def on_retriever_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._end(run_id)
+
+
+def callback_config() -> Dict[str, Any]:
+    """Runnable config attaching a `StageTimingCallbackHandler` to the current request.
+
+    Returns an empty config outside of an instrumented request.
+    """
+    timings = _current.get()
+    if timings is None:
+        return {}
+    return {"callbacks": [StageTimingCallbackHandler(timings)]}
+
+
+class LatencyWindow:
+    """Sliding window of latency samples with running count and sum."""
+
+    __slots__ = ("samples", "count", "total")
+
+    def __init__(self, size: int) -> None:
+        self.samples: Deque[float] = deque(maxlen=size)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+
+    def quantiles(self) -> Dict[float, float]:
+        """Nearest-rank quantiles over the window."""
+        ordered = sorted(self.samples)
+        if not ordered:
+            return {q: math.nan for q in _QUANTILES}
+        n = len(ordered)
+        return {q: ordered[max(0, math.ceil(q * n) - 1)] for q in _QUANTILES}
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class MetricsRegistry:
+    """Per-endpoint stage latency windows plus a ring buffer of recent requests."""
+
+    def __init__(
+        self,
+        *,
+        enabled: Optional[bool] = None,
+        window_size: int = 1024,
+        recent_size: int = 256,
+    ) -> None:
+        # None: read `RAG_METRICS` on first use
+        self._enabled = enabled
+        self.window_size = window_size
+        self.recent_size = recent_size
+        self._windows: Dict[Tuple[str, str], LatencyWindow] = {}
+        self._recent: Deque[Dict[str, Any]] = deque(maxlen=recent_size)
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether requests are timed."""
+        if self._enabled is None:
+            self._enabled = _env_enabled()
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = value
+
+    def begin(
+        self, endpoint: str, request_id: str = "-"
+    ) -> Tuple[Optional[RequestTimings], Optional[contextvars.Token]]:
+        """Start timing a request and bind it to the current context."""
+        if not self.enabled:
+            return None, None
+        timings = RequestTimings(endpoint, request_id)
+        return timings, _current.set(timings)
+
+    def finish(
+        self,
+        timings: Optional[RequestTimings],
+        token: Optional[contextvars.Token] = None,
+        *,
+        status: Optional[int] = None,
+        endpoint: Optional[str] = None,
+    ) -> None:
+        """Record a finished request into the windows and the ring buffer.
+
+        `endpoint` replaces the endpoint given to `begin`, e.g. with the route
+        template once routing has matched it.
+        """
+        if token is not None:
+            _current.reset(token)
+        if timings is None:
+            return
+        if endpoint is not None:
+            timings.endpoint = endpoint
+        total = time.perf_counter() - timings.start
+        breakdown = timings.breakdown()
+        with self._lock:
+            self._observe(timings.endpoint, "total", total)
+            for stage_name, seconds in breakdown.items():
+                self._observe(timings.endpoint, stage_name, seconds)
+            self._recent.append(
+                {
+                    "request_id": timings.request_id,
+                    "endpoint": timings.endpoint,
+                    "status": status,
+                    "total_ms": round(total * 1000, 3),
+                    "stages_ms": {k: round(v * 1000, 3) for k, v in breakdown.items()},
+                }
+            )
+
+    def _observe(self, endpoint: str, stage_name: str, seconds: float) -> None:
+        window = self._windows.get((endpoint, stage_name))
+        if window is None:
+            window = self._windows[(endpoint, stage_name)] = LatencyWindow(
+                self.window_size
+            )
+        window.observe(seconds)
+
+    def recent(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Most recent request breakdowns, newest first.
+
+        `limit` is clamped to `1..recent_size`.
+        """
+        with self._lock:
+            items = list(self._recent)
+        items.reverse()
+        if limit is None:
+            return items
+        return items[: min(max(limit, 1), self.recent_size)]
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Quantiles (in ms) and counts per endpoint and stage."""
+        out: Dict[str, Dict[str, Dict[str, float]]] = {}
+        with self._lock:
+            for (endpoint, stage_name), window in sorted(self._windows.items()):
+                stats: Dict[str, float] = {
+                    f"p{int(q * 100)}_ms": v * 1000
+                    for q, v in window.quantiles().items()
+                }
+                stats["count"] = window.count
+                out.setdefault(endpoint, {})[stage_name] = stats
+        return out
+
+    def render_prometheus(self) -> str:
+        """Render all windows as a Prometheus summary in text exposition format."""
+        name = "rag_stage_latency_seconds"
+        lines = [
+            f"# HELP {name} Latency of RAG API request stages.",
+            f"# TYPE {name} summary",
+        ]
+        with self._lock:
+            for (endpoint, stage_name), window in sorted(self._windows.items()):
+                labels = (
+                    f'endpoint="{_escape_label(endpoint)}",'
+                    f'stage="{_escape_label(stage_name)}"'
+                )
+                for q, v in window.quantiles().items():
+                    lines.append(f'{name}{{{labels},quantile="{q}"}} {v!r}')
+                lines.append(f"{name}_sum{{{labels}}} {window.total!r}")
+                lines.append(f"{name}_count{{{labels}}} {window.count}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Drop all recorded samples."""
+        with self._lock:
+            self._windows.clear()
+            self._recent.clear()
+
+
+registry = MetricsRegistry()
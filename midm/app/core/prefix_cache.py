@@ -0,0 +1,159 @@
+"""KV-cache reuse for static prompt prefixes on the local transformers path.
+
+Prompts for local generation start with a fixed system instruction. Instead of
+recomputing attention over that prefix for every request, `PrefixKVCache`
+runs the prefix through the model once, keeps its `past_key_values`, and hands a
+copy to `model.generate(...)` whenever a prompt starts with the same tokens.
+
+Matching is done on token ids (not strings), so a prefix is only reused when the
+full prompt tokenizes to exactly the prefix's ids followed by more tokens.
+Entries are keyed by model instance and adapter, so switching or reloading a
+LoRA adapter never reuses a stale cache; `invalidate()` drops entries explicitly.
+
+The module itself does not import torch: tensors come from the tokenizer and the
+model passed in.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class PrefixHit:
+    """A cached prefix matching the start of a prompt."""
+
+    past_key_values: Any
+    """Private copy of the prefix KV cache, safe to pass to `generate`."""
+    length: int
+    """Number of prompt tokens covered by the cache."""
+    saved_ms: float
+    """Prefill time saved: the time it took to compute the cached prefix, or 0.0 if
+    it was computed for this request."""
+
+
+@dataclass
+class _Entry:
+    model_ref: "weakref.ref[Any]"
+    past_key_values: Any
+    prefill_ms: float
+
+
+def _adapter_key(model: Any, namespace: Optional[str]) -> Hashable:
+    # PEFT models can switch adapters in place
+    active = getattr(model, "active_adapter", None)
+    return (namespace, active if isinstance(active, Hashable) else repr(active))
+
+
+class PrefixKVCache:
+    """LRU of precomputed KV caches for registered prompt prefixes."""
+
+    def __init__(self, prefixes: Sequence[str] = (), *, max_entries: int = 8) -> None:
+        self.prefixes: List[str] = list(prefixes)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[Any, ...], _Entry]" = OrderedDict()
+        # (id(tokenizer), prefix) -> prefix token ids
+        self._prefix_ids: Dict[Tuple[int, str], Tuple[Any, List[int]]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, prefix: str) -> None:
+        """Register a static prompt prefix."""
+        with self._lock:
+            if prefix not in self.prefixes:
+                self.prefixes.append(prefix)
+
+    def invalidate(self, namespace: Optional[str] = None) -> None:
+        """Drop cached entries, for one adapter `namespace` or all of them."""
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[1][0] == namespace]:
+                del self._entries[key]
+
+    def _encode_prefix(self, tokenizer: Any, prefix: str) -> Tuple[Any, List[int]]:
+        key = (id(tokenizer), prefix)
+        cached = self._prefix_ids.get(key)
+        if cached is None:
+            encoded = tokenizer(prefix, return_tensors="pt")
+            input_ids = encoded["input_ids"]
+            cached = self._prefix_ids[key] = (input_ids, list(input_ids[0].tolist()))
+        return cached
+
+    def _match(
+        self, tokenizer: Any, prompt_ids: Sequence[int]
+    ) -> Optional[Tuple[str, Any, int]]:
+        best: Optional[Tuple[str, Any, int]] = None
+        for prefix in self.prefixes:
+            tensor, ids = self._encode_prefix(tokenizer, prefix)
+            n = len(ids)
+            # `generate` needs at least one uncached prompt token
+            if n >= len(prompt_ids) or list(prompt_ids[:n]) != ids:
+                continue
+            if best is None or n > best[2]:
+                best = (prefix, tensor, n)
+        return best
+
+    def _compute(self, model: Any, prefix_ids: Any) -> Tuple[Any, float]:
+        if hasattr(model, "device"):
+            prefix_ids = prefix_ids.to(model.device)
+        start = time.perf_counter()
+        output = model(input_ids=prefix_ids, use_cache=True)
+        return output.past_key_values, (time.perf_counter() - start) * 1000
+
+    def lookup(
+        self,
+        model: Any,
+        tokenizer: Any,
+        prompt_ids: Sequence[int],
+        *,
+        namespace: Optional[str] = None,
+    ) -> Optional[PrefixHit]:
+        """Find (or compute) the KV cache of the longest prefix of `prompt_ids`.
+
+        Args:
+            model: Causal LM used for generation.
+            tokenizer: Tokenizer that produced `prompt_ids`.
+            prompt_ids: Token ids of the full prompt (batch size 1).
+            namespace: Adapter identifier, e.g. the adapter path.
+
+        Returns:
+            A `PrefixHit` with a private copy of the cache, or `None` if no registered
+            prefix matches.
+        """
+        with self._lock:
+            match = self._match(tokenizer, prompt_ids)
+        if match is None:
+            return None
+        prefix, prefix_tensor, length = match
+        key = (id(model), _adapter_key(model, namespace), id(tokenizer), prefix)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.model_ref() is not model:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+
+        saved_ms = 0.0 if entry is None else entry.prefill_ms
+        if entry is None:
+            past_key_values, prefill_ms = self._compute(model, prefix_tensor)
+            entry = _Entry(weakref.ref(model), past_key_values, prefill_ms)
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = entry
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        # `generate` appends to the cache in place, so it always gets a copy
+        return PrefixHit(copy.deepcopy(entry.past_key_values), length, saved_ms)
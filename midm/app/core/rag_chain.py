@@ -7,7 +7,7 @@ from langchain_core.documents import Document
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import PromptTemplate
 from langchain_core.runnables import Runnable, RunnablePassthrough
-from langchain_huggingface import HuggingFacePipeline
+from langchain_huggingface import BatchedHuggingFacePipeline, HuggingFacePipeline
 from langchain_postgres import PGVector
 try:
     import torch
@@ -351,12 +351,28 @@ def _init_huggingface_llm() -> HuggingFacePipeline:
     )
 
     # LangChain LLM 객체로 래핑
-    llm = HuggingFacePipeline(pipeline=pipe)
+    # 동시 요청의 프롬프트를 모아 한 번의 배치로 생성 (ainvoke 경로)
+    llm = BatchedHuggingFacePipeline(
+        pipeline=pipe,
+        batch_size=int(os.getenv("HF_BATCH_SIZE", "4")),
+        batch_wait=float(os.getenv("HF_BATCH_WAIT_MS", "10")) / 1000,
+    )
 
     print("[OK] Local HF LLM initialized!")
     return llm
 
 
+def supports_early_stop(llm: Any) -> bool:
+    """Whether closing an `astream` of `llm` stops generation.
+
+    `HuggingFacePipeline` decodes on its own thread up to `max_new_tokens` whether or
+    not the stream is read, and `BatchedHuggingFacePipeline` only batches `ainvoke`
+    calls, so streaming a local pipeline saves no decode time and bypasses batching.
+    Remote providers (OpenAI, Ollama) stop when the response stream is closed.
+    """
+    return not isinstance(llm, HuggingFacePipeline)
+
+
 def create_rag_chain(vector_store: PGVector, llm: Union[HuggingFacePipeline, Any]) -> Runnable:
     """Create RAG chain with retriever and LLM.
 
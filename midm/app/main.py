@@ -14,6 +14,7 @@ sys.path.insert(0, os.path.dirname(__file__))
 _REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
 _LOCAL_LIB_PATHS = [
     os.path.join(_REPO_ROOT, "libs", "core"),  # langchain_core
+    os.path.join(_REPO_ROOT, "libs", "langchain"),  # langchain_classic (EnsembleRetriever)
     os.path.join(_REPO_ROOT, "libs", "partners", "huggingface"),  # langchain_huggingface
 ]
 for _p in _LOCAL_LIB_PATHS:
@@ -22,12 +23,25 @@ for _p in _LOCAL_LIB_PATHS:
 
 try:
     from api.routers import chat, rag, search  # type: ignore
-    from core.rag_chain import create_rag_chain, init_llm  # type: ignore
+    from core.hybrid import (  # type: ignore
+        build_bm25_retriever,
+        create_hybrid_retriever,
+        hybrid_enabled,
+        load_review_documents,
+        load_vector_store_documents,
+    )
+    from core.metrics import registry as metrics_registry  # type: ignore
+    from core.rag_chain import (  # type: ignore
+        create_rag_chain,
+        init_llm,
+        supports_early_stop,
+    )
     from core.vectorstore import init_vector_store  # type: ignore
     from service.chat_service import warmup_qlora_from_env  # type: ignore
     from dotenv import find_dotenv, load_dotenv  # type: ignore
     from fastapi import FastAPI  # type: ignore
     from fastapi.middleware.cors import CORSMiddleware  # type: ignore
+    from fastapi.responses import PlainTextResponse  # type: ignore
     import uvicorn  # type: ignore
 except (ModuleNotFoundError, ImportError) as e:  # pragma: no cover
     msg = (
@@ -64,12 +78,28 @@ def _truncate(text: str, max_len: int = 160) -> str:
     return text[: max_len - 3] + "..."
 
 
+_UNMATCHED_ROUTE = "unmatched"
+
+
+def _route_label(request) -> str:
+    """Matched route template (e.g. `/items/{id}`) so metric labels stay bounded."""
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or _UNMATCHED_ROUTE
+
+
 @app.middleware("http")
 async def request_logging_middleware(request, call_next):
     """Log request/response with a correlation id."""
     request_id = request.headers.get("x-request-id") or uuid.uuid4().hex[:12]
     request.state.request_id = request_id
     start = time.perf_counter()
+    # Per-stage timings for /metrics (no-op when RAG_METRICS=0). The endpoint is
+    # replaced by the matched route template when the request finishes.
+    timings, timings_token = (
+        metrics_registry.begin(_UNMATCHED_ROUTE, request_id)
+        if not request.url.path.startswith("/metrics")
+        else (None, None)
+    )
 
     logger.info(
         "[REQ] id=%s method=%s path=%s client=%s",
@@ -91,8 +121,18 @@ async def request_logging_middleware(request, call_next):
             duration_ms,
             str(e),
         )
+        metrics_registry.finish(
+            timings, timings_token, status=500, endpoint=_route_label(request)
+        )
         raise
 
+    metrics_registry.finish(
+        timings,
+        timings_token,
+        status=response.status_code,
+        endpoint=_route_label(request),
+    )
+
     duration_ms = int((time.perf_counter() - start) * 1000)
     response.headers["x-request-id"] = request_id
     logger.info(
@@ -122,6 +162,17 @@ async def startup_event():
         vector_store = await init_vector_store()
         print("[OK] Vector store initialized!")
 
+        # Optional BM25 index fused with dense search (RAG_HYBRID=1)
+        bm25_retriever = None
+        hybrid_retriever = None
+        if hybrid_enabled():
+            documents = await load_vector_store_documents(vector_store)
+            if documents is None:
+                documents = load_review_documents(os.getenv("RAG_BM25_DATA_DIR"))
+            bm25_retriever = build_bm25_retriever(documents)
+            hybrid_retriever = create_hybrid_retriever(vector_store, bm25_retriever)
+            print(f"[OK] Hybrid retrieval enabled ({len(documents)} documents in BM25)")
+
         # Check LLM provider mode
         llm_provider = os.getenv("LLM_PROVIDER", "openai").lower()
         use_qlora = os.getenv("USE_QLORA", "0").lower() in {"1", "true", "yes"}
@@ -146,8 +197,13 @@ async def startup_event():
             rag_chain_instance = create_rag_chain(vector_store, llm)
 
             # Set dependencies for routers
-            rag.set_dependencies(vector_store, rag_chain_instance)
-            search.set_dependencies(vector_store)
+            rag.set_dependencies(
+                vector_store,
+                rag_chain_instance,
+                hybrid_retriever,
+                stream=supports_early_stop(llm),
+            )
+            search.set_dependencies(vector_store, bm25_retriever)
             chat.set_dependencies(llm)
 
             print("✅ API server is ready! (OpenAI mode)")
@@ -158,8 +214,8 @@ async def startup_event():
             rag_chain_instance = None
 
             # Set dependencies for routers
-            rag.set_dependencies(vector_store, rag_chain_instance)
-            search.set_dependencies(vector_store)
+            rag.set_dependencies(vector_store, rag_chain_instance, hybrid_retriever)
+            search.set_dependencies(vector_store, bm25_retriever)
             # In QLoRA mode, chat router uses chat_service directly.
             chat.set_dependencies(None)
 
@@ -175,8 +231,13 @@ async def startup_event():
             rag_chain_instance = create_rag_chain(vector_store, llm)
 
             # Set dependencies for routers
-            rag.set_dependencies(vector_store, rag_chain_instance)
-            search.set_dependencies(vector_store)
+            rag.set_dependencies(
+                vector_store,
+                rag_chain_instance,
+                hybrid_retriever,
+                stream=supports_early_stop(llm),
+            )
+            search.set_dependencies(vector_store, bm25_retriever)
             chat.set_dependencies(llm)
 
             print("API server is ready! (Standard LLM mode)")
@@ -208,10 +269,30 @@ async def root():
             "add_document": "POST /documents - Add a document",
             "add_documents": "POST /documents/batch - Add multiple documents",
             "health": "GET /health - Health check",
+            "metrics": "GET /metrics - Stage latency metrics (Prometheus)",
         },
     }
 
 
+@app.get("/metrics")
+async def metrics():
+    """Stage latency summaries (p50/p95/p99) in Prometheus text format."""
+    return PlainTextResponse(
+        metrics_registry.render_prometheus(),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
+@app.get("/metrics/recent")
+async def metrics_recent(limit: int = 50):
+    """Per-stage latency breakdowns of the most recent requests."""
+    return {
+        "enabled": metrics_registry.enabled,
+        "summary": metrics_registry.snapshot(),
+        "requests": metrics_registry.recent(limit),
+    }
+
+
 @app.get("/health")
 async def health():
     """Health check endpoint."""
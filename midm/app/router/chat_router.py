@@ -13,6 +13,9 @@ import os
 from typing import TYPE_CHECKING
 
 from api.models import QueryRequest, RAGResponse  # type: ignore
+from core.answer_filter import AnswerFilter  # type: ignore
+from core.hybrid import relevance_threshold  # type: ignore
+from core.metrics import callback_config, stage  # type: ignore
 
 if TYPE_CHECKING:  # pragma: no cover
     from fastapi import APIRouter, HTTPException, Request
@@ -28,13 +31,31 @@ logger = logging.getLogger("rag-api")
 # Global references (will be set by main app)
 vector_store = None
 rag_chain = None
+hybrid_retriever = None
+# Whether the LLM backend stops generating when the stream is closed
+stream_by_default = False
 
 
-def set_dependencies(vs, chain) -> None:
-    """Set vector store and RAG chain dependencies."""
-    global vector_store, rag_chain
+def _stream_generation() -> bool:
+    # Streaming only saves time when closing the stream cancels generation;
+    # RAG_STREAM_GENERATION overrides the backend default.
+    value = os.getenv("RAG_STREAM_GENERATION")
+    if value is None or not value.strip():
+        return stream_by_default
+    return value.lower() not in {"0", "false", "no", "off"}
+
+
+def set_dependencies(vs, chain, hybrid=None, stream=False) -> None:
+    """Set vector store, RAG chain and optional hybrid retriever dependencies.
+
+    `stream` enables streaming generation (with early stop) by default, and should
+    only be set for backends that cancel generation when the stream is closed.
+    """
+    global vector_store, rag_chain, hybrid_retriever, stream_by_default
     vector_store = vs
     rag_chain = chain
+    hybrid_retriever = hybrid
+    stream_by_default = stream
 
 
 @router.post("", response_model=RAGResponse)
@@ -69,14 +90,6 @@ async def rag_query(request: QueryRequest, raw_request: Request) -> RAGResponse:
                     detail="Neither RAG chain nor QLoRA is configured. Please set LLM_PROVIDER=openai or configure QLoRA."
                 )
 
-        print(
-            "[ROUTER] /rag received",
-            {
-                "request_id": request_id,
-                "question_preview": (request.question or "")[:200],
-                "k": request.k,
-            },
-        )
         logger.info(
             "[RAG] id=%s q=%r k=%s history_len=%s",
             request_id,
@@ -85,37 +98,66 @@ async def rag_query(request: QueryRequest, raw_request: Request) -> RAGResponse:
             len(request.conversation_history or []),
         )
 
-        # Retrieve documents with similarity scores (async)
-        retrieved_docs_with_scores = await vector_store.asimilarity_search_with_score(
-            request.question, k=request.k
-        )
-
-        # PGVector returns list of (Document, score) tuples
-        # Filter documents by relevance threshold
-        relevance_threshold = 0.8
-        retrieved_docs = [
-            doc
-            for doc, score in retrieved_docs_with_scores
-            if score < relevance_threshold  # Lower score = more similar in pgvector
-        ]
-
-        print(
-            f"[RAG] Retrieved {len(retrieved_docs)} relevant documents (threshold: {relevance_threshold})"
+        # PGVector distance cut-off, shared with the dense side of hybrid search
+        max_distance = relevance_threshold()
+        if hybrid_retriever is not None:
+            # BM25 + dense candidates fused by reciprocal rank (RAG_HYBRID=1).
+            # Dense candidates are already cut at the relevance threshold.
+            with stage("hybrid_search"):
+                fused = await hybrid_retriever.ainvoke(
+                    request.question, config=callback_config()
+                )
+            retrieved_docs = fused[: request.k]
+        else:
+            # Retrieve documents with similarity scores (async).
+            # Embed the query separately when possible so its latency is attributed
+            # apart from the PGVector round-trip.
+            embeddings = getattr(vector_store, "embeddings", None)
+            if embeddings is not None and hasattr(
+                vector_store, "asimilarity_search_with_score_by_vector"
+            ):
+                with stage("embed_query"):
+                    query_embedding = await embeddings.aembed_query(request.question)
+                with stage("vector_search"):
+                    retrieved_docs_with_scores = (
+                        await vector_store.asimilarity_search_with_score_by_vector(
+                            query_embedding, k=request.k
+                        )
+                    )
+            else:
+                with stage("retrieve"):
+                    retrieved_docs_with_scores = (
+                        await vector_store.asimilarity_search_with_score(
+                            request.question, k=request.k
+                        )
+                    )
+
+            # PGVector returns list of (Document, score) tuples
+            # Filter documents by relevance threshold
+            retrieved_docs = [
+                doc
+                for doc, score in retrieved_docs_with_scores
+                if score < max_distance  # Lower score = more similar in pgvector
+            ]
+
+        logger.debug(
+            "[RAG] id=%s retrieved=%s threshold=%s",
+            request_id,
+            len(retrieved_docs),
+            max_distance,
         )
 
         # Generate answer with conversation history
-        print("[RAG] Generating answer...")
         history = request.conversation_history or []
-        print(f"[RAG] Conversation history: {len(history)} messages")
 
         # Format context from retrieved documents
-        context = "\n\n".join(doc.page_content for doc in retrieved_docs)
+        with stage("format_context"):
+            context = "\n\n".join(doc.page_content for doc in retrieved_docs)
 
         # Generate answer using rag_chain (OpenAI/standard LLM) or QLoRA
+        answer_filter = AnswerFilter()
         if use_rag_chain:
             # Use rag_chain (OpenAI or standard LLM mode)
-            print("[RAG] Using rag_chain for answer generation")
-            
             # Build input for rag_chain
             # rag_chain expects: {"question": str, "context": str, "history": list}
             chain_input = {
@@ -124,98 +166,58 @@ async def rag_query(request: QueryRequest, raw_request: Request) -> RAGResponse:
                 "history": history,
             }
             
-            # Invoke rag_chain (supports both sync and async)
-            if hasattr(rag_chain, "ainvoke"):
-                chain_result = await rag_chain.ainvoke(chain_input)
-            elif hasattr(rag_chain, "invoke"):
-                chain_result = rag_chain.invoke(chain_input)
-            else:
-                chain_result = rag_chain(chain_input)
-            
-            # Extract answer from chain result
-            answer = str(getattr(chain_result, "content", chain_result)).strip()
+            # Invoke rag_chain (supports both sync and async).
+            # The callback config attributes time to each chain step.
+            # When streaming, generation is stopped as soon as the answer filter
+            # sees a stop sequence or the length cap.
+            with stage("generate"):
+                if _stream_generation() and hasattr(rag_chain, "astream"):
+                    async for chunk in rag_chain.astream(
+                        chain_input, config=callback_config()
+                    ):
+                        if answer_filter.feed(str(getattr(chunk, "content", chunk))):
+                            break
+                else:
+                    if hasattr(rag_chain, "ainvoke"):
+                        chain_result = await rag_chain.ainvoke(
+                            chain_input, config=callback_config()
+                        )
+                    elif hasattr(rag_chain, "invoke"):
+                        chain_result = rag_chain.invoke(
+                            chain_input, config=callback_config()
+                        )
+                    else:
+                        chain_result = rag_chain(chain_input)
+                    answer_filter.feed(str(getattr(chain_result, "content", chain_result)))
             logger.info(
-                "[RAG] id=%s backend=rag_chain answer_preview=%r", request_id, answer[:120]
+                "[RAG] id=%s backend=rag_chain stopped_early=%s",
+                request_id,
+                answer_filter.stopped,
             )
         else:
             # Use QLoRA mode
-            print("[RAG] Using QLoRA for answer generation")
             adapter_path = os.getenv("QLORA_ADAPTER_PATH") or None
             from service.chat_service import rag_chat_with_qlora  # type: ignore
 
-            answer = rag_chat_with_qlora(
-                base_model_path=base_model_path,
-                adapter_path=adapter_path,
-                question=request.question,
-                context=context,
-                conversation_history=history,
-                max_new_tokens=int(os.getenv("QLORA_MAX_NEW_TOKENS", "256")),
-                request_id=request_id,
-            )
+            with stage("generate"):
+                answer = rag_chat_with_qlora(
+                    base_model_path=base_model_path,
+                    adapter_path=adapter_path,
+                    question=request.question,
+                    context=context,
+                    conversation_history=history,
+                    max_new_tokens=int(os.getenv("QLORA_MAX_NEW_TOKENS", "256")),
+                    request_id=request_id,
+                )
             logger.info(
                 "[RAG] id=%s backend=qlora answer_preview=%r", request_id, answer[:120]
             )
+            answer_filter.feed(answer)
 
-        # 답변 정제: 불필요한 텍스트 제거
-        answer = answer.strip()
-
-        # 일부 추론형/지시형 모델이 출력에 포함하는 <think>...</think> 제거
-        if "<think>" in answer:
-            if "</think>" in answer:
-                answer = answer.split("</think>")[-1].strip()
-            else:
-                answer = answer.split("<think>")[0].strip()
-
-        # 모델/프롬프트 잔여 특수 토큰 제거
-        special_tokens_to_strip = [
-            "<|start_header_id|>",
-            "<|end_header_id|>",
-            "<|eot_id|>",
-            "<|begin_of_text|>",
-            "system<|end_header_id|>",
-            "user<|end_header_id|>",
-            "assistant<|end_header_id|>",
-            "[SYSTEM]",
-            "[HISTORY]",
-            "[CONTEXT]",
-            "[USER]",
-            "[ASSISTANT]",
-        ]
-        for token in special_tokens_to_strip:
-            answer = answer.replace(token, "")
-
-        # Stop sequences로 생성 중단
-        stop_sequences = [
-            "질문:",
-            "참고 정보:",
-            "규칙:",
-            "\n\n참고",
-            "\n\n질문",
-            "<|start_header_id|>",
-        ]
-        for stop_seq in stop_sequences:
-            if stop_seq in answer:
-                answer = answer.split(stop_seq)[0].strip()
-
-        # 프롬프트 잔여물 제거
-        if "답변:" in answer and not answer.startswith("답변:"):
-            answer = answer.split("답변:")[-1].strip()
-
-        # 연속된 줄바꿈 정리
-        while "\n\n\n" in answer:
-            answer = answer.replace("\n\n\n", "\n\n")
-
-        # 너무 긴 답변 자르기 (300자 제한)
-        if len(answer) > 300:
-            answer_prefix: str = answer[:300]
-            last_period: int = answer_prefix.rfind(".")
-            if last_period > 200:
-                answer = answer[: last_period + 1]
-            else:
-                answer = answer_prefix + "..."
+        with stage("postprocess"):
+            answer = answer_filter.finish()
 
-        answer_preview: str = answer[:100] if len(answer) > 100 else answer
-        print(f"[RAG] Answer generated: {answer_preview}...")
+        logger.debug("[RAG] id=%s answer_len=%s", request_id, len(answer))
 
         return RAGResponse(
             question=request.question,
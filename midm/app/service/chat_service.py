@@ -17,6 +17,9 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
+from core.answer_filter import AnswerFilter  # type: ignore
+from core.prefix_cache import PrefixKVCache  # type: ignore
+
 # NOTE:
 # We intentionally store optional deps in `Any`-typed variables so MyPy does not
 # treat imported class names as types that cannot be reassigned to `None`.
@@ -371,6 +374,62 @@ def warmup_qlora_from_env() -> bool:
         return False
 
 
+_CHAT_SYSTEM_PROMPT = "너는 친절하고 유용한 한국어 어시스턴트야."
+_RAG_SYSTEM_PROMPT = (
+    "너는 한국어로 답하는 유용한 어시스턴트야.\n"
+    "아래 '참고 정보'가 주어지면 그 범위 안에서 답을 구성해.\n"
+    "참고 정보가 부족하면 부족하다고 말하고, 필요한 추가 질문을 해.\n\n"
+    "[참고 정보]\n"
+)
+
+# 모든 요청이 같은 system 지시문으로 시작하므로 그 KV 캐시를 재사용한다.
+# (format_chat_prompt 결과의 앞부분과 정확히 일치해야 함)
+_prefix_cache = PrefixKVCache(
+    [
+        f"{_CHAT_SYSTEM_PROMPT}\nsystem: {_CHAT_SYSTEM_PROMPT}\n",
+        f"{_CHAT_SYSTEM_PROMPT}\nsystem: {_RAG_SYSTEM_PROMPT}",
+    ]
+)
+
+
+def _prefix_cache_enabled() -> bool:
+    return os.getenv("QLORA_PREFIX_CACHE", "1").lower() not in {"0", "false", "no", "off"}
+
+
+def _early_stop_enabled() -> bool:
+    return os.getenv("QLORA_EARLY_STOP", "1").lower() not in {"0", "false", "no", "off"}
+
+
+class _AnswerStoppingCriteria:
+    """`generate` stopping criterion fed by an `AnswerFilter`.
+
+    Decodes the generated tokens after every step (like transformers'
+    `TextStreamer`) and stops once the filter sees a stop sequence or the
+    answer length cap, instead of decoding up to `max_new_tokens`.
+    """
+
+    def __init__(self, tokenizer: Any, prompt_length: int) -> None:
+        self.tokenizer = tokenizer
+        self.prompt_length = prompt_length
+        self.answer_filter = AnswerFilter()
+        self._fed = 0
+
+    def __call__(self, input_ids: Any, scores: Any, **kwargs: Any) -> Any:
+        text = self.tokenizer.decode(
+            input_ids[0][self.prompt_length :], skip_special_tokens=True
+        )
+        # Wait for the rest of a multi-byte character
+        if not text.endswith("\ufffd") and len(text) > self._fed:
+            self.answer_filter.feed(text[self._fed :])
+            self._fed = len(text)
+        done = self.answer_filter.stopped
+        if torch is None:
+            return done
+        return torch.full(
+            (input_ids.shape[0],), done, dtype=torch.bool, device=input_ids.device
+        )
+
+
 def format_chat_prompt(messages: list[dict]) -> str:
     """Format a simple chat prompt from messages.
 
@@ -380,7 +439,7 @@ def format_chat_prompt(messages: list[dict]) -> str:
     Returns:
         Prompt string.
     """
-    system = "너는 친절하고 유용한 한국어 어시스턴트야."
+    system = _CHAT_SYSTEM_PROMPT
     parts: list[str] = [system]
     for msg in messages:
         role = (msg.get("role") or "").strip()
@@ -404,12 +463,15 @@ def qlora_chat(
     *,
     messages: list[dict],
     request_id: Optional[str] = None,
+    early_stop: bool = False,
 ) -> str:
     """Run chat inference using a 4-bit QLoRA model (+ optional adapter).
 
     Args:
         cfg: QLoRAChatConfig.
         messages: List of chat messages.
+        early_stop: Stop generating once the answer hits a RAG stop sequence or
+            the answer length cap (see `core.answer_filter`).
 
     Returns:
         Generated answer string.
@@ -443,8 +505,27 @@ def qlora_chat(
     if hasattr(model, "device"):
         inputs = {k: v.to(model.device) for k, v in inputs.items()}
 
+    # 고정 system 프리픽스의 KV 캐시가 있으면 나머지 토큰만 prefill 한다
+    prefix_hit = None
+    gen_kwargs: dict[str, Any] = {}
+    if _prefix_cache_enabled():
+        prefix_hit = _prefix_cache.lookup(
+            model,
+            tokenizer,
+            inputs["input_ids"][0].tolist(),
+            namespace=cfg.adapter_path,
+        )
+        if prefix_hit is not None:
+            gen_kwargs["past_key_values"] = prefix_hit.past_key_values
+
+    stopping = None
+    if early_stop:
+        stopping = _AnswerStoppingCriteria(tokenizer, inputs["input_ids"].shape[-1])
+        gen_kwargs["stopping_criteria"] = [stopping]
+
     gen = model.generate(
         **inputs,
+        **gen_kwargs,
         max_new_tokens=cfg.max_new_tokens,
         do_sample=cfg.temperature > 0.0,
         temperature=max(cfg.temperature, 1e-6),
@@ -462,7 +543,14 @@ def qlora_chat(
     dt_ms = int((time.perf_counter() - t0) * 1000)
     print(
         "[SERVICE] qlora_chat completed",
-        {"request_id": request_id, "duration_ms": dt_ms, "answer_preview": _preview(answer, max_len=200)},
+        {
+            "request_id": request_id,
+            "duration_ms": dt_ms,
+            "prefix_tokens": prefix_hit.length if prefix_hit else 0,
+            "prefill_saved_ms": round(prefix_hit.saved_ms, 1) if prefix_hit else 0.0,
+            "stopped_early": stopping.answer_filter.stopped if stopping else False,
+            "answer_preview": _preview(answer, max_len=200),
+        },
     )
     return answer
 
@@ -491,12 +579,7 @@ def rag_chat_with_qlora(
         temperature=0.0,
     )
 
-    system = (
-        "너는 한국어로 답하는 유용한 어시스턴트야.\n"
-        "아래 '참고 정보'가 주어지면 그 범위 안에서 답을 구성해.\n"
-        "참고 정보가 부족하면 부족하다고 말하고, 필요한 추가 질문을 해.\n\n"
-        f"[참고 정보]\n{context}\n"
-    )
+    system = f"{_RAG_SYSTEM_PROMPT}{context}\n"
 
     messages: list[dict] = [{"role": "system", "content": system}]
     for msg in (conversation_history or [])[-10:]:
@@ -514,7 +597,12 @@ def rag_chat_with_qlora(
         "[SERVICE] rag_chat_with_qlora",
         {"request_id": request_id, "question_preview": _preview(question, max_len=200)},
     )
-    return qlora_chat(cfg, messages=messages, request_id=request_id)
+    return qlora_chat(
+        cfg,
+        messages=messages,
+        request_id=request_id,
+        early_stop=_early_stop_enabled(),
+    )
 
 
 def chat_with_qlora(
@@ -536,9 +624,7 @@ def chat_with_qlora(
         temperature=0.0,
     )
 
-    messages: list[dict] = [
-        {"role": "system", "content": "너는 친절하고 유용한 한국어 어시스턴트야."}
-    ]
+    messages: list[dict] = [{"role": "system", "content": _CHAT_SYSTEM_PROMPT}]
     for msg in (conversation_history or [])[-10:]:
         role = msg.get("role")
         content = msg.get("content")
@@ -0,0 +1,128 @@
+"""Recall@k and latency of BM25, dense and hybrid retrieval on `app/data`.
+
+Queries are known-item queries: a short span copied from a random review (names,
+titles and other exact phrases), and the review it came from is the only relevant
+document.
+
+Usage:
+    python tests/bench_hybrid.py [--queries 200] [--embeddings jhgan/ko-sroberta-multitask]
+
+Dense and hybrid retrieval need `langchain-huggingface` with sentence-transformers
+(and the embedding model); without them only BM25 is measured.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+_APP_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
+_REPO_ROOT = os.path.normpath(os.path.join(_APP_DIR, "..", ".."))
+sys.path.insert(0, _APP_DIR)
+for _p in (
+    os.path.join(_REPO_ROOT, "libs", "core"),
+    os.path.join(_REPO_ROOT, "libs", "langchain"),
+    os.path.join(_REPO_ROOT, "libs", "partners", "huggingface"),
+):
+    if os.path.isdir(_p) and _p not in sys.path:
+        sys.path.append(_p)
+
+from langchain_core.documents import Document  # noqa: E402
+
+from core.hybrid import build_bm25_retriever, load_review_documents  # noqa: E402
+
+_KS = (1, 5, 10)
+
+
+def _make_queries(
+    documents: List[Document], n: int, seed: int
+) -> List[Tuple[str, str]]:
+    rng = random.Random(seed)
+    queries: List[Tuple[str, str]] = []
+    candidates = list(documents)
+    rng.shuffle(candidates)
+    for doc in candidates:
+        words = doc.page_content.split("리뷰:", 1)[-1].split()
+        if len(words) < 4:
+            continue
+        start = rng.randrange(len(words) - 1)
+        queries.append((" ".join(words[start : start + 2]), doc.metadata["review_id"]))
+        if len(queries) == n:
+            break
+    return queries
+
+
+def _evaluate(
+    name: str, search: Callable[[str], List[Document]], queries: List[Tuple[str, str]]
+) -> Dict[str, Any]:
+    hits = dict.fromkeys(_KS, 0)
+    latencies: List[float] = []
+    for query, relevant in queries:
+        start = time.perf_counter()
+        docs = search(query)
+        latencies.append((time.perf_counter() - start) * 1000)
+        ranked = [doc.metadata.get("review_id") for doc in docs]
+        for k in _KS:
+            hits[k] += relevant in ranked[:k]
+    latencies.sort()
+    row: Dict[str, Any] = {"retriever": name}
+    row.update({f"recall@{k}": hits[k] / len(queries) for k in _KS})
+    row["p50_ms"] = statistics.median(latencies)
+    row["p95_ms"] = latencies[int(0.95 * (len(latencies) - 1))]
+    return row
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--embeddings", default="jhgan/ko-sroberta-multitask")
+    args = parser.parse_args()
+
+    documents = load_review_documents()
+    queries = _make_queries(documents, args.queries, args.seed)
+    fetch_k = max(_KS)
+
+    start = time.perf_counter()
+    bm25 = build_bm25_retriever(documents, k=fetch_k)
+    print(
+        f"{len(documents)} documents, {len(queries)} queries; "
+        f"BM25 index built in {(time.perf_counter() - start) * 1000:.0f} ms"
+    )
+    rows = [_evaluate("bm25", bm25.invoke, queries)]
+
+    try:
+        from langchain_classic.retrievers import EnsembleRetriever
+        from langchain_core.vectorstores import InMemoryVectorStore
+        from langchain_huggingface import HuggingFaceEmbeddings
+
+        embeddings = HuggingFaceEmbeddings(
+            model_name=args.embeddings,
+            encode_kwargs={"normalize_embeddings": True},
+        )
+        store = InMemoryVectorStore.from_documents(documents, embeddings)
+    except Exception as e:  # noqa: BLE001
+        print(f"Skipping dense and hybrid retrieval: {e}")
+    else:
+        dense = store.as_retriever(search_kwargs={"k": fetch_k})
+        hybrid = EnsembleRetriever(retrievers=[dense, bm25], weights=[0.5, 0.5])
+        rows.append(_evaluate("dense", dense.invoke, queries))
+        rows.append(_evaluate("hybrid", lambda q: hybrid.invoke(q)[:fetch_k], queries))
+
+    columns = list(rows[0])
+    print(" ".join(f"{c:>10}" for c in columns))
+    for row in rows:
+        print(
+            " ".join(
+                f"{v:>10.3f}" if isinstance(v, float) else f"{v:>10}" for v in row.values()
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
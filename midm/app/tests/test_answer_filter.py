@@ -0,0 +1,165 @@
+import os
+import random
+import sys
+
+import pytest
+
+# Ensure `app/` package modules are importable even though repo root has `app.py`.
+_APP_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, _APP_DIR)
+
+from core.answer_filter import AnswerFilter, postprocess_answer  # noqa: E402
+
+
+def _whole_string_postprocess(answer: str) -> str:
+    """Reference: the previous whole-string post-processing of the RAG router."""
+    answer = answer.strip()
+    if "<think>" in answer:
+        if "</think>" in answer:
+            answer = answer.split("</think>")[-1].strip()
+        else:
+            answer = answer.split("<think>")[0].strip()
+    for token in [
+        "<|start_header_id|>",
+        "<|end_header_id|>",
+        "<|eot_id|>",
+        "<|begin_of_text|>",
+        "[SYSTEM]",
+        "[HISTORY]",
+        "[CONTEXT]",
+        "[USER]",
+        "[ASSISTANT]",
+    ]:
+        answer = answer.replace(token, "")
+    for stop_seq in ["질문:", "참고 정보:", "규칙:", "\n\n참고", "\n\n질문"]:
+        if stop_seq in answer:
+            answer = answer.split(stop_seq)[0].strip()
+    if "답변:" in answer and not answer.startswith("답변:"):
+        answer = answer.split("답변:")[-1].strip()
+    while "\n\n\n" in answer:
+        answer = answer.replace("\n\n\n", "\n\n")
+    if len(answer) > 300:
+        answer_prefix = answer[:300]
+        last_period = answer_prefix.rfind(".")
+        if last_period > 200:
+            answer = answer[: last_period + 1]
+        else:
+            answer = answer_prefix + "..."
+    return answer
+
+
+_ANSWERS = [
+    "  서울의 인구는 약 940만 명입니다.  ",
+    "<think>사용자가 인구를 묻는다.</think>\n서울의 인구는 약 940만 명입니다.",
+    "서울의 인구는 약 940만 명입니다.<think>추가로 설명할까",
+    "서울은 대한민국의 수도입니다.<|eot_id|><|start_header_id|>user",
+    "부산은 항구 도시입니다.\n\n질문: 대구는?\n답변: 대구는 내륙 도시입니다.",
+    "참고 정보를 보면 다음과 같습니다.\n\n참고: 문서 1",
+    "규칙: 한국어로 답해.\n답변: 네, 알겠습니다.",
+    "답변: 제주도는 섬입니다.",
+    "이전 대화 요약\n답변: 광주는 호남 지역에 있습니다.",
+    "첫 줄입니다.\n\n\n\n\n둘째 줄입니다.",
+    "가" * 250 + ". " + "나" * 100,
+    "가" * 150 + ". " + "나" * 200,
+    "다" * 400,
+    "",
+    "<|begin_of_text|>",
+]
+
+
+@pytest.mark.parametrize("answer", _ANSWERS)
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+def test_matches_whole_string_postprocess(answer: str, chunk_size: int) -> None:
+    answer_filter = AnswerFilter()
+    for i in range(0, len(answer), chunk_size):
+        answer_filter.feed(answer[i : i + chunk_size])
+    assert answer_filter.finish() == _whole_string_postprocess(answer)
+
+
+def test_postprocess_answer() -> None:
+    assert postprocess_answer("<think>음</think> 답변: 네.") == "답변: 네."
+    # Whitespace left behind by a removed token is trimmed as well
+    assert postprocess_answer("[ASSISTANT] 부산은 항구 도시입니다.") == "부산은 항구 도시입니다."
+
+
+def test_stops_at_stop_sequence() -> None:
+    answer_filter = AnswerFilter()
+    assert answer_filter.feed("대구는 내륙 도시입니다.\n") is False
+    assert answer_filter.feed("\n질") is False
+    assert answer_filter.feed("문: 부산은?") is True
+    # Anything generated after the stop is ignored
+    assert answer_filter.feed(" 답변: 부산은 항구입니다.") is True
+    assert answer_filter.finish() == "대구는 내륙 도시입니다."
+
+
+def test_stops_at_length_cap() -> None:
+    answer_filter = AnswerFilter(max_chars=10)
+    assert answer_filter.feed("가나다라마") is False
+    assert answer_filter.feed("     ") is False
+    assert answer_filter.feed("바사아자차카") is True
+    assert answer_filter.finish() == "가나다라마     ..."
+
+
+def test_unterminated_think_does_not_stop() -> None:
+    answer_filter = AnswerFilter()
+    answer_filter.feed("<think>" + "생각 " * 200 + "질문: ")
+    assert answer_filter.stopped is False
+    answer_filter.feed("</think>서울입니다.")
+    assert answer_filter.finish() == "서울입니다."
+
+
+@pytest.mark.parametrize(
+    ("answer", "expected"),
+    [
+        # Whitespace left by a removed token means the answer does not start with
+        # the marker, unless a stop sequence (which stripped the answer) follows
+        ("[USER] 답변:", ""),
+        ("[USER] 답변: 네.질문:", "답변: 네."),
+        # Nothing after the stop sequence is looked at
+        (".질문:<think></think>", "."),
+        ("</think>질문:<think>", "</think>"),
+    ],
+)
+def test_edge_cases(answer: str, expected: str) -> None:
+    assert postprocess_answer(answer) == expected
+
+
+_FRAGMENTS = [
+    "가",
+    "나다",
+    ".",
+    " ",
+    "\n",
+    "\n\n",
+    "<think>",
+    "</think>",
+    "<thi",
+    "nk>",
+    "질문:",
+    "질문",
+    ":",
+    "참고 정보:",
+    "참고",
+    "규칙:",
+    "답변:",
+    "답변",
+    "[USER]",
+    "<|eot_id|>",
+    "[SYSTEM]",
+    "<|start_header_id|>",
+    "ab",
+]
+
+
+def test_matches_whole_string_postprocess_up_to_stop() -> None:
+    rng = random.Random(0)
+    for _ in range(5000):
+        answer = "".join(rng.choice(_FRAGMENTS) for _ in range(rng.randint(0, 12)))
+        answer_filter = AnswerFilter()
+        consumed = len(answer)
+        for i, ch in enumerate(answer):
+            if answer_filter.feed(ch):
+                consumed = i + 1
+                break
+        expected = _whole_string_postprocess(answer[:consumed]).strip()
+        assert answer_filter.finish() == expected, answer
@@ -0,0 +1,164 @@
+import asyncio
+import os
+import sys
+from typing import List, Tuple
+
+import pytest
+
+# Ensure `app/` package modules are importable even though repo root has `app.py`.
+_APP_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, _APP_DIR)
+# `langchain_classic` (for `EnsembleRetriever`) from the monorepo when not installed
+_LANGCHAIN_DIR = os.path.normpath(os.path.join(_APP_DIR, "..", "..", "libs", "langchain"))
+if os.path.isdir(_LANGCHAIN_DIR):
+    sys.path.append(_LANGCHAIN_DIR)
+
+from langchain_core.documents import Document  # noqa: E402
+
+from core import bm25 as bm25_module  # noqa: E402
+from core.bm25 import (  # noqa: E402
+    BM25Index,
+    BM25Retriever,
+    char_ngram_tokenizer,
+    whitespace_tokenizer,
+)
+from core.hybrid import load_review_documents, review_to_document  # noqa: E402
+
+_DOCS = [
+    Document(page_content="아저씨 원빈이다 최고의 액션 영화", id="a"),
+    Document(page_content="감시자들 정우성 연기가 좋았다", id="b"),
+    Document(page_content="드림하이 옥택연 주연 드라마", id="c"),
+    Document(page_content="The Man from Nowhere starring Won Bin", id="d"),
+]
+
+
+def test_char_ngram_tokenizer() -> None:
+    tokenize = char_ngram_tokenizer(2)
+    assert tokenize("원빈이다, Won-Bin 2010!") == ["원빈", "빈이", "이다", "won", "bin", "2010"]
+    assert tokenize("빈") == ["빈"]
+    with pytest.raises(ValueError):
+        char_ngram_tokenizer(0)
+
+
+def test_korean_substring_match_and_ranking() -> None:
+    index = BM25Index()
+    index.add_documents(_DOCS)
+    results = index.search("원빈 액션", k=3)
+    assert [doc.id for doc, _ in results] == ["a"]
+    assert index.search("정우성", k=3)[0][0].id == "b"
+    # No shared term, no result
+    assert index.search("없는단어", k=3) == []
+
+
+def test_pluggable_tokenizer() -> None:
+    index = BM25Index(whitespace_tokenizer)
+    index.add_documents(_DOCS)
+    assert index.search("원빈", k=3) == []
+    assert index.search("won bin", k=3)[0][0].id == "d"
+
+
+def test_incremental_add_delete_and_upsert() -> None:
+    index = BM25Index()
+    index.add_documents(_DOCS[:2])
+    index.add_documents(_DOCS[2:])
+    assert len(index) == 4
+    assert index.search("옥택연", k=1)[0][0].id == "c"
+
+    assert index.delete(["c", "missing"]) == 1
+    assert index.search("옥택연", k=1) == []
+
+    index.add_documents([Document(page_content="원빈 아닌 정우성")], ids=["a"])
+    assert len(index) == 3
+    assert index.search("원빈", k=1)[0][0].page_content == "원빈 아닌 정우성"
+
+
+def test_scores_match_rebuilt_index_after_compaction(monkeypatch) -> None:
+    monkeypatch.setattr(bm25_module, "_MIN_COMPACT_TOMBSTONES", 1)
+    docs = [Document(page_content=f"리뷰 {i} 원빈 {'영화 ' * i}") for i in range(10)]
+    ids = [str(i) for i in range(10)]
+    index = BM25Index()
+    index.add_documents(docs, ids=ids)
+    index.delete(ids[:6])
+    assert index._tombstones == 0  # compacted
+
+    rebuilt = BM25Index()
+    rebuilt.add_documents(docs[6:], ids=ids[6:])
+    assert index.search("원빈 영화", k=4) == rebuilt.search("원빈 영화", k=4)
+
+
+def test_retriever_sync_and_async() -> None:
+    retriever = BM25Retriever.from_documents(_DOCS, k=2)
+    assert [doc.id for doc in retriever.invoke("원빈 연기")] == ["a", "b"]
+    docs = asyncio.run(retriever.ainvoke("드림하이"))
+    assert [doc.id for doc in docs] == ["c"]
+
+
+def test_review_documents() -> None:
+    documents = load_review_documents()
+    assert documents
+    doc = review_to_document(
+        {"review_id": "1", "movie_id": "2", "review": "원빈 최고"}, "2.json"
+    )
+    assert "리뷰:\n원빈 최고" in doc.page_content
+    assert doc.metadata["review_id"] == "1"
+    assert doc.metadata["source"] == "2.json"
+
+
+def test_hybrid_retriever_fuses_dense_and_bm25() -> None:
+    pytest.importorskip("langchain_classic.retrievers")
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+    from langchain_core.vectorstores import InMemoryVectorStore
+
+    from core.hybrid import build_bm25_retriever, create_hybrid_retriever
+
+    store = InMemoryVectorStore(DeterministicFakeEmbedding(size=8))
+    store.add_documents(_DOCS)
+    # InMemoryVectorStore scores are similarities, so keep every dense candidate
+    hybrid = create_hybrid_retriever(
+        store, build_bm25_retriever(_DOCS), fetch_k=2, bm25_weight=0.9, max_distance=2.0
+    )
+    docs = hybrid.invoke("옥택연")
+    # The BM25 hit ranks first; dense candidates fill in after it
+    assert docs[0].id == "c"
+    assert 1 < len(docs) <= 3
+
+
+class _DistanceStore:
+    """Vector store stub returning fixed PGVector-style distances."""
+
+    def __init__(self, docs_and_scores: List[Tuple[Document, float]]) -> None:
+        self.docs_and_scores = docs_and_scores
+
+    def similarity_search_with_score(self, query: str, k: int = 4) -> List[Tuple[Document, float]]:
+        return self.docs_and_scores[:k]
+
+    async def asimilarity_search_with_score(
+        self, query: str, k: int = 4
+    ) -> List[Tuple[Document, float]]:
+        return self.docs_and_scores[:k]
+
+
+def test_hybrid_retriever_keeps_relevance_threshold(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("langchain_classic.retrievers")
+    from core.hybrid import build_bm25_retriever, create_hybrid_retriever
+
+    store = _DistanceStore([(_DOCS[0], 0.3), (_DOCS[1], 0.85), (_DOCS[3], 0.95)])
+    monkeypatch.delenv("RAG_RELEVANCE_THRESHOLD", raising=False)
+    hybrid = create_hybrid_retriever(store, build_bm25_retriever(_DOCS), fetch_k=3)
+    # Dense candidates beyond the 0.8 default are dropped before fusion
+    assert {doc.id for doc in hybrid.invoke("옥택연")} == {"a", "c"}
+    assert {doc.id for doc in asyncio.run(hybrid.ainvoke("옥택연"))} == {"a", "c"}
+
+    monkeypatch.setenv("RAG_RELEVANCE_THRESHOLD", "0.9")
+    hybrid = create_hybrid_retriever(store, build_bm25_retriever(_DOCS), fetch_k=3)
+    assert {doc.id for doc in hybrid.invoke("옥택연")} == {"a", "b", "c"}
+
+
+def test_vector_store_documents_fall_back_for_other_stores() -> None:
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+    from langchain_core.vectorstores import InMemoryVectorStore
+
+    from core.hybrid import load_vector_store_documents
+
+    store = InMemoryVectorStore(DeterministicFakeEmbedding(size=8))
+    assert asyncio.run(load_vector_store_documents(store)) is None
@@ -0,0 +1,84 @@
+import os
+import sys
+
+# Ensure `app/` package modules are importable even though repo root has `app.py`.
+_APP_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, _APP_DIR)
+
+from langchain_core.runnables import RunnableLambda  # noqa: E402
+
+from core.metrics import MetricsRegistry, callback_config, stage  # noqa: E402
+
+
+def test_stage_is_noop_outside_request() -> None:
+    with stage("anything"):
+        pass
+    assert callback_config() == {}
+
+
+def test_disabled_registry_records_nothing() -> None:
+    registry = MetricsRegistry(enabled=False)
+    timings, token = registry.begin("/rag")
+    assert timings is None and token is None
+    with stage("retrieve"):
+        pass
+    registry.finish(timings, token)
+    assert registry.recent() == []
+    assert "rag_stage_latency_seconds_count" not in registry.render_prometheus()
+
+
+def test_request_breakdown_and_prometheus_export() -> None:
+    registry = MetricsRegistry(enabled=True, recent_size=2)
+    for i in range(3):
+        timings, token = registry.begin("/rag", f"req-{i}")
+        with stage("retrieve"):
+            pass
+        with stage("generate"):
+            chain = RunnableLambda(lambda x: x + 1) | RunnableLambda(lambda x: x * 2)
+            assert chain.invoke(1, config=callback_config()) == 4
+        registry.finish(timings, token, status=200)
+
+    # Context is restored once the request finishes
+    assert callback_config() == {}
+
+    recent = registry.recent()
+    assert [r["request_id"] for r in recent] == ["req-2", "req-1"]
+    stages = recent[0]["stages_ms"]
+    assert stages.keys() == {
+        "retrieve",
+        "generate",
+        "chain:RunnableSequence",
+        "chain:RunnableLambda",
+    }
+
+    summary = registry.snapshot()["/rag"]
+    assert summary["total"]["count"] == 3
+    assert summary["retrieve"]["p50_ms"] <= summary["retrieve"]["p99_ms"]
+
+    text = registry.render_prometheus()
+    assert "# TYPE rag_stage_latency_seconds summary" in text
+    assert (
+        'rag_stage_latency_seconds_count{endpoint="/rag",stage="retrieve"} 3' in text
+    )
+    assert 'stage="total",quantile="0.95"}' in text
+
+
+def test_enabled_flag_is_read_on_first_use(monkeypatch) -> None:
+    monkeypatch.setenv("RAG_METRICS", "1")
+    registry = MetricsRegistry()
+    # e.g. `.env` loaded after the module was imported
+    monkeypatch.setenv("RAG_METRICS", "0")
+    assert registry.enabled is False
+    assert registry.begin("/rag") == (None, None)
+
+
+def test_finish_endpoint_override_and_recent_limit() -> None:
+    registry = MetricsRegistry(enabled=True, recent_size=3)
+    for path in ("/items/1", "/items/2", "/nope"):
+        timings, token = registry.begin("unmatched")
+        route = "/items/{item_id}" if path.startswith("/items") else None
+        registry.finish(timings, token, status=200, endpoint=route)
+
+    assert set(registry.snapshot()) == {"/items/{item_id}", "unmatched"}
+    assert len(registry.recent(0)) == 1
+    assert len(registry.recent(10_000)) == 3
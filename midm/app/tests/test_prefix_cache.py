@@ -0,0 +1,91 @@
+import os
+import sys
+from types import SimpleNamespace
+from typing import Any, List
+
+# Ensure `app/` package modules are importable even though repo root has `app.py`.
+_APP_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, _APP_DIR)
+
+from core.prefix_cache import PrefixKVCache  # noqa: E402
+
+
+class _Ids(list):
+    """Minimal stand-in for a `[1, n]` tensor of token ids."""
+
+    def tolist(self) -> List[int]:
+        return list(self)
+
+
+class _CharTokenizer:
+    """One token per character, with a BOS token like most causal LMs."""
+
+    def __call__(self, text: str, return_tensors: str = "pt") -> dict:
+        return {"input_ids": [_Ids([0, *(ord(c) for c in text)])]}
+
+
+class _CountingModel:
+    def __init__(self) -> None:
+        self.prefilled: List[int] = []
+        self.active_adapter = "default"
+
+    def __call__(self, input_ids: Any, use_cache: bool) -> Any:
+        self.prefilled.append(len(input_ids[0]))
+        return SimpleNamespace(past_key_values={"tokens": list(input_ids[0])})
+
+
+def _ids(text: str) -> List[int]:
+    return _CharTokenizer()(text)["input_ids"][0].tolist()
+
+
+def test_prefix_is_computed_once_and_copied() -> None:
+    cache = PrefixKVCache(["SYSTEM\n", "SYSTEM\nrag: "])
+    model, tokenizer = _CountingModel(), _CharTokenizer()
+
+    first = cache.lookup(model, tokenizer, _ids("SYSTEM\nrag: question one"))
+    assert first is not None
+    assert first.length == len(_ids("SYSTEM\nrag: "))
+    assert first.saved_ms == 0.0
+
+    # `generate` extends its cache in place; the stored entry must not change
+    first.past_key_values["tokens"].append(-1)
+
+    second = cache.lookup(model, tokenizer, _ids("SYSTEM\nrag: question two"))
+    assert second is not None
+    assert second.past_key_values == {"tokens": _ids("SYSTEM\nrag: ")}
+    assert second.saved_ms >= 0.0
+    assert model.prefilled == [len(_ids("SYSTEM\nrag: "))]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_no_reuse_without_exact_token_prefix() -> None:
+    cache = PrefixKVCache(["SYSTEM\n"])
+    model, tokenizer = _CountingModel(), _CharTokenizer()
+
+    assert cache.lookup(model, tokenizer, _ids("OTHER\nquestion")) is None
+    # At least one prompt token must be left for `generate`
+    assert cache.lookup(model, tokenizer, _ids("SYSTEM\n")) is None
+    assert model.prefilled == []
+
+
+def test_adapter_change_invalidates() -> None:
+    cache = PrefixKVCache(["SYSTEM\n"])
+    model, tokenizer = _CountingModel(), _CharTokenizer()
+    prompt = _ids("SYSTEM\nquestion")
+
+    cache.lookup(model, tokenizer, prompt, namespace="adapter-a")
+    cache.lookup(model, tokenizer, prompt, namespace="adapter-b")
+    model.active_adapter = "other"
+    cache.lookup(model, tokenizer, prompt, namespace="adapter-b")
+    assert len(model.prefilled) == 3
+
+    cache.invalidate("adapter-b")
+    model.active_adapter = "default"
+    cache.lookup(model, tokenizer, prompt, namespace="adapter-a")
+    assert len(model.prefilled) == 3
+    cache.lookup(model, tokenizer, prompt, namespace="adapter-b")
+    assert len(model.prefilled) == 4
+
+    # A different model instance never sees another model's cache
+    cache.lookup(_CountingModel(), tokenizer, prompt, namespace="adapter-a")
+    assert (cache.hits, cache.misses) == (1, 5)